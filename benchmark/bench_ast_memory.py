@@ -0,0 +1,55 @@
+import os
+import re
+import tracemalloc
+from mathtex.parser import MathTexParser
+
+TEST_MD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test.md")
+RE_INLINE_MATH = re.compile(r"\$([^$]+)\$")
+FORMULAS = [
+    r"x",
+    r"\alpha",
+    r"y^i(t)",
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"\frac{\sqrt{x_1^2 + x_2^2}}{\boldsymbol{W} x + b}",
+    r"\begin{array}{cc} a_{11} & a_{12} \\ a_{21} & a_{22} \end{array}",
+]
+COPIES = 1000
+
+
+def parse(formula):
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(formula)
+    return parser.end_parse()
+
+
+def load_corpus():
+    with open(TEST_MD, "r", encoding="utf8") as file:
+        return RE_INLINE_MATH.findall(file.read()) + FORMULAS
+
+
+def bytes_per_formula(formula, build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    trees = [build(formula) for _ in range(COPIES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del trees
+    return (after - before) / COPIES
+
+
+def main():
+    print("{0:>10} {1:>10}  {2}".format("AST (B)", "IR (B)", "formula"))
+    total_ast = 0
+    total_ir = 0
+    for formula in load_corpus():
+        ast_bytes = bytes_per_formula(formula, parse)
+        ir_bytes = bytes_per_formula(formula, lambda f: parse(f).lower())
+        total_ast += ast_bytes
+        total_ir += ir_bytes
+        print("{0:>10.0f} {1:>10.0f}  {2}".format(ast_bytes, ir_bytes, formula))
+    print("{0:>10.0f} {1:>10.0f}  total".format(total_ast, total_ir))
+
+
+if __name__ == "__main__":
+    main()
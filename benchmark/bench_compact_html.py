@@ -0,0 +1,37 @@
+import os
+from mathtex.markdown import parse_markdown
+
+TEST_MD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test.md")
+
+FORMULAS = [
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"\frac{\partial E}{\partial w_{ij}} = \sum_t \delta_i(t) y^j(t-1)",
+    r"\delta_i(t) = f'\left(net_i(t)\right) \sum_k w_{ki} \delta_k(t+1)",
+    r"\begin{array}{cc} w_{11} & w_{12} \\ w_{21} & w_{22} \end{array}",
+    r"\sqrt{x_1^2 + x_2^2} \le \left[ a + b \right]",
+]
+
+
+def make_document(paragraphs):
+    lines = []
+    for i in range(0, paragraphs):
+        lines.append("Paragraph {0}: ".format(i) + ", ".join("${0}$".format(f) for f in FORMULAS) + "\n")
+    return "\n".join(lines)
+
+
+def report(name, text):
+    before = len(parse_markdown(text).encode("utf8"))
+    print("{0}: {1} bytes".format(name, before))
+    for precision in (4, 3, 2):
+        after = len(parse_markdown(text, precision).encode("utf8"))
+        print("  precision {0}: {1} bytes ({2:.1%})".format(precision, after, after / before))
+
+
+def main():
+    with open(TEST_MD, "r", encoding="utf8") as file:
+        report("test.md", file.read())
+    report("200 paragraphs", make_document(200))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import timeit
+from mathtex.astree import MathTexAST
+from mathtex.parser import MathTexParser
+
+
+def legacy_lower_special_command(children):
+    # The association loop used before delimiters were matched through an index of open \left commands.
+    stack = []
+    for child in children:
+        if child.command == "_" or child.command == "^":
+            if len(stack) > 0:
+                top = stack.pop()
+                if top.command == MathTexAST.CMD_SUB_SUP:
+                    new_cmd = top
+                else:
+                    new_cmd = MathTexAST.command_node(MathTexAST.CMD_SUB_SUP, 3)
+                    new_cmd.children = [top, None, None]
+                if child.command == "^" and len(child.children) > 0:
+                    new_cmd.children[1] = child.children[0]
+                elif len(child.children) > 0:
+                    new_cmd.children[2] = child.children[0]
+                stack.append(new_cmd)
+        elif child.command == "right":
+            inner = []
+            while len(stack) > 0:
+                top = stack.pop()
+                if top.command == "left":
+                    new_cmd = MathTexAST.command_node(MathTexAST.CMD_LEFT_RIGHT, 3)
+                    new_cmd.children = [top.children[0], child.children[0], MathTexAST.block_node(inner)]
+                    stack.append(new_cmd)
+                    break
+                else:
+                    inner.insert(0, top)
+        else:
+            stack.append(child)
+    return stack
+
+
+def delimited_sum(terms):
+    return r"\left(" + " + ".join(r"a_{0} \alpha^{0}".format(i) for i in range(terms)) + r"\right)"
+
+
+def nested_product(terms):
+    return r"\left[" + r" \left( x_i y^i \right) ".join("p" for _ in range(terms)) + r"\right]"
+
+
+def cell_children(formula):
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(formula)
+    return parser.end_parse().children[0].children[0].children
+
+
+def main():
+    for name, build in [("delimited sum", delimited_sum), ("delimited product", nested_product)]:
+        print(name)
+        print("{0:>8} {1:>12} {2:>12}".format("terms", "legacy (s)", "linear (s)"))
+        for terms in [500, 1000, 2000, 4000]:
+            children = cell_children(build(terms))
+            legacy = min(timeit.repeat(lambda: legacy_lower_special_command(children), number=3, repeat=3)) / 3
+            linear = min(timeit.repeat(lambda: MathTexAST.lower_special_command(children), number=3, repeat=3)) / 3
+            print("{0:>8} {1:>12.6f} {2:>12.6f}".format(terms, legacy, linear))
+        print()
+
+
+if __name__ == "__main__":
+    main()
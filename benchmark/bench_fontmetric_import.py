@@ -0,0 +1,68 @@
+# Import cost of the font metrics in fresh interpreters, optionally compared with a legacy
+# generated module, e.g. one restored with "git show <commit>:mathtex/fontmetric.py".
+#
+#   python benchmark/bench_fontmetric_import.py [<legacy fontmetric.py>]
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+IMPORT_SCRIPT = """
+import sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+import mathtex.util
+if {trace_memory}:
+    tracemalloc.start()
+start = time.perf_counter()
+{import_line}
+imported = time.perf_counter()
+FONT_METRICS.get_glyph("x").width
+looked_up = time.perf_counter()
+print(imported - start, looked_up - imported, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def measure(import_line, runs, write_bytecode, trace_memory=False):
+    script = "import sys; sys.modules['numpy'] = None\n" + IMPORT_SCRIPT.format(
+        root=ROOT, import_line=import_line, trace_memory=trace_memory)
+    samples = []
+    with tempfile.TemporaryDirectory() as cache:
+        # A fresh bytecode cache: without writing, every import compiles the module from source.
+        # numpy is blocked so that only the metrics module itself is measured.
+        env = dict(os.environ)
+        env["PYTHONPYCACHEPREFIX"] = cache
+        if write_bytecode:
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+        else:
+            env["PYTHONDONTWRITEBYTECODE"] = "1"
+        for i in range(0, runs):
+            output = subprocess.check_output([sys.executable, "-c", script], env=env, universal_newlines=True)
+            samples.append([float(value) for value in output.split()])
+    return [statistics.median(column) for column in zip(*samples)]
+
+
+def report(name, import_line, runs=7):
+    for write_bytecode in (False, True):
+        import_time, lookup_time = measure(import_line, runs, write_bytecode)[:2]
+        memory = measure(import_line, 1, write_bytecode, trace_memory=True)[2]
+        print("{0:<8} {1:<9} import {2:7.2f} ms, first lookup {3:6.3f} ms, {4:8.0f} bytes allocated".format(
+            name, "bytecode" if write_bytecode else "source", import_time * 1000, lookup_time * 1000, memory))
+
+
+def main():
+    report("table", "from mathtex.fontmetric import FONT_METRICS")
+    if len(sys.argv) > 1:
+        legacy = os.path.abspath(sys.argv[1])
+        import_line = ("import importlib.util\n"
+                       "spec = importlib.util.spec_from_file_location('legacy_fontmetric', {0!r})\n"
+                       "module = importlib.util.module_from_spec(spec)\n"
+                       "spec.loader.exec_module(module)\n"
+                       "FONT_METRICS = module.FONT_METRICS").format(legacy)
+        report("legacy", import_line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import timeit
+from mathtex.fontmetric import FONT_METRICS
+
+TEXTS = [
+    ("latin", "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-=()"),
+    ("greek and symbols", "αβγδεζηθικλμνξοπρστυφχψω∑∏∫∂∇∞≤≥≠≈∈∉⊂⊃∪∩"),
+    ("missing BMP", "递归网络中的长短期记忆神经单元工作在离散时间序列中"),
+    ("missing astral", "𝑥𝑦𝑧𝛼𝛽😀"),
+]
+
+
+def main():
+    FONT_METRICS.missing_glyphs.clear()
+    for name, text in TEXTS:
+        number = 2000
+        seconds = timeit.timeit(lambda: [FONT_METRICS.get_glyph(c) for c in text], number=number)
+        print("{0:<18} {1:6.1f} ns per lookup".format(name, seconds / number / len(text) * 1e9))
+    for name, text in TEXTS:
+        FONT_METRICS.measure_text(text)
+    missing = FONT_METRICS.missing_glyphs
+    print("{0} codepoints missing, {1} measured characters fell back to 'M'".format(
+        len(missing), sum(missing.values())))
+    for code, count in missing.most_common(5):
+        print("  U+{0:04X} {1} {2}".format(code, chr(code), count))
+
+
+if __name__ == "__main__":
+    main()
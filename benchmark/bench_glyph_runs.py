@@ -0,0 +1,40 @@
+import os
+import re
+from mathtex.displaylist import DisplayList
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import parse_formula
+
+TEST_MD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test.md")
+
+EXTRA_FORMULAS = [
+    r"net_i(t) = \sum_j w_{ij} y^j(t-1)",
+    r"\frac{\partial E}{\partial w_{ij}} = \sum_t \delta_i(t) y^j(t-1)",
+    r"\delta_i(t) = f'\left(net_i(t)\right) \sum_k w_{ki} \delta_k(t+1)",
+    r"\begin{array}{cc} w_{11} & w_{12} \\ w_{21} & w_{22} \end{array}",
+    r"x_{1000} = 2000 + 1111 \cdot 1001",
+]
+
+
+def load_formulas():
+    with open(TEST_MD, "r", encoding="utf8") as file:
+        return re.findall(r"\$([^$]+)\$", file.read()) + EXTRA_FORMULAS
+
+
+def main():
+    total_before = [0, 0]
+    total_after = [0, 0]
+    for formula in load_formulas():
+        elem = HtmlRender().render(parse_formula(formula), 1)
+        before = DisplayList.from_element(elem, merge_glyph_runs=False).get_output_size()
+        after = DisplayList.from_element(elem, merge_glyph_runs=True).get_output_size()
+        for i in range(0, 2):
+            total_before[i] += before[i]
+            total_after[i] += after[i]
+        print("{0:>4} -> {1:>4} nodes {2:>6} -> {3:>6} bytes  {4}".format(
+            before[0], after[0], before[1], after[1], formula[:48]))
+    print("total: {0} -> {1} nodes, {2} -> {3} bytes".format(
+        total_before[0], total_after[0], total_before[1], total_after[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import timeit
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import parse_formula
+
+
+def make_array(rows, columns, ragged=False):
+    lines = []
+    cells = 0
+    for i in range(0, rows):
+        count = max(columns - i % 3 if ragged else columns, 1)
+        lines.append(" & ".join("a_{{{0}{1}}}".format(i, j) for j in range(0, count)))
+        cells += count
+    return r"\begin{array}{c} " + r" \\ ".join(lines) + r" \end{array}", cells
+
+
+def main():
+    for size in (4, 8, 16, 32, 64):
+        for ragged in (False, True):
+            source, cells = make_array(size, size, ragged)
+            ast = parse_formula(source)
+            render = HtmlRender()
+            render.layout_cache = None
+            number = max(1, 2000 // cells)
+            seconds = timeit.timeit(lambda: render.render(ast, 1), number=number) / number
+            print("{0:>2}x{0:<2} {1:<7} {2:>5} cells: {3:.6f} s, {4:.2f} us per cell".format(
+                size, "ragged" if ragged else "dense", cells, seconds, seconds / cells * 1e6))
+
+
+if __name__ == "__main__":
+    main()
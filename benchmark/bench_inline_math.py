@@ -0,0 +1,59 @@
+import timeit
+import markdown
+from markdown.inlinepatterns import Pattern
+from mathtex.mdextension import MATH_TEX_INLINE_REG_PATTERN
+from mathtex.mdextension import MathTexExtension
+from mathtex.mdextension import MathTexInlinePattern
+
+
+class LegacyMathTexInlinePattern(Pattern):
+    # The former extraction: a Pattern is matched as "^(.*?)<pattern>(.*)$" against the remaining text.
+    def __init__(self, inline_pattern):
+        super(LegacyMathTexInlinePattern, self).__init__(MATH_TEX_INLINE_REG_PATTERN)
+        self.inline_pattern = inline_pattern
+
+    def handleMatch(self, m):
+        return self.inline_pattern.context.get_element(m.group(2))
+
+
+def make_paragraph(formulas):
+    # Few distinct formulas, so that the render context cache leaves mostly the extraction cost.
+    return " ".join("the term $x_{0}^2$ is".format(i % 10) for i in range(0, formulas))
+
+
+def create_markdown(legacy):
+    md = markdown.Markdown(extensions=[MathTexExtension()])
+    if legacy:
+        inline_pattern = md.inlinePatterns["mathtex"]
+        md.inlinePatterns.register(LegacyMathTexInlinePattern(inline_pattern), "mathtex", 200)
+    return md
+
+
+def measure(md, text):
+    number = 3
+    return min(timeit.repeat(lambda: md.reset().convert(text), number=number, repeat=3)) / number
+
+
+def main():
+    print("{0:>9} {1:>14} {2:>14} {3:>14} {4:>14}".format(
+        "formulas", "legacy (s)", "us / formula", "processor (s)", "us / formula"))
+    legacy_md = create_markdown(True)
+    md = create_markdown(False)
+    assert isinstance(md.inlinePatterns["mathtex"], MathTexInlinePattern)
+    first = None
+    for formulas in (100, 200, 400, 800):
+        text = make_paragraph(formulas)
+        assert legacy_md.reset().convert(text) == md.reset().convert(text)
+        legacy_seconds = measure(legacy_md, text)
+        seconds = measure(md, text)
+        if first is None:
+            first = (legacy_seconds / formulas, seconds / formulas)
+        print("{0:>9} {1:>14.4f} {2:>14.1f} {3:>14.4f} {4:>14.1f}".format(
+            formulas, legacy_seconds, legacy_seconds / formulas * 1e6, seconds, seconds / formulas * 1e6))
+    # Linear extraction keeps the per-formula cost flat as the paragraph grows.
+    print("per-formula cost ratio (largest / smallest): legacy {0:.2f}, processor {1:.2f}".format(
+        legacy_seconds / formulas / first[0], seconds / formulas / first[1]))
+
+
+if __name__ == "__main__":
+    main()
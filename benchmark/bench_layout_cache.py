@@ -0,0 +1,38 @@
+import timeit
+from mathtex.htmlrender import HtmlRender
+from mathtex.htmlrender import LAYOUT_CACHE
+from mathtex.parser import parse_formula
+
+DOCUMENT = [
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"net_i(t) = \sum_j w_{ij} y^j(t-1)",
+    r"\frac{\partial E}{\partial w_{ij}} = \sum_t \delta_i(t) y^j(t-1)",
+    r"\delta_i(t) = f'\left(net_i(t)\right) \sum_k w_{ki} \delta_k(t+1)",
+    r"\begin{array}{cc} w_{11} & w_{12} \\ w_{21} & w_{22} \end{array}",
+]
+
+
+def render_document(layout_cache):
+    for formula in DOCUMENT:
+        render = HtmlRender()
+        render.layout_cache = layout_cache
+        render.render(parse_formula(formula), 1).to_html_div()
+
+
+def main():
+    for formula in DOCUMENT:
+        parse_formula(formula)
+    number = 200
+    uncached = timeit.timeit(lambda: render_document(None), number=number) / number
+    LAYOUT_CACHE.clear()
+    render_document(LAYOUT_CACHE)
+    print("first document: {0} hits, {1} misses".format(LAYOUT_CACHE.hits, LAYOUT_CACHE.misses))
+    cached = timeit.timeit(lambda: render_document(LAYOUT_CACHE), number=number) / number
+    print("uncached: {0:.6f} s per document".format(uncached))
+    print("cached:   {0:.6f} s per document".format(cached))
+    print("hit rate {0:.1%}, {1} entries, {2} evictions".format(
+        LAYOUT_CACHE.hit_rate(), len(LAYOUT_CACHE), LAYOUT_CACHE.evictions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import timeit
+import markdown
+from mathtex.mdextension import MathTexExtension
+from mathtex.util import LRUCache
+
+FORMULAS = [
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"\frac{\partial E}{\partial w_{ij}}",
+    r"\delta_i(t)",
+    r"w_{ij}",
+]
+
+
+def make_document(repeats):
+    paragraphs = []
+    for i in range(0, repeats):
+        paragraphs.append("Step {0}: ".format(i) + " and ".join("${0}$".format(f) for f in FORMULAS))
+    return "\n\n".join(paragraphs)
+
+
+def convert(text, cache_elements):
+    extension = MathTexExtension()
+    md = markdown.Markdown(extensions=[extension])
+    if not cache_elements:
+        extension.context.elements = LRUCache(0)
+    return md.convert(text)
+
+
+def main():
+    for repeats in (1, 10, 100):
+        text = make_document(repeats)
+        assert convert(text, True) == convert(text, False)
+        number = max(1, 100 // repeats)
+        uncached = timeit.timeit(lambda: convert(text, False), number=number) / number
+        cached = timeit.timeit(lambda: convert(text, True), number=number) / number
+        print("{0:>4} formulas: {1:.4f} s rendering each, {2:.4f} s with the render context cache".format(
+            repeats * len(FORMULAS), uncached, cached))
+
+
+if __name__ == "__main__":
+    main()
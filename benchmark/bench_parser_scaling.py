@@ -0,0 +1,37 @@
+import timeit
+from mathtex.parser import MathTexParser
+from tests.test_parser_scaling import array_formula
+from tests.test_parser_scaling import nested_formula
+
+
+def parse(text):
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(text)
+    return parser.end_parse()
+
+
+def measure(name, build, sizes):
+    print(name)
+    print("{0:>8} {1:>12} {2:>14}".format("size", "time (s)", "us per item"))
+    first = None
+    for size in sizes:
+        text = build(size)
+        number = 5
+        seconds = min(timeit.repeat(lambda: parse(text), number=number, repeat=3)) / number
+        per_item = seconds / size
+        if first is None:
+            first = per_item
+        print("{0:>8} {1:>12.6f} {2:>14.3f}".format(size, seconds, per_item * 1e6))
+    # A linear parser keeps the per-item cost flat as the input grows.
+    print("per-item cost ratio (largest / smallest): {0:.2f}\n".format(per_item / first))
+
+
+def main():
+    measure("array cells", array_formula, [1250, 2500, 5000, 10000])
+    measure("array cells, one column", lambda n: array_formula(n, columns=1), [1250, 2500, 5000, 10000])
+    measure("nesting depth", nested_formula, [125, 250, 500, 1000])
+
+
+if __name__ == "__main__":
+    main()
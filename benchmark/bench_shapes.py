@@ -0,0 +1,35 @@
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import parse_formula
+from mathtex.shapes import SHAPE_CACHE
+
+FORMULAS = [
+    r"\left\{ \frac{a}{b} \right\}",
+    r"\left( \sum_j w_{ij} y^j(t-1) \right)",
+    r"\sqrt{x_1^2 + x_2^2} + \sqrt{\frac{1}{2}}",
+    r"\left[ \begin{array}{cc} a & b \\ c & d \end{array} \right]",
+    r"\left\{ \begin{array}{c} x + y = 1 \\ x - y = 2 \end{array} \right.",
+]
+
+
+def count_elements(html):
+    return html.count("</")
+
+
+def main():
+    document = FORMULAS * 50
+    for svg_shapes in (False, True):
+        render = HtmlRender()
+        render.svg_shapes = svg_shapes
+        SHAPE_CACHE.clear()
+        elements = size = 0
+        for formula in document:
+            html = render.render_display_list(parse_formula(formula), 1).to_html_div()
+            elements += count_elements(html)
+            size += len(html.encode("utf8"))
+        print("{0}: {1} elements, {2} bytes for {3} formulas".format(
+            "svg shapes" if svg_shapes else "css shapes", elements, size, len(document)))
+    print("shape cache: {0} entries, hit rate {1:.1%}".format(len(SHAPE_CACHE), SHAPE_CACHE.hit_rate()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Cold-start cost of the markdown entry point, measured in fresh interpreters with -X importtime.
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+TEST_MD = os.path.join(ROOT, "test.md")
+
+IMPORT_ONLY = "import mathtex.markdown"
+RENDER = ("from mathtex.markdown import parse_markdown\n"
+          "with open({0!r}, encoding='utf8') as file:\n"
+          "    parse_markdown(file.read())").format(TEST_MD)
+
+
+def run(code):
+    # Returns the wall time and the -X importtime records as (self us, cumulative us, depth, module).
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    wall = time.perf_counter() - start
+    records = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return wall, records
+
+
+def report(title, code, runs=5):
+    samples = [run(code) for i in range(0, runs)]
+    walls = [wall for wall, records in samples]
+    imports = [sum(record[0] for record in records) for wall, records in samples]
+    print("{0}: {1:.1f} ms wall, {2:.1f} ms in imports (median of {3})".format(
+        title, statistics.median(walls) * 1000, statistics.median(imports) / 1000, runs))
+    # The most expensive top level imports of the last run
+    top = sorted((record for record in samples[-1][1] if record[2] == 0), reverse=True, key=lambda r: r[1])
+    for self_us, cumulative_us, depth, name in top[:6]:
+        print("  {0:>8.1f} ms  {1}".format(cumulative_us / 1000, name))
+
+
+def main():
+    report("import mathtex.markdown", IMPORT_ONLY)
+    report("render test.md", RENDER)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import random
+import timeit
+from mathtex import fontmetric
+from mathtex.fontmetric import FONT_METRICS
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789+-=()αβγ∑"
+
+
+def main():
+    if not fontmetric.load_numpy():
+        print("NumPy is not installed, only the scalar path is available")
+        return
+    random.seed(0)
+    print("{0:>8} {1:>12} {2:>12}".format("length", "scalar (us)", "numpy (us)"))
+    for length in [1, 2, 4, 8, 16, 32, 48, 64, 128, 256, 1024, 4096]:
+        text = "".join(random.choice(ALPHABET) for _ in range(length))
+        scalar_width, scalar_offsets = FONT_METRICS.measure_text_scalar(text)
+        numpy_width, numpy_offsets = FONT_METRICS.measure_text_numpy(text)
+        assert abs(scalar_width - numpy_width) < 1e-9
+        assert all(abs(a - b) < 1e-9 for a, b in zip(scalar_offsets, numpy_offsets))
+        number = max(10, 20000 // length)
+        scalar = timeit.timeit(lambda: FONT_METRICS.measure_text_scalar(text), number=number) / number
+        vector = timeit.timeit(lambda: FONT_METRICS.measure_text_numpy(text), number=number) / number
+        print("{0:>8} {1:>12.2f} {2:>12.2f}{3}".format(
+            length, scalar * 1e6, vector * 1e6, "  <- numpy" if vector < scalar else ""))
+    print("runs of at least {0} characters use NumPy".format(fontmetric.NUMPY_MIN_LENGTH))
+
+
+if __name__ == "__main__":
+    main()
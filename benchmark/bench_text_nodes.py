@@ -0,0 +1,66 @@
+import os
+import re
+import timeit
+from mathtex.astree import MathTexAST
+from mathtex.parser import MathTexParser
+
+TEST_MD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test.md")
+RE_INLINE_MATH = re.compile(r"\$([^$]+)\$")
+SYNTHETIC = [
+    r"x = 3.14159265358979323846264338327950288419716939937510",
+    r"\mathrm{velocity} = \mathrm{distance} / \mathrm{time}",
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"\begin{array}{cc} 1024 & 2048 \\ 4096 & 8192 \end{array}",
+]
+
+
+class PerCharacterParser(MathTexParser):
+    # Text handling used before text runs: one node per character.
+    def do_text(self, text):
+        for c in text:
+            self.stack.append(MathTexAST.text_node(c))
+
+
+class NodeCounter:
+    def __init__(self):
+        self.count = 0
+        self.original_init = MathTexAST.__init__
+
+    def __enter__(self):
+        original_init = self.original_init
+
+        def counting_init(node, node_type):
+            self.count += 1
+            original_init(node, node_type)
+        MathTexAST.__init__ = counting_init
+        return self
+
+    def __exit__(self, *args):
+        MathTexAST.__init__ = self.original_init
+
+
+def parse(parser_class, text):
+    parser = parser_class()
+    parser.begin_parse()
+    parser.parse_line(text)
+    return parser.end_parse()
+
+
+def load_corpus():
+    with open(TEST_MD, "r", encoding="utf8") as file:
+        return RE_INLINE_MATH.findall(file.read()) + SYNTHETIC
+
+
+def main():
+    corpus = load_corpus()
+    print("{0:>20} {1:>10} {2:>12}".format("parser", "nodes", "time (s)"))
+    for parser_class in [PerCharacterParser, MathTexParser]:
+        with NodeCounter() as counter:
+            for formula in corpus:
+                parse(parser_class, formula)
+        seconds = timeit.timeit(lambda: [parse(parser_class, f) for f in corpus], number=200) / 200
+        print("{0:>20} {1:>10} {2:>12.6f}".format(parser_class.__name__, counter.count, seconds))
+
+
+if __name__ == "__main__":
+    main()
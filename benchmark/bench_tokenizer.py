@@ -0,0 +1,78 @@
+import re
+import timeit
+from mathtex.parser import MathTexParser
+
+RE_CMD = re.compile(r"\\([A-Za-z]+|.)", re.DOTALL)
+RE_BEGIN_ENV = re.compile(r"\\begin\{([A-Za-z]+)\}")
+RE_END_ENV = re.compile(r"\\end\{([A-Za-z]+)\}")
+RE_WHITESPACE = re.compile(r"\s+")
+RE_COMMENT = re.compile(r"%.*")
+
+FORMULA = r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right) + \frac{\alpha}{\sqrt{x_1^2 + x_2^2}} "
+
+
+class LegacyParser(MathTexParser):
+    # The per-position regex chain used before the single-pass tokenizer.
+    def parse_line(self, line):
+        m = None
+        line_len = len(line)
+        start_pos = 0
+        while start_pos < line_len:
+            if m is not None:
+                start_pos = m.end()
+            if start_pos >= line_len:
+                break
+            m = RE_WHITESPACE.match(line, start_pos)
+            if m is not None:
+                continue
+            m = RE_COMMENT.match(line, start_pos)
+            if m is not None:
+                continue
+            m = RE_BEGIN_ENV.match(line, start_pos)
+            if m is not None:
+                self.begin_env(m.group(1))
+                continue
+            m = RE_END_ENV.match(line, start_pos)
+            if m is not None:
+                self.end_env()
+                continue
+            m = RE_CMD.match(line, start_pos)
+            if m is not None:
+                self.do_command(m.group(1))
+                continue
+            self.do_char(line[start_pos])
+            start_pos += 1
+
+    def do_char(self, c):
+        if c == "{":
+            self.begin_block()
+        elif c == "}":
+            self.end_block()
+        elif c == "_" or c == "^":
+            self.push_command(c, 1)
+        elif c == "&":
+            self.end_cell(True)
+        else:
+            self.do_text(c)
+
+
+def parse(parser_class, text):
+    parser = parser_class()
+    parser.begin_parse()
+    parser.parse_line(text)
+    return parser.end_parse()
+
+
+def main():
+    print("{0:>8} {1:>12} {2:>12} {3:>8}".format("chars", "legacy (s)", "tokens (s)", "speedup"))
+    for repeat in [1, 10, 100, 1000]:
+        text = FORMULA * repeat
+        assert str(parse(LegacyParser, text)) == str(parse(MathTexParser, text))
+        number = max(1, 1000 // repeat)
+        legacy = timeit.timeit(lambda: parse(LegacyParser, text), number=number) / number
+        tokens = timeit.timeit(lambda: parse(MathTexParser, text), number=number) / number
+        print("{0:>8} {1:>12.6f} {2:>12.6f} {3:>7.2f}x".format(len(text), legacy, tokens, legacy / tokens))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import hashlib
 from typing import List
+from mathtex.util import walk_tree
 
 
 class MathTexAST:
@@ -11,15 +13,22 @@ class MathTexAST:
     CMD_LEFT_RIGHT = "left+right"
     CMD_SUB_SUP = "sub+sup"
     ROOT_ENV = "ROOT_ENV"
+    NO_CHILDREN = ()  # shared by all leaf nodes; nodes with children get their own list
+
+    # Whole documents of parsed formulas are kept in memory, so nodes carry no __dict__.
+    __slots__ = ("children", "text", "env_name", "command", "arg_number", "node_type", "parameter", "lowered",
+                 "fingerprint")
 
     def __init__(self, node_type):
-        self.children = []  # type: List[MathTexAST]
+        self.children = MathTexAST.NO_CHILDREN  # type: List[MathTexAST]
         self.text = ""
         self.env_name = ""
         self.command = ""
         self.arg_number = 0
         self.node_type = node_type
         self.parameter = ""
+        self.lowered = False
+        self.fingerprint = None  # type: bytes
 
     @staticmethod
     def block_node(children):
@@ -57,92 +66,195 @@ class MathTexAST:
         node = MathTexAST(MathTexAST.CMD_NODE)
         node.command = cmd
         node.arg_number = arg_number
-        node.children = []
         return node
 
     def __str__(self):
-        sub_nodes = ",".join(map(lambda x: str(x), self.children))
-        if self.node_type == MathTexAST.BLOCK_NODE:
-            return "<Block: {0}>".format(sub_nodes)
-        elif self.node_type == MathTexAST.CELL_NODE:
-            return "<Cell: {0}>".format(sub_nodes)
-        elif self.node_type == MathTexAST.ENV_NODE:
-            return "<Env {0}: {1}>".format(self.env_name, sub_nodes)
-        elif self.node_type == MathTexAST.LINE_NODE:
-            return "<Line: {0}>".format(sub_nodes)
-        elif self.node_type == MathTexAST.TEXT_NODE:
-            return "<Text: {0}>".format(self.text)
-        elif self.node_type == MathTexAST.CMD_NODE:
-            return "<Cmd {0}: {1}>".format(self.command, sub_nodes)
+        return "".join(map(str, walk_tree(self, MathTexAST.expand_str)))
+
+    @staticmethod
+    def expand_str(item):
+        if not isinstance(item, MathTexAST):
+            return None
+        if item.node_type == MathTexAST.BLOCK_NODE:
+            head = "<Block: "
+        elif item.node_type == MathTexAST.CELL_NODE:
+            head = "<Cell: "
+        elif item.node_type == MathTexAST.ENV_NODE:
+            head = "<Env {0}: ".format(item.env_name)
+        elif item.node_type == MathTexAST.LINE_NODE:
+            head = "<Line: "
+        elif item.node_type == MathTexAST.TEXT_NODE:
+            return ["<Text: {0}>".format(item.text)]
+        elif item.node_type == MathTexAST.CMD_NODE:
+            head = "<Cmd {0}: ".format(item.command)
         else:
-            return "<MathTexAST Unknown>"
+            return ["<MathTexAST Unknown>"]
+        expanded = [head]
+        for i in range(0, len(item.children)):
+            if i > 0:
+                expanded.append(",")
+            expanded.append(item.children[i])
+        expanded.append(">")
+        return expanded
 
     def get_first_string(self) -> str:
-        if self.node_type == MathTexAST.TEXT_NODE or len(self.children) < 1:
-            return self.text
-        else:
-            return self.children[0].get_first_string()
+        node = self
+        while node.node_type != MathTexAST.TEXT_NODE and len(node.children) > 0:
+            node = node.children[0]
+        return node.text
 
     def get_all_string(self):
-        if self.node_type == MathTexAST.TEXT_NODE or len(self.children) < 1:
-            return self.text
-        all_string = ""
-        for child in self.children:
-            all_string += child.get_all_string()
-        return all_string
-
-    def prepare_render(self):
-        self.prepare_render_special_command()
-        self.prepare_render_special_env()
-
-    def prepare_render_special_env(self):
+        return "".join(node.text for node in walk_tree(self, MathTexAST.expand_string_children))
+
+    @staticmethod
+    def expand_string_children(node):
+        if node.node_type == MathTexAST.TEXT_NODE or len(node.children) < 1:
+            return None
+        return [child for child in node.children if child is not None]
+
+    def get_fingerprint(self) -> bytes:
+        # A digest of the subtree's structure and text, e.g. to recognize repeated subexpressions.
+        # SHA-1 rather than BLAKE2, which hashlib only has since Python 3.6.
+        # It is stored on the nodes, so it must only be used on trees that are no longer modified.
+        if self.fingerprint is not None:
+            return self.fingerprint
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if not visited:
+                stack.append((node, True))
+                for child in node.children:
+                    if isinstance(child, MathTexAST) and child.fingerprint is None:
+                        stack.append((child, False))
+                continue
+            digest = hashlib.sha1()
+            digest.update("{0}\0{1}\0{2}\0{3}\0{4}\0{5}\0".format(
+                node.node_type, node.text, node.env_name, node.command, node.arg_number, node.parameter
+            ).encode("utf8"))
+            for child in node.children:
+                if isinstance(child, MathTexAST):
+                    digest.update(child.fingerprint)
+                else:
+                    digest.update(hashlib.sha1(repr(child).encode("utf8")).digest())
+            node.fingerprint = digest.digest()
+        return self.fingerprint
+
+    def lower(self) -> "MathTexAST":
+        # Builds the render IR: a new tree in which "_"/"^" are folded into "sub+sup" commands,
+        # "\\left ... \\right" into "left+right" commands and the array parameter is moved to
+        # the env node. The tree itself is not modified, and the IR is never modified by the
+        # renderer, so both can be shared between render passes and threads.
+        if self.lowered:
+            return self
+        lowered = {}  # id of a source node -> its lowered copy
+        stripped_cells = set()  # ids of the cells whose first child is the array parameter
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if not visited:
+                stack.append((node, True))
+                cell = node.get_array_parameter_cell()
+                if cell is not None:
+                    stripped_cells.add(id(cell))
+                for child in node.get_source_children(stripped_cells):
+                    if isinstance(child, MathTexAST):
+                        stack.append((child, False))
+                continue
+            new_node = MathTexAST(node.node_type)
+            new_node.text = node.text
+            new_node.env_name = node.env_name
+            new_node.command = node.command
+            new_node.arg_number = node.arg_number
+            new_node.lowered = True
+            if len(node.children) > 0:
+                new_node.children = [lowered.pop(id(child)) if isinstance(child, MathTexAST) else child
+                                     for child in node.get_source_children(stripped_cells)]
+            cell = node.get_array_parameter_cell()
+            if cell is not None:
+                new_node.parameter = cell.children[0].get_all_string()
+            if node.node_type == MathTexAST.BLOCK_NODE or node.node_type == MathTexAST.CELL_NODE:
+                new_node.children = MathTexAST.lower_special_command(new_node.children)
+            lowered[id(node)] = new_node
+        root = lowered[id(self)]
+        MathTexAST.freeze_children(root)
+        return root
+
+    @staticmethod
+    def freeze_children(root):
+        # The IR is shared, e.g. by parser.PARSE_CACHE, so its children lists become tuples.
+        stack = [root]
+        while len(stack) > 0:
+            node = stack.pop()
+            if isinstance(node.children, list):
+                node.children = tuple(node.children)
+            stack.extend(child for child in node.children if isinstance(child, MathTexAST))
+
+    def get_source_children(self, stripped_cells):
+        if id(self) in stripped_cells:
+            return self.children[1:]
+        return self.children
+
+    def get_array_parameter_cell(self):
         if self.node_type != MathTexAST.ENV_NODE or self.env_name != "array":
-            return
+            return None
         if self.children is None or len(self.children) < 1:
-            return
+            return None
         line = self.children[0]
         if line is None or line.children is None or len(line.children) < 1:
-            return
+            return None
         cell = line.children[0]
         if cell is None or cell.children is None or len(cell.children) < 1:
-            return
-        parameter = cell.children[0]
-        if parameter.node_type == MathTexAST.BLOCK_NODE:
-            cell.children = cell.children[1:]
-            self.parameter = parameter.get_all_string()
+            return None
+        if isinstance(cell.children[0], MathTexAST) and cell.children[0].node_type == MathTexAST.BLOCK_NODE:
+            return cell
+        return None
+
+    @staticmethod
+    def lowered_command_node(cmd, children):
+        node = MathTexAST.command_node(cmd, len(children))
+        node.children = children
+        node.lowered = True
+        return node
 
-    def prepare_render_special_command(self):
+    @staticmethod
+    def get_delimiter(node):
+        if len(node.children) > 0:
+            return node.children[0]
+        return MathTexAST.text_node("")
+
+    @staticmethod
+    def lower_special_command(children):
         stack = []  # type: List[MathTexAST]
-        if self.children is None or len(self.children) < 2:
-            return
-        if self.node_type != MathTexAST.BLOCK_NODE and self.node_type != MathTexAST.CELL_NODE:
-            return
-        for child in self.children:
+        lefts = []  # stack indices of the open \left commands, innermost last
+        for child in children:
             if child.command == "_" or child.command == "^":
-                if len(stack) > 0:
+                slot = 1 if child.command == "^" else 2
+                if len(stack) == 0 or (len(lefts) > 0 and lefts[-1] == len(stack) - 1):
+                    top = MathTexAST.text_node("")  # a leading script gets an empty base, like "{}_x"
+                else:
                     top = stack.pop()
-                    if top.command == MathTexAST.CMD_SUB_SUP:
-                        new_cmd = top
-                    else:
-                        new_cmd = MathTexAST.command_node(MathTexAST.CMD_SUB_SUP, 3)
-                        new_cmd.children = [top, None, None]
-                    if child.command == "^" and len(child.children) > 0:
-                        new_cmd.children[1] = child.children[0]
-                    elif len(child.children) > 0:
-                        new_cmd.children[2] = child.children[0]
-                    stack.append(new_cmd)
+                if top.command == MathTexAST.CMD_SUB_SUP and top.children[slot] is None:
+                    new_cmd = top
+                else:
+                    # A second script of the same kind stacks on the first instead of replacing it.
+                    new_cmd = MathTexAST.lowered_command_node(MathTexAST.CMD_SUB_SUP, [top, None, None])
+                if len(child.children) > 0:
+                    new_cmd.children[slot] = child.children[0]
+                stack.append(new_cmd)
+            elif child.command == "left":
+                lefts.append(len(stack))
+                stack.append(child)
             elif child.command == "right":
-                inner = []
-                while len(stack) > 0:
-                    top = stack.pop()
-                    if top.command == "left":
-                        new_cmd = MathTexAST.command_node(MathTexAST.CMD_LEFT_RIGHT, 3)
-                        new_block = MathTexAST.block_node(inner)
-                        new_cmd.children = [top.children[0], child.children[0], new_block]
-                        stack.append(new_cmd)
-                        break
-                    else:
-                        inner.insert(0, top)
+                if len(lefts) == 0:
+                    continue  # an unmatched \right is dropped, the content before it is kept
+                begin_index = lefts.pop()
+                left = stack[begin_index]
+                new_block = MathTexAST.block_node(stack[begin_index + 1:])
+                new_block.lowered = True
+                del stack[begin_index:]
+                stack.append(MathTexAST.lowered_command_node(
+                    MathTexAST.CMD_LEFT_RIGHT,
+                    [MathTexAST.get_delimiter(left), MathTexAST.get_delimiter(child), new_block]))
             else:
                 stack.append(child)
-        self.children = stack
+        return stack
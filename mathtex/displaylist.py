@@ -0,0 +1,200 @@
+from mathtex.fontmetric import FontMetrics
+from mathtex.shapes import get_shape_markup
+from mathtex.util import walk_tree
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+GLYPH = "glyph"
+RULE = "rule"
+SHAPE = "shape"
+
+# Positions closer than this (in em) are treated as equal when glyphs are merged into runs.
+RUN_TOLERANCE = 1e-9
+
+
+def format_number(value, precision=None) -> str:
+    # Python's float repr, or the value rounded to precision decimals without trailing zeros.
+    if precision is None:
+        return "{0}".format(value)
+    text = "{0:.{1}f}".format(value, precision)
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+class StyleSheet:
+    # Generated CSS classes for the declarations that repeat across the formulas of a page. Items emitted
+    # with a style sheet round their coordinates to its precision and only keep the left offset inline.
+    SHARED_PROPERTIES = ("top", "width", "height", "font-size", "letter-spacing")
+
+    def __init__(self, precision=3, prefix="m"):
+        self.precision = precision
+        self.prefix = prefix
+        self.classes = {}  # type: Dict[str, str]
+
+    def get_class(self, declaration: str) -> str:
+        css_class = self.classes.get(declaration)
+        if css_class is None:
+            css_class = "{0}{1}".format(self.prefix, len(self.classes))
+            self.classes[declaration] = css_class
+        return css_class
+
+    def apply(self, css_class: Optional[str], declarations: List[Tuple[str, str]]) -> Tuple[Optional[str], str]:
+        # Returns the class attribute and the inline style of an item.
+        classes = [] if css_class is None else [css_class]
+        style = ""
+        for name, value in declarations:
+            if name in self.SHARED_PROPERTIES:
+                classes.append(self.get_class("{0}:{1};".format(name, value)))
+            else:
+                style += "{0}:{1};".format(name, value)
+        return " ".join(classes) if len(classes) > 0 else None, style
+
+    def to_css(self) -> str:
+        return "".join(".math .{0} {{{1}}}\n".format(css_class, declaration)
+                       for declaration, css_class in self.classes.items())
+
+
+class DisplayItem:
+    __slots__ = ("kind", "x", "y", "width", "height", "font_size", "text", "css_class", "letter_spacing", "shape")
+
+    def __init__(self, kind, x, y, width=None, height=None, font_size=1, text=None, css_class=None,
+                 letter_spacing=0, shape=None):
+        self.kind = kind
+        self.x = x  # x-offset relative to the formula box
+        self.y = y  # y-offset relative to the formula box
+        self.width = width
+        self.height = height
+        self.font_size = font_size  # font-size relative to 1em
+        self.text = text
+        self.css_class = css_class
+        self.letter_spacing = letter_spacing  # extra space after every glyph of a run, relative to font-size
+        self.shape = shape  # shape drawn as inline SVG, see mathtex.shapes
+
+    def get_declarations(self, precision=None) -> List[Tuple[str, str]]:
+        declarations = [("left", format_number(self.x / self.font_size, precision) + "em"),
+                        ("top", format_number(self.y / self.font_size, precision) + "em")]
+        if self.width is not None:
+            declarations.append(("width", format_number(self.width, precision) + "em"))
+        if self.height is not None:
+            declarations.append(("height", format_number(self.height, precision) + "em"))
+        if self.font_size != 1:
+            declarations.append(("font-size", format_number(self.font_size, precision) + "em"))
+        if self.letter_spacing != 0:
+            declarations.append(("letter-spacing", format_number(self.letter_spacing, precision) + "em"))
+        return declarations
+
+    def get_style(self) -> str:
+        return "".join("{0}:{1};".format(name, value) for name, value in self.get_declarations())
+
+    def get_class_and_style(self, style_sheet: Optional[StyleSheet] = None) -> Tuple[Optional[str], str]:
+        if style_sheet is None:
+            return self.css_class, self.get_style()
+        return style_sheet.apply(self.css_class, self.get_declarations(style_sheet.precision))
+
+    def to_html(self, style_sheet: Optional[StyleSheet] = None) -> str:
+        css_class, style = self.get_class_and_style(style_sheet)
+        html_style = "" if style == "" and style_sheet is not None else ' style="{0}"'.format(style)
+        html_class = "" if css_class is None else ' class="{0}"'.format(css_class)
+        if self.shape is not None:
+            # The positioned element is the <svg> itself.
+            markup = get_shape_markup(self.shape, self.width, self.height)
+            return "<svg{0}{1}{2}".format(html_style, html_class, markup[len("<svg"):])
+        html_text = "" if self.text is None else self.text
+        return '<div{0}{1}>{2}</div>'.format(html_style, html_class, html_text)
+
+
+class DisplayList:
+    # The flat output of a layout: every glyph, rule and shape with its position in the formula box.
+    def __init__(self, width=0, height=0, baseline=0, font_metrics: Optional[FontMetrics] = None):
+        self.width = width
+        self.height = height
+        self.baseline = baseline
+        self.font_metrics = font_metrics  # metrics of the font the items were laid out with
+        self.items = []  # type: List[DisplayItem]
+
+    @staticmethod
+    def from_element(root, merge_glyph_runs=True, font_metrics: Optional[FontMetrics] = None) -> "DisplayList":
+        # font_metrics defaults to the metrics HtmlRender.render stored on the root.
+        if font_metrics is None:
+            font_metrics = root.font_metrics
+        display_list = DisplayList(root.width, root.height, root.baseline, font_metrics)
+        items = display_list.items
+        for elem, offset_x, offset_y in walk_tree((root, 0, 0), DisplayList.expand_offset_children):
+            if elem.text is not None:
+                kind = GLYPH
+            elif elem.css_class == "hline":
+                kind = RULE
+            elif elem.css_class is not None:
+                kind = SHAPE
+            else:
+                continue
+            items.append(DisplayItem(kind, elem.x + offset_x, elem.y + offset_y, elem.width, elem.height,
+                                     elem.font_size, elem.text, elem.css_class, shape=elem.shape))
+        if merge_glyph_runs:
+            display_list.merge_glyph_runs()
+        return display_list
+
+    @staticmethod
+    def expand_offset_children(item):
+        elem, offset_x, offset_y = item
+        if len(elem.children) == 0:
+            return None
+        offset_x += elem.x
+        offset_y += elem.y
+        return [(child, offset_x, offset_y) for child in elem.children]
+
+    def merge_glyph_runs(self, font_metrics: Optional[FontMetrics] = None):
+        # Consecutive glyphs of the same style on the same baseline are emitted as one text run when
+        # the browser would place them where the layout did: every gap between the advance widths must
+        # be the same, it becomes the letter-spacing of the run. Other glyphs keep their own element.
+        # Without the metrics of the layout font the advance widths are unknown and nothing is merged.
+        if font_metrics is None:
+            font_metrics = self.font_metrics
+        if font_metrics is None:
+            return
+        items = []
+        run = None
+        run_end = 0  # x where the browser puts the glyph after the run, without letter-spacing
+        spacing = None
+        for item in self.items:
+            if item.kind != GLYPH or item.text is None or len(item.text) != 1 \
+                    or not font_metrics.has_glyph(item.text):
+                items.append(item)
+                run = None
+                continue
+            if run is not None and run.font_size == item.font_size and run.css_class == item.css_class \
+                    and abs(run.y - item.y) <= RUN_TOLERANCE:
+                gap = item.x - run_end
+                if spacing is None or abs(gap - spacing) <= RUN_TOLERANCE:
+                    spacing = gap
+                    run.text += item.text
+                    run.letter_spacing = spacing / run.font_size
+                    run_end = item.x + font_metrics.get_glyph(item.text).width * item.font_size
+                    continue
+            run = DisplayItem(GLYPH, item.x, item.y, item.width, item.height, item.font_size, item.text,
+                              item.css_class)
+            run_end = item.x + font_metrics.get_glyph(item.text).width * item.font_size
+            spacing = None
+            items.append(run)
+        self.items = items
+
+    def get_output_size(self, style_sheet: Optional[StyleSheet] = None) -> Tuple[int, int]:
+        # Returns the number of emitted elements and the byte size of to_html_div(), to track the output cost.
+        return len(self.items) + 1, len(self.to_html_div(style_sheet).encode("utf8"))
+
+    def get_style(self, precision=None) -> str:
+        return 'width:{0}em;height:{1}em;vertical-align:{2}em;'.format(
+            format_number(self.width, precision), format_number(self.height, precision),
+            format_number(self.baseline - self.height, precision))
+
+    def to_html(self, style_sheet: Optional[StyleSheet] = None) -> str:
+        return '\n'.join(item.to_html(style_sheet) for item in self.items)
+
+    def to_html_div(self, style_sheet: Optional[StyleSheet] = None) -> str:
+        precision = None if style_sheet is None else style_sheet.precision
+        lines = ['<div class="math" style="{0}">'.format(self.get_style(precision)), self.to_html(style_sheet),
+                 "</div>"]
+        return '\n'.join(lines)
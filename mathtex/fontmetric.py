@@ -1,4 +1,49 @@
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_left
+from collections import Counter
+from mathtex.util import LRUCache
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+numpy = None  # imported by load_numpy() on first use, False when it is not installed
+
+# Text runs at least this long are measured with NumPy when it is installed,
+# see benchmark/bench_text_measure.py for the crossover.
+NUMPY_MIN_LENGTH = 32
+
+# Generated by tools/convert_fontmetric.py, see MetricsTable for the layout. Tables for other
+# fonts are generated from TrueType files by tools/ttf_metrics.py and added to FONT_REGISTRY.
+DEFAULT_FONT = "Lucida Sans Unicode"
+METRICS_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fontmetric.bin")
+METRICS_MAGIC = b"MTFM"
+METRICS_VERSION = 1
+# magic, version, number of glyph columns, number of rows, glyphCount, baseline, capsHeight, xHeight, height
+METRICS_HEADER = struct.Struct("<4sHHII4d")
+GLYPH_COLUMNS = ("width", "descent", "ascent", "left_bearing", "right_bearing")
+FALLBACK_CODE = 77  # char 'M' stands in for glyphs the font does not have
+PAGE_BITS = 8  # BMP lookups go through 256 pages of 256 codepoints, allocated when first used
+PAGE_MASK = (1 << PAGE_BITS) - 1
+
+
+def load_numpy():
+    global numpy
+    if numpy is None:
+        try:
+            import numpy as module
+            numpy = module
+        except ImportError:
+            numpy = False
+    return numpy
+
+
 class Glyph:
+    __slots__ = ("char", "name", "width", "descent", "ascent", "left_bearing", "right_bearing")
+
     def __init__(self, char, name, width, descent, ascent, left_bearing, right_bearing):
         self.char = char
         self.name = name
@@ -8,1760 +53,251 @@ class Glyph:
         self.left_bearing = left_bearing
         self.right_bearing = right_bearing
 
-GLYPHS = {}
+
+class MetricsTable:
+    # Glyph metrics as a header, the sorted uint32 codepoints padded to 8 bytes and one float64
+    # column per GLYPH_COLUMNS entry, all little-endian. The columns are read in place from the mmap.
+    def __init__(self, buffer):
+        magic, version, columns, rows, glyph_count, baseline, caps_height, x_height, height = \
+            METRICS_HEADER.unpack_from(buffer)
+        if magic != METRICS_MAGIC or version != METRICS_VERSION or columns != len(GLYPH_COLUMNS):
+            raise ValueError("unsupported font metrics table")
+        self.buffer = buffer
+        self.rows = rows
+        self.glyph_count = glyph_count
+        self.baseline = baseline
+        self.caps_height = caps_height
+        self.x_height = x_height
+        self.height = height
+        offset = METRICS_HEADER.size
+        self.codes = MetricsTable.read_column(buffer, offset, rows, "I")
+        offset += MetricsTable.get_padded_size(rows * 4)
+        self.columns = []
+        for i in range(0, columns):
+            self.columns.append(MetricsTable.read_column(buffer, offset, rows, "d"))
+            offset += rows * 8
+
+    @staticmethod
+    def get_padded_size(size):
+        return (size + 7) // 8 * 8
+
+    @staticmethod
+    def read_column(buffer, offset, rows, typecode):
+        size = rows * (4 if typecode == "I" else 8)
+        if sys.byteorder == "little":
+            return memoryview(buffer)[offset:offset + size].cast(typecode)
+        from array import array
+        column = array(typecode)
+        column.frombytes(buffer[offset:offset + size])
+        column.byteswap()
+        return column
+
+    @staticmethod
+    def load(path: str) -> "MetricsTable":
+        with open(path, "rb") as file:
+            return MetricsTable(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def write(path: str, font: Tuple[int, float, float, float, float], glyphs: Dict[int, Tuple[float, ...]]):
+        # font is (glyphCount, baseline, capsHeight, xHeight, height), glyphs maps codepoints to GLYPH_COLUMNS.
+        codes = sorted(glyphs)
+        data = bytearray(METRICS_HEADER.pack(METRICS_MAGIC, METRICS_VERSION, len(GLYPH_COLUMNS), len(codes), *font))
+        data += struct.pack("<{0}I".format(len(codes)), *codes)
+        data += bytes(MetricsTable.get_padded_size(len(data)) - len(data))
+        for i in range(0, len(GLYPH_COLUMNS)):
+            data += struct.pack("<{0}d".format(len(codes)), *(glyphs[code][i] for code in codes))
+        with open(path, "wb") as file:
+            file.write(data)
+
+    def find(self, code: int) -> int:
+        i = bisect_left(self.codes, code)
+        if i < self.rows and self.codes[i] == code:
+            return i
+        return -1
+
+    def get_glyph(self, i: int) -> Glyph:
+        return Glyph(chr(self.codes[i]), None, *(column[i] for column in self.columns))
 
 
 class FontMetrics:
-    def __init__(self):
-        self.glyphCount = 0
-        self.baseline = 0
-        self.capsHeight = 0
-        self.xHeight = 0
-        self.height = 0
-        self.glyphs = {}
+    # The metrics table is loaded on first use. Every codepoint is resolved once to its glyph, or to
+    # the fallback glyph when the font does not have it, and kept in a page of the dense BMP table
+    # or in the dict for the other planes.
+    def __init__(self, path=METRICS_TABLE_PATH, family: Optional[str] = None):
+        self.path = path
+        self.family = family  # CSS font-family of the font the table was generated from
+        self.table = None  # type: Optional[MetricsTable]
+        self.pages = [None] * (0x10000 >> PAGE_BITS)  # type: List[Optional[List[Optional[Glyph]]]]
+        self.astral_glyphs = {}  # type: Dict[int, Glyph]
+        # codepoint -> number of characters measured by measure_text() with the fallback glyph,
+        # counted on every call, also when the measure comes from the cache
+        self.missing_glyphs = Counter()
+        self.pair_overlaps = {}  # two-character string -> bearing overlap removed between them
+        # (text, char_margin) -> (width, offsets, codepoints of the missing characters)
+        self.text_measures = LRUCache(8192)  # type: LRUCache[Tuple[float, Tuple[float, ...], Tuple[int, ...]]]
+        self.glyph_arrays = None  # codepoint-indexed (width, left_bearing, right_bearing) NumPy arrays
+
+    def get_table(self) -> MetricsTable:
+        if self.table is None:
+            self.table = MetricsTable.load(self.path)
+        return self.table
+
+    @property
+    def glyphCount(self):
+        return self.get_table().glyph_count
+
+    @property
+    def baseline(self):
+        return self.get_table().baseline
+
+    @property
+    def capsHeight(self):
+        return self.get_table().caps_height
+
+    @property
+    def xHeight(self):
+        return self.get_table().x_height
+
+    @property
+    def height(self):
+        return self.get_table().height
+
+    def lookup(self, code: int) -> Glyph:
+        if code < 0x10000:
+            page = self.pages[code >> PAGE_BITS]
+            if page is not None:
+                glyph = page[code & PAGE_MASK]
+                if glyph is not None:
+                    return glyph
+        else:
+            glyph = self.astral_glyphs.get(code)
+            if glyph is not None:
+                return glyph
+        return self.resolve(code)
+
+    def resolve(self, code: int) -> Glyph:
+        table = self.get_table()
+        i = table.find(code)
+        if i >= 0:
+            glyph = table.get_glyph(i)
+        elif code != FALLBACK_CODE:
+            glyph = self.lookup(FALLBACK_CODE)
+        else:
+            raise ValueError("font metrics '{0}' have no fallback glyph".format(self.path))
+        if code < 0x10000:
+            page = self.pages[code >> PAGE_BITS]
+            if page is None:
+                page = self.pages[code >> PAGE_BITS] = [None] * (PAGE_MASK + 1)
+            page[code & PAGE_MASK] = glyph
+        else:
+            self.astral_glyphs[code] = glyph
+        return glyph
+
+    def has_glyph(self, char: str) -> bool:
+        return self.lookup(ord(char)).char == char
 
     def get_glyph(self, char: str) -> Glyph:
-        if char is not None and len(char) > 0:
-            c = char[0]
-            code = ord(c)
-            if code in self.glyphs:
-                return self.glyphs[code]
-        return self.glyphs[77]  # char 'M'
+        if char is None or len(char) == 0:
+            return self.lookup(FALLBACK_CODE)
+        c = char[0]
+        code = ord(c)
+        page = self.pages[code >> PAGE_BITS] if code < 0x10000 else None
+        glyph = page[code & PAGE_MASK] if page is not None else None
+        if glyph is None:
+            glyph = self.lookup(code)
+        return glyph
+
+    def get_pair_overlap(self, pair: str) -> float:
+        overlap = self.pair_overlaps.get(pair)
+        if overlap is None:
+            overlap = max(0, min(self.get_glyph(pair[0]).right_bearing, self.get_glyph(pair[1]).left_bearing))
+            self.pair_overlaps[pair] = overlap
+        return overlap
+
+    def measure_text(self, text: str, char_margin=0) -> Tuple[float, Tuple[float, ...]]:
+        # Returns the width and the x-offset of every character at font size 1.
+        key = (text, char_margin)
+        measure = self.text_measures.get(key)
+        if measure is None:
+            if len(text) >= NUMPY_MIN_LENGTH and load_numpy():
+                width, offsets = self.measure_text_numpy(text, char_margin)
+            else:
+                width, offsets = self.measure_text_scalar(text, char_margin)
+            measure = width, offsets, self.find_missing_codes(text)
+            self.text_measures.put(key, measure)
+        width, offsets, missing = measure
+        if len(missing) > 0:
+            self.missing_glyphs.update(missing)
+        return width, offsets
+
+    def find_missing_codes(self, text: str) -> Tuple[int, ...]:
+        return tuple(ord(c) for c in text if self.lookup(ord(c)).char != c)
+
+    def measure_text_scalar(self, text: str, char_margin=0) -> Tuple[float, Tuple[float, ...]]:
+        width = 0
+        offsets = []
+        for i in range(0, len(text)):
+            if i > 0:
+                width += char_margin
+                width -= self.get_pair_overlap(text[i - 1:i + 1])
+            offsets.append(width)
+            width += self.get_glyph(text[i]).width
+        return width, tuple(offsets)
+
+    def measure_text_numpy(self, text: str, char_margin=0) -> Tuple[float, Tuple[float, ...]]:
+        if len(text) == 0:
+            return 0, ()
+        if not load_numpy():
+            raise ImportError("measure_text_numpy needs NumPy")
+        if self.glyph_arrays is None:
+            self.glyph_arrays = self.build_glyph_arrays()
+        widths, left_bearings, right_bearings = self.glyph_arrays
+        codes = numpy.frombuffer(text.encode("utf-32-le"), dtype="<u4")  # little-endian on every host
+        in_range = codes < len(widths)
+        if not in_range.all():
+            codes = numpy.where(in_range, codes, FALLBACK_CODE)
+        glyph_widths = widths[codes]
+        overlaps = numpy.maximum(0, numpy.minimum(right_bearings[codes[:-1]], left_bearings[codes[1:]]))
+        offsets = numpy.zeros(len(codes))
+        numpy.cumsum(glyph_widths[:-1] + char_margin - overlaps, out=offsets[1:])
+        return float(offsets[-1] + glyph_widths[-1]), tuple(offsets.tolist())
+
+    def build_glyph_arrays(self):
+        table = self.get_table()
+        codes = numpy.asarray(table.codes)
+        size = int(codes[-1]) + 1
+        fallback = self.lookup(FALLBACK_CODE)
+        widths = numpy.full(size, fallback.width)
+        left_bearings = numpy.full(size, fallback.left_bearing)
+        right_bearings = numpy.full(size, fallback.right_bearing)
+        widths[codes] = table.columns[GLYPH_COLUMNS.index("width")]
+        left_bearings[codes] = table.columns[GLYPH_COLUMNS.index("left_bearing")]
+        right_bearings[codes] = table.columns[GLYPH_COLUMNS.index("right_bearing")]
+        return widths, left_bearings, right_bearings
+
+
+class FontRegistry:
+    # Metrics table files by font name. The metrics of a font are loaded when it is first
+    # asked for, and at most max_fonts of them are kept loaded.
+    def __init__(self, max_fonts=8):
+        self.paths = {}  # type: Dict[str, str]
+        self.fonts = LRUCache(max_fonts)  # type: LRUCache[FontMetrics]
 
+    def register(self, name: str, path: str):
+        self.paths[name] = path
+        self.fonts.remove(name)
 
-FONT_METRICS = FontMetrics()
+    def get_metrics(self, name: str = DEFAULT_FONT) -> FontMetrics:
+        metrics = self.fonts.get(name)
+        if metrics is None:
+            path = self.paths.get(name)
+            if path is None:
+                raise KeyError("no font metrics registered for '{0}'".format(name))
+            metrics = FontMetrics(path, name)
+            self.fonts.put(name, metrics)
+        return metrics
 
-FONT_METRICS.glyphCount = 1779
-FONT_METRICS.baseline = 1.0966796875
-FONT_METRICS.capsHeight = 0.72265625
-FONT_METRICS.xHeight = 0.5302734375
-FONT_METRICS.height = 1.53662109375
-FONT_METRICS.glyphs = GLYPHS
 
-GLYPHS[33] = Glyph('!', 'exclamation mark', 0.31640625, 0, 0.72265625, 0.10986328125, 0.1103515625)
-GLYPHS[34] = Glyph('"', 'quotation mark', 0.37353515625, -0.5302734375, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[35] = Glyph('#', 'number sign', 0.63232421875, 0, 0.72265625, 0.00732421875, 0.00732421875)
-GLYPHS[36] = Glyph('$', 'dollar sign', 0.63232421875, 0.06005859375, 0.783203125, 0.10546875, 0.1171875)
-GLYPHS[37] = Glyph('%', 'percent sign', 0.66845703125, 0.01806640625, 0.74072265625, 0.005859375, 0.005859375)
-GLYPHS[38] = Glyph('&', 'ampersand', 0.697265625, 0.01806640625, 0.74072265625, 0.0361328125, 0.04248046875)
-GLYPHS[39] = Glyph('\'', 'apostrophe', 0.22900390625, -0.505859375, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[40] = Glyph('(', 'left parenthesis', 0.3251953125, 0.14453125, 0.77099609375, 0.06005859375, 0.0361328125)
-GLYPHS[41] = Glyph(')', 'right parenthesis', 0.3251953125, 0.14453125, 0.77099609375, 0.0361328125, 0.06005859375)
-GLYPHS[42] = Glyph('*', 'asterisk', 0.48193359375, -0.36669921875, 0.72265625, 0.0537109375, 0.0537109375)
-GLYPHS[43] = Glyph('+', 'plus sign', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[44] = Glyph(',', 'comma', 0.31640625, 0.15673828125, 0.12060546875, 0.09765625, 0.09814453125)
-GLYPHS[45] = Glyph('-', 'hyphen-minus', 0.57861328125, -0.26513671875, 0.32470703125, 0.072265625, 0.07275390625)
-GLYPHS[46] = Glyph('.', 'full stop', 0.31640625, 0, 0.12060546875, 0.09765625, 0.09814453125)
-GLYPHS[47] = Glyph('/', 'solidus', 0.5244140625, 0.14453125, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[48] = Glyph('0', 'digit zero', 0.63232421875, 0.01806640625, 0.74072265625, 0.0634765625, 0.06298828125)
-GLYPHS[49] = Glyph('1', 'digit one', 0.63232421875, 0, 0.72900390625, 0.1474609375, 0.27392578125)
-GLYPHS[50] = Glyph('2', 'digit two', 0.63232421875, 0, 0.74072265625, 0.0830078125, 0.11572265625)
-GLYPHS[51] = Glyph('3', 'digit three', 0.63232421875, 0.01806640625, 0.74072265625, 0.1015625, 0.109375)
-GLYPHS[52] = Glyph('4', 'digit four', 0.63232421875, 0, 0.72265625, 0.05126953125, 0.06884765625)
-GLYPHS[53] = Glyph('5', 'digit five', 0.63232421875, 0.01806640625, 0.72265625, 0.12158203125, 0.11865234375)
-GLYPHS[54] = Glyph('6', 'digit six', 0.63232421875, 0.01806640625, 0.74072265625, 0.06689453125, 0.07177734375)
-GLYPHS[55] = Glyph('7', 'digit seven', 0.63232421875, 0, 0.72265625, 0.1083984375, 0.06005859375)
-GLYPHS[56] = Glyph('8', 'digit eight', 0.63232421875, 0.01806640625, 0.74072265625, 0.08642578125, 0.0625)
-GLYPHS[57] = Glyph('9', 'digit nine', 0.63232421875, 0.01806640625, 0.74072265625, 0.076171875, 0.06494140625)
-GLYPHS[58] = Glyph(':', 'colon', 0.31640625, 0, 0.5302734375, 0.10986328125, 0.1103515625)
-GLYPHS[59] = Glyph(';', 'semicolon', 0.31640625, 0.15673828125, 0.5302734375, 0.10986328125, 0.1103515625)
-GLYPHS[60] = Glyph('<', 'less-than sign', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[61] = Glyph('=', 'equals sign', 0.794921875, -0.1748046875, 0.404296875, 0.1083984375, 0.1083984375)
-GLYPHS[62] = Glyph('>', 'greater-than sign', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[63] = Glyph('?', 'question mark', 0.421875, 0, 0.74072265625, 0.01806640625, 0.01806640625)
-GLYPHS[64] = Glyph('@', 'commercial at', 0.8583984375, 0.01806640625, 0.74072265625, 0.04541015625, 0.0361328125)
-GLYPHS[65] = Glyph('A', 'latin capital letter a', 0.68994140625, 0, 0.72265625, 0.00830078125, 0.01123046875)
-GLYPHS[66] = Glyph('B', 'latin capital letter b', 0.5751953125, 0, 0.72265625, 0.09326171875, 0.04150390625)
-GLYPHS[67] = Glyph('C', 'latin capital letter c', 0.69189453125, 0.01806640625, 0.74072265625, 0.05078125, 0.0556640625)
-GLYPHS[68] = Glyph('D', 'latin capital letter d', 0.7490234375, 0, 0.72265625, 0.09326171875, 0.05078125)
-GLYPHS[69] = Glyph('E', 'latin capital letter e', 0.5419921875, 0, 0.72265625, 0.09326171875, 0.02392578125)
-GLYPHS[70] = Glyph('F', 'latin capital letter f', 0.5361328125, 0, 0.72265625, 0.09326171875, 0.0390625)
-GLYPHS[71] = Glyph('G', 'latin capital letter g', 0.72265625, 0.01806640625, 0.74072265625, 0.05078125, 0.08642578125)
-GLYPHS[72] = Glyph('H', 'latin capital letter h', 0.73486328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[73] = Glyph('I', 'latin capital letter i', 0.2880859375, 0, 0.72265625, 0.0927734375, 0.0927734375)
-GLYPHS[74] = Glyph('J', 'latin capital letter j', 0.31103515625, 0.14453125, 0.72265625, -0.08984375, 0.08984375)
-GLYPHS[75] = Glyph('K', 'latin capital letter k', 0.65283203125, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[76] = Glyph('L', 'latin capital letter l', 0.533203125, 0, 0.72265625, 0.09326171875, 0.01220703125)
-GLYPHS[77] = Glyph('M', 'latin capital letter m', 0.861328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[78] = Glyph('N', 'latin capital letter n', 0.73876953125, 0, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[79] = Glyph('O', 'latin capital letter o', 0.77685546875, 0.01806640625, 0.74072265625, 0.05078125, 0.05029296875)
-GLYPHS[80] = Glyph('P', 'latin capital letter p', 0.552734375, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[81] = Glyph('Q', 'latin capital letter q', 0.77685546875, 0.14453125, 0.74072265625, 0.05078125, -0.02294921875)
-GLYPHS[82] = Glyph('R', 'latin capital letter r', 0.63232421875, 0, 0.72265625, 0.09326171875, 0.01025390625)
-GLYPHS[83] = Glyph('S', 'latin capital letter s', 0.53857421875, 0.01806640625, 0.74072265625, 0.048828125, 0.0498046875)
-GLYPHS[84] = Glyph('T', 'latin capital letter t', 0.63232421875, 0, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[85] = Glyph('U', 'latin capital letter u', 0.69287109375, 0.01806640625, 0.72265625, 0.08740234375, 0.0869140625)
-GLYPHS[86] = Glyph('V', 'latin capital letter v', 0.65380859375, 0, 0.72265625, 0.017578125, 0.00439453125)
-GLYPHS[87] = Glyph('W', 'latin capital letter w', 0.85546875, 0, 0.72265625, 0.0009765625, 0.00146484375)
-GLYPHS[88] = Glyph('X', 'latin capital letter x', 0.6259765625, 0, 0.72265625, 0.0078125, 0.0263671875)
-GLYPHS[89] = Glyph('Y', 'latin capital letter y', 0.623046875, 0, 0.72265625, 0.00830078125, 0.0126953125)
-GLYPHS[90] = Glyph('Z', 'latin capital letter z', 0.6044921875, 0, 0.72265625, 0.04638671875, 0.046875)
-GLYPHS[91] = Glyph('[', 'left square bracket', 0.3251953125, 0.14453125, 0.77099609375, 0.09619140625, 0.0361328125)
-GLYPHS[92] = Glyph('\\', 'reverse solidus', 0.5244140625, 0.14453125, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[93] = Glyph(']', 'right square bracket', 0.3251953125, 0.14453125, 0.77099609375, 0.0361328125, 0.09619140625)
-GLYPHS[94] = Glyph('^', 'circumflex accent', 0.63232421875, -0.19287109375, 0.72265625, 0.05126953125, 0.05078125)
-GLYPHS[95] = Glyph('_', 'low line', 0.5, 0.072265625, 0, 0.0419921875, 0.04248046875)
-GLYPHS[96] = Glyph('`', 'grave accent', 0.6142578125, -0.62646484375, 0.783203125, 0.19287109375, 0.1923828125)
-GLYPHS[97] = Glyph('a', 'latin small letter a', 0.55224609375, 0.01220703125, 0.5419921875, 0.05029296875, 0.0244140625)
-GLYPHS[98] = Glyph('b', 'latin small letter b', 0.62939453125, 0.01220703125, 0.77099609375, 0.09619140625, 0.05419921875)
-GLYPHS[99] = Glyph('c', 'latin small letter c', 0.51220703125, 0.01220703125, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[100] = Glyph('d', 'latin small letter d', 0.62939453125, 0.01220703125, 0.77099609375, 0.05419921875, 0.09619140625)
-GLYPHS[101] = Glyph('e', 'latin small letter e', 0.55712890625, 0.01220703125, 0.5419921875, 0.05419921875, 0.06982421875)
-GLYPHS[102] = Glyph('f', 'latin small letter f', 0.36767578125, 0, 0.783203125, 0.0390625, -0.029296875)
-GLYPHS[103] = Glyph('g', 'latin small letter g', 0.62353515625, 0.20458984375, 0.5419921875, 0.05419921875, 0.09033203125)
-GLYPHS[104] = Glyph('h', 'latin small letter h', 0.62060546875, 0, 0.77099609375, 0.09619140625, 0.0908203125)
-GLYPHS[105] = Glyph('i', 'latin small letter i', 0.2890625, 0, 0.72265625, 0.09619140625, 0.0966796875)
-GLYPHS[106] = Glyph('j', 'latin small letter j', 0.30419921875, 0.20458984375, 0.72265625, -0.07470703125, 0.095703125)
-GLYPHS[107] = Glyph('k', 'latin small letter k', 0.58447265625, 0, 0.77099609375, 0.09619140625, 0.01953125)
-GLYPHS[108] = Glyph('l', 'latin small letter l', 0.2890625, 0, 0.77099609375, 0.09619140625, 0.0966796875)
-GLYPHS[109] = Glyph('m', 'latin small letter m', 0.93359375, 0, 0.5419921875, 0.09619140625, 0.09033203125)
-GLYPHS[110] = Glyph('n', 'latin small letter n', 0.62060546875, 0, 0.5419921875, 0.09619140625, 0.0908203125)
-GLYPHS[111] = Glyph('o', 'latin small letter o', 0.6142578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[112] = Glyph('p', 'latin small letter p', 0.62939453125, 0.19287109375, 0.5419921875, 0.09619140625, 0.05419921875)
-GLYPHS[113] = Glyph('q', 'latin small letter q', 0.62939453125, 0.19287109375, 0.5419921875, 0.05419921875, 0.09619140625)
-GLYPHS[114] = Glyph('r', 'latin small letter r', 0.4091796875, 0, 0.5419921875, 0.09619140625, 0.02001953125)
-GLYPHS[115] = Glyph('s', 'latin small letter s', 0.509765625, 0.01220703125, 0.5419921875, 0.07666015625, 0.07666015625)
-GLYPHS[116] = Glyph('t', 'latin small letter t', 0.3740234375, 0.01220703125, 0.6357421875, 0.03369140625, 0.0390625)
-GLYPHS[117] = Glyph('u', 'latin small letter u', 0.62060546875, 0.01220703125, 0.5302734375, 0.09033203125, 0.0966796875)
-GLYPHS[118] = Glyph('v', 'latin small letter v', 0.517578125, 0, 0.5302734375, 0.0087890625, 0.005859375)
-GLYPHS[119] = Glyph('w', 'latin small letter w', 0.7705078125, 0, 0.5302734375, 0.005859375, 0.0068359375)
-GLYPHS[120] = Glyph('x', 'latin small letter x', 0.61328125, 0, 0.5302734375, 0.04296875, 0.04541015625)
-GLYPHS[121] = Glyph('y', 'latin small letter y', 0.5224609375, 0.19287109375, 0.5302734375, 0.0078125, 0.005859375)
-GLYPHS[122] = Glyph('z', 'latin small letter z', 0.5732421875, 0, 0.5302734375, 0.06005859375, 0.06005859375)
-GLYPHS[123] = Glyph('{', 'left curly bracket', 0.3251953125, 0.14453125, 0.77099609375, 0.01220703125, 0.06591796875)
-GLYPHS[124] = Glyph('|', 'vertical line', 0.37353515625, 0.14453125, 0.77099609375, 0.16259765625, 0.16259765625)
-GLYPHS[125] = Glyph('}', 'right curly bracket', 0.3251953125, 0.14453125, 0.77099609375, 0.06640625, 0.01171875)
-GLYPHS[126] = Glyph('~', 'tilde', 0.63232421875, -0.19873046875, 0.37744140625, 0.05126953125, 0.05078125)
-GLYPHS[161] = Glyph('¡', 'inverted exclamation mark', 0.31640625, 0.19287109375, 0.5302734375, 0.10986328125, 0.1103515625)
-GLYPHS[162] = Glyph('¢', 'cent sign', 0.63232421875, 0, 0.72265625, 0.10009765625, 0.12158203125)
-GLYPHS[163] = Glyph('£', 'pound sign', 0.63232421875, 0, 0.74072265625, 0.12060546875, 0.09912109375)
-GLYPHS[164] = Glyph('¤', 'currency sign', 0.6328125, -0.09326171875, 0.6298828125, 0.0478515625, 0.04833984375)
-GLYPHS[165] = Glyph('¥', 'yen sign', 0.63232421875, 0, 0.72265625, 0.0390625, 0.02685546875)
-GLYPHS[166] = Glyph('¦', 'broken bar', 0.37158203125, 0.14453125, 0.77099609375, 0.16259765625, 0.16064453125)
-GLYPHS[167] = Glyph('§', 'section sign', 0.63232421875, 0.1630859375, 0.74072265625, 0.10791015625, 0.09423828125)
-GLYPHS[168] = Glyph('¨', 'diaeresis', 0.6142578125, -0.62646484375, 0.7109375, 0.16845703125, 0.16845703125)
-GLYPHS[169] = Glyph('©', 'copyright sign', 0.85546875, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[170] = Glyph('ª', 'feminine ordinal indicator', 0.421875, -0.44384765625, 0.7783203125, 0.06005859375, 0.06396484375)
-GLYPHS[171] = Glyph('«', 'left-pointing double angle quotation mark', 0.52392578125, -0.04833984375, 0.482421875, 0.05419921875, 0.0361328125)
-GLYPHS[172] = Glyph('¬', 'not sign', 0.794921875, -0.14453125, 0.3857421875, 0.1083984375, 0.1083984375)
-GLYPHS[173] = Glyph('­', 'soft hyphen', 0.3251953125, -0.26513671875, 0.33740234375, 0.05419921875, 0.05419921875)
-GLYPHS[174] = Glyph('®', 'registered sign', 0.63232421875, -0.30712890625, 0.74072265625, 0.099609375, 0.09912109375)
-GLYPHS[175] = Glyph('¯', 'macron', 0.5, -0.7109375, 0.783203125, 0.0419921875, 0.04248046875)
-GLYPHS[176] = Glyph('°', 'degree sign', 0.27685546875, -0.52392578125, 0.74072265625, 0.03125, 0.02880859375)
-GLYPHS[177] = Glyph('±', 'plus-minus sign', 0.794921875, 0, 0.5791015625, 0.1083984375, 0.1083984375)
-GLYPHS[178] = Glyph('²', 'superscript two', 0.421875, -0.2890625, 0.7333984375, 0.07275390625, 0.0732421875)
-GLYPHS[179] = Glyph('³', 'superscript three', 0.421875, -0.2783203125, 0.7333984375, 0.0771484375, 0.07666015625)
-GLYPHS[180] = Glyph('´', 'acute accent', 0.6142578125, -0.62646484375, 0.783203125, 0.19287109375, 0.1923828125)
-GLYPHS[181] = Glyph('µ', 'micro sign', 0.62646484375, 0.19287109375, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[182] = Glyph('¶', 'pilcrow sign', 0.63232421875, 0.14453125, 0.72265625, 0.10546875, 0.12939453125)
-GLYPHS[183] = Glyph('·', 'middle dot', 0.63232421875, -0.2294921875, 0.349609375, 0.255859375, 0.255859375)
-GLYPHS[184] = Glyph('¸', 'cedilla', 0.6142578125, 0.2109375, 0, 0.2490234375, 0.19580078125)
-GLYPHS[185] = Glyph('¹', 'superscript one', 0.421875, -0.2890625, 0.7275390625, 0.12646484375, 0.15087890625)
-GLYPHS[186] = Glyph('º', 'masculine ordinal indicator', 0.421875, -0.44384765625, 0.7783203125, 0.06005859375, 0.0439453125)
-GLYPHS[187] = Glyph('»', 'right-pointing double angle quotation mark', 0.52392578125, -0.04833984375, 0.482421875, 0.0361328125, 0.05419921875)
-GLYPHS[188] = Glyph('¼', 'vulgar fraction one quarter', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[189] = Glyph('½', 'vulgar fraction one half', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.0478515625)
-GLYPHS[190] = Glyph('¾', 'vulgar fraction three quarters', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[191] = Glyph('¿', 'inverted question mark', 0.421875, 0.2109375, 0.5302734375, 0.01806640625, 0.01806640625)
-GLYPHS[192] = Glyph('À', 'latin capital letter a with grave', 0.68994140625, 0, 0.93994140625, 0.00830078125, 0.01123046875)
-GLYPHS[193] = Glyph('Á', 'latin capital letter a with acute', 0.68994140625, 0, 0.93994140625, 0.00830078125, 0.01123046875)
-GLYPHS[194] = Glyph('Â', 'latin capital letter a with circumflex', 0.68994140625, 0, 0.93994140625, 0.00830078125, 0.01123046875)
-GLYPHS[195] = Glyph('Ã', 'latin capital letter a with tilde', 0.68994140625, 0, 0.8974609375, 0.00830078125, 0.01123046875)
-GLYPHS[196] = Glyph('Ä', 'latin capital letter a with diaeresis', 0.68994140625, 0, 0.86767578125, 0.00830078125, 0.01123046875)
-GLYPHS[197] = Glyph('Å', 'latin capital letter a with ring above', 0.68994140625, 0, 1.0048828125, 0.00830078125, 0.01123046875)
-GLYPHS[198] = Glyph('Æ', 'latin capital letter ae', 0.90673828125, 0, 0.72265625, 0.0087890625, 0.02392578125)
-GLYPHS[199] = Glyph('Ç', 'latin capital letter c with cedilla', 0.69189453125, 0.2109375, 0.74072265625, 0.05078125, 0.0556640625)
-GLYPHS[200] = Glyph('È', 'latin capital letter e with grave', 0.5419921875, 0, 0.93994140625, 0.09326171875, 0.02392578125)
-GLYPHS[201] = Glyph('É', 'latin capital letter e with acute', 0.5419921875, 0, 0.93994140625, 0.09326171875, 0.02392578125)
-GLYPHS[202] = Glyph('Ê', 'latin capital letter e with circumflex', 0.5419921875, 0, 0.93994140625, 0.09326171875, 0.02392578125)
-GLYPHS[203] = Glyph('Ë', 'latin capital letter e with diaeresis', 0.5419921875, 0, 0.86767578125, 0.09326171875, 0.02392578125)
-GLYPHS[204] = Glyph('Ì', 'latin capital letter i with grave', 0.2880859375, 0, 0.93994140625, -0.01220703125, 0.0712890625)
-GLYPHS[205] = Glyph('Í', 'latin capital letter i with acute', 0.2880859375, 0, 0.93994140625, 0.07177734375, -0.0126953125)
-GLYPHS[206] = Glyph('Î', 'latin capital letter i with circumflex', 0.2880859375, 0, 0.93994140625, -0.0263671875, -0.02734375)
-GLYPHS[207] = Glyph('Ï', 'latin capital letter i with diaeresis', 0.2880859375, 0, 0.86767578125, 0.00537109375, 0.00537109375)
-GLYPHS[208] = Glyph('Ð', 'latin capital letter eth', 0.7490234375, 0, 0.72265625, -0.0146484375, 0.05029296875)
-GLYPHS[209] = Glyph('Ñ', 'latin capital letter n with tilde', 0.73876953125, 0, 0.8974609375, 0.09326171875, 0.09326171875)
-GLYPHS[210] = Glyph('Ò', 'latin capital letter o with grave', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[211] = Glyph('Ó', 'latin capital letter o with acute', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[212] = Glyph('Ô', 'latin capital letter o with circumflex', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[213] = Glyph('Õ', 'latin capital letter o with tilde', 0.77685546875, 0.01806640625, 0.8974609375, 0.05078125, 0.05029296875)
-GLYPHS[214] = Glyph('Ö', 'latin capital letter o with diaeresis', 0.77685546875, 0.01806640625, 0.86767578125, 0.05078125, 0.05029296875)
-GLYPHS[215] = Glyph('×', 'multiplication sign', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[216] = Glyph('Ø', 'latin capital letter o with stroke', 0.77685546875, 0.01806640625, 0.74072265625, 0.05078125, 0.05029296875)
-GLYPHS[217] = Glyph('Ù', 'latin capital letter u with grave', 0.69287109375, 0.01806640625, 0.93994140625, 0.08740234375, 0.0869140625)
-GLYPHS[218] = Glyph('Ú', 'latin capital letter u with acute', 0.69287109375, 0.01806640625, 0.93994140625, 0.08740234375, 0.0869140625)
-GLYPHS[219] = Glyph('Û', 'latin capital letter u with circumflex', 0.69287109375, 0.01806640625, 0.93994140625, 0.08740234375, 0.0869140625)
-GLYPHS[220] = Glyph('Ü', 'latin capital letter u with diaeresis', 0.69287109375, 0.01806640625, 0.86767578125, 0.08740234375, 0.0869140625)
-GLYPHS[221] = Glyph('Ý', 'latin capital letter y with acute', 0.623046875, 0, 0.93994140625, 0.00830078125, 0.0126953125)
-GLYPHS[222] = Glyph('Þ', 'latin capital letter thorn', 0.552734375, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[223] = Glyph('ß', 'latin small letter sharp s', 0.59814453125, 0.01220703125, 0.783203125, 0.09619140625, 0.02978515625)
-GLYPHS[224] = Glyph('à', 'latin small letter a with grave', 0.55224609375, 0.01220703125, 0.783203125, 0.05029296875, 0.0244140625)
-GLYPHS[225] = Glyph('á', 'latin small letter a with acute', 0.55224609375, 0.01220703125, 0.783203125, 0.05029296875, 0.0244140625)
-GLYPHS[226] = Glyph('â', 'latin small letter a with circumflex', 0.55224609375, 0.01220703125, 0.783203125, 0.05029296875, 0.0244140625)
-GLYPHS[227] = Glyph('ã', 'latin small letter a with tilde', 0.55224609375, 0.01220703125, 0.74072265625, 0.05029296875, 0.0244140625)
-GLYPHS[228] = Glyph('ä', 'latin small letter a with diaeresis', 0.55224609375, 0.01220703125, 0.7109375, 0.05029296875, 0.0244140625)
-GLYPHS[229] = Glyph('å', 'latin small letter a with ring above', 0.55224609375, 0.01220703125, 0.84814453125, 0.05029296875, 0.0244140625)
-GLYPHS[230] = Glyph('æ', 'latin small letter ae', 0.85107421875, 0.01220703125, 0.5419921875, 0.05029296875, 0.07080078125)
-GLYPHS[231] = Glyph('ç', 'latin small letter c with cedilla', 0.51220703125, 0.2109375, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[232] = Glyph('è', 'latin small letter e with grave', 0.55712890625, 0.01220703125, 0.783203125, 0.05419921875, 0.06982421875)
-GLYPHS[233] = Glyph('é', 'latin small letter e with acute', 0.55712890625, 0.01220703125, 0.783203125, 0.05419921875, 0.06982421875)
-GLYPHS[234] = Glyph('ê', 'latin small letter e with circumflex', 0.55712890625, 0.01220703125, 0.783203125, 0.05419921875, 0.06982421875)
-GLYPHS[235] = Glyph('ë', 'latin small letter e with diaeresis', 0.55712890625, 0.01220703125, 0.7109375, 0.05419921875, 0.06982421875)
-GLYPHS[236] = Glyph('ì', 'latin small letter i with grave', 0.2890625, 0, 0.783203125, -0.01171875, 0.07177734375)
-GLYPHS[237] = Glyph('í', 'latin small letter i with acute', 0.2890625, 0, 0.783203125, 0.072265625, -0.01220703125)
-GLYPHS[238] = Glyph('î', 'latin small letter i with circumflex', 0.2890625, 0, 0.783203125, -0.02587890625, -0.02685546875)
-GLYPHS[239] = Glyph('ï', 'latin small letter i with diaeresis', 0.2890625, 0, 0.7109375, 0.005859375, 0.005859375)
-GLYPHS[240] = Glyph('ð', 'latin small letter eth', 0.6025390625, 0.01220703125, 0.81640625, 0.05322265625, 0.0546875)
-GLYPHS[241] = Glyph('ñ', 'latin small letter n with tilde', 0.62060546875, 0, 0.74072265625, 0.09619140625, 0.0908203125)
-GLYPHS[242] = Glyph('ò', 'latin small letter o with grave', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[243] = Glyph('ó', 'latin small letter o with acute', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[244] = Glyph('ô', 'latin small letter o with circumflex', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[245] = Glyph('õ', 'latin small letter o with tilde', 0.6142578125, 0.01220703125, 0.74072265625, 0.05419921875, 0.05419921875)
-GLYPHS[246] = Glyph('ö', 'latin small letter o with diaeresis', 0.6142578125, 0.01220703125, 0.7109375, 0.05419921875, 0.05419921875)
-GLYPHS[247] = Glyph('÷', 'division sign', 0.794921875, -0.04833984375, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[248] = Glyph('ø', 'latin small letter o with stroke', 0.6142578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[249] = Glyph('ù', 'latin small letter u with grave', 0.62060546875, 0.01220703125, 0.783203125, 0.09033203125, 0.0966796875)
-GLYPHS[250] = Glyph('ú', 'latin small letter u with acute', 0.62060546875, 0.01220703125, 0.783203125, 0.09033203125, 0.0966796875)
-GLYPHS[251] = Glyph('û', 'latin small letter u with circumflex', 0.62060546875, 0.01220703125, 0.783203125, 0.09033203125, 0.0966796875)
-GLYPHS[252] = Glyph('ü', 'latin small letter u with diaeresis', 0.62060546875, 0.01220703125, 0.7109375, 0.09033203125, 0.0966796875)
-GLYPHS[253] = Glyph('ý', 'latin small letter y with acute', 0.5224609375, 0.19287109375, 0.783203125, 0.0078125, 0.005859375)
-GLYPHS[254] = Glyph('þ', 'latin small letter thorn', 0.62939453125, 0.19287109375, 0.77099609375, 0.09619140625, 0.05419921875)
-GLYPHS[255] = Glyph('ÿ', 'latin small letter y with diaeresis', 0.5224609375, 0.19287109375, 0.7109375, 0.0078125, 0.005859375)
-GLYPHS[256] = Glyph('Ā', 'latin capital letter a with macron', 0.68994140625, 0, 0.85546875, 0.00830078125, 0.01123046875)
-GLYPHS[257] = Glyph('ā', 'latin small letter a with macron', 0.55224609375, 0.01220703125, 0.69873046875, 0.05029296875, 0.0244140625)
-GLYPHS[258] = Glyph('Ă', 'latin capital letter a with breve', 0.68994140625, 0, 0.927734375, 0.00830078125, 0.01123046875)
-GLYPHS[259] = Glyph('ă', 'latin small letter a with breve', 0.55224609375, 0.01220703125, 0.77099609375, 0.05029296875, 0.0244140625)
-GLYPHS[260] = Glyph('Ą', 'latin capital letter a with ogonek', 0.68994140625, 0.1806640625, 0.72265625, 0.00830078125, 0.01123046875)
-GLYPHS[261] = Glyph('ą', 'latin small letter a with ogonek', 0.55224609375, 0.1806640625, 0.5419921875, 0.05029296875, 0.0244140625)
-GLYPHS[262] = Glyph('Ć', 'latin capital letter c with acute', 0.69189453125, 0.01806640625, 0.93994140625, 0.05078125, 0.0556640625)
-GLYPHS[263] = Glyph('ć', 'latin small letter c with acute', 0.51220703125, 0.01220703125, 0.783203125, 0.05419921875, 0.0478515625)
-GLYPHS[264] = Glyph('Ĉ', 'latin capital letter c with circumflex', 0.69189453125, 0.01806640625, 0.93994140625, 0.05078125, 0.0556640625)
-GLYPHS[265] = Glyph('ĉ', 'latin small letter c with circumflex', 0.51220703125, 0.01220703125, 0.783203125, 0.05419921875, 0.04345703125)
-GLYPHS[266] = Glyph('Ċ', 'latin capital letter c with dot above', 0.69189453125, 0.01806640625, 0.87939453125, 0.05078125, 0.0556640625)
-GLYPHS[267] = Glyph('ċ', 'latin small letter c with dot above', 0.51220703125, 0.01220703125, 0.72265625, 0.05419921875, 0.0478515625)
-GLYPHS[268] = Glyph('Č', 'latin capital letter c with caron', 0.69189453125, 0.01806640625, 0.93994140625, 0.05078125, 0.0556640625)
-GLYPHS[269] = Glyph('č', 'latin small letter c with caron', 0.51220703125, 0.01220703125, 0.783203125, 0.05419921875, 0.04052734375)
-GLYPHS[270] = Glyph('Ď', 'latin capital letter d with caron', 0.7490234375, 0, 0.93994140625, 0.09326171875, 0.05078125)
-GLYPHS[271] = Glyph('ď', 'latin small letter d with caron', 0.77392578125, 0.01220703125, 0.77099609375, 0.05419921875, 0.04833984375)
-GLYPHS[272] = Glyph('Đ', 'latin capital letter d with stroke', 0.7490234375, 0, 0.72265625, -0.0146484375, 0.05029296875)
-GLYPHS[273] = Glyph('đ', 'latin small letter d with stroke', 0.62939453125, 0.01220703125, 0.77099609375, 0.05419921875, 0)
-GLYPHS[274] = Glyph('Ē', 'latin capital letter e with macron', 0.5419921875, 0, 0.85546875, 0.09326171875, 0.02392578125)
-GLYPHS[275] = Glyph('ē', 'latin small letter e with macron', 0.55712890625, 0.01220703125, 0.69873046875, 0.05419921875, 0.06982421875)
-GLYPHS[276] = Glyph('Ĕ', 'latin capital letter e with breve', 0.5419921875, 0, 0.927734375, 0.09326171875, 0.02392578125)
-GLYPHS[277] = Glyph('ĕ', 'latin small letter e with breve', 0.55712890625, 0.01220703125, 0.77099609375, 0.05419921875, 0.06982421875)
-GLYPHS[278] = Glyph('Ė', 'latin capital letter e with dot above', 0.5419921875, 0, 0.87939453125, 0.09326171875, 0.02392578125)
-GLYPHS[279] = Glyph('ė', 'latin small letter e with dot above', 0.55712890625, 0.01220703125, 0.72265625, 0.05419921875, 0.06982421875)
-GLYPHS[280] = Glyph('Ę', 'latin capital letter e with ogonek', 0.5419921875, 0.1806640625, 0.72265625, 0.09326171875, 0.02392578125)
-GLYPHS[281] = Glyph('ę', 'latin small letter e with ogonek', 0.55712890625, 0.1806640625, 0.5419921875, 0.05419921875, 0.06982421875)
-GLYPHS[282] = Glyph('Ě', 'latin capital letter e with caron', 0.5419921875, 0, 0.93994140625, 0.09326171875, 0.02392578125)
-GLYPHS[283] = Glyph('ě', 'latin small letter e with caron', 0.55712890625, 0.01220703125, 0.783203125, 0.05419921875, 0.06982421875)
-GLYPHS[284] = Glyph('Ĝ', 'latin capital letter g with circumflex', 0.72265625, 0.01806640625, 0.93994140625, 0.05078125, 0.08642578125)
-GLYPHS[285] = Glyph('ĝ', 'latin small letter g with circumflex', 0.62353515625, 0.20458984375, 0.783203125, 0.05419921875, 0.09033203125)
-GLYPHS[286] = Glyph('Ğ', 'latin capital letter g with breve', 0.72265625, 0.01806640625, 0.927734375, 0.05078125, 0.08642578125)
-GLYPHS[287] = Glyph('ğ', 'latin small letter g with breve', 0.62353515625, 0.20458984375, 0.77099609375, 0.05419921875, 0.09033203125)
-GLYPHS[288] = Glyph('Ġ', 'latin capital letter g with dot above', 0.72265625, 0.01806640625, 0.87939453125, 0.05078125, 0.08642578125)
-GLYPHS[289] = Glyph('ġ', 'latin small letter g with dot above', 0.62353515625, 0.20458984375, 0.72265625, 0.05419921875, 0.09033203125)
-GLYPHS[290] = Glyph('Ģ', 'latin capital letter g with cedilla', 0.72265625, 0.2109375, 0.74072265625, 0.05078125, 0.08642578125)
-GLYPHS[291] = Glyph('ģ', 'latin small letter g with cedilla', 0.62353515625, 0.20458984375, 0.84814453125, 0.05419921875, 0.09033203125)
-GLYPHS[292] = Glyph('Ĥ', 'latin capital letter h with circumflex', 0.73486328125, 0, 0.93994140625, 0.09326171875, 0.0927734375)
-GLYPHS[293] = Glyph('ĥ', 'latin small letter h with circumflex', 0.62060546875, 0, 0.97607421875, -0.02587890625, 0.09033203125)
-GLYPHS[294] = Glyph('Ħ', 'latin capital letter h with stroke', 0.78955078125, 0, 0.72265625, 0.02392578125, 0.0244140625)
-GLYPHS[295] = Glyph('ħ', 'latin small letter h with stroke', 0.62060546875, 0, 0.77099609375, 0, 0.0908203125)
-GLYPHS[296] = Glyph('Ĩ', 'latin capital letter i with tilde', 0.2880859375, 0, 0.8974609375, -0.01806640625, -0.01904296875)
-GLYPHS[297] = Glyph('ĩ', 'latin small letter i with tilde', 0.2890625, 0, 0.74072265625, -0.017578125, -0.0185546875)
-GLYPHS[298] = Glyph('Ī', 'latin capital letter i with macron', 0.2880859375, 0, 0.85546875, -0.01220703125, -0.01318359375)
-GLYPHS[299] = Glyph('ī', 'latin small letter i with macron', 0.2890625, 0, 0.69873046875, -0.01171875, -0.0126953125)
-GLYPHS[300] = Glyph('Ĭ', 'latin capital letter i with breve', 0.2880859375, 0, 0.927734375, -0.01806640625, -0.01904296875)
-GLYPHS[301] = Glyph('ĭ', 'latin small letter i with breve', 0.2890625, 0, 0.77099609375, -0.017578125, -0.0185546875)
-GLYPHS[302] = Glyph('Į', 'latin capital letter i with ogonek', 0.2880859375, 0.1806640625, 0.72265625, 0.06591796875, 0.05517578125)
-GLYPHS[303] = Glyph('į', 'latin small letter i with ogonek', 0.2890625, 0.1806640625, 0.72265625, 0.0634765625, 0.05859375)
-GLYPHS[304] = Glyph('İ', 'latin capital letter i with dot above', 0.2880859375, 0, 0.87939453125, 0.0927734375, 0.0927734375)
-GLYPHS[305] = Glyph('ı', 'latin small letter dotless i', 0.2890625, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[306] = Glyph('Ĳ', 'latin capital ligature ij', 0.595703125, 0.14453125, 0.72265625, 0.0927734375, 0.08935546875)
-GLYPHS[307] = Glyph('ĳ', 'latin small ligature ij', 0.57861328125, 0.20458984375, 0.72265625, 0.09619140625, 0.0966796875)
-GLYPHS[308] = Glyph('Ĵ', 'latin capital letter j with circumflex', 0.31103515625, 0.14453125, 0.93994140625, -0.08935546875, -0.0302734375)
-GLYPHS[309] = Glyph('ĵ', 'latin small letter j with circumflex', 0.30419921875, 0.20458984375, 0.783203125, -0.07470703125, -0.02685546875)
-GLYPHS[310] = Glyph('Ķ', 'latin capital letter k with cedilla', 0.65283203125, 0.2109375, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[311] = Glyph('ķ', 'latin small letter k with cedilla', 0.58447265625, 0.2109375, 0.77099609375, 0.09619140625, 0.01953125)
-GLYPHS[312] = Glyph('ĸ', 'latin small letter kra', 0.58447265625, 0, 0.5302734375, 0.09619140625, 0.01953125)
-GLYPHS[313] = Glyph('Ĺ', 'latin capital letter l with acute', 0.533203125, 0, 0.93994140625, 0.083984375, 0.01220703125)
-GLYPHS[314] = Glyph('ĺ', 'latin small letter l with acute', 0.2890625, 0, 0.97607421875, 0.072265625, -0.01220703125)
-GLYPHS[315] = Glyph('Ļ', 'latin capital letter l with cedilla', 0.533203125, 0.2109375, 0.72265625, 0.09326171875, 0.01220703125)
-GLYPHS[316] = Glyph('ļ', 'latin small letter l with cedilla', 0.2890625, 0.2109375, 0.77099609375, 0.06982421875, 0.0498046875)
-GLYPHS[317] = Glyph('Ľ', 'latin capital letter l with caron', 0.533203125, 0, 0.72265625, 0.09326171875, 0.01220703125)
-GLYPHS[318] = Glyph('ľ', 'latin small letter l with caron', 0.43359375, 0, 0.77099609375, 0.09619140625, 0.04833984375)
-GLYPHS[319] = Glyph('Ŀ', 'latin capital letter l with middle dot', 0.533203125, 0, 0.72265625, 0.09326171875, 0.01220703125)
-GLYPHS[320] = Glyph('ŀ', 'latin small letter l with middle dot', 0.3857421875, 0, 0.77099609375, 0.09619140625, 0.00048828125)
-GLYPHS[321] = Glyph('Ł', 'latin capital letter l with stroke', 0.533203125, 0, 0.72265625, -0.01416015625, 0.01220703125)
-GLYPHS[322] = Glyph('ł', 'latin small letter l with stroke', 0.2890625, 0, 0.77099609375, -0.01318359375, -0.01123046875)
-GLYPHS[323] = Glyph('Ń', 'latin capital letter n with acute', 0.73876953125, 0, 0.93994140625, 0.09326171875, 0.09326171875)
-GLYPHS[324] = Glyph('ń', 'latin small letter n with acute', 0.62060546875, 0, 0.783203125, 0.09619140625, 0.0908203125)
-GLYPHS[325] = Glyph('Ņ', 'latin capital letter n with cedilla', 0.73876953125, 0.2109375, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[326] = Glyph('ņ', 'latin small letter n with cedilla', 0.62060546875, 0.2109375, 0.5419921875, 0.09619140625, 0.0908203125)
-GLYPHS[327] = Glyph('Ň', 'latin capital letter n with caron', 0.73876953125, 0, 0.93994140625, 0.09326171875, 0.09326171875)
-GLYPHS[328] = Glyph('ň', 'latin small letter n with caron', 0.62060546875, 0, 0.783203125, 0.09619140625, 0.0908203125)
-GLYPHS[329] = Glyph('ŉ', 'latin small letter n preceded by apostrophe', 0.74072265625, 0, 0.77099609375, 0.0361328125, 0.09033203125)
-GLYPHS[330] = Glyph('Ŋ', 'latin capital letter eng', 0.73876953125, 0.205078125, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[331] = Glyph('ŋ', 'latin small letter eng', 0.62060546875, 0.20458984375, 0.5419921875, 0.09619140625, 0.0908203125)
-GLYPHS[332] = Glyph('Ō', 'latin capital letter o with macron', 0.77685546875, 0.01806640625, 0.85546875, 0.05078125, 0.05029296875)
-GLYPHS[333] = Glyph('ō', 'latin small letter o with macron', 0.6142578125, 0.01220703125, 0.69873046875, 0.05419921875, 0.05419921875)
-GLYPHS[334] = Glyph('Ŏ', 'latin capital letter o with breve', 0.77685546875, 0.01806640625, 0.927734375, 0.05078125, 0.05029296875)
-GLYPHS[335] = Glyph('ŏ', 'latin small letter o with breve', 0.6142578125, 0.01220703125, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[336] = Glyph('Ő', 'latin capital letter o with double acute', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[337] = Glyph('ő', 'latin small letter o with double acute', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.03759765625)
-GLYPHS[338] = Glyph('Œ', 'latin capital ligature oe', 1, 0.01806640625, 0.74072265625, 0.05078125, 0.02392578125)
-GLYPHS[339] = Glyph('œ', 'latin small ligature oe', 0.92822265625, 0.01220703125, 0.5419921875, 0.05419921875, 0.07080078125)
-GLYPHS[340] = Glyph('Ŕ', 'latin capital letter r with acute', 0.63232421875, 0, 0.93994140625, 0.09326171875, 0.01025390625)
-GLYPHS[341] = Glyph('ŕ', 'latin small letter r with acute', 0.4091796875, 0, 0.783203125, 0.09619140625, 0.02001953125)
-GLYPHS[342] = Glyph('Ŗ', 'latin capital letter r with cedilla', 0.63232421875, 0.2109375, 0.72265625, 0.09326171875, 0.01025390625)
-GLYPHS[343] = Glyph('ŗ', 'latin small letter r with cedilla', 0.4091796875, 0.2109375, 0.5419921875, 0.0888671875, 0.02001953125)
-GLYPHS[344] = Glyph('Ř', 'latin capital letter r with caron', 0.63232421875, 0, 0.93994140625, 0.09326171875, 0.01025390625)
-GLYPHS[345] = Glyph('ř', 'latin small letter r with caron', 0.4091796875, 0, 0.783203125, 0.0751953125, -0.0078125)
-GLYPHS[346] = Glyph('Ś', 'latin capital letter s with acute', 0.53857421875, 0.01806640625, 0.93994140625, 0.048828125, 0.0498046875)
-GLYPHS[347] = Glyph('ś', 'latin small letter s with acute', 0.50927734375, 0.01220703125, 0.783203125, 0.07666015625, 0.076171875)
-GLYPHS[348] = Glyph('Ŝ', 'latin capital letter s with circumflex', 0.53857421875, 0.01806640625, 0.93994140625, 0.048828125, 0.0498046875)
-GLYPHS[349] = Glyph('ŝ', 'latin small letter s with circumflex', 0.50927734375, 0.01220703125, 0.783203125, 0.07666015625, 0.076171875)
-GLYPHS[350] = Glyph('Ş', 'latin capital letter s with cedilla', 0.53857421875, 0.2109375, 0.74072265625, 0.048828125, 0.0498046875)
-GLYPHS[351] = Glyph('ş', 'latin small letter s with cedilla', 0.50927734375, 0.2109375, 0.5419921875, 0.07666015625, 0.076171875)
-GLYPHS[352] = Glyph('Š', 'latin capital letter s with caron', 0.53857421875, 0.01806640625, 0.93994140625, 0.048828125, 0.0498046875)
-GLYPHS[353] = Glyph('š', 'latin small letter s with caron', 0.50927734375, 0.01220703125, 0.783203125, 0.07666015625, 0.076171875)
-GLYPHS[354] = Glyph('Ţ', 'latin capital letter t with cedilla', 0.63232421875, 0.2109375, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[355] = Glyph('ţ', 'latin small letter t with cedilla', 0.3740234375, 0.2109375, 0.6357421875, 0.03369140625, 0.03271484375)
-GLYPHS[356] = Glyph('Ť', 'latin capital letter t with caron', 0.63232421875, 0, 0.93994140625, 0.0087890625, 0.00830078125)
-GLYPHS[357] = Glyph('ť', 'latin small letter t with caron', 0.576171875, 0.01220703125, 0.8359375, 0.03369140625, 0.19921875)
-GLYPHS[358] = Glyph('Ŧ', 'latin capital letter t with stroke', 0.63232421875, 0, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[359] = Glyph('ŧ', 'latin small letter t with stroke', 0.3740234375, 0.01220703125, 0.6357421875, 0.009765625, 0.0390625)
-GLYPHS[360] = Glyph('Ũ', 'latin capital letter u with tilde', 0.69287109375, 0.01806640625, 0.8974609375, 0.08740234375, 0.0869140625)
-GLYPHS[361] = Glyph('ũ', 'latin small letter u with tilde', 0.62060546875, 0.01220703125, 0.74072265625, 0.09033203125, 0.0966796875)
-GLYPHS[362] = Glyph('Ū', 'latin capital letter u with macron', 0.69287109375, 0.01806640625, 0.85546875, 0.08740234375, 0.0869140625)
-GLYPHS[363] = Glyph('ū', 'latin small letter u with macron', 0.62060546875, 0.01220703125, 0.69873046875, 0.09033203125, 0.0966796875)
-GLYPHS[364] = Glyph('Ŭ', 'latin capital letter u with breve', 0.69287109375, 0.01806640625, 0.927734375, 0.08740234375, 0.0869140625)
-GLYPHS[365] = Glyph('ŭ', 'latin small letter u with breve', 0.62060546875, 0.01220703125, 0.77099609375, 0.09033203125, 0.0966796875)
-GLYPHS[366] = Glyph('Ů', 'latin capital letter u with ring above', 0.69287109375, 0.01806640625, 0.99267578125, 0.08740234375, 0.0869140625)
-GLYPHS[367] = Glyph('ů', 'latin small letter u with ring above', 0.62060546875, 0.01220703125, 0.84814453125, 0.09033203125, 0.0966796875)
-GLYPHS[368] = Glyph('Ű', 'latin capital letter u with double acute', 0.69287109375, 0.01806640625, 0.93994140625, 0.08740234375, 0.0703125)
-GLYPHS[369] = Glyph('ű', 'latin small letter u with double acute', 0.62060546875, 0.01220703125, 0.783203125, 0.09033203125, 0.0517578125)
-GLYPHS[370] = Glyph('Ų', 'latin capital letter u with ogonek', 0.69287109375, 0.1806640625, 0.72265625, 0.08740234375, 0.0869140625)
-GLYPHS[371] = Glyph('ų', 'latin small letter u with ogonek', 0.62060546875, 0.1806640625, 0.5302734375, 0.09033203125, 0.0966796875)
-GLYPHS[372] = Glyph('Ŵ', 'latin capital letter w with circumflex', 0.85546875, 0, 0.93994140625, 0.0009765625, 0.00146484375)
-GLYPHS[373] = Glyph('ŵ', 'latin small letter w with circumflex', 0.7705078125, 0, 0.783203125, 0.005859375, 0.0068359375)
-GLYPHS[374] = Glyph('Ŷ', 'latin capital letter y with circumflex', 0.623046875, 0, 0.93994140625, 0.00830078125, 0.0126953125)
-GLYPHS[375] = Glyph('ŷ', 'latin small letter y with circumflex', 0.5224609375, 0.19287109375, 0.783203125, 0.0078125, 0.005859375)
-GLYPHS[376] = Glyph('Ÿ', 'latin capital letter y with diaeresis', 0.623046875, 0, 0.86767578125, 0.00830078125, 0.0126953125)
-GLYPHS[377] = Glyph('Ź', 'latin capital letter z with acute', 0.60498046875, 0, 0.93994140625, 0.04638671875, 0.04736328125)
-GLYPHS[378] = Glyph('ź', 'latin small letter z with acute', 0.57373046875, 0, 0.783203125, 0.06005859375, 0.060546875)
-GLYPHS[379] = Glyph('Ż', 'latin capital letter z with dot above', 0.6044921875, 0, 0.87939453125, 0.04638671875, 0.046875)
-GLYPHS[380] = Glyph('ż', 'latin small letter z with dot above', 0.5732421875, 0, 0.72265625, 0.06005859375, 0.06005859375)
-GLYPHS[381] = Glyph('Ž', 'latin capital letter z with caron', 0.60498046875, 0, 0.93994140625, 0.04638671875, 0.04736328125)
-GLYPHS[382] = Glyph('ž', 'latin small letter z with caron', 0.57373046875, 0, 0.783203125, 0.06005859375, 0.060546875)
-GLYPHS[383] = Glyph('ſ', 'latin small letter long s', 0.3486328125, 0, 0.783203125, 0.0390625, -0.04833984375)
-GLYPHS[384] = Glyph('ƀ', 'latin small letter b with stroke', 0.62939453125, 0.01220703125, 0.77099609375, 0, 0.05419921875)
-GLYPHS[385] = Glyph('Ɓ', 'latin capital letter b with hook', 0.69873046875, 0, 0.72265625, 0.01220703125, 0.041015625)
-GLYPHS[386] = Glyph('Ƃ', 'latin capital letter b with topbar', 0.58154296875, 0, 0.72265625, 0.09326171875, 0.04833984375)
-GLYPHS[387] = Glyph('ƃ', 'latin small letter b with topbar', 0.62939453125, 0.01220703125, 0.77099609375, 0.09619140625, 0.05419921875)
-GLYPHS[388] = Glyph('Ƅ', 'latin capital letter tone six', 0.5693359375, 0, 0.72265625, 0.09326171875, 0.0361328125)
-GLYPHS[389] = Glyph('ƅ', 'latin small letter tone six', 0.494140625, 0, 0.5302734375, 0.099609375, 0.044921875)
-GLYPHS[390] = Glyph('Ɔ', 'latin capital letter open o', 0.69189453125, 0.01806640625, 0.74072265625, 0.0556640625, 0.05078125)
-GLYPHS[391] = Glyph('Ƈ', 'latin capital letter c with hook', 0.69189453125, 0.01806640625, 0.927734375, 0.05078125, -0.09423828125)
-GLYPHS[392] = Glyph('ƈ', 'latin small letter c with hook', 0.5322265625, 0.01220703125, 0.783203125, 0.05419921875, -0.07861328125)
-GLYPHS[393] = Glyph('Ɖ', 'latin capital letter african d', 0.7490234375, 0, 0.72265625, -0.0146484375, 0.05029296875)
-GLYPHS[394] = Glyph('Ɗ', 'latin capital letter d with hook', 0.87255859375, 0, 0.72265625, 0.01220703125, 0.05029296875)
-GLYPHS[395] = Glyph('Ƌ', 'latin capital letter d with topbar', 0.5810546875, 0, 0.72265625, 0.04833984375, 0.0927734375)
-GLYPHS[396] = Glyph('ƌ', 'latin small letter d with topbar', 0.62939453125, 0.01220703125, 0.77099609375, 0.05419921875, 0.09619140625)
-GLYPHS[397] = Glyph('ƍ', 'latin small letter turned delta', 0.59033203125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[398] = Glyph('Ǝ', 'latin capital letter reversed e', 0.5419921875, 0, 0.72265625, 0.02392578125, 0.09326171875)
-GLYPHS[399] = Glyph('Ə', 'latin capital letter schwa', 0.677734375, 0.01806640625, 0.74072265625, 0.0556640625, 0.05078125)
-GLYPHS[400] = Glyph('Ɛ', 'latin capital letter open e', 0.52685546875, 0.01806640625, 0.74072265625, 0.072265625, 0.03271484375)
-GLYPHS[401] = Glyph('Ƒ', 'latin capital letter f with hook', 0.5361328125, 0.20458984375, 0.72265625, -0.0478515625, 0.03857421875)
-GLYPHS[402] = Glyph('ƒ', 'latin small letter f with hook', 0.390625, 0.20458984375, 0.783203125, -0.0478515625, -0.02978515625)
-GLYPHS[403] = Glyph('Ɠ', 'latin capital letter g with hook', 0.72265625, 0.01806640625, 0.927734375, 0.05078125, -0.0634765625)
-GLYPHS[404] = Glyph('Ɣ', 'latin capital letter gamma', 0.6572265625, 0.20458984375, 0.72265625, 0.005859375, 0.005859375)
-GLYPHS[405] = Glyph('ƕ', 'latin small letter hv', 0.90966796875, 0.01220703125, 0.77099609375, 0.09619140625, 0.0546875)
-GLYPHS[406] = Glyph('Ɩ', 'latin capital letter iota', 0.400390625, 0.01806640625, 0.72265625, 0.08447265625, 0.03271484375)
-GLYPHS[407] = Glyph('Ɨ', 'latin capital letter i with stroke', 0.36767578125, 0, 0.72265625, 0.01220703125, 0.01220703125)
-GLYPHS[408] = Glyph('Ƙ', 'latin capital letter k with hook', 0.6640625, 0, 0.73193359375, 0.09326171875, -0.0244140625)
-GLYPHS[409] = Glyph('ƙ', 'latin small letter k with hook', 0.58447265625, 0, 0.783203125, 0.09619140625, 0.01953125)
-GLYPHS[410] = Glyph('ƚ', 'latin small letter l with bar', 0.361328125, 0, 0.77099609375, 0.01220703125, 0.01171875)
-GLYPHS[411] = Glyph('ƛ', 'latin small letter lambda with stroke', 0.59423828125, 0, 0.77099609375, 0.02197265625, 0.0166015625)
-GLYPHS[412] = Glyph('Ɯ', 'latin capital letter turned m', 1.0634765625, 0.01806640625, 0.72265625, 0.08447265625, 0.09326171875)
-GLYPHS[413] = Glyph('Ɲ', 'latin capital letter n with left hook', 0.73876953125, 0.20458984375, 0.72265625, -0.04296875, 0.0927734375)
-GLYPHS[414] = Glyph('ƞ', 'latin small letter n with long right leg', 0.62060546875, 0, 0.5419921875, 0.09619140625, 0.0908203125)
-GLYPHS[415] = Glyph('Ɵ', 'latin capital letter o with middle tilde', 0.77734375, 0.01806640625, 0.74072265625, 0.05078125, 0.05078125)
-GLYPHS[416] = Glyph('Ơ', 'latin capital letter o with horn', 0.77685546875, 0.01806640625, 0.87353515625, 0.05078125, 0.05029296875)
-GLYPHS[417] = Glyph('ơ', 'latin small letter o with horn', 0.62646484375, 0.01220703125, 0.68212890625, 0.05419921875, 0.02880859375)
-GLYPHS[418] = Glyph('Ƣ', 'latin capital letter oi', 1.06005859375, 0.19287109375, 0.74072265625, 0.05126953125, 0.083984375)
-GLYPHS[419] = Glyph('ƣ', 'latin small letter oi', 0.89208984375, 0.19287109375, 0.5419921875, 0.05419921875, 0.09033203125)
-GLYPHS[420] = Glyph('Ƥ', 'latin capital letter p with hook', 0.6767578125, 0, 0.72265625, 0.01220703125, 0.017578125)
-GLYPHS[421] = Glyph('ƥ', 'latin small letter p with hook', 0.62939453125, 0.19287109375, 0.783203125, 0.09619140625, 0.05419921875)
-GLYPHS[422] = Glyph('Ʀ', 'latin letter yr', 0.63525390625, 0.1474609375, 0.8193359375, 0.09326171875, 0.01220703125)
-GLYPHS[423] = Glyph('Ƨ', 'latin capital letter tone two', 0.53857421875, 0.01806640625, 0.74072265625, 0.0498046875, 0.048828125)
-GLYPHS[424] = Glyph('ƨ', 'latin small letter tone two', 0.50927734375, 0.01220703125, 0.5419921875, 0.07666015625, 0.076171875)
-GLYPHS[425] = Glyph('Ʃ', 'latin capital letter esh', 0.58154296875, 0, 0.72265625, 0.02392578125, 0.021484375)
-GLYPHS[426] = Glyph('ƪ', 'latin letter reversed esh loop', 0.52734375, 0.20458984375, 0.783203125, 0.01806640625, -0.04833984375)
-GLYPHS[427] = Glyph('ƫ', 'latin small letter t with palatal hook', 0.3740234375, 0.20458984375, 0.6357421875, 0.03369140625, 0.0390625)
-GLYPHS[428] = Glyph('Ƭ', 'latin capital letter t with hook', 0.671875, 0, 0.72265625, 0.01220703125, 0.00830078125)
-GLYPHS[429] = Glyph('ƭ', 'latin small letter t with hook', 0.3740234375, 0.01220703125, 0.783203125, 0.03369140625, 0.0390625)
-GLYPHS[430] = Glyph('Ʈ', 'latin capital letter t with retroflex hook', 0.63232421875, 0.20458984375, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[431] = Glyph('Ư', 'latin capital letter u with horn', 0.82275390625, 0.01806640625, 0.87353515625, 0.08740234375, 0.01220703125)
-GLYPHS[432] = Glyph('ư', 'latin small letter u with horn', 0.7314453125, 0.01220703125, 0.68212890625, 0.09033203125, 0.01806640625)
-GLYPHS[433] = Glyph('Ʊ', 'latin capital letter upsilon', 0.783203125, 0.01806640625, 0.72265625, 0.0302734375, 0.0302734375)
-GLYPHS[434] = Glyph('Ʋ', 'latin capital letter v with hook', 0.7138671875, 0.01806640625, 0.72265625, 0.08447265625, 0.072265625)
-GLYPHS[435] = Glyph('Ƴ', 'latin capital letter y with hook', 0.638671875, 0, 0.73193359375, -0.017578125, 0)
-GLYPHS[436] = Glyph('ƴ', 'latin small letter y with hook', 0.671875, 0.19287109375, 0.73193359375, 0.00048828125, -0.02978515625)
-GLYPHS[437] = Glyph('Ƶ', 'latin capital letter z with stroke', 0.60498046875, 0, 0.72265625, 0.04638671875, 0.04736328125)
-GLYPHS[438] = Glyph('ƶ', 'latin small letter z with stroke', 0.57373046875, 0, 0.5302734375, 0.06005859375, 0.060546875)
-GLYPHS[439] = Glyph('Ʒ', 'latin capital letter ezh', 0.55712890625, 0.01806640625, 0.72265625, 0.04541015625, 0.06591796875)
-GLYPHS[440] = Glyph('Ƹ', 'latin capital letter ezh reversed', 0.55712890625, 0.01806640625, 0.72265625, 0.06640625, 0.044921875)
-GLYPHS[441] = Glyph('ƹ', 'latin small letter ezh reversed', 0.51220703125, 0.20458984375, 0.5302734375, 0.04833984375, 0.0390625)
-GLYPHS[442] = Glyph('ƺ', 'latin small letter ezh with tail', 0.51806640625, 0.20458984375, 0.5302734375, 0.05712890625, 0.0537109375)
-GLYPHS[443] = Glyph('ƻ', 'latin letter two with stroke', 0.63232421875, 0, 0.74072265625, 0.0830078125, 0.11572265625)
-GLYPHS[444] = Glyph('Ƽ', 'latin capital letter tone five', 0.63232421875, 0.01806640625, 0.72265625, 0.12158203125, 0.11865234375)
-GLYPHS[445] = Glyph('ƽ', 'latin small letter tone five', 0.474609375, 0.01318359375, 0.5302734375, 0.08154296875, 0.076171875)
-GLYPHS[446] = Glyph('ƾ', 'latin letter inverted glottal stop with stroke', 0.4580078125, 0.01220703125, 0.77099609375, 0.02392578125, 0.03076171875)
-GLYPHS[447] = Glyph('ƿ', 'latin letter wynn', 0.60546875, 0.19287109375, 0.5419921875, 0.09619140625, 0.04541015625)
-GLYPHS[448] = Glyph('ǀ', 'latin letter dental click', 0.283203125, 0, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[449] = Glyph('ǁ', 'latin letter lateral click', 0.44580078125, 0, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[450] = Glyph('ǂ', 'latin letter alveolar click', 0.64453125, 0, 0.77099609375, 0.072265625, 0.072265625)
-GLYPHS[451] = Glyph('ǃ', 'latin letter retroflex click', 0.31640625, 0, 0.72265625, 0.10986328125, 0.1103515625)
-GLYPHS[452] = Glyph('Ǆ', 'latin capital letter dz with caron', 1.2685546875, 0, 0.93994140625, 0.09326171875, 0.04736328125)
-GLYPHS[453] = Glyph('ǅ', 'latin capital letter d with small letter z with caron', 1.28564453125, 0, 0.783203125, 0.09326171875, 0.06005859375)
-GLYPHS[454] = Glyph('ǆ', 'latin small letter dz with caron', 1.142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.06005859375)
-GLYPHS[455] = Glyph('Ǉ', 'latin capital letter lj', 0.83349609375, 0.14453125, 0.72265625, 0.09326171875, 0.08984375)
-GLYPHS[456] = Glyph('ǈ', 'latin capital letter l with small letter j', 0.81591796875, 0.20458984375, 0.72265625, 0.09326171875, 0.09619140625)
-GLYPHS[457] = Glyph('ǉ', 'latin small letter lj', 0.5302734375, 0.20458984375, 0.77099609375, 0.09619140625, 0.0966796875)
-GLYPHS[458] = Glyph('Ǌ', 'latin capital letter nj', 1.00830078125, 0.14453125, 0.72265625, 0.09326171875, 0.08984375)
-GLYPHS[459] = Glyph('ǋ', 'latin capital letter n with small letter j', 0.98876953125, 0.20458984375, 0.72265625, 0.09326171875, 0.09619140625)
-GLYPHS[460] = Glyph('ǌ', 'latin small letter nj', 0.86767578125, 0.20458984375, 0.72265625, 0.09619140625, 0.0966796875)
-GLYPHS[461] = Glyph('Ǎ', 'latin capital letter a with caron', 0.68994140625, 0, 0.93994140625, 0.00830078125, 0.01123046875)
-GLYPHS[462] = Glyph('ǎ', 'latin small letter a with caron', 0.55224609375, 0.01220703125, 0.783203125, 0.05029296875, 0.0244140625)
-GLYPHS[463] = Glyph('Ǐ', 'latin capital letter i with caron', 0.2880859375, 0, 0.93994140625, -0.0263671875, -0.02734375)
-GLYPHS[464] = Glyph('ǐ', 'latin small letter i with caron', 0.2890625, 0, 0.783203125, -0.02587890625, -0.02685546875)
-GLYPHS[465] = Glyph('Ǒ', 'latin capital letter o with caron', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[466] = Glyph('ǒ', 'latin small letter o with caron', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[467] = Glyph('Ǔ', 'latin capital letter u with caron', 0.69287109375, 0.01806640625, 0.93994140625, 0.08740234375, 0.0869140625)
-GLYPHS[468] = Glyph('ǔ', 'latin small letter u with caron', 0.62060546875, 0.01220703125, 0.783203125, 0.09033203125, 0.0966796875)
-GLYPHS[469] = Glyph('Ǖ', 'latin capital letter u with diaeresis and macron', 0.69287109375, 0.01806640625, 1.01220703125, 0.08740234375, 0.0869140625)
-GLYPHS[470] = Glyph('ǖ', 'latin small letter u with diaeresis and macron', 0.62060546875, 0.01220703125, 0.85546875, 0.09033203125, 0.0966796875)
-GLYPHS[471] = Glyph('Ǘ', 'latin capital letter u with diaeresis and acute', 0.69287109375, 0.01806640625, 1.0966796875, 0.08740234375, 0.0869140625)
-GLYPHS[472] = Glyph('ǘ', 'latin small letter u with diaeresis and acute', 0.62060546875, 0.01220703125, 0.93994140625, 0.09033203125, 0.0966796875)
-GLYPHS[473] = Glyph('Ǚ', 'latin capital letter u with diaeresis and caron', 0.69287109375, 0.01806640625, 1.0966796875, 0.08740234375, 0.0869140625)
-GLYPHS[474] = Glyph('ǚ', 'latin small letter u with diaeresis and caron', 0.62060546875, 0.01220703125, 0.93994140625, 0.09033203125, 0.0966796875)
-GLYPHS[475] = Glyph('Ǜ', 'latin capital letter u with diaeresis and grave', 0.69287109375, 0.01806640625, 1.0966796875, 0.08740234375, 0.0869140625)
-GLYPHS[476] = Glyph('ǜ', 'latin small letter u with diaeresis and grave', 0.62060546875, 0.01220703125, 0.93994140625, 0.09033203125, 0.0966796875)
-GLYPHS[477] = Glyph('ǝ', 'latin small letter turned e', 0.55712890625, 0.01220703125, 0.5419921875, 0.07080078125, 0.05322265625)
-GLYPHS[478] = Glyph('Ǟ', 'latin capital letter a with diaeresis and macron', 0.68994140625, 0, 1.01220703125, 0.00830078125, 0.01123046875)
-GLYPHS[479] = Glyph('ǟ', 'latin small letter a with diaeresis and macron', 0.55224609375, 0.01220703125, 0.85546875, 0.05029296875, 0.0244140625)
-GLYPHS[480] = Glyph('Ǡ', 'latin capital letter a with dot above and macron', 0.68994140625, 0, 1.01220703125, 0.00830078125, 0.01123046875)
-GLYPHS[481] = Glyph('ǡ', 'latin small letter a with dot above and macron', 0.55224609375, 0.01220703125, 0.85546875, 0.05029296875, 0.0244140625)
-GLYPHS[482] = Glyph('Ǣ', 'latin capital letter ae with macron', 0.90673828125, 0, 0.85546875, 0.0087890625, 0.02392578125)
-GLYPHS[483] = Glyph('ǣ', 'latin small letter ae with macron', 0.85107421875, 0.01220703125, 0.69873046875, 0.05029296875, 0.07080078125)
-GLYPHS[484] = Glyph('Ǥ', 'latin capital letter g with stroke', 0.80517578125, 0.01806640625, 0.74072265625, 0.05078125, 0.04833984375)
-GLYPHS[485] = Glyph('ǥ', 'latin small letter g with stroke', 0.70166015625, 0.20458984375, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[486] = Glyph('Ǧ', 'latin capital letter g with caron', 0.72265625, 0.01806640625, 0.93994140625, 0.05078125, 0.08642578125)
-GLYPHS[487] = Glyph('ǧ', 'latin small letter g with caron', 0.62353515625, 0.20458984375, 0.783203125, 0.05419921875, 0.09033203125)
-GLYPHS[488] = Glyph('Ǩ', 'latin capital letter k with caron', 0.65283203125, 0, 0.93994140625, 0.09326171875, 0.017578125)
-GLYPHS[489] = Glyph('ǩ', 'latin small letter k with caron', 0.58447265625, 0, 0.93994140625, 0.09619140625, 0.01953125)
-GLYPHS[490] = Glyph('Ǫ', 'latin capital letter o with ogonek', 0.77685546875, 0.1806640625, 0.74072265625, 0.05078125, 0.05029296875)
-GLYPHS[491] = Glyph('ǫ', 'latin small letter o with ogonek', 0.6142578125, 0.1806640625, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[492] = Glyph('Ǭ', 'latin capital letter o with ogonek and macron', 0.77685546875, 0.1806640625, 0.85546875, 0.05078125, 0.05029296875)
-GLYPHS[493] = Glyph('ǭ', 'latin small letter o with ogonek and macron', 0.6142578125, 0.1806640625, 0.69873046875, 0.05419921875, 0.05419921875)
-GLYPHS[494] = Glyph('Ǯ', 'latin capital letter ezh with caron', 0.55712890625, 0.01806640625, 0.93994140625, 0.04541015625, 0.06591796875)
-GLYPHS[495] = Glyph('ǯ', 'latin small letter ezh with caron', 0.51220703125, 0.20458984375, 0.783203125, 0.0390625, 0.04833984375)
-GLYPHS[496] = Glyph('ǰ', 'latin small letter j with caron', 0.30419921875, 0.20458984375, 0.783203125, -0.07470703125, -0.02685546875)
-GLYPHS[506] = Glyph('Ǻ', 'latin capital letter a with ring above and acute', 0.68994140625, 0, 1.14453125, 0.00830078125, 0.01123046875)
-GLYPHS[507] = Glyph('ǻ', 'latin small letter a with ring above and acute', 0.55224609375, 0.01220703125, 1.01708984375, 0.05029296875, 0.0244140625)
-GLYPHS[508] = Glyph('Ǽ', 'latin capital letter ae with acute', 0.90673828125, 0, 0.93994140625, 0.0087890625, 0.02392578125)
-GLYPHS[509] = Glyph('ǽ', 'latin small letter ae with acute', 0.85107421875, 0.01220703125, 0.783203125, 0.05029296875, 0.07080078125)
-GLYPHS[510] = Glyph('Ǿ', 'latin capital letter o with stroke and acute', 0.77685546875, 0.01806640625, 0.93994140625, 0.05078125, 0.05029296875)
-GLYPHS[511] = Glyph('ǿ', 'latin small letter o with stroke and acute', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[536] = Glyph('Ș', 'latin capital letter s with comma below', 0.53857421875, 0.2705078125, 0.74072265625, 0.048828125, 0.0498046875)
-GLYPHS[537] = Glyph('ș', 'latin small letter s with comma below', 0.50927734375, 0.2705078125, 0.5419921875, 0.07666015625, 0.076171875)
-GLYPHS[538] = Glyph('Ț', 'latin capital letter t with comma below', 0.63232421875, 0.2705078125, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[539] = Glyph('ț', 'latin small letter t with comma below', 0.3740234375, 0.2705078125, 0.6357421875, 0.03369140625, 0.0390625)
-GLYPHS[592] = Glyph('ɐ', 'latin small letter turned a', 0.55224609375, 0.01220703125, 0.5419921875, 0.02392578125, 0.05078125)
-GLYPHS[593] = Glyph('ɑ', 'latin small letter alpha', 0.6083984375, 0.01220703125, 0.5419921875, 0.05419921875, 0.09619140625)
-GLYPHS[594] = Glyph('ɒ', 'latin small letter turned alpha', 0.6083984375, 0.01220703125, 0.5419921875, 0.09619140625, 0.05419921875)
-GLYPHS[595] = Glyph('ɓ', 'latin small letter b with hook', 0.62939453125, 0.01220703125, 0.783203125, 0.09619140625, 0.05419921875)
-GLYPHS[596] = Glyph('ɔ', 'latin small letter open o', 0.51220703125, 0.01220703125, 0.5419921875, 0.0478515625, 0.05419921875)
-GLYPHS[597] = Glyph('ɕ', 'latin small letter c with curl', 0.55712890625, 0.09619140625, 0.5419921875, 0.05419921875, 0.0302734375)
-GLYPHS[598] = Glyph('ɖ', 'latin small letter d with tail', 0.62939453125, 0.20458984375, 0.77099609375, 0.05419921875, -0.0361328125)
-GLYPHS[599] = Glyph('ɗ', 'latin small letter d with hook', 0.62939453125, 0.01220703125, 0.783203125, 0.05419921875, -0.0361328125)
-GLYPHS[600] = Glyph('ɘ', 'latin small letter reversed e', 0.55712890625, 0.01220703125, 0.5419921875, 0.07080078125, 0.0537109375)
-GLYPHS[601] = Glyph('ə', 'latin small letter schwa', 0.55712890625, 0.01220703125, 0.5419921875, 0.07080078125, 0.05322265625)
-GLYPHS[602] = Glyph('ɚ', 'latin small letter schwa with hook', 0.7890625, 0.01220703125, 0.5419921875, 0.0693359375, 0.005859375)
-GLYPHS[603] = Glyph('ɛ', 'latin small letter open e', 0.47607421875, 0.01220703125, 0.5419921875, 0.05419921875, 0.060546875)
-GLYPHS[604] = Glyph('ɜ', 'latin small letter reversed open e', 0.47607421875, 0.01220703125, 0.5419921875, 0.06005859375, 0.0546875)
-GLYPHS[605] = Glyph('ɝ', 'latin small letter reversed open e with hook', 0.6669921875, 0.01220703125, 0.5419921875, 0.06005859375, 0.00634765625)
-GLYPHS[606] = Glyph('ɞ', 'latin small letter closed reversed open e', 0.578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[607] = Glyph('ɟ', 'latin small letter dotless j with stroke', 0.39453125, 0.20458984375, 0.5302734375, -0.03564453125, 0.0263671875)
-GLYPHS[608] = Glyph('ɠ', 'latin small letter g with hook', 0.62353515625, 0.20458984375, 0.783203125, 0.05419921875, -0.044921875)
-GLYPHS[609] = Glyph('ɡ', 'latin small letter script g', 0.62353515625, 0.20458984375, 0.5419921875, 0.05419921875, 0.09033203125)
-GLYPHS[610] = Glyph('ɢ', 'latin letter small capital g', 0.58642578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.0732421875)
-GLYPHS[611] = Glyph('ɣ', 'latin small letter gamma', 0.53955078125, 0.20458984375, 0.5302734375, 0, 0.01806640625)
-GLYPHS[612] = Glyph('ɤ', 'latin small letter rams horn', 0.533203125, 0.01220703125, 0.533203125, 0.02392578125, 0.0244140625)
-GLYPHS[613] = Glyph('ɥ', 'latin small letter turned h', 0.62060546875, 0.19287109375, 0.5302734375, 0.09033203125, 0.0966796875)
-GLYPHS[614] = Glyph('ɦ', 'latin small letter h with hook', 0.62060546875, 0, 0.783203125, 0.09619140625, 0.0908203125)
-GLYPHS[615] = Glyph('ɧ', 'latin small letter heng with hook', 0.62060546875, 0.20458984375, 0.783203125, 0.09619140625, 0.0908203125)
-GLYPHS[616] = Glyph('ɨ', 'latin small letter i with stroke', 0.38525390625, 0, 0.72265625, 0.02392578125, 0.02392578125)
-GLYPHS[617] = Glyph('ɩ', 'latin small letter iota', 0.37060546875, 0.01220703125, 0.5302734375, 0.09326171875, 0.0302734375)
-GLYPHS[618] = Glyph('ɪ', 'latin letter small capital i', 0.40966796875, 0, 0.5302734375, 0.06005859375, 0.060546875)
-GLYPHS[619] = Glyph('ɫ', 'latin small letter l with middle tilde', 0.505859375, 0, 0.77099609375, 0.01806640625, 0.01806640625)
-GLYPHS[620] = Glyph('ɬ', 'latin small letter l with belt', 0.51806640625, 0, 0.77099609375, 0.01220703125, 0.01220703125)
-GLYPHS[621] = Glyph('ɭ', 'latin small letter l with retroflex hook', 0.29833984375, 0.20458984375, 0.77099609375, 0.09619140625, -0.02685546875)
-GLYPHS[622] = Glyph('ɮ', 'latin small letter lezh', 0.65673828125, 0.20458984375, 0.77099609375, 0.09619140625, 0.04541015625)
-GLYPHS[623] = Glyph('ɯ', 'latin small letter turned m', 0.93359375, 0.01220703125, 0.5302734375, 0.09033203125, 0.09619140625)
-GLYPHS[624] = Glyph('ɰ', 'latin small letter turned m with long leg', 0.93359375, 0.19287109375, 0.5302734375, 0.09033203125, 0.09619140625)
-GLYPHS[625] = Glyph('ɱ', 'latin small letter m with hook', 0.93359375, 0.20458984375, 0.5419921875, 0.09619140625, 0.09033203125)
-GLYPHS[626] = Glyph('ɲ', 'latin small letter n with left hook', 0.62939453125, 0.20458984375, 0.5419921875, -0.02685546875, 0.08984375)
-GLYPHS[627] = Glyph('ɳ', 'latin small letter n with retroflex hook', 0.6328125, 0.20458984375, 0.5419921875, 0.09619140625, -0.02978515625)
-GLYPHS[628] = Glyph('ɴ', 'latin letter small capital n', 0.62646484375, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[629] = Glyph('ɵ', 'latin small letter barred o', 0.6142578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[630] = Glyph('ɶ', 'latin letter small capital oe', 0.81005859375, 0.01220703125, 0.5419921875, 0.05419921875, 0.04833984375)
-GLYPHS[631] = Glyph('ɷ', 'latin small letter closed omega', 0.80712890625, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[632] = Glyph('ɸ', 'latin small letter phi', 0.75927734375, 0.19287109375, 0.77099609375, 0.04833984375, 0.04833984375)
-GLYPHS[633] = Glyph('ɹ', 'latin small letter turned r', 0.4091796875, 0.01220703125, 0.5302734375, 0.01953125, 0.0966796875)
-GLYPHS[634] = Glyph('ɺ', 'latin small letter turned r with long leg', 0.4091796875, 0.01220703125, 0.77099609375, 0.01953125, 0.0966796875)
-GLYPHS[635] = Glyph('ɻ', 'latin small letter turned r with hook', 0.42724609375, 0.20458984375, 0.5302734375, 0.01953125, -0.01806640625)
-GLYPHS[636] = Glyph('ɼ', 'latin small letter r with long leg', 0.4091796875, 0.19287109375, 0.5419921875, 0.09619140625, 0.02001953125)
-GLYPHS[637] = Glyph('ɽ', 'latin small letter r with tail', 0.4091796875, 0.20458984375, 0.5419921875, 0.09619140625, 0.02001953125)
-GLYPHS[638] = Glyph('ɾ', 'latin small letter r with fishhook', 0.4111328125, 0, 0.5419921875, 0.09619140625, 0.02001953125)
-GLYPHS[639] = Glyph('ɿ', 'latin small letter reversed r with fishhook', 0.4111328125, 0, 0.5419921875, 0.01953125, 0.0966796875)
-GLYPHS[640] = Glyph('ʀ', 'latin letter small capital r', 0.55029296875, 0, 0.5302734375, 0.09619140625, 0.01953125)
-GLYPHS[641] = Glyph('ʁ', 'latin letter small capital inverted r', 0.55029296875, 0, 0.5302734375, 0.09619140625, 0.01953125)
-GLYPHS[642] = Glyph('ʂ', 'latin small letter s with hook', 0.50927734375, 0.20458984375, 0.5419921875, 0.07666015625, 0.076171875)
-GLYPHS[643] = Glyph('ʃ', 'latin small letter esh', 0.4248046875, 0.20458984375, 0.783203125, -0.04150390625, -0.0244140625)
-GLYPHS[644] = Glyph('ʄ', 'latin small letter dotless j with stroke and hook', 0.43408203125, 0.20458984375, 0.783203125, -0.017578125, 0.0361328125)
-GLYPHS[645] = Glyph('ʅ', 'latin small letter squat reversed esh', 0.44873046875, 0.01220703125, 0.783203125, -0.04150390625, -0.00048828125)
-GLYPHS[646] = Glyph('ʆ', 'latin small letter esh with curl', 0.52099609375, 0.20458984375, 0.783203125, -0.0205078125, -0.0009765625)
-GLYPHS[647] = Glyph('ʇ', 'latin small letter turned t', 0.3740234375, 0.10546875, 0.5419921875, 0.0390625, 0.03369140625)
-GLYPHS[648] = Glyph('ʈ', 'latin small letter t with retroflex hook', 0.3740234375, 0.20458984375, 0.6357421875, 0.03369140625, 0.0390625)
-GLYPHS[649] = Glyph('ʉ', 'latin small letter u bar', 0.66259765625, 0.01220703125, 0.5302734375, 0.01806640625, 0.01806640625)
-GLYPHS[650] = Glyph('ʊ', 'latin small letter upsilon', 0.65966796875, 0.01220703125, 0.5302734375, 0.0419921875, 0.04248046875)
-GLYPHS[651] = Glyph('ʋ', 'latin small letter v with hook', 0.59619140625, 0, 0.5302734375, 0.02099609375, 0.0546875)
-GLYPHS[652] = Glyph('ʌ', 'latin small letter turned v', 0.517578125, 0, 0.5302734375, 0.005859375, 0.0087890625)
-GLYPHS[653] = Glyph('ʍ', 'latin small letter turned w', 0.7705078125, 0, 0.5302734375, 0.0068359375, 0.005859375)
-GLYPHS[654] = Glyph('ʎ', 'latin small letter turned y', 0.5224609375, 0, 0.72265625, 0.005859375, 0.0078125)
-GLYPHS[655] = Glyph('ʏ', 'latin letter small capital y', 0.4853515625, 0, 0.5302734375, 0.005859375, 0.00634765625)
-GLYPHS[656] = Glyph('ʐ', 'latin small letter z with retroflex hook', 0.57373046875, 0.20458984375, 0.5302734375, 0.06005859375, -0.09130859375)
-GLYPHS[657] = Glyph('ʑ', 'latin small letter z with curl', 0.69873046875, 0.14453125, 0.5302734375, 0.06005859375, 0.01513671875)
-GLYPHS[658] = Glyph('ʒ', 'latin small letter ezh', 0.51220703125, 0.20458984375, 0.5302734375, 0.0390625, 0.04833984375)
-GLYPHS[659] = Glyph('ʓ', 'latin small letter ezh with curl', 0.5361328125, 0.2919921875, 0.5302734375, 0.02734375, 0.05078125)
-GLYPHS[660] = Glyph('ʔ', 'latin letter glottal stop', 0.44287109375, 0, 0.783203125, 0.0419921875, 0.021484375)
-GLYPHS[661] = Glyph('ʕ', 'latin letter pharyngeal voiced fricative', 0.44287109375, 0, 0.783203125, 0.02099609375, 0.04248046875)
-GLYPHS[662] = Glyph('ʖ', 'latin letter inverted glottal stop', 0.44287109375, 0.01220703125, 0.77099609375, 0.02734375, 0.02978515625)
-GLYPHS[663] = Glyph('ʗ', 'latin letter stretched c', 0.4853515625, 0.2236328125, 0.5419921875, 0.05419921875, 0.01806640625)
-GLYPHS[664] = Glyph('ʘ', 'latin letter bilabial click', 0.66259765625, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[665] = Glyph('ʙ', 'latin letter small capital b', 0.52490234375, 0, 0.5302734375, 0.09619140625, 0.0546875)
-GLYPHS[666] = Glyph('ʚ', 'latin small letter closed open e', 0.578125, 0.01220703125, 0.5419921875, 0.04833984375, 0.0537109375)
-GLYPHS[667] = Glyph('ʛ', 'latin letter small capital g with hook', 0.59228515625, 0.01220703125, 0.783203125, 0.05419921875, -0.072265625)
-GLYPHS[668] = Glyph('ʜ', 'latin letter small capital h', 0.6240234375, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[669] = Glyph('ʝ', 'latin small letter j with crossed-tail', 0.48486328125, 0.20458984375, 0.72265625, -0.0205078125, 0.01708984375)
-GLYPHS[670] = Glyph('ʞ', 'latin small letter turned k', 0.58447265625, 0.19287109375, 0.5302734375, 0.01904296875, 0.0966796875)
-GLYPHS[671] = Glyph('ʟ', 'latin letter small capital l', 0.4609375, 0, 0.5302734375, 0.09619140625, 0.0244140625)
-GLYPHS[672] = Glyph('ʠ', 'latin small letter q with hook', 0.62939453125, 0.19287109375, 0.783203125, 0.05419921875, -0.0361328125)
-GLYPHS[673] = Glyph('ʡ', 'latin letter glottal stop with stroke', 0.4580078125, 0, 0.783203125, 0.033203125, 0.021484375)
-GLYPHS[674] = Glyph('ʢ', 'latin letter reversed glottal stop with stroke', 0.4580078125, 0, 0.783203125, 0.02099609375, 0.033203125)
-GLYPHS[675] = Glyph('ʣ', 'latin small letter dz digraph', 1.04052734375, 0.01220703125, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[676] = Glyph('ʤ', 'latin small letter dezh digraph', 0.9970703125, 0.20458984375, 0.77099609375, 0.05419921875, 0.04541015625)
-GLYPHS[677] = Glyph('ʥ', 'latin small letter dz digraph with curl', 1.171875, 0.14453125, 0.77099609375, 0.05419921875, 0.01513671875)
-GLYPHS[678] = Glyph('ʦ', 'latin small letter ts digraph', 0.79296875, 0.01220703125, 0.6357421875, 0.03369140625, 0.072265625)
-GLYPHS[679] = Glyph('ʧ', 'latin small letter tesh digraph', 0.70263671875, 0.20458984375, 0.783203125, 0.03369140625, -0.02978515625)
-GLYPHS[680] = Glyph('ʨ', 'latin small letter tc digraph with curl', 0.8798828125, 0.09619140625, 0.6357421875, 0.03369140625, 0.0302734375)
-GLYPHS[688] = Glyph('ʰ', 'modifier letter small h', 0.38330078125, -0.451171875, 0.9140625, 0.05615234375, 0.05224609375)
-GLYPHS[689] = Glyph('ʱ', 'modifier letter small h with hook', 0.38330078125, -0.451171875, 0.9208984375, 0.05615234375, 0.05224609375)
-GLYPHS[690] = Glyph('ʲ', 'modifier letter small j', 0.24609375, -0.328125, 0.90869140625, 0.005859375, 0.05615234375)
-GLYPHS[691] = Glyph('ʳ', 'modifier letter small r', 0.25927734375, -0.451171875, 0.7783203125, 0.05615234375, 0.0126953125)
-GLYPHS[692] = Glyph('ʴ', 'modifier letter small turned r', 0.2646484375, -0.44384765625, 0.77099609375, 0.01806640625, 0.05615234375)
-GLYPHS[693] = Glyph('ʵ', 'modifier letter small turned r with hook', 0.3203125, -0.328125, 0.77099609375, 0.01806640625, 0.01220703125)
-GLYPHS[694] = Glyph('ʶ', 'modifier letter small capital inverted r', 0.3505859375, -0.453125, 0.77099609375, 0.05615234375, 0.01171875)
-GLYPHS[695] = Glyph('ʷ', 'modifier letter small w', 0.490234375, -0.451171875, 0.77099609375, 0.0126953125, 0.01220703125)
-GLYPHS[696] = Glyph('ʸ', 'modifier letter small y', 0.33154296875, -0.33544921875, 0.77099609375, 0.0068359375, 0.00537109375)
-GLYPHS[697] = Glyph('ʹ', 'modifier letter prime', 0.2890625, -0.48193359375, 0.77099609375, 0.06005859375, 0.0244140625)
-GLYPHS[698] = Glyph('ʺ', 'modifier letter double prime', 0.505859375, -0.48193359375, 0.77099609375, 0.06005859375, 0.0244140625)
-GLYPHS[699] = Glyph('ʻ', 'modifier letter turned comma', 0.31640625, -0.494140625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[700] = Glyph('ʼ', 'modifier letter apostrophe', 0.31640625, -0.494140625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[701] = Glyph('ʽ', 'modifier letter reversed comma', 0.31640625, -0.494140625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[702] = Glyph('ʾ', 'modifier letter right half ring', 0.3134765625, -0.49462890625, 0.77099609375, 0.08154296875, 0.06298828125)
-GLYPHS[703] = Glyph('ʿ', 'modifier letter left half ring', 0.3134765625, -0.49462890625, 0.77099609375, 0.0634765625, 0.0810546875)
-GLYPHS[704] = Glyph('ˀ', 'modifier letter glottal stop', 0.326171875, -0.451171875, 0.7783203125, 0.0419921875, 0.03662109375)
-GLYPHS[705] = Glyph('ˁ', 'modifier letter reversed glottal stop', 0.326171875, -0.451171875, 0.7783203125, 0.0361328125, 0.04248046875)
-GLYPHS[706] = Glyph('˂', 'modifier letter left arrowhead', 0.40185546875, -0.47119140625, 0.783203125, 0.01806640625, 0.072265625)
-GLYPHS[707] = Glyph('˃', 'modifier letter right arrowhead', 0.40185546875, -0.47119140625, 0.783203125, 0.072265625, 0.01806640625)
-GLYPHS[708] = Glyph('˄', 'modifier letter up arrowhead', 0.40185546875, -0.4716796875, 0.783203125, 0.04541015625, 0.044921875)
-GLYPHS[709] = Glyph('˅', 'modifier letter down arrowhead', 0.40185546875, -0.4716796875, 0.783203125, 0.04541015625, 0.044921875)
-GLYPHS[710] = Glyph('ˆ', 'modifier letter circumflex accent', 0.6142578125, -0.62646484375, 0.783203125, 0.13623046875, 0.13623046875)
-GLYPHS[711] = Glyph('ˇ', 'caron', 0.6142578125, -0.62646484375, 0.783203125, 0.13623046875, 0.13623046875)
-GLYPHS[712] = Glyph('ˈ', 'modifier letter vertical line', 0.2412109375, -0.48193359375, 0.77099609375, 0.08447265625, 0.08447265625)
-GLYPHS[713] = Glyph('ˉ', 'modifier letter macron', 0.6142578125, -0.62646484375, 0.69873046875, 0.150390625, 0.150390625)
-GLYPHS[714] = Glyph('ˊ', 'modifier letter acute accent', 0.6142578125, -0.62646484375, 0.783203125, 0.19287109375, 0.1923828125)
-GLYPHS[715] = Glyph('ˋ', 'modifier letter grave accent', 0.6142578125, -0.62646484375, 0.783203125, 0.19287109375, 0.1923828125)
-GLYPHS[716] = Glyph('ˌ', 'modifier letter low vertical line', 0.2412109375, 0.20458984375, 0.04833984375, 0.08447265625, 0.08447265625)
-GLYPHS[717] = Glyph('ˍ', 'modifier letter low macron', 0.6142578125, 0.1689453125, -0.0966796875, 0.150390625, 0.150390625)
-GLYPHS[718] = Glyph('ˎ', 'modifier letter low grave accent', 0.6142578125, 0.2529296875, -0.09619140625, 0.19287109375, 0.1923828125)
-GLYPHS[719] = Glyph('ˏ', 'modifier letter low acute accent', 0.6142578125, 0.2529296875, -0.09619140625, 0.19287109375, 0.1923828125)
-GLYPHS[720] = Glyph('ː', 'modifier letter triangular colon', 0.40966796875, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[721] = Glyph('ˑ', 'modifier letter half triangular colon', 0.40966796875, -0.3134765625, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[722] = Glyph('˒', 'modifier letter centred right half ring', 0.2890625, -0.15673828125, 0.43359375, 0.06005859375, 0.06005859375)
-GLYPHS[723] = Glyph('˓', 'modifier letter centred left half ring', 0.2890625, -0.15673828125, 0.43359375, 0.06005859375, 0.06005859375)
-GLYPHS[724] = Glyph('˔', 'modifier letter up tack', 0.47021484375, -0.22900390625, 0.43359375, 0.072265625, 0.07275390625)
-GLYPHS[725] = Glyph('˕', 'modifier letter down tack', 0.47021484375, -0.22900390625, 0.43359375, 0.072265625, 0.07275390625)
-GLYPHS[726] = Glyph('˖', 'modifier letter plus sign', 0.47021484375, -0.12060546875, 0.44580078125, 0.072265625, 0.072265625)
-GLYPHS[727] = Glyph('˗', 'modifier letter minus sign', 0.47021484375, -0.19287109375, 0.37353515625, 0.072265625, 0.07275390625)
-GLYPHS[728] = Glyph('˘', 'breve', 0.6142578125, -0.62646484375, 0.77099609375, 0.14453125, 0.14453125)
-GLYPHS[729] = Glyph('˙', 'dot above', 0.6142578125, -0.62646484375, 0.72265625, 0.2587890625, 0.25927734375)
-GLYPHS[730] = Glyph('˚', 'ring above', 0.6142578125, -0.62646484375, 0.84814453125, 0.1962890625, 0.1962890625)
-GLYPHS[731] = Glyph('˛', 'ogonek', 0.6142578125, 0.1806640625, 0, 0.244140625, 0.203125)
-GLYPHS[732] = Glyph('˜', 'small tilde', 0.6142578125, -0.62646484375, 0.74072265625, 0.14453125, 0.14453125)
-GLYPHS[733] = Glyph('˝', 'double acute accent', 0.6142578125, -0.62646484375, 0.783203125, 0.11572265625, 0.1162109375)
-GLYPHS[734] = Glyph('˞', 'modifier letter rhotic hook', 0.26123046875, -0.12353515625, 0.408203125, -0.0595703125, 0.01171875)
-GLYPHS[736] = Glyph('ˠ', 'modifier letter small gamma', 0.37890625, -0.28125, 0.77099609375, 0, 0.01171875)
-GLYPHS[737] = Glyph('ˡ', 'modifier letter small l', 0.1845703125, -0.451171875, 0.9140625, 0.05615234375, 0.05615234375)
-GLYPHS[738] = Glyph('ˢ', 'modifier letter small s', 0.34521484375, -0.44384765625, 0.7783203125, 0.05615234375, 0.0556640625)
-GLYPHS[739] = Glyph('ˣ', 'modifier letter small x', 0.423828125, -0.451171875, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[740] = Glyph('ˤ', 'modifier letter small reversed glottal stop', 0.326171875, -0.451171875, 0.89599609375, 0.02392578125, 0.0546875)
-GLYPHS[741] = Glyph('˥', 'modifier letter extra-high tone bar', 0.4375, 0, 0.72265625, 0.01806640625, 0.09619140625)
-GLYPHS[742] = Glyph('˦', 'modifier letter high tone bar', 0.4375, 0, 0.72265625, 0.01806640625, 0.09619140625)
-GLYPHS[743] = Glyph('˧', 'modifier letter mid tone bar', 0.4375, 0, 0.72265625, 0.01806640625, 0.09619140625)
-GLYPHS[744] = Glyph('˨', 'modifier letter low tone bar', 0.4375, 0, 0.72265625, 0.01806640625, 0.09619140625)
-GLYPHS[745] = Glyph('˩', 'modifier letter extra-low tone bar', 0.4375, 0, 0.72265625, 0.01806640625, 0.09619140625)
-GLYPHS[768] = Glyph('̀', 'combining grave accent', 0, -0.62646484375, 0.783203125, -0.46337890625, 0.234375)
-GLYPHS[769] = Glyph('́', 'combining acute accent', 0, -0.62646484375, 0.783203125, -0.37890625, 0.14990234375)
-GLYPHS[770] = Glyph('̂', 'combining circumflex accent', 0, -0.62646484375, 0.783203125, -0.4775390625, 0.1357421875)
-GLYPHS[771] = Glyph('̃', 'combining tilde', 0, -0.62646484375, 0.74072265625, -0.46923828125, 0.14404296875)
-GLYPHS[772] = Glyph('̄', 'combining macron', 0, -0.62646484375, 0.69873046875, -0.4453125, 0.16796875)
-GLYPHS[773] = Glyph('̅', 'combining overline', 0, -0.783203125, 0.85546875, -0.61376953125, -0.00048828125)
-GLYPHS[774] = Glyph('̆', 'combining breve', 0, -0.62646484375, 0.77099609375, -0.46923828125, 0.14404296875)
-GLYPHS[775] = Glyph('̇', 'combining dot above', 0, -0.62646484375, 0.72265625, -0.35498046875, 0.2587890625)
-GLYPHS[776] = Glyph('̈', 'combining diaeresis', 0, -0.62646484375, 0.7109375, -0.4453125, 0.16796875)
-GLYPHS[777] = Glyph('̉', 'combining hook above', 0, -0.62646484375, 0.80712890625, -0.3564453125, 0.22412109375)
-GLYPHS[778] = Glyph('̊', 'combining ring above', 0, -0.62646484375, 0.84814453125, -0.41748046875, 0.1962890625)
-GLYPHS[779] = Glyph('̋', 'combining double acute accent', 0, -0.62646484375, 0.783203125, -0.45166015625, 0.06298828125)
-GLYPHS[780] = Glyph('̌', 'combining caron', 0, -0.62646484375, 0.783203125, -0.4775390625, 0.1357421875)
-GLYPHS[781] = Glyph('̍', 'combining vertical line above', 0, -0.62646484375, 0.80712890625, -0.3427734375, 0.2705078125)
-GLYPHS[782] = Glyph('̎', 'combining double vertical line above', 0, -0.62646484375, 0.80712890625, -0.42724609375, 0.1865234375)
-GLYPHS[783] = Glyph('̏', 'combining double grave accent', 0, -0.62646484375, 0.783203125, -0.55029296875, 0.16162109375)
-GLYPHS[784] = Glyph('̐', 'combining candrabindu', 0, -0.62646484375, 0.91259765625, -0.4775390625, 0.1357421875)
-GLYPHS[785] = Glyph('̑', 'combining inverted breve', 0, -0.62646484375, 0.77099609375, -0.46923828125, 0.14404296875)
-GLYPHS[786] = Glyph('̒', 'combining turned comma above', 0, -0.62646484375, 0.84814453125, -0.35498046875, 0.2587890625)
-GLYPHS[787] = Glyph('̓', 'combining comma above', 0, -0.62646484375, 0.84814453125, -0.35498046875, 0.2587890625)
-GLYPHS[788] = Glyph('̔', 'combining reversed comma above', 0, -0.62646484375, 0.84814453125, -0.35498046875, 0.2587890625)
-GLYPHS[789] = Glyph('̕', 'combining comma above right', 0, -0.62646484375, 0.84814453125, -0.095703125, -0.00048828125)
-GLYPHS[790] = Glyph('̖', 'combining grave accent below', 0, 0.2529296875, -0.09619140625, -0.41845703125, 0.189453125)
-GLYPHS[791] = Glyph('̗', 'combining acute accent below', 0, 0.2529296875, -0.09619140625, -0.42431640625, 0.1953125)
-GLYPHS[792] = Glyph('̘', 'combining left tack below', 0, 0.3134765625, -0.04833984375, -0.439453125, 0.2587890625)
-GLYPHS[793] = Glyph('̙', 'combining right tack below', 0, 0.3134765625, -0.04833984375, -0.3310546875, 0.150390625)
-GLYPHS[794] = Glyph('̚', 'combining left angle above', 0, -0.5302734375, 0.77099609375, -0.240234375, -0.00048828125)
-GLYPHS[795] = Glyph('̛', 'combining horn', 0, -0.4580078125, 0.68212890625, -0.2041015625, -0.0009765625)
-GLYPHS[796] = Glyph('̜', 'combining left half ring below', 0, 0.31787109375, -0.095703125, -0.3740234375, 0.2392578125)
-GLYPHS[797] = Glyph('̝', 'combining up tack below', 0, 0.27685546875, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[798] = Glyph('̞', 'combining down tack below', 0, 0.27685546875, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[799] = Glyph('̟', 'combining plus sign below', 0, 0.361328125, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[800] = Glyph('̠', 'combining minus sign below', 0, 0.2412109375, -0.095703125, -0.439453125, 0.17431640625)
-GLYPHS[801] = Glyph('̡', 'combining palatalized hook below', 0, 0.20458984375, 0, -0.228515625, -0.00048828125)
-GLYPHS[802] = Glyph('̢', 'combining retroflex hook below', 0, 0.20458984375, 0, -0.228515625, -0.00048828125)
-GLYPHS[803] = Glyph('̣', 'combining dot below', 0, 0.19287109375, -0.0966796875, -0.35498046875, 0.2587890625)
-GLYPHS[804] = Glyph('̤', 'combining diaeresis below', 0, 0.1806640625, -0.09619140625, -0.4453125, 0.16796875)
-GLYPHS[805] = Glyph('̥', 'combining ring below', 0, 0.31787109375, -0.09619140625, -0.41748046875, 0.1962890625)
-GLYPHS[806] = Glyph('̦', 'combining comma below', 0, 0.318359375, -0.0966796875, -0.35498046875, 0.2587890625)
-GLYPHS[807] = Glyph('̧', 'combining cedilla', 0, 0.2109375, 0, -0.34619140625, 0.1767578125)
-GLYPHS[808] = Glyph('̨', 'combining ogonek', 0, 0.1806640625, 0, -0.36865234375, 0.20166015625)
-GLYPHS[809] = Glyph('̩', 'combining vertical line below', 0, 0.27734375, -0.09619140625, -0.3427734375, 0.2705078125)
-GLYPHS[810] = Glyph('̪', 'combining bridge below', 0, 0.2529296875, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[811] = Glyph('̫', 'combining inverted double arch below', 0, 0.22265625, -0.09619140625, -0.517578125, 0.095703125)
-GLYPHS[812] = Glyph('̬', 'combining caron below', 0, 0.2529296875, -0.09619140625, -0.4775390625, 0.1357421875)
-GLYPHS[813] = Glyph('̭', 'combining circumflex accent below', 0, 0.2529296875, -0.09619140625, -0.4775390625, 0.1357421875)
-GLYPHS[814] = Glyph('̮', 'combining breve below', 0, 0.2412109375, -0.09619140625, -0.46923828125, 0.14404296875)
-GLYPHS[815] = Glyph('̯', 'combining inverted breve below', 0, 0.2412109375, -0.09619140625, -0.46923828125, 0.14404296875)
-GLYPHS[816] = Glyph('̰', 'combining tilde below', 0, 0.2109375, -0.09619140625, -0.46923828125, 0.14404296875)
-GLYPHS[817] = Glyph('̱', 'combining macron below', 0, 0.1689453125, -0.0966796875, -0.46337890625, 0.14990234375)
-GLYPHS[818] = Glyph('̲', 'combining low line', 0, 0.283203125, -0.2109375, -0.61376953125, -0.00048828125)
-GLYPHS[819] = Glyph('̳', 'combining double low line', 0, 0.43994140625, -0.2109375, -0.61376953125, -0.00048828125)
-GLYPHS[820] = Glyph('̴', 'combining tilde overlay', 0, -0.19873046875, 0.376953125, -0.5595703125, 0.0537109375)
-GLYPHS[821] = Glyph('̵', 'combining short stroke overlay', 0, -0.23486328125, 0.30712890625, -0.5595703125, 0.0537109375)
-GLYPHS[822] = Glyph('̶', 'combining long stroke overlay', 0, -0.23486328125, 0.30712890625, -0.61376953125, -0.00048828125)
-GLYPHS[823] = Glyph('̷', 'combining short solidus overlay', 0, 0, 0.5302734375, -0.6142578125, -0.0009765625)
-GLYPHS[824] = Glyph('̸', 'combining long solidus overlay', 0, 0.09619140625, 0.8193359375, -0.5693359375, 0.0439453125)
-GLYPHS[825] = Glyph('̹', 'combining right half ring below', 0, 0.27685546875, -0.09619140625, -0.36376953125, 0.24951171875)
-GLYPHS[826] = Glyph('̺', 'combining inverted bridge below', 0, 0.2529296875, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[827] = Glyph('̻', 'combining square below', 0, 0.30126953125, -0.09619140625, -0.439453125, 0.17431640625)
-GLYPHS[828] = Glyph('̼', 'combining seagull below', 0, 0.22265625, -0.09619140625, -0.517578125, 0.095703125)
-GLYPHS[829] = Glyph('̽', 'combining x above', 0, -0.61962890625, 0.80712890625, -0.4345703125, 0.17919921875)
-GLYPHS[830] = Glyph('̾', 'combining vertical tilde', 0, -0.62646484375, 0.80712890625, -0.35498046875, 0.2548828125)
-GLYPHS[831] = Glyph('̿', 'combining double overline', 0, -0.783203125, 1.0126953125, -0.61376953125, -0.00048828125)
-GLYPHS[832] = Glyph('̀', 'combining grave tone mark', 0, -0.86767578125, 1.02392578125, -0.61376953125, 0.384765625)
-GLYPHS[833] = Glyph('́', 'combining acute tone mark', 0, -0.86767578125, 1.02392578125, -0.228515625, -0.00048828125)
-GLYPHS[836] = Glyph('̈́', 'combining greek dialytika tonos', 0.00048828125, -0.62646484375, 0.783203125, -0.4990234375, 0.11376953125)
-GLYPHS[837] = Glyph('ͅ', 'combining greek ypogegrammeni', 0, 0.205078125, -0.06005859375, -0.31298828125, 0.16845703125)
-GLYPHS[884] = Glyph('ʹ', 'greek numeral sign', 0.3251953125, -0.43359375, 0.72265625, 0.072265625, 0.04833984375)
-GLYPHS[885] = Glyph('͵', 'greek lower numeral sign', 0.3251953125, 0, 0.2890625, 0.072265625, 0.04833984375)
-GLYPHS[890] = Glyph('ͺ', 'greek ypogegrammeni', 0.6142578125, 0.2109375, -0.06005859375, 0.2666015625, 0.203125)
-GLYPHS[894] = Glyph(';', 'greek question mark', 0.31640625, 0.15673828125, 0.5302734375, 0.10986328125, 0.1103515625)
-GLYPHS[900] = Glyph('΄', 'greek tonos', 0.6142578125, -0.62646484375, 0.783203125, 0.25927734375, 0.2587890625)
-GLYPHS[901] = Glyph('΅', 'greek dialytika tonos', 0.6142578125, -0.62646484375, 0.783203125, 0.1142578125, 0.1142578125)
-GLYPHS[902] = Glyph('Ά', 'greek capital letter alpha with tonos', 0.68994140625, 0, 0.72265625, 0.00830078125, 0.01123046875)
-GLYPHS[904] = Glyph('Έ', 'greek capital letter epsilon with tonos', 0.64794921875, 0, 0.72265625, 0.005859375, 0.0244140625)
-GLYPHS[905] = Glyph('Ή', 'greek capital letter eta with tonos', 0.84033203125, 0, 0.72265625, 0.005859375, 0.0927734375)
-GLYPHS[906] = Glyph('Ί', 'greek capital letter iota with tonos', 0.3955078125, 0, 0.72265625, 0.005859375, 0.09326171875)
-GLYPHS[908] = Glyph('Ό', 'greek capital letter omicron with tonos', 0.86279296875, 0.01806640625, 0.74072265625, 0.005859375, 0.05078125)
-GLYPHS[910] = Glyph('Ύ', 'greek capital letter upsilon with tonos', 0.818359375, 0, 0.72265625, 0.005859375, 0.01416015625)
-GLYPHS[911] = Glyph('Ώ', 'greek capital letter omega with tonos', 0.87255859375, 0, 0.74072265625, 0.005859375, 0.03076171875)
-GLYPHS[912] = Glyph('ΐ', 'greek small letter iota with dialytika and tonos', 0.36767578125, 0.01220703125, 0.783203125, -0.0478515625, 0.02392578125)
-GLYPHS[913] = Glyph('Α', 'greek capital letter alpha', 0.68994140625, 0, 0.72265625, 0.00830078125, 0.01123046875)
-GLYPHS[914] = Glyph('Β', 'greek capital letter beta', 0.5751953125, 0, 0.72265625, 0.09326171875, 0.04150390625)
-GLYPHS[915] = Glyph('Γ', 'greek capital letter gamma', 0.50927734375, 0, 0.72265625, 0.09326171875, 0.01171875)
-GLYPHS[916] = Glyph('Δ', 'greek capital letter delta', 0.7001953125, 0, 0.72265625, 0.02392578125, 0.02392578125)
-GLYPHS[917] = Glyph('Ε', 'greek capital letter epsilon', 0.5419921875, 0, 0.72265625, 0.09326171875, 0.02392578125)
-GLYPHS[918] = Glyph('Ζ', 'greek capital letter zeta', 0.6044921875, 0, 0.72265625, 0.04638671875, 0.046875)
-GLYPHS[919] = Glyph('Η', 'greek capital letter eta', 0.73486328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[920] = Glyph('Θ', 'greek capital letter theta', 0.77734375, 0.01806640625, 0.74072265625, 0.05078125, 0.05078125)
-GLYPHS[921] = Glyph('Ι', 'greek capital letter iota', 0.2880859375, 0, 0.72265625, 0.0927734375, 0.0927734375)
-GLYPHS[922] = Glyph('Κ', 'greek capital letter kappa', 0.65283203125, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[923] = Glyph('Λ', 'greek capital letter lamda', 0.650390625, 0, 0.72265625, 0.00927734375, 0.0087890625)
-GLYPHS[924] = Glyph('Μ', 'greek capital letter mu', 0.861328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[925] = Glyph('Ν', 'greek capital letter nu', 0.73876953125, 0, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[926] = Glyph('Ξ', 'greek capital letter xi', 0.6083984375, 0, 0.72265625, 0.01806640625, 0.01806640625)
-GLYPHS[927] = Glyph('Ο', 'greek capital letter omicron', 0.77685546875, 0.01806640625, 0.74072265625, 0.05078125, 0.05029296875)
-GLYPHS[928] = Glyph('Π', 'greek capital letter pi', 0.75927734375, 0, 0.72265625, 0.0390625, 0.0390625)
-GLYPHS[929] = Glyph('Ρ', 'greek capital letter rho', 0.552734375, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[931] = Glyph('Σ', 'greek capital letter sigma', 0.59326171875, 0, 0.72265625, 0.0302734375, 0.02685546875)
-GLYPHS[932] = Glyph('Τ', 'greek capital letter tau', 0.63232421875, 0, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[933] = Glyph('Υ', 'greek capital letter upsilon', 0.63818359375, 0, 0.72265625, 0.0126953125, 0.01416015625)
-GLYPHS[934] = Glyph('Φ', 'greek capital letter phi', 0.70458984375, 0, 0.72265625, 0.0302734375, 0.02978515625)
-GLYPHS[935] = Glyph('Χ', 'greek capital letter chi', 0.6259765625, 0, 0.72265625, 0.0078125, 0.0263671875)
-GLYPHS[936] = Glyph('Ψ', 'greek capital letter psi', 0.73193359375, 0, 0.72265625, 0.005859375, 0.00634765625)
-GLYPHS[937] = Glyph('Ω', 'greek capital letter omega', 0.794921875, 0, 0.74072265625, 0.0361328125, 0.0361328125)
-GLYPHS[938] = Glyph('Ϊ', 'greek capital letter iota with dialytika', 0.2880859375, 0, 0.86767578125, 0.00537109375, 0.00537109375)
-GLYPHS[939] = Glyph('Ϋ', 'greek capital letter upsilon with dialytika', 0.63818359375, 0, 0.86767578125, 0.0126953125, 0.01416015625)
-GLYPHS[940] = Glyph('ά', 'greek small letter alpha with tonos', 0.716796875, 0.01220703125, 0.783203125, 0.064453125, 0.05029296875)
-GLYPHS[941] = Glyph('έ', 'greek small letter epsilon with tonos', 0.52734375, 0.01220703125, 0.783203125, 0.05419921875, 0.060546875)
-GLYPHS[942] = Glyph('ή', 'greek small letter eta with tonos', 0.6220703125, 0.19287109375, 0.783203125, 0.06591796875, 0.09033203125)
-GLYPHS[943] = Glyph('ί', 'greek small letter iota with tonos', 0.36767578125, 0.01220703125, 0.783203125, 0.09619140625, 0.0244140625)
-GLYPHS[944] = Glyph('ΰ', 'greek small letter upsilon with dialytika and tonos', 0.6083984375, 0.01220703125, 0.783203125, 0.09033203125, 0.072265625)
-GLYPHS[945] = Glyph('α', 'greek small letter alpha', 0.716796875, 0.01220703125, 0.5419921875, 0.064453125, 0.05029296875)
-GLYPHS[946] = Glyph('β', 'greek small letter beta', 0.6025390625, 0.19287109375, 0.783203125, 0.09619140625, 0.04833984375)
-GLYPHS[947] = Glyph('γ', 'greek small letter gamma', 0.57177734375, 0.19287109375, 0.5302734375, 0.0029296875, 0.0029296875)
-GLYPHS[948] = Glyph('δ', 'greek small letter delta', 0.59033203125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[949] = Glyph('ε', 'greek small letter epsilon', 0.52734375, 0.01220703125, 0.5419921875, 0.05419921875, 0.060546875)
-GLYPHS[950] = Glyph('ζ', 'greek small letter zeta', 0.6357421875, 0.20458984375, 0.783203125, 0.02099609375, 0.01220703125)
-GLYPHS[951] = Glyph('η', 'greek small letter eta', 0.6220703125, 0.19287109375, 0.5419921875, 0.06591796875, 0.09033203125)
-GLYPHS[952] = Glyph('θ', 'greek small letter theta', 0.6142578125, 0.01220703125, 0.783203125, 0.06640625, 0.06591796875)
-GLYPHS[953] = Glyph('ι', 'greek small letter iota', 0.36767578125, 0.01220703125, 0.5302734375, 0.09619140625, 0.0244140625)
-GLYPHS[954] = Glyph('κ', 'greek small letter kappa', 0.54541015625, 0, 0.5302734375, 0.09619140625, 0.0302734375)
-GLYPHS[955] = Glyph('λ', 'greek small letter lamda', 0.59423828125, 0, 0.77099609375, 0.02197265625, 0.0166015625)
-GLYPHS[956] = Glyph('μ', 'greek small letter mu', 0.6318359375, 0.14453125, 0.5302734375, 0.09619140625, 0.0693359375)
-GLYPHS[957] = Glyph('ν', 'greek small letter nu', 0.548828125, 0, 0.5302734375, 0, 0.0390625)
-GLYPHS[958] = Glyph('ξ', 'greek small letter xi', 0.578125, 0.20458984375, 0.783203125, -0.00537109375, 0.01708984375)
-GLYPHS[959] = Glyph('ο', 'greek small letter omicron', 0.6142578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[960] = Glyph('π', 'greek small letter pi', 0.7802734375, 0, 0.5302734375, 0.0361328125, 0.0361328125)
-GLYPHS[961] = Glyph('ρ', 'greek small letter rho', 0.62060546875, 0.19287109375, 0.5419921875, 0.09619140625, 0.06640625)
-GLYPHS[962] = Glyph('ς', 'greek small letter final sigma', 0.58154296875, 0.20458984375, 0.5419921875, 0.05419921875, 0.0244140625)
-GLYPHS[963] = Glyph('σ', 'greek small letter sigma', 0.67333984375, 0.01220703125, 0.5419921875, 0.05419921875, -0.0302734375)
-GLYPHS[964] = Glyph('τ', 'greek small letter tau', 0.5390625, 0, 0.5302734375, 0.01953125, 0.01953125)
-GLYPHS[965] = Glyph('υ', 'greek small letter upsilon', 0.6083984375, 0.01220703125, 0.5302734375, 0.09033203125, 0.072265625)
-GLYPHS[966] = Glyph('φ', 'greek small letter phi', 0.77099609375, 0.19287109375, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[967] = Glyph('χ', 'greek small letter chi', 0.54833984375, 0.19287109375, 0.5302734375, 0.00341796875, 0.00146484375)
-GLYPHS[968] = Glyph('ψ', 'greek small letter psi', 0.7890625, 0.19287109375, 0.62646484375, 0.04541015625, 0.05126953125)
-GLYPHS[969] = Glyph('ω', 'greek small letter omega', 0.8974609375, 0.01220703125, 0.5302734375, 0.05419921875, 0.05419921875)
-GLYPHS[970] = Glyph('ϊ', 'greek small letter iota with dialytika', 0.36767578125, 0.01220703125, 0.7109375, 0.005859375, 0.0244140625)
-GLYPHS[971] = Glyph('ϋ', 'greek small letter upsilon with dialytika', 0.6083984375, 0.01220703125, 0.7109375, 0.09033203125, 0.072265625)
-GLYPHS[972] = Glyph('ό', 'greek small letter omicron with tonos', 0.6142578125, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[973] = Glyph('ύ', 'greek small letter upsilon with tonos', 0.6083984375, 0.01220703125, 0.783203125, 0.09033203125, 0.072265625)
-GLYPHS[974] = Glyph('ώ', 'greek small letter omega with tonos', 0.8974609375, 0.01220703125, 0.783203125, 0.05419921875, 0.05419921875)
-GLYPHS[976] = Glyph('ϐ', 'greek beta symbol', 0.51806640625, 0.01220703125, 0.783203125, 0.05419921875, 0.0390625)
-GLYPHS[977] = Glyph('ϑ', 'greek theta symbol', 0.62353515625, 0.01220703125, 0.783203125, 0.05419921875, 0.0302734375)
-GLYPHS[978] = Glyph('ϒ', 'greek upsilon with hook symbol', 0.63623046875, 0, 0.72265625, 0.001953125, 0.00390625)
-GLYPHS[979] = Glyph('ϓ', 'greek upsilon with acute and hook symbol', 0.81884765625, 0, 0.72265625, 0.005859375, 0.01416015625)
-GLYPHS[980] = Glyph('ϔ', 'greek upsilon with diaeresis and hook symbol', 0.63623046875, 0, 0.86767578125, 0.001953125, 0.00390625)
-GLYPHS[981] = Glyph('ϕ', 'greek phi symbol', 0.849609375, 0.19287109375, 0.5419921875, 0.04833984375, 0.04833984375)
-GLYPHS[982] = Glyph('ϖ', 'greek pi symbol', 0.88525390625, 0.01220703125, 0.5302734375, 0.0087890625, 0.0361328125)
-GLYPHS[986] = Glyph('Ϛ', 'greek letter stigma', 0.671875, 0.20458984375, 0.74072265625, 0.05419921875, 0.01220703125)
-GLYPHS[988] = Glyph('Ϝ', 'greek letter digamma', 0.5361328125, 0, 0.72265625, 0.09326171875, 0.0390625)
-GLYPHS[990] = Glyph('Ϟ', 'greek letter koppa', 0.533203125, 0, 0.72265625, 0.04833984375, 0.01171875)
-GLYPHS[992] = Glyph('Ϡ', 'greek letter sampi', 0.62646484375, 0.0185546875, 0.7431640625, 0, 0.04833984375)
-GLYPHS[1006] = Glyph('Ϯ', 'coptic capital letter dei', 0.63232421875, 0, 0.72265625, 0.01220703125, 0.01171875)
-GLYPHS[1007] = Glyph('ϯ', 'coptic small letter dei', 0.54833984375, 0.19287109375, 0.77099609375, 0.033203125, 0.033203125)
-GLYPHS[1008] = Glyph('ϰ', 'greek kappa symbol', 0.54541015625, 0.01220703125, 0.5419921875, 0.0419921875, 0.04248046875)
-GLYPHS[1009] = Glyph('ϱ', 'greek rho symbol', 0.6025390625, 0.19287109375, 0.5419921875, 0.078125, 0.06640625)
-GLYPHS[1010] = Glyph('ϲ', 'greek lunate sigma symbol', 0.51220703125, 0.01220703125, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[1025] = Glyph('Ё', 'cyrillic capital letter io', 0.5419921875, 0, 0.86767578125, 0.09326171875, 0.02392578125)
-GLYPHS[1026] = Glyph('Ђ', 'cyrillic capital letter dje', 0.794921875, 0.005859375, 0.72265625, 0.005859375, 0.0361328125)
-GLYPHS[1027] = Glyph('Ѓ', 'cyrillic capital letter gje', 0.50927734375, 0, 0.93994140625, 0.09326171875, 0.01171875)
-GLYPHS[1028] = Glyph('Є', 'cyrillic capital letter ukrainian ie', 0.6025390625, 0.01806640625, 0.74072265625, 0.05126953125, 0.0419921875)
-GLYPHS[1029] = Glyph('Ѕ', 'cyrillic capital letter dze', 0.53857421875, 0.01806640625, 0.74072265625, 0.048828125, 0.0498046875)
-GLYPHS[1030] = Glyph('І', 'cyrillic capital letter byelorussian-ukrainian i', 0.2880859375, 0, 0.72265625, 0.0927734375, 0.0927734375)
-GLYPHS[1031] = Glyph('Ї', 'cyrillic capital letter yi', 0.2880859375, 0, 0.86767578125, 0.00537109375, 0.00537109375)
-GLYPHS[1032] = Glyph('Ј', 'cyrillic capital letter je', 0.31103515625, 0.14453125, 0.72265625, -0.08935546875, 0.08935546875)
-GLYPHS[1033] = Glyph('Љ', 'cyrillic capital letter lje', 0.98193359375, 0, 0.72265625, 0.01513671875, 0.0361328125)
-GLYPHS[1034] = Glyph('Њ', 'cyrillic capital letter nje', 0.96728515625, 0, 0.72265625, 0.09326171875, 0.0361328125)
-GLYPHS[1035] = Glyph('Ћ', 'cyrillic capital letter tshe', 0.76220703125, 0, 0.72265625, 0.00927734375, 0.0390625)
-GLYPHS[1036] = Glyph('Ќ', 'cyrillic capital letter kje', 0.5927734375, 0, 0.93994140625, 0.09326171875, 0.0302734375)
-GLYPHS[1038] = Glyph('Ў', 'cyrillic capital letter short u', 0.6416015625, 0, 0.927734375, 0.0361328125, -0.0087890625)
-GLYPHS[1039] = Glyph('Џ', 'cyrillic capital letter dzhe', 0.7353515625, 0.15673828125, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[1040] = Glyph('А', 'cyrillic capital letter a', 0.68994140625, 0, 0.72265625, 0.00830078125, 0.01123046875)
-GLYPHS[1041] = Glyph('Б', 'cyrillic capital letter be', 0.58154296875, 0, 0.72265625, 0.09326171875, 0.04833984375)
-GLYPHS[1042] = Glyph('В', 'cyrillic capital letter ve', 0.5751953125, 0, 0.72265625, 0.09326171875, 0.04150390625)
-GLYPHS[1043] = Glyph('Г', 'cyrillic capital letter ghe', 0.50927734375, 0, 0.72265625, 0.09326171875, 0.01171875)
-GLYPHS[1044] = Glyph('Д', 'cyrillic capital letter de', 0.76220703125, 0.15673828125, 0.72265625, 0.0361328125, 0.0302734375)
-GLYPHS[1045] = Glyph('Е', 'cyrillic capital letter ie', 0.5419921875, 0, 0.72265625, 0.09326171875, 0.02392578125)
-GLYPHS[1046] = Glyph('Ж', 'cyrillic capital letter zhe', 0.81689453125, 0, 0.72314453125, 0.02734375, 0.02685546875)
-GLYPHS[1047] = Glyph('З', 'cyrillic capital letter ze', 0.54052734375, 0.01806640625, 0.74072265625, 0.03173828125, 0.04150390625)
-GLYPHS[1048] = Glyph('И', 'cyrillic capital letter i', 0.74072265625, 0, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[1049] = Glyph('Й', 'cyrillic capital letter short i', 0.7412109375, 0, 0.927734375, 0.09326171875, 0.09375)
-GLYPHS[1050] = Glyph('К', 'cyrillic capital letter ka', 0.5927734375, 0, 0.72314453125, 0.09326171875, 0.0302734375)
-GLYPHS[1051] = Glyph('Л', 'cyrillic capital letter el', 0.70166015625, 0, 0.72265625, 0.01513671875, 0.09326171875)
-GLYPHS[1052] = Glyph('М', 'cyrillic capital letter em', 0.861328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[1053] = Glyph('Н', 'cyrillic capital letter en', 0.73486328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[1054] = Glyph('О', 'cyrillic capital letter o', 0.77685546875, 0.01806640625, 0.74072265625, 0.05078125, 0.05029296875)
-GLYPHS[1055] = Glyph('П', 'cyrillic capital letter pe', 0.73486328125, 0, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[1056] = Glyph('Р', 'cyrillic capital letter er', 0.552734375, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[1057] = Glyph('С', 'cyrillic capital letter es', 0.69189453125, 0.01806640625, 0.74072265625, 0.05078125, 0.0556640625)
-GLYPHS[1058] = Glyph('Т', 'cyrillic capital letter te', 0.63232421875, 0, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[1059] = Glyph('У', 'cyrillic capital letter u', 0.6416015625, 0, 0.72265625, 0.0361328125, -0.0087890625)
-GLYPHS[1060] = Glyph('Ф', 'cyrillic capital letter ef', 0.69287109375, 0, 0.72265625, 0.0302734375, 0.0302734375)
-GLYPHS[1061] = Glyph('Х', 'cyrillic capital letter ha', 0.6259765625, 0, 0.72265625, 0.0078125, 0.0263671875)
-GLYPHS[1062] = Glyph('Ц', 'cyrillic capital letter tse', 0.7685546875, 0.15673828125, 0.72265625, 0.09326171875, 0.0302734375)
-GLYPHS[1063] = Glyph('Ч', 'cyrillic capital letter che', 0.62939453125, 0, 0.72265625, 0.0390625, 0.09326171875)
-GLYPHS[1064] = Glyph('Ш', 'cyrillic capital letter sha', 0.95166015625, 0, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[1065] = Glyph('Щ', 'cyrillic capital letter shcha', 0.98486328125, 0.15673828125, 0.72265625, 0.09326171875, 0.0302734375)
-GLYPHS[1066] = Glyph('Ъ', 'cyrillic capital letter hard sign', 0.677734375, 0, 0.72265625, 0.00927734375, 0.0361328125)
-GLYPHS[1067] = Glyph('Ы', 'cyrillic capital letter yeru', 0.80419921875, 0, 0.72265625, 0.09326171875, 0.09326171875)
-GLYPHS[1068] = Glyph('Ь', 'cyrillic capital letter soft sign', 0.5693359375, 0, 0.72265625, 0.09326171875, 0.0361328125)
-GLYPHS[1069] = Glyph('Э', 'cyrillic capital letter e', 0.6025390625, 0.01806640625, 0.74072265625, 0.0419921875, 0.05126953125)
-GLYPHS[1070] = Glyph('Ю', 'cyrillic capital letter yu', 0.96533203125, 0.01806640625, 0.74072265625, 0.09326171875, 0.05419921875)
-GLYPHS[1071] = Glyph('Я', 'cyrillic capital letter ya', 0.6201171875, 0, 0.72265625, 0.01220703125, 0.09326171875)
-GLYPHS[1072] = Glyph('а', 'cyrillic small letter a', 0.55224609375, 0.01220703125, 0.5419921875, 0.05029296875, 0.0244140625)
-GLYPHS[1073] = Glyph('б', 'cyrillic small letter be', 0.59619140625, 0.01220703125, 0.796875, 0.05419921875, 0.05029296875)
-GLYPHS[1074] = Glyph('в', 'cyrillic small letter ve', 0.52490234375, 0, 0.5302734375, 0.09619140625, 0.0546875)
-GLYPHS[1075] = Glyph('г', 'cyrillic small letter ghe', 0.494140625, 0, 0.5302734375, 0.09619140625, 0.01220703125)
-GLYPHS[1076] = Glyph('д', 'cyrillic small letter de', 0.671875, 0.12060546875, 0.5302734375, 0.0361328125, 0.04248046875)
-GLYPHS[1077] = Glyph('е', 'cyrillic small letter ie', 0.55712890625, 0.01220703125, 0.5419921875, 0.05419921875, 0.06982421875)
-GLYPHS[1078] = Glyph('ж', 'cyrillic small letter zhe', 0.7275390625, 0, 0.5302734375, 0.02392578125, 0.02392578125)
-GLYPHS[1079] = Glyph('з', 'cyrillic small letter ze', 0.48046875, 0.01220703125, 0.5419921875, 0.0419921875, 0.0546875)
-GLYPHS[1080] = Glyph('и', 'cyrillic small letter i', 0.62646484375, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1081] = Glyph('й', 'cyrillic small letter short i', 0.62646484375, 0, 0.77099609375, 0.09619140625, 0.0966796875)
-GLYPHS[1082] = Glyph('к', 'cyrillic small letter ka', 0.537109375, 0, 0.5302734375, 0.09619140625, 0.04833984375)
-GLYPHS[1083] = Glyph('л', 'cyrillic small letter el', 0.58740234375, 0, 0.5302734375, 0.01806640625, 0.0966796875)
-GLYPHS[1084] = Glyph('м', 'cyrillic small letter em', 0.72607421875, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1085] = Glyph('н', 'cyrillic small letter en', 0.62646484375, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1086] = Glyph('о', 'cyrillic small letter o', 0.6142578125, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[1087] = Glyph('п', 'cyrillic small letter pe', 0.62646484375, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1088] = Glyph('р', 'cyrillic small letter er', 0.62939453125, 0.19287109375, 0.5419921875, 0.09619140625, 0.05419921875)
-GLYPHS[1089] = Glyph('с', 'cyrillic small letter es', 0.51220703125, 0.01220703125, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[1090] = Glyph('т', 'cyrillic small letter te', 0.494140625, 0, 0.5302734375, 0.005859375, 0.00634765625)
-GLYPHS[1091] = Glyph('у', 'cyrillic small letter u', 0.52587890625, 0.19287109375, 0.5302734375, 0.005859375, 0.00927734375)
-GLYPHS[1092] = Glyph('ф', 'cyrillic small letter ef', 0.80712890625, 0.19287109375, 0.72265625, 0.06005859375, 0.060546875)
-GLYPHS[1093] = Glyph('х', 'cyrillic small letter ha', 0.61328125, 0, 0.5302734375, 0.04296875, 0.04541015625)
-GLYPHS[1094] = Glyph('ц', 'cyrillic small letter tse', 0.66845703125, 0.12060546875, 0.5302734375, 0.09619140625, 0.0419921875)
-GLYPHS[1095] = Glyph('ч', 'cyrillic small letter che', 0.52392578125, 0, 0.5302734375, 0.0390625, 0.09619140625)
-GLYPHS[1096] = Glyph('ш', 'cyrillic small letter sha', 0.84326171875, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1097] = Glyph('щ', 'cyrillic small letter shcha', 0.8857421875, 0.12060546875, 0.5302734375, 0.09619140625, 0.04248046875)
-GLYPHS[1098] = Glyph('ъ', 'cyrillic small letter hard sign', 0.560546875, 0, 0.5302734375, 0.00927734375, 0.044921875)
-GLYPHS[1099] = Glyph('ы', 'cyrillic small letter yeru', 0.72314453125, 0, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1100] = Glyph('ь', 'cyrillic small letter soft sign', 0.50634765625, 0, 0.5302734375, 0.099609375, 0.044921875)
-GLYPHS[1101] = Glyph('э', 'cyrillic small letter e', 0.5087890625, 0.01220703125, 0.5419921875, 0.0419921875, 0.05419921875)
-GLYPHS[1102] = Glyph('ю', 'cyrillic small letter yu', 0.81396484375, 0.01220703125, 0.5419921875, 0.09619140625, 0.05419921875)
-GLYPHS[1103] = Glyph('я', 'cyrillic small letter ya', 0.51025390625, 0, 0.5302734375, 0.01806640625, 0.09619140625)
-GLYPHS[1105] = Glyph('ё', 'cyrillic small letter io', 0.55712890625, 0.01220703125, 0.7109375, 0.05419921875, 0.06982421875)
-GLYPHS[1106] = Glyph('ђ', 'cyrillic small letter dje', 0.62060546875, 0.20458984375, 0.77099609375, 0, 0.0908203125)
-GLYPHS[1107] = Glyph('ѓ', 'cyrillic small letter gje', 0.494140625, 0, 0.783203125, 0.09619140625, 0.01220703125)
-GLYPHS[1108] = Glyph('є', 'cyrillic small letter ukrainian ie', 0.5087890625, 0.01220703125, 0.5419921875, 0.05419921875, 0.0419921875)
-GLYPHS[1109] = Glyph('ѕ', 'cyrillic small letter dze', 0.509765625, 0.01220703125, 0.5419921875, 0.07666015625, 0.07666015625)
-GLYPHS[1110] = Glyph('і', 'cyrillic small letter byelorussian-ukrainian i', 0.2890625, 0, 0.72265625, 0.09619140625, 0.0966796875)
-GLYPHS[1111] = Glyph('ї', 'cyrillic small letter yi', 0.2890625, 0, 0.7109375, 0.005859375, 0.005859375)
-GLYPHS[1112] = Glyph('ј', 'cyrillic small letter je', 0.30419921875, 0.20458984375, 0.72265625, -0.07470703125, 0.095703125)
-GLYPHS[1113] = Glyph('љ', 'cyrillic small letter lje', 0.80126953125, 0, 0.5302734375, 0.01806640625, 0.044921875)
-GLYPHS[1114] = Glyph('њ', 'cyrillic small letter nje', 0.84033203125, 0, 0.5302734375, 0.09619140625, 0.04541015625)
-GLYPHS[1115] = Glyph('ћ', 'cyrillic small letter tshe', 0.62060546875, 0, 0.7587890625, 0, 0.0908203125)
-GLYPHS[1116] = Glyph('ќ', 'cyrillic small letter kje', 0.537109375, 0, 0.783203125, 0.09619140625, 0.04833984375)
-GLYPHS[1118] = Glyph('ў', 'cyrillic small letter short u', 0.52587890625, 0.19287109375, 0.77099609375, 0.005859375, 0.00927734375)
-GLYPHS[1119] = Glyph('џ', 'cyrillic small letter dzhe', 0.62646484375, 0.12060546875, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1122] = Glyph('Ѣ', 'cyrillic capital letter yat', 0.65673828125, 0, 0.72265625, 0, 0.0361328125)
-GLYPHS[1123] = Glyph('ѣ', 'cyrillic small letter yat', 0.55126953125, 0, 0.77099609375, 0.01220703125, 0.044921875)
-GLYPHS[1130] = Glyph('Ѫ', 'cyrillic capital letter big yus', 0.80517578125, 0, 0.72265625, 0.02734375, 0.02734375)
-GLYPHS[1131] = Glyph('ѫ', 'cyrillic small letter big yus', 0.701171875, 0, 0.5302734375, 0.02490234375, 0.0205078125)
-GLYPHS[1168] = Glyph('Ґ', 'cyrillic capital letter ghe with upturn', 0.50927734375, 0, 0.86767578125, 0.09326171875, 0.01171875)
-GLYPHS[1169] = Glyph('ґ', 'cyrillic small letter ghe with upturn', 0.494140625, 0, 0.650390625, 0.09619140625, 0.01220703125)
-GLYPHS[1170] = Glyph('Ғ', 'cyrillic capital letter ghe with stroke', 0.5634765625, 0, 0.72265625, 0.01220703125, 0.0390625)
-GLYPHS[1171] = Glyph('ғ', 'cyrillic small letter ghe with stroke', 0.494140625, 0, 0.5302734375, 0.02392578125, 0.01220703125)
-GLYPHS[1172] = Glyph('Ҕ', 'cyrillic capital letter ghe with middle hook', 0.62646484375, 0.14453125, 0.72265625, 0.09326171875, 0.0361328125)
-GLYPHS[1173] = Glyph('ҕ', 'cyrillic small letter ghe with middle hook', 0.54541015625, 0.14453125, 0.5302734375, 0.09619140625, 0.04833984375)
-GLYPHS[1174] = Glyph('Җ', 'cyrillic capital letter zhe with descender', 0.873046875, 0.14453125, 0.72314453125, 0.02734375, 0.02392578125)
-GLYPHS[1175] = Glyph('җ', 'cyrillic small letter zhe with descender', 0.783203125, 0.12060546875, 0.5302734375, 0.02392578125, 0.0302734375)
-GLYPHS[1176] = Glyph('Ҙ', 'cyrillic capital letter ze with descender', 0.54052734375, 0.2109375, 0.74072265625, 0.03173828125, 0.04150390625)
-GLYPHS[1177] = Glyph('ҙ', 'cyrillic small letter ze with descender', 0.48046875, 0.2109375, 0.5419921875, 0.0419921875, 0.0546875)
-GLYPHS[1178] = Glyph('Қ', 'cyrillic capital letter ka with descender', 0.638671875, 0.15673828125, 0.72314453125, 0.09326171875, 0.02392578125)
-GLYPHS[1179] = Glyph('қ', 'cyrillic small letter ka with descender', 0.56640625, 0.12060546875, 0.5302734375, 0.09619140625, 0.0302734375)
-GLYPHS[1180] = Glyph('Ҝ', 'cyrillic capital letter ka with vertical stroke', 0.72509765625, 0, 0.72314453125, 0.09326171875, 0.04248046875)
-GLYPHS[1181] = Glyph('ҝ', 'cyrillic small letter ka with vertical stroke', 0.6669921875, 0, 0.5302734375, 0.09619140625, 0.04833984375)
-GLYPHS[1182] = Glyph('Ҟ', 'cyrillic capital letter ka with stroke', 0.60791015625, 0, 0.72314453125, 0.00927734375, 0.0302734375)
-GLYPHS[1183] = Glyph('ҟ', 'cyrillic small letter ka with stroke', 0.537109375, 0, 0.77099609375, 0, 0.04833984375)
-GLYPHS[1184] = Glyph('Ҡ', 'cyrillic capital letter bashkir ka', 0.69189453125, 0, 0.72314453125, 0, 0.02978515625)
-GLYPHS[1185] = Glyph('ҡ', 'cyrillic small letter bashkir ka', 0.59130859375, 0, 0.5302734375, 0.005859375, 0.04833984375)
-GLYPHS[1186] = Glyph('Ң', 'cyrillic capital letter en with descender', 0.7685546875, 0.15673828125, 0.72265625, 0.09326171875, 0.0302734375)
-GLYPHS[1187] = Glyph('ң', 'cyrillic small letter en with descender', 0.66015625, 0.12060546875, 0.5302734375, 0.09619140625, 0.03662109375)
-GLYPHS[1188] = Glyph('Ҥ', 'cyrillic capital ligature en ghe', 0.8466796875, 0, 0.72265625, 0.09326171875, 0.01220703125)
-GLYPHS[1189] = Glyph('ҥ', 'cyrillic small ligature en ghe', 0.68408203125, 0, 0.5302734375, 0.09619140625, 0.01220703125)
-GLYPHS[1190] = Glyph('Ҧ', 'cyrillic capital letter pe with middle hook', 1.0244140625, 0.14453125, 0.72265625, 0.09326171875, 0.0361328125)
-GLYPHS[1191] = Glyph('ҧ', 'cyrillic small letter pe with middle hook', 0.8828125, 0.14453125, 0.5302734375, 0.09619140625, 0.04833984375)
-GLYPHS[1192] = Glyph('Ҩ', 'cyrillic capital letter abkhasian ha', 0.77392578125, 0.11865234375, 0.74072265625, 0.05419921875, 0.01806640625)
-GLYPHS[1193] = Glyph('ҩ', 'cyrillic small letter abkhasian ha', 0.62060546875, 0.12646484375, 0.5419921875, 0.05419921875, 0.01220703125)
-GLYPHS[1194] = Glyph('Ҫ', 'cyrillic capital letter es with descender', 0.69189453125, 0.2109375, 0.74072265625, 0.05078125, 0.0556640625)
-GLYPHS[1195] = Glyph('ҫ', 'cyrillic small letter es with descender', 0.51220703125, 0.2109375, 0.5419921875, 0.05419921875, 0.0478515625)
-GLYPHS[1196] = Glyph('Ҭ', 'cyrillic capital letter te with descender', 0.63232421875, 0.15673828125, 0.72265625, 0.0087890625, 0.00830078125)
-GLYPHS[1197] = Glyph('ҭ', 'cyrillic small letter te with descender', 0.494140625, 0.12060546875, 0.5302734375, 0.005859375, 0.00634765625)
-GLYPHS[1198] = Glyph('Ү', 'cyrillic capital letter straight u', 0.623046875, 0, 0.72265625, 0.00830078125, 0.0126953125)
-GLYPHS[1199] = Glyph('ү', 'cyrillic small letter straight u', 0.4853515625, 0, 0.5302734375, 0.005859375, 0.00634765625)
-GLYPHS[1200] = Glyph('Ұ', 'cyrillic capital letter straight u with stroke', 0.623046875, 0, 0.72265625, 0.00830078125, 0.0126953125)
-GLYPHS[1201] = Glyph('ұ', 'cyrillic small letter straight u with stroke', 0.4853515625, 0, 0.5302734375, 0.005859375, 0.00634765625)
-GLYPHS[1202] = Glyph('Ҳ', 'cyrillic capital letter ha with descender', 0.66259765625, 0.15673828125, 0.72265625, 0.0078125, 0.02392578125)
-GLYPHS[1203] = Glyph('ҳ', 'cyrillic small letter ha with descender', 0.63037109375, 0.12060546875, 0.5302734375, 0.04296875, 0.03076171875)
-GLYPHS[1204] = Glyph('Ҵ', 'cyrillic capital ligature te tse', 0.8740234375, 0.15673828125, 0.72265625, 0.005859375, 0.0302734375)
-GLYPHS[1205] = Glyph('ҵ', 'cyrillic small ligature te tse', 0.69287109375, 0.12060546875, 0.5302734375, 0.005859375, 0.03662109375)
-GLYPHS[1206] = Glyph('Ҷ', 'cyrillic capital letter che with descender', 0.66259765625, 0.15673828125, 0.72265625, 0.0390625, 0.0302734375)
-GLYPHS[1207] = Glyph('ҷ', 'cyrillic small letter che with descender', 0.56005859375, 0.12060546875, 0.5302734375, 0.0390625, 0.0361328125)
-GLYPHS[1208] = Glyph('Ҹ', 'cyrillic capital letter che with vertical stroke', 0.62939453125, 0, 0.72265625, 0.0390625, 0.09326171875)
-GLYPHS[1209] = Glyph('ҹ', 'cyrillic small letter che with vertical stroke', 0.52392578125, 0, 0.5302734375, 0.0390625, 0.09619140625)
-GLYPHS[1210] = Glyph('Һ', 'cyrillic capital letter shha', 0.62939453125, 0, 0.72265625, 0.09326171875, 0.0390625)
-GLYPHS[1211] = Glyph('һ', 'cyrillic small letter shha', 0.52392578125, 0, 0.5302734375, 0.09619140625, 0.0390625)
-GLYPHS[1212] = Glyph('Ҽ', 'cyrillic capital letter abkhasian che', 0.85791015625, 0.01806640625, 0.74072265625, 0.0234375, 0.06591796875)
-GLYPHS[1213] = Glyph('ҽ', 'cyrillic small letter abkhasian che', 0.7197265625, 0.01220703125, 0.5419921875, 0.01220703125, 0.0703125)
-GLYPHS[1214] = Glyph('Ҿ', 'cyrillic capital letter abkhasian che with descender', 0.85791015625, 0.1806640625, 0.74072265625, 0.0234375, 0.06591796875)
-GLYPHS[1215] = Glyph('ҿ', 'cyrillic small letter abkhasian che with descender', 0.7197265625, 0.1806640625, 0.5419921875, 0.01220703125, 0.0703125)
-GLYPHS[1216] = Glyph('Ӏ', 'cyrillic letter palochka', 0.2880859375, 0, 0.72265625, 0.0927734375, 0.0927734375)
-GLYPHS[1217] = Glyph('Ӂ', 'cyrillic capital letter zhe with breve', 0.81689453125, 0, 0.927734375, 0.02734375, 0.02685546875)
-GLYPHS[1218] = Glyph('ӂ', 'cyrillic small letter zhe with breve', 0.7275390625, 0, 0.77099609375, 0.02392578125, 0.02392578125)
-GLYPHS[1219] = Glyph('Ӄ', 'cyrillic capital letter ka with hook', 0.599609375, 0.14453125, 0.72314453125, 0.09326171875, 0.04833984375)
-GLYPHS[1220] = Glyph('ӄ', 'cyrillic small letter ka with hook', 0.5361328125, 0.14453125, 0.5302734375, 0.09619140625, 0.060546875)
-GLYPHS[1223] = Glyph('Ӈ', 'cyrillic capital letter en with hook', 0.73486328125, 0.20458984375, 0.72265625, 0.09326171875, 0.0927734375)
-GLYPHS[1224] = Glyph('ӈ', 'cyrillic small letter en with hook', 0.6240234375, 0.20458984375, 0.5302734375, 0.09619140625, 0.0966796875)
-GLYPHS[1227] = Glyph('Ӌ', 'cyrillic capital letter khakassian che', 0.62939453125, 0.15673828125, 0.72265625, 0.0390625, 0.09326171875)
-GLYPHS[1228] = Glyph('ӌ', 'cyrillic small letter khakassian che', 0.52392578125, 0.12060546875, 0.5302734375, 0.0390625, 0.09619140625)
-GLYPHS[1456] = Glyph('ְ', 'hebrew point sheva', 0, 0.3349609375, -0.04833984375, 0.29541015625, -0.41455078125)
-GLYPHS[1457] = Glyph('ֱ', 'hebrew point hataf segol', 0, 0.3349609375, -0.04833984375, 0.1279296875, -0.58203125)
-GLYPHS[1458] = Glyph('ֲ', 'hebrew point hataf patah', 0, 0.3349609375, -0.04833984375, 0.14990234375, -0.560546875)
-GLYPHS[1459] = Glyph('ֳ', 'hebrew point hataf qamats', 0, 0.3349609375, -0.04833984375, 0.1484375, -0.56103515625)
-GLYPHS[1460] = Glyph('ִ', 'hebrew point hiriq', 0, 0.16748046875, -0.04833984375, 0.29541015625, -0.41455078125)
-GLYPHS[1461] = Glyph('ֵ', 'hebrew point tsere', 0, 0.16748046875, -0.04833984375, 0.21142578125, -0.498046875)
-GLYPHS[1462] = Glyph('ֶ', 'hebrew point segol', 0, 0.3349609375, -0.04833984375, 0.21142578125, -0.498046875)
-GLYPHS[1463] = Glyph('ַ', 'hebrew point patah', 0, 0.10791015625, -0.04833984375, 0.2333984375, -0.4765625)
-GLYPHS[1464] = Glyph('ָ', 'hebrew point qamats', 0, 0.27734375, -0.04833984375, 0.232421875, -0.4775390625)
-GLYPHS[1465] = Glyph('ֹ', 'hebrew point holam', 0, -0.62646484375, 0.74560546875, -0.05908203125, -0.06005859375)
-GLYPHS[1467] = Glyph('ֻ', 'hebrew point qubuts', 0, 0.3349609375, -0.04833984375, 0.1279296875, -0.58203125)
-GLYPHS[1468] = Glyph('ּ', 'hebrew point dagesh or mapiq', 0, -0.24853515625, 0.3447265625, 0.2265625, -0.32275390625)
-GLYPHS[1469] = Glyph('ֽ', 'hebrew point meteg', 0, 0.2109375, -0.04833984375, 0.32470703125, -0.384765625)
-GLYPHS[1470] = Glyph('־', 'hebrew punctuation maqaf', 0.4208984375, -0.48193359375, 0.578125, 0.04833984375, 0.04833984375)
-GLYPHS[1471] = Glyph('ֿ', 'hebrew point rafe', 0, -0.67529296875, 0.73486328125, 0.2333984375, -0.4765625)
-GLYPHS[1472] = Glyph('׀', 'hebrew punctuation paseq', 0.2529296875, 0.01220703125, 0.59033203125, 0.08447265625, 0.083984375)
-GLYPHS[1473] = Glyph('ׁ', 'hebrew point shin dot', 0, -0.62646484375, 0.74560546875, 0.56298828125, -0.68212890625)
-GLYPHS[1474] = Glyph('ׂ', 'hebrew point sin dot', 0, -0.62646484375, 0.74560546875, 0.0302734375, -0.1494140625)
-GLYPHS[1475] = Glyph('׃', 'hebrew punctuation sof pasuq', 0.24951171875, 0.01220703125, 0.59033203125, 0.04833984375, 0.0478515625)
-GLYPHS[1488] = Glyph('א', 'hebrew letter alef', 0.64501953125, 0.01220703125, 0.59033203125, 0.05712890625, 0.05126953125)
-GLYPHS[1489] = Glyph('ב', 'hebrew letter bet', 0.5625, 0, 0.578125, 0.01806640625, 0.037109375)
-GLYPHS[1490] = Glyph('ג', 'hebrew letter gimel', 0.4267578125, 0.01220703125, 0.59033203125, 0.01220703125, 0.056640625)
-GLYPHS[1491] = Glyph('ד', 'hebrew letter dalet', 0.5009765625, 0, 0.578125, 0.005859375, 0.0029296875)
-GLYPHS[1492] = Glyph('ה', 'hebrew letter he', 0.7099609375, 0, 0.578125, 0.0361328125, 0.09033203125)
-GLYPHS[1493] = Glyph('ו', 'hebrew letter vav', 0.31982421875, 0, 0.59033203125, 0.005859375, 0.09033203125)
-GLYPHS[1494] = Glyph('ז', 'hebrew letter zayin', 0.3173828125, 0, 0.590301513671875, 0.00927734375, 0.017578125)
-GLYPHS[1495] = Glyph('ח', 'hebrew letter het', 0.7119140625, 0, 0.578125, 0.0361328125, 0.09033203125)
-GLYPHS[1496] = Glyph('ט', 'hebrew letter tet', 0.6416015625, 0, 0.59033203125, 0.05419921875, 0.0478515625)
-GLYPHS[1497] = Glyph('י', 'hebrew letter yod', 0.3173828125, -0.25244140625, 0.59033203125, 0.02099609375, 0.0751953125)
-GLYPHS[1498] = Glyph('ך', 'hebrew letter final kaf', 0.52783203125, 0.14453125, 0.578125, 0.01513671875, 0.09619140625)
-GLYPHS[1499] = Glyph('כ', 'hebrew letter kaf', 0.57177734375, 0, 0.578125, 0.01806640625, 0.0751953125)
-GLYPHS[1500] = Glyph('ל', 'hebrew letter lamed', 0.533203125, 0.01220703125, 0.783203125, 0.04833984375, 0.06640625)
-GLYPHS[1501] = Glyph('ם', 'hebrew letter final mem', 0.712890625, 0, 0.578125, 0.0390625, 0.09033203125)
-GLYPHS[1502] = Glyph('מ', 'hebrew letter mem', 0.65966796875, 0, 0.59033203125, 0.04541015625, 0.072265625)
-GLYPHS[1503] = Glyph('ן', 'hebrew letter final nun', 0.3115234375, 0.14453125, 0.59033203125, 0.005859375, 0.09033203125)
-GLYPHS[1504] = Glyph('נ', 'hebrew letter nun', 0.4130859375, 0, 0.59033203125, 0.01806640625, 0.09033203125)
-GLYPHS[1505] = Glyph('ס', 'hebrew letter samekh', 0.66455078125, 0, 0.578125, 0.00927734375, 0.06591796875)
-GLYPHS[1506] = Glyph('ע', 'hebrew letter ayin', 0.6005859375, 0.0654296875, 0.59033203125, -0.0146484375, 0.05810546875)
-GLYPHS[1507] = Glyph('ף', 'hebrew letter final pe', 0.52392578125, 0.14453125, 0.59033203125, 0.01806640625, 0.09033203125)
-GLYPHS[1508] = Glyph('פ', 'hebrew letter pe', 0.572265625, 0, 0.59033203125, 0.02392578125, 0.09033203125)
-GLYPHS[1509] = Glyph('ץ', 'hebrew letter final tsadi', 0.48583984375, 0.14453125, 0.59033203125, 0.0029296875, 0.03271484375)
-GLYPHS[1510] = Glyph('צ', 'hebrew letter tsadi', 0.57470703125, 0, 0.59033203125, 0.01513671875, 0.0654296875)
-GLYPHS[1511] = Glyph('ק', 'hebrew letter qof', 0.666015625, 0.14453125, 0.578125, 0.0361328125, 0.06640625)
-GLYPHS[1512] = Glyph('ר', 'hebrew letter resh', 0.509765625, 0, 0.578125, 0.02734375, 0.09033203125)
-GLYPHS[1513] = Glyph('ש', 'hebrew letter shin', 0.71630859375, 0, 0.59033203125, 0.05712890625, 0.04833984375)
-GLYPHS[1514] = Glyph('ת', 'hebrew letter tav', 0.69384765625, 0, 0.578125, 0.01220703125, 0.09033203125)
-GLYPHS[1520] = Glyph('װ', 'hebrew ligature yiddish double vav', 0.61572265625, 0, 0.59033203125, 0.005859375, 0.0908203125)
-GLYPHS[1521] = Glyph('ױ', 'hebrew ligature yiddish vav yod', 0.6162109375, 0, 0.59033203125, 0.02099609375, 0.09033203125)
-GLYPHS[1522] = Glyph('ײ', 'hebrew ligature yiddish double yod', 0.59912109375, -0.25244140625, 0.59033203125, 0.02099609375, 0.0751953125)
-GLYPHS[1523] = Glyph('׳', 'hebrew punctuation geresh', 0.27734375, -0.48193359375, 0.72265625, 0.06005859375, 0.03662109375)
-GLYPHS[1524] = Glyph('״', 'hebrew punctuation gershayim', 0.47802734375, -0.48193359375, 0.72265625, 0.06005859375, 0.03662109375)
-GLYPHS[7808] = Glyph('Ẁ', 'latin capital letter w with grave', 0.85546875, 0, 0.93994140625, 0.0009765625, 0.00146484375)
-GLYPHS[7809] = Glyph('ẁ', 'latin small letter w with grave', 0.7705078125, 0, 0.783203125, 0.005859375, 0.0068359375)
-GLYPHS[7810] = Glyph('Ẃ', 'latin capital letter w with acute', 0.85546875, 0, 0.93994140625, 0.0009765625, 0.00146484375)
-GLYPHS[7811] = Glyph('ẃ', 'latin small letter w with acute', 0.7705078125, 0, 0.783203125, 0.005859375, 0.0068359375)
-GLYPHS[7812] = Glyph('Ẅ', 'latin capital letter w with diaeresis', 0.85546875, 0, 0.86767578125, 0.0009765625, 0.00146484375)
-GLYPHS[7813] = Glyph('ẅ', 'latin small letter w with diaeresis', 0.7705078125, 0, 0.7109375, 0.005859375, 0.0068359375)
-GLYPHS[7922] = Glyph('Ỳ', 'latin capital letter y with grave', 0.623046875, 0, 0.93994140625, 0.00830078125, 0.0126953125)
-GLYPHS[7923] = Glyph('ỳ', 'latin small letter y with grave', 0.5224609375, 0.19287109375, 0.783203125, 0.0078125, 0.005859375)
-GLYPHS[8208] = Glyph('‐', 'hyphen', 0.3251953125, -0.26513671875, 0.33740234375, 0.05419921875, 0.05419921875)
-GLYPHS[8209] = Glyph('‑', 'non-breaking hyphen', 0.3251953125, -0.26513671875, 0.33740234375, 0.05419921875, 0.05419921875)
-GLYPHS[8210] = Glyph('‒', 'figure dash', 0.63232421875, -0.26513671875, 0.3251953125, 0.12060546875, 0.1201171875)
-GLYPHS[8211] = Glyph('–', 'en dash', 0.5, -0.26513671875, 0.32470703125, 0.05126953125, 0.05126953125)
-GLYPHS[8212] = Glyph('—', 'em dash', 1, -0.26513671875, 0.32470703125, 0.04833984375, 0.0478515625)
-GLYPHS[8213] = Glyph('―', 'horizontal bar', 1, -0.26513671875, 0.3251953125, 0.04833984375, 0.0478515625)
-GLYPHS[8214] = Glyph('‖', 'double vertical line', 0.578125, 0.14453125, 0.77099609375, 0.16259765625, 0.16259765625)
-GLYPHS[8215] = Glyph('‗', 'double low line', 0.5, 0.20458984375, 0, 0.0419921875, 0.04248046875)
-GLYPHS[8216] = Glyph('‘', 'left single quotation mark', 0.31640625, -0.494140625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[8217] = Glyph('’', 'right single quotation mark', 0.31640625, -0.494140625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[8218] = Glyph('‚', 'single low-9 quotation mark', 0.31640625, 0.14453125, 0.12060546875, 0.09765625, 0.09814453125)
-GLYPHS[8219] = Glyph('‛', 'single high-reversed-9 quotation mark', 0.31640625, -0.49462890625, 0.77099609375, 0.09765625, 0.09814453125)
-GLYPHS[8220] = Glyph('“', 'left double quotation mark', 0.37353515625, -0.51806640625, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[8221] = Glyph('”', 'right double quotation mark', 0.37353515625, -0.51806640625, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[8222] = Glyph('„', 'double low-9 quotation mark', 0.37353515625, 0.15673828125, 0.09619140625, 0.05419921875, 0.05419921875)
-GLYPHS[8223] = Glyph('‟', 'double high-reversed-9 quotation mark', 0.37353515625, -0.517578125, 0.77099609375, 0.05419921875, 0.05419921875)
-GLYPHS[8224] = Glyph('†', 'dagger', 0.63232421875, 0.14453125, 0.72265625, 0.111328125, 0.111328125)
-GLYPHS[8225] = Glyph('‡', 'double dagger', 0.63232421875, 0.14453125, 0.72265625, 0.111328125, 0.111328125)
-GLYPHS[8226] = Glyph('•', 'bullet', 0.63232421875, -0.19580078125, 0.37646484375, 0.22607421875, 0.2255859375)
-GLYPHS[8227] = Glyph('‣', 'triangular bullet', 0.35595703125, -0.0986328125, 0.47412109375, 0.09619140625, 0.072265625)
-GLYPHS[8228] = Glyph('․', 'one dot leader', 0.33349609375, 0, 0.095703125, 0.11865234375, 0.11865234375)
-GLYPHS[8229] = Glyph('‥', 'two dot leader', 0.66650390625, 0, 0.09619140625, 0.11865234375, 0.1181640625)
-GLYPHS[8230] = Glyph('…', 'horizontal ellipsis', 1, 0, 0.09619140625, 0.11865234375, 0.1181640625)
-GLYPHS[8231] = Glyph('‧', 'hyphenation point', 0.3251953125, -0.24169921875, 0.349609375, 0.1083984375, 0.1083984375)
-GLYPHS[8240] = Glyph('‰', 'per mille sign', 1.01220703125, 0.01806640625, 0.74072265625, 0.005859375, 0.00634765625)
-GLYPHS[8241] = Glyph('‱', 'per ten thousand sign', 1.35546875, 0.01806640625, 0.74072265625, 0.005859375, 0.00634765625)
-GLYPHS[8242] = Glyph('′', 'prime', 0.3251953125, -0.48193359375, 0.77099609375, 0.072265625, 0.04833984375)
-GLYPHS[8243] = Glyph('″', 'double prime', 0.5419921875, -0.48193359375, 0.77099609375, 0.072265625, 0.04833984375)
-GLYPHS[8244] = Glyph('‴', 'triple prime', 0.7587890625, -0.48193359375, 0.77099609375, 0.072265625, 0.04833984375)
-GLYPHS[8245] = Glyph('‵', 'reversed prime', 0.3251953125, -0.48193359375, 0.77099609375, 0.04833984375, 0.072265625)
-GLYPHS[8246] = Glyph('‶', 'reversed double prime', 0.5419921875, -0.48193359375, 0.77099609375, 0.04833984375, 0.072265625)
-GLYPHS[8247] = Glyph('‷', 'reversed triple prime', 0.7587890625, -0.48193359375, 0.77099609375, 0.04833984375, 0.072265625)
-GLYPHS[8248] = Glyph('‸', 'caret', 0.3525390625, 0.19287109375, 0.1357421875, 0.01220703125, 0.01220703125)
-GLYPHS[8249] = Glyph('‹', 'single left-pointing angle quotation mark', 0.33154296875, -0.04833984375, 0.482421875, 0.05419921875, 0.03662109375)
-GLYPHS[8250] = Glyph('›', 'single right-pointing angle quotation mark', 0.33154296875, -0.04833984375, 0.482421875, 0.0361328125, 0.0546875)
-GLYPHS[8251] = Glyph('※', 'reference mark', 0.72265625, -0.0732421875, 0.64990234375, 0.0732421875, 0.07275390625)
-GLYPHS[8252] = Glyph('‼', 'double exclamation mark', 0.51806640625, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8253] = Glyph('‽', 'interrobang', 0.421875, 0, 0.74072265625, 0.01806640625, 0.01806640625)
-GLYPHS[8254] = Glyph('‾', 'overline', 0.5, -0.783203125, 0.85546875, 0.0419921875, 0.04248046875)
-GLYPHS[8256] = Glyph('⁀', 'character tie', 0.59033203125, -0.81982421875, 0.97607421875, 0.005859375, 0.00634765625)
-GLYPHS[8257] = Glyph('⁁', 'caret insertion point', 0.46484375, 0.19287109375, 0.5302734375, 0.01220703125, 0.02392578125)
-GLYPHS[8258] = Glyph('⁂', 'asterism', 0.916015625, 0, 0.72265625, 0.08447265625, 0.083984375)
-GLYPHS[8259] = Glyph('⁃', 'hyphen bullet', 0.3251953125, -0.2412109375, 0.349609375, 0.05419921875, 0.05419921875)
-GLYPHS[8260] = Glyph('⁄', 'fraction slash', 0, 0.01806640625, 0.74072265625, -0.30126953125, -0.2958984375)
-GLYPHS[8304] = Glyph('⁰', 'superscript zero', 0.421875, -0.2783203125, 0.7333984375, 0.05078125, 0.05126953125)
-GLYPHS[8308] = Glyph('⁴', 'superscript four', 0.421875, -0.2890625, 0.72265625, 0.046875, 0.0498046875)
-GLYPHS[8309] = Glyph('⁵', 'superscript five', 0.421875, -0.2783203125, 0.72265625, 0.09033203125, 0.0810546875)
-GLYPHS[8310] = Glyph('⁶', 'superscript six', 0.421875, -0.2783203125, 0.7333984375, 0.05615234375, 0.0537109375)
-GLYPHS[8311] = Glyph('⁷', 'superscript seven', 0.421875, -0.2890625, 0.72265625, 0.07421875, 0.060546875)
-GLYPHS[8312] = Glyph('⁸', 'superscript eight', 0.421875, -0.2783203125, 0.7333984375, 0.05859375, 0.05859375)
-GLYPHS[8313] = Glyph('⁹', 'superscript nine', 0.421875, -0.28564453125, 0.74072265625, 0.0537109375, 0.0556640625)
-GLYPHS[8314] = Glyph('⁺', 'superscript plus sign', 0.421875, -0.3466796875, 0.6650390625, 0.0517578125, 0.05224609375)
-GLYPHS[8315] = Glyph('⁻', 'superscript minus', 0.421875, -0.4814453125, 0.5302734375, 0.0517578125, 0.05224609375)
-GLYPHS[8316] = Glyph('⁼', 'superscript equals sign', 0.421875, -0.42626953125, 0.5849609375, 0.0517578125, 0.05224609375)
-GLYPHS[8317] = Glyph('⁽', 'superscript left parenthesis', 0.2255859375, -0.20068359375, 0.75341796875, 0.04833984375, 0.02978515625)
-GLYPHS[8318] = Glyph('⁾', 'superscript right parenthesis', 0.2255859375, -0.20068359375, 0.75341796875, 0.0302734375, 0.0478515625)
-GLYPHS[8319] = Glyph('ⁿ', 'superscript latin small letter n', 0.38330078125, -0.2890625, 0.6162109375, 0.05615234375, 0.05224609375)
-GLYPHS[8320] = Glyph('₀', 'subscript zero', 0.421875, 0.0107421875, 0.4443359375, 0.05078125, 0.05126953125)
-GLYPHS[8321] = Glyph('₁', 'subscript one', 0.421875, 0, 0.4384765625, 0.12646484375, 0.15087890625)
-GLYPHS[8322] = Glyph('₂', 'subscript two', 0.421875, 0, 0.4443359375, 0.07275390625, 0.0732421875)
-GLYPHS[8323] = Glyph('₃', 'subscript three', 0.421875, 0.0107421875, 0.4443359375, 0.0771484375, 0.07666015625)
-GLYPHS[8324] = Glyph('₄', 'subscript four', 0.421875, 0, 0.43359375, 0.046875, 0.0498046875)
-GLYPHS[8325] = Glyph('₅', 'subscript five', 0.421875, 0.0107421875, 0.43359375, 0.09033203125, 0.0810546875)
-GLYPHS[8326] = Glyph('₆', 'subscript six', 0.421875, 0.0107421875, 0.4443359375, 0.05615234375, 0.0537109375)
-GLYPHS[8327] = Glyph('₇', 'subscript seven', 0.421875, 0, 0.43359375, 0.07421875, 0.060546875)
-GLYPHS[8328] = Glyph('₈', 'subscript eight', 0.421875, 0.0107421875, 0.4443359375, 0.05859375, 0.05859375)
-GLYPHS[8329] = Glyph('₉', 'subscript nine', 0.421875, 0.0107421875, 0.4443359375, 0.0537109375, 0.0556640625)
-GLYPHS[8330] = Glyph('₊', 'subscript plus sign', 0.421875, -0.05810546875, 0.3759765625, 0.0517578125, 0.05224609375)
-GLYPHS[8331] = Glyph('₋', 'subscript minus', 0.421875, -0.19287109375, 0.2412109375, 0.0517578125, 0.05224609375)
-GLYPHS[8332] = Glyph('₌', 'subscript equals sign', 0.421875, -0.13720703125, 0.29638671875, 0.0517578125, 0.05224609375)
-GLYPHS[8333] = Glyph('₍', 'subscript left parenthesis', 0.2255859375, 0.0888671875, 0.46484375, 0.04833984375, 0.02978515625)
-GLYPHS[8334] = Glyph('₎', 'subscript right parenthesis', 0.2255859375, 0.0888671875, 0.46484375, 0.0302734375, 0.0478515625)
-GLYPHS[8352] = Glyph('₠', 'euro-currency sign', 0.69580078125, 0, 0.74072265625, 0.04833984375, 0.09619140625)
-GLYPHS[8353] = Glyph('₡', 'colon sign', 0.7060546875, 0.09619140625, 0.8193359375, 0, 0.005859375)
-GLYPHS[8354] = Glyph('₢', 'cruzeiro sign', 0.6865234375, 0.01806640625, 0.74072265625, 0.05419921875, 0.0869140625)
-GLYPHS[8355] = Glyph('₣', 'french franc sign', 0.63232421875, 0, 0.72265625, 0.0390625, 0.0869140625)
-GLYPHS[8356] = Glyph('₤', 'lira sign', 0.63232421875, 0, 0.74072265625, 0.12060546875, 0.09912109375)
-GLYPHS[8357] = Glyph('₥', 'mill sign', 0.93359375, 0.09619140625, 0.72265625, 0.09619140625, 0.09033203125)
-GLYPHS[8358] = Glyph('₦', 'naira sign', 0.8173828125, 0, 0.72265625, 0.0361328125, 0.0361328125)
-GLYPHS[8359] = Glyph('₧', 'peseta sign', 1.31884765625, 0.01220703125, 0.72265625, 0.0986328125, 0.07666015625)
-GLYPHS[8360] = Glyph('₨', 'rupee sign', 1.01416015625, 0.01220703125, 0.72265625, 0.09326171875, 0.08447265625)
-GLYPHS[8361] = Glyph('₩', 'won sign', 1.0458984375, 0, 0.72265625, 0.02392578125, 0.02392578125)
-GLYPHS[8362] = Glyph('₪', 'new sheqel sign', 1.060546875, 0, 0.72265625, 0.1083984375, 0.10888671875)
-GLYPHS[8364] = Glyph('€', 'euro sign', 0.6318359375, 0.01806640625, 0.74072265625, -0.01416015625, 0.0556640625)
-GLYPHS[8448] = Glyph('℀', 'account of', 0.75, 0, 0.72265625, 0.00927734375, 0)
-GLYPHS[8449] = Glyph('℁', 'addressed to the subject', 0.75, 0, 0.72265625, 0.00927734375, 0)
-GLYPHS[8450] = Glyph('ℂ', 'double-struck capital c', 0.73779296875, 0.01806640625, 0.74072265625, 0.06640625, 0.06005859375)
-GLYPHS[8451] = Glyph('℃', 'degree celsius', 0.92236328125, 0.01806640625, 0.74072265625, 0.04833984375, 0.05517578125)
-GLYPHS[8452] = Glyph('℄', 'centre line symbol', 0.6474609375, 0, 0.72265625, 0.05419921875, 0.05126953125)
-GLYPHS[8453] = Glyph('℅', 'care of', 0.75, 0, 0.72265625, 0.00927734375, 0)
-GLYPHS[8454] = Glyph('℆', 'cada una', 0.75, 0.00732421875, 0.72265625, 0.00927734375, 0)
-GLYPHS[8455] = Glyph('ℇ', 'euler constant', 0.62939453125, 0.01806640625, 0.74072265625, 0.08447265625, 0.083984375)
-GLYPHS[8456] = Glyph('℈', 'scruple', 0.6025390625, 0.01806640625, 0.74072265625, 0.0419921875, 0.05126953125)
-GLYPHS[8457] = Glyph('℉', 'degree fahrenheit', 0.7802734375, 0, 0.74072265625, 0.04833984375, 0.0390625)
-GLYPHS[8458] = Glyph('ℊ', 'script small g', 0.7734375, 0.3251953125, 0.5419921875, 0.0166015625, 0.0078125)
-GLYPHS[8459] = Glyph('ℋ', 'script capital h', 1.12109375, 0.01806640625, 0.783203125, 0.02392578125, 0.02978515625)
-GLYPHS[8460] = Glyph('ℌ', 'black-letter capital h', 0.642578125, 0.18310546875, 0.74072265625, 0.01171875, 0.041015625)
-GLYPHS[8461] = Glyph('ℍ', 'double-struck capital h', 0.87939453125, 0, 0.72265625, 0.1142578125, 0.11474609375)
-GLYPHS[8462] = Glyph('ℎ', 'planck constant', 0.7041015625, 0.01220703125, 0.77099609375, 0.06640625, 0.01171875)
-GLYPHS[8463] = Glyph('ℏ', 'planck constant over two pi', 0.7041015625, 0.01220703125, 0.77099609375, 0.0478515625, 0.01171875)
-GLYPHS[8464] = Glyph('ℐ', 'script capital i', 0.6748046875, 0.1806640625, 0.74072265625, -0.02978515625, 0.025390625)
-GLYPHS[8465] = Glyph('ℑ', 'black-letter capital i', 0.70361328125, 0.01806640625, 0.7412109375, 0.07373046875, 0.0927734375)
-GLYPHS[8466] = Glyph('ℒ', 'script capital l', 0.78662109375, 0.01806640625, 0.74072265625, 0.01806640625, 0.02392578125)
-GLYPHS[8467] = Glyph('ℓ', 'script small l', 0.59033203125, 0.01123046875, 0.85546875, 0, 0.01171875)
-GLYPHS[8468] = Glyph('℔', 'l b bar symbol', 0.97900390625, 0.01220703125, 0.77099609375, 0.0302734375, 0.05419921875)
-GLYPHS[8469] = Glyph('ℕ', 'double-struck capital n', 0.8193359375, 0, 0.72265625, 0.1142578125, 0.11474609375)
-GLYPHS[8470] = Glyph('№', 'numero sign', 0.966796875, 0, 0.72265625, 0.09326171875, 0.02392578125)
-GLYPHS[8471] = Glyph('℗', 'sound recording copyright', 0.85546875, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[8472] = Glyph('℘', 'script capital p', 0.72509765625, 0.20458984375, 0.6025390625, 0.02392578125, 0.05078125)
-GLYPHS[8473] = Glyph('ℙ', 'double-struck capital p', 0.70458984375, 0, 0.72265625, 0.1142578125, 0.0361328125)
-GLYPHS[8474] = Glyph('ℚ', 'double-struck capital q', 0.90380859375, 0.14697265625, 0.74072265625, 0.06640625, 0.0166015625)
-GLYPHS[8475] = Glyph('ℛ', 'script capital r', 0.93798828125, 0.01806640625, 0.74072265625, 0.02392578125, 0.0302734375)
-GLYPHS[8476] = Glyph('ℜ', 'black-letter capital r', 0.90869140625, 0.01806640625, 0.740814208984375, 0.05810546875, 0.0439453125)
-GLYPHS[8477] = Glyph('ℝ', 'double-struck capital r', 0.78173828125, 0, 0.72314453125, 0.1142578125, 0.0361328125)
-GLYPHS[8478] = Glyph('℞', 'prescription take', 0.63232421875, 0, 0.72265625, 0.09326171875, 0.01025390625)
-GLYPHS[8479] = Glyph('℟', 'response', 0.63232421875, 0.14453125, 0.86773681640625, 0.09326171875, 0.01025390625)
-GLYPHS[8480] = Glyph('℠', 'service mark', 0.80712890625, -0.3525390625, 0.73193359375, 0.06005859375, 0.060546875)
-GLYPHS[8481] = Glyph('℡', 'telephone sign', 1.48046875, 0, 0.5302734375, 0.09619140625, 0.09619140625)
-GLYPHS[8482] = Glyph('™', 'trade mark sign', 0.80712890625, -0.361328125, 0.72265625, 0.02392578125, 0.02490234375)
-GLYPHS[8483] = Glyph('℣', 'versicle', 0.6533203125, 0.14453125, 0.86773681640625, 0.017578125, 0.00390625)
-GLYPHS[8484] = Glyph('ℤ', 'double-struck capital z', 0.64453125, 0, 0.72265625, 0.05419921875, 0.05419921875)
-GLYPHS[8485] = Glyph('℥', 'ounce sign', 0.51220703125, 0.20458984375, 0.77099609375, 0.0419921875, 0.04541015625)
-GLYPHS[8486] = Glyph('Ω', 'ohm sign', 0.8759765625, 0, 0.74072265625, 0.0751953125, 0.07568359375)
-GLYPHS[8487] = Glyph('℧', 'inverted ohm sign', 0.8759765625, 0.01806640625, 0.72265625, 0.0751953125, 0.07568359375)
-GLYPHS[8488] = Glyph('ℨ', 'black-letter capital z', 0.58203125, 0.01806640625, 0.74072265625, 0.0234375, 0.044921875)
-GLYPHS[8489] = Glyph('℩', 'turned greek small letter iota', 0.40087890625, 0, 0.5419921875, 0.06005859375, 0.09375)
-GLYPHS[8490] = Glyph('K', 'kelvin sign', 0.65283203125, 0, 0.72265625, 0.09326171875, 0.017578125)
-GLYPHS[8491] = Glyph('Å', 'angstrom sign', 0.68994140625, 0, 0.8828125, 0.00830078125, 0.01123046875)
-GLYPHS[8492] = Glyph('ℬ', 'script capital b', 0.79931640625, 0.01806640625, 0.74072265625, 0.01806640625, 0.06103515625)
-GLYPHS[8493] = Glyph('ℭ', 'black-letter capital c', 0.67822265625, 0.01806640625, 0.7333984375, 0.02490234375, 0.0283203125)
-GLYPHS[8494] = Glyph('℮', 'estimated symbol', 0.853515625, 0.01806640625, 0.74072265625, 0.04736328125, 0.0390625)
-GLYPHS[8495] = Glyph('ℯ', 'script small e', 0.48779296875, 0.01220703125, 0.5419921875, 0.05419921875, 0.033203125)
-GLYPHS[8496] = Glyph('ℰ', 'script capital e', 0.572265625, 0.01806640625, 0.861328125, 0.0322265625, 0.0361328125)
-GLYPHS[8497] = Glyph('ℱ', 'script capital f', 0.82763671875, 0.01806640625, 0.791015625, 0.01806640625, -0.08154296875)
-GLYPHS[8498] = Glyph('Ⅎ', 'turned capital f', 0.66357421875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8499] = Glyph('ℳ', 'script capital m', 1.04345703125, 0.01904296875, 0.7412109375, 0.04833984375, 0.0478515625)
-GLYPHS[8500] = Glyph('ℴ', 'script small o', 0.57373046875, 0.01220703125, 0.5419921875, 0.05419921875, 0.05419921875)
-GLYPHS[8501] = Glyph('ℵ', 'alef symbol', 0.67626953125, 0.01220703125, 0.6142578125, 0.0576171875, 0.07861328125)
-GLYPHS[8502] = Glyph('ℶ', 'bet symbol', 0.66650390625, 0, 0.6142578125, 0.064453125, 0.06591796875)
-GLYPHS[8503] = Glyph('ℷ', 'gimel symbol', 0.462890625, 0, 0.6142578125, 0.03564453125, 0.05419921875)
-GLYPHS[8504] = Glyph('ℸ', 'dalet symbol', 0.607421875, 0.01220703125, 0.62646484375, 0.03466796875, 0.04248046875)
-GLYPHS[8539] = Glyph('⅛', 'vulgar fraction one eighth', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.08203125)
-GLYPHS[8540] = Glyph('⅜', 'vulgar fraction three eighths', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[8541] = Glyph('⅝', 'vulgar fraction five eighths', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[8542] = Glyph('⅞', 'vulgar fraction seven eighths', 0.80126953125, 0.01806640625, 0.74072265625, 0.04833984375, 0.04833984375)
-GLYPHS[8592] = Glyph('←', 'leftwards arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8593] = Glyph('↑', 'upwards arrow', 0.52978515625, 0, 0.72265625, 0.14453125, 0.14404296875)
-GLYPHS[8594] = Glyph('→', 'rightwards arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8595] = Glyph('↓', 'downwards arrow', 0.52978515625, 0, 0.72265625, 0.14453125, 0.14404296875)
-GLYPHS[8596] = Glyph('↔', 'left right arrow', 1.20458984375, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8597] = Glyph('↕', 'up down arrow', 0.5302734375, 0.20458984375, 0.783203125, 0.14453125, 0.14501953125)
-GLYPHS[8598] = Glyph('↖', 'north west arrow', 0.7451171875, -0.0888671875, 0.61669921875, 0.1083984375, 0.1083984375)
-GLYPHS[8599] = Glyph('↗', 'north east arrow', 0.7451171875, -0.0888671875, 0.61669921875, 0.1083984375, 0.1083984375)
-GLYPHS[8600] = Glyph('↘', 'south east arrow', 0.74462890625, -0.0888671875, 0.6171875, 0.1083984375, 0.10791015625)
-GLYPHS[8601] = Glyph('↙', 'south west arrow', 0.74462890625, -0.0888671875, 0.6171875, 0.1083984375, 0.10791015625)
-GLYPHS[8602] = Glyph('↚', 'leftwards arrow with stroke', 0.939453125, -0.12060546875, 0.4580078125, 0.1083984375, 0.1083984375)
-GLYPHS[8603] = Glyph('↛', 'rightwards arrow with stroke', 0.939453125, -0.12060546875, 0.4580078125, 0.1083984375, 0.1083984375)
-GLYPHS[8604] = Glyph('↜', 'leftwards wave arrow', 0.794921875, -0.15966796875, 0.41845703125, 0.1083984375, 0.1083984375)
-GLYPHS[8605] = Glyph('↝', 'rightwards wave arrow', 0.794921875, -0.15966796875, 0.41845703125, 0.1083984375, 0.1083984375)
-GLYPHS[8606] = Glyph('↞', 'leftwards two headed arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8607] = Glyph('↟', 'upwards two headed arrow', 0.5302734375, 0, 0.72265625, 0.14453125, 0.14501953125)
-GLYPHS[8608] = Glyph('↠', 'rightwards two headed arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8609] = Glyph('↡', 'downwards two headed arrow', 0.5302734375, 0, 0.72265625, 0.14453125, 0.14501953125)
-GLYPHS[8610] = Glyph('↢', 'leftwards arrow with tail', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8611] = Glyph('↣', 'rightwards arrow with tail', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8612] = Glyph('↤', 'leftwards arrow from bar', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8613] = Glyph('↥', 'upwards arrow from bar', 0.5302734375, 0, 0.72265625, 0.138671875, 0.138671875)
-GLYPHS[8614] = Glyph('↦', 'rightwards arrow from bar', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8615] = Glyph('↧', 'downwards arrow from bar', 0.5302734375, 0, 0.72265625, 0.138671875, 0.138671875)
-GLYPHS[8616] = Glyph('↨', 'up down arrow with base', 0.5302734375, 0, 0.72265625, 0.072265625, 0.072265625)
-GLYPHS[8617] = Glyph('↩', 'leftwards arrow with hook', 0.939453125, -0.16845703125, 0.4697265625, 0.1083984375, 0.1083984375)
-GLYPHS[8618] = Glyph('↪', 'rightwards arrow with hook', 0.939453125, -0.16845703125, 0.4697265625, 0.1083984375, 0.1083984375)
-GLYPHS[8619] = Glyph('↫', 'leftwards arrow with loop', 0.939453125, -0.16845703125, 0.4697265625, 0.1083984375, 0.1083984375)
-GLYPHS[8620] = Glyph('↬', 'rightwards arrow with loop', 0.939453125, -0.16845703125, 0.4697265625, 0.1083984375, 0.1083984375)
-GLYPHS[8621] = Glyph('↭', 'left right wave arrow', 1.216796875, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8622] = Glyph('↮', 'left right arrow with stroke', 1.20458984375, -0.12060546875, 0.4580078125, 0.1083984375, 0.1083984375)
-GLYPHS[8623] = Glyph('↯', 'downwards zigzag arrow', 0.66064453125, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8624] = Glyph('↰', 'upwards arrow with tip leftwards', 0.6865234375, 0, 0.72265625, 0.1083984375, 0.14453125)
-GLYPHS[8625] = Glyph('↱', 'upwards arrow with tip rightwards', 0.6865234375, 0, 0.72265625, 0.14453125, 0.1083984375)
-GLYPHS[8626] = Glyph('↲', 'downwards arrow with tip leftwards', 0.6865234375, 0, 0.72265625, 0.1083984375, 0.14453125)
-GLYPHS[8627] = Glyph('↳', 'downwards arrow with tip rightwards', 0.6865234375, 0, 0.72265625, 0.14453125, 0.1083984375)
-GLYPHS[8628] = Glyph('↴', 'rightwards arrow with corner downwards', 0.6865234375, 0, 0.72265625, 0.1083984375, 0.14453125)
-GLYPHS[8629] = Glyph('↵', 'downwards arrow with corner leftwards', 0.939453125, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8630] = Glyph('↶', 'anticlockwise top semicircle arrow', 0.98291015625, -0.197265625, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8631] = Glyph('↷', 'clockwise top semicircle arrow', 0.98291015625, -0.197265625, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8632] = Glyph('↸', 'north west arrow to long bar', 0.939453125, -0.05029296875, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8633] = Glyph('↹', 'leftwards arrow to bar over rightwards arrow to bar', 0.939453125, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8634] = Glyph('↺', 'anticlockwise open circle arrow', 0.939453125, 0, 0.71337890625, 0.1083984375, 0.1083984375)
-GLYPHS[8635] = Glyph('↻', 'clockwise open circle arrow', 0.939453125, 0, 0.71337890625, 0.1083984375, 0.1083984375)
-GLYPHS[8636] = Glyph('↼', 'leftwards harpoon with barb upwards', 0.939453125, -0.2646484375, 0.4091796875, 0.1083984375, 0.1083984375)
-GLYPHS[8637] = Glyph('↽', 'leftwards harpoon with barb downwards', 0.939453125, -0.16845703125, 0.31298828125, 0.1083984375, 0.1083984375)
-GLYPHS[8638] = Glyph('↾', 'upwards harpoon with barb rightwards', 0.43359375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8639] = Glyph('↿', 'upwards harpoon with barb leftwards', 0.43359375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8640] = Glyph('⇀', 'rightwards harpoon with barb upwards', 0.939453125, -0.2646484375, 0.4091796875, 0.1083984375, 0.1083984375)
-GLYPHS[8641] = Glyph('⇁', 'rightwards harpoon with barb downwards', 0.939453125, -0.16845703125, 0.31298828125, 0.1083984375, 0.1083984375)
-GLYPHS[8642] = Glyph('⇂', 'downwards harpoon with barb rightwards', 0.43359375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8643] = Glyph('⇃', 'downwards harpoon with barb leftwards', 0.43359375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8644] = Glyph('⇄', 'rightwards arrow over leftwards arrow', 0.939453125, -0.04833984375, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8645] = Glyph('⇅', 'upwards arrow leftwards of downwards arrow', 0.77099609375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8646] = Glyph('⇆', 'leftwards arrow over rightwards arrow', 0.939453125, -0.04833984375, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8647] = Glyph('⇇', 'leftwards paired arrows', 0.939453125, -0.04833984375, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8648] = Glyph('⇈', 'upwards paired arrows', 0.77099609375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8649] = Glyph('⇉', 'rightwards paired arrows', 0.939453125, -0.04833984375, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8650] = Glyph('⇊', 'downwards paired arrows', 0.77099609375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8651] = Glyph('⇋', 'leftwards harpoon over rightwards harpoon', 0.939453125, -0.095703125, 0.48193359375, 0.1083984375, 0.1083984375)
-GLYPHS[8652] = Glyph('⇌', 'rightwards harpoon over leftwards harpoon', 0.939453125, -0.095703125, 0.48193359375, 0.1083984375, 0.1083984375)
-GLYPHS[8653] = Glyph('⇍', 'leftwards double arrow with stroke', 0.939453125, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8654] = Glyph('⇎', 'left right double arrow with stroke', 1.20458984375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8655] = Glyph('⇏', 'rightwards double arrow with stroke', 0.939453125, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8656] = Glyph('⇐', 'leftwards double arrow', 0.939453125, -0.0478515625, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8657] = Glyph('⇑', 'upwards double arrow', 0.771484375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8658] = Glyph('⇒', 'rightwards double arrow', 0.939453125, -0.0478515625, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8659] = Glyph('⇓', 'downwards double arrow', 0.771484375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8660] = Glyph('⇔', 'left right double arrow', 1.20458984375, -0.0478515625, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8661] = Glyph('⇕', 'up down double arrow', 0.771484375, 0.20458984375, 0.783203125, 0.14453125, 0.14453125)
-GLYPHS[8662] = Glyph('⇖', 'north west double arrow', 0.81298828125, 0, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8663] = Glyph('⇗', 'north east double arrow', 0.81298828125, 0, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8664] = Glyph('⇘', 'south east double arrow', 0.81298828125, 0, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8665] = Glyph('⇙', 'south west double arrow', 0.81298828125, 0, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8666] = Glyph('⇚', 'leftwards triple arrow', 0.939453125, 0.0439453125, 0.622085571289063, 0.1083984375, 0.1083984375)
-GLYPHS[8667] = Glyph('⇛', 'rightwards triple arrow', 0.939453125, 0.0439453125, 0.622085571289063, 0.1083984375, 0.1083984375)
-GLYPHS[8668] = Glyph('⇜', 'leftwards squiggle arrow', 1.205078125, -0.16845703125, 0.40966796875, 0.1083984375, 0.10888671875)
-GLYPHS[8669] = Glyph('⇝', 'rightwards squiggle arrow', 1.205078125, -0.16845703125, 0.40966796875, 0.1083984375, 0.10888671875)
-GLYPHS[8670] = Glyph('⇞', 'upwards arrow with double stroke', 0.5302734375, 0, 0.72265625, 0.138671875, 0.13818359375)
-GLYPHS[8671] = Glyph('⇟', 'downwards arrow with double stroke', 0.5302734375, 0, 0.72265625, 0.138671875, 0.13818359375)
-GLYPHS[8672] = Glyph('⇠', 'leftwards dashed arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8673] = Glyph('⇡', 'upwards dashed arrow', 0.5302734375, 0, 0.72265625, 0.14453125, 0.14501953125)
-GLYPHS[8674] = Glyph('⇢', 'rightwards dashed arrow', 0.939453125, -0.16845703125, 0.40966796875, 0.1083984375, 0.1083984375)
-GLYPHS[8675] = Glyph('⇣', 'downwards dashed arrow', 0.5302734375, 0, 0.72265625, 0.14453125, 0.14501953125)
-GLYPHS[8676] = Glyph('⇤', 'leftwards arrow to bar', 0.939453125, -0.16259765625, 0.41552734375, 0.1083984375, 0.1083984375)
-GLYPHS[8677] = Glyph('⇥', 'rightwards arrow to bar', 0.939453125, -0.16259765625, 0.41552734375, 0.1083984375, 0.1083984375)
-GLYPHS[8678] = Glyph('⇦', 'leftwards white arrow', 0.939453125, -0.0478515625, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8679] = Glyph('⇧', 'upwards white arrow', 0.771484375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8680] = Glyph('⇨', 'rightwards white arrow', 0.939453125, -0.0478515625, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8681] = Glyph('⇩', 'downwards white arrow', 0.771484375, 0, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8682] = Glyph('⇪', 'upwards white arrow from bar', 0.771484375, 0.20458984375, 0.72265625, 0.14453125, 0.14453125)
-GLYPHS[8704] = Glyph('∀', 'for all', 0.88623046875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8705] = Glyph('∁', 'complement', 0.716796875, 0.138671875, 0.861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8706] = Glyph('∂', 'partial differential', 0.6552734375, 0.01220703125, 0.783203125, 0.1083984375, 0.1083984375)
-GLYPHS[8707] = Glyph('∃', 'there exists', 0.66357421875, 0, 0.72314453125, 0.1083984375, 0.1083984375)
-GLYPHS[8708] = Glyph('∄', 'there does not exist', 0.66357421875, 0.1083984375, 0.81982421875, 0.1083984375, 0.1083984375)
-GLYPHS[8709] = Glyph('∅', 'empty set', 0.97607421875, 0.01806640625, 0.7412109375, 0.1083984375, 0.1083984375)
-GLYPHS[8710] = Glyph('∆', 'increment', 0.8916015625, 0, 0.72900390625, 0.1083984375, 0.1083984375)
-GLYPHS[8711] = Glyph('∇', 'nabla', 0.8916015625, 0.00634765625, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8712] = Glyph('∈', 'element of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8713] = Glyph('∉', 'not an element of', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8714] = Glyph('∊', 'small element of', 0.66455078125, 0.01220703125, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8715] = Glyph('∋', 'contains as member', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8716] = Glyph('∌', 'does not contain as member', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8717] = Glyph('∍', 'small contains as member', 0.66455078125, 0.01220703125, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8718] = Glyph('∎', 'end of proof', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8719] = Glyph('∏', 'n-ary product', 0.927734375, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8720] = Glyph('∐', 'n-ary coproduct', 0.927734375, 0, 0.7236328125, 0.1083984375, 0.1083984375)
-GLYPHS[8721] = Glyph('∑', 'n-ary summation', 0.80712890625, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8722] = Glyph('−', 'minus sign', 0.794921875, -0.26513671875, 0.31396484375, 0.1083984375, 0.1083984375)
-GLYPHS[8723] = Glyph('∓', 'minus-or-plus sign', 0.794921875, 0, 0.5791015625, 0.1083984375, 0.1083984375)
-GLYPHS[8724] = Glyph('∔', 'dot plus', 0.794921875, 0, 0.626953125, 0.1083984375, 0.1083984375)
-GLYPHS[8725] = Glyph('∕', 'division slash', 0.5244140625, 0.14453125, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8726] = Glyph('∖', 'set minus', 0.5244140625, 0.14453125, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8727] = Glyph('∗', 'asterisk operator', 0.794921875, 0, 0.578125, 0.12890625, 0.12939453125)
-GLYPHS[8728] = Glyph('∘', 'ring operator', 0.560546875, -0.1171875, 0.4609375, 0.1083984375, 0.1083984375)
-GLYPHS[8729] = Glyph('∙', 'bullet operator', 0.560546875, -0.1171875, 0.4609375, 0.1083984375, 0.1083984375)
-GLYPHS[8730] = Glyph('√', 'square root', 0.80712890625, 0.09619140625, 0.8974609375, 0.08642578125, -0.01220703125)
-GLYPHS[8731] = Glyph('∛', 'cube root', 0.80712890625, 0.09619140625, 0.8974609375, 0.08642578125, -0.01220703125)
-GLYPHS[8732] = Glyph('∜', 'fourth root', 0.80712890625, 0.09619140625, 0.8974609375, 0.08642578125, -0.01220703125)
-GLYPHS[8733] = Glyph('∝', 'proportional to', 0.93994140625, -0.083984375, 0.494140625, 0.1083984375, 0.1083984375)
-GLYPHS[8734] = Glyph('∞', 'infinity', 0.93994140625, -0.083984375, 0.494140625, 0.1083984375, 0.1083984375)
-GLYPHS[8735] = Glyph('∟', 'right angle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8736] = Glyph('∠', 'angle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8737] = Glyph('∡', 'measured angle', 0.794921875, 0.166015625, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8738] = Glyph('∢', 'spherical angle', 0.794921875, 0.017578125, 0.595703125, 0.1083984375, 0.1083984375)
-GLYPHS[8739] = Glyph('∣', 'divides', 0.37353515625, 0.14453125, 0.77099609375, 0.16259765625, 0.16259765625)
-GLYPHS[8740] = Glyph('∤', 'does not divide', 0.505859375, 0.14453125, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8741] = Glyph('∥', 'parallel to', 0.578125, 0.14453125, 0.77099609375, 0.16259765625, 0.16259765625)
-GLYPHS[8742] = Glyph('∦', 'not parallel to', 0.7109375, 0.14453125, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8743] = Glyph('∧', 'logical and', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8744] = Glyph('∨', 'logical or', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8745] = Glyph('∩', 'intersection', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8746] = Glyph('∪', 'union', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8747] = Glyph('∫', 'integral', 0.578125, 0.14453125, 0.7890625, 0.1083984375, 0.1083984375)
-GLYPHS[8748] = Glyph('∬', 'double integral', 0.85546875, 0.14453125, 0.7890625, 0.1083984375, 0.1083984375)
-GLYPHS[8749] = Glyph('∭', 'triple integral', 1.13232421875, 0.14453125, 0.7890625, 0.1083984375, 0.10791015625)
-GLYPHS[8750] = Glyph('∮', 'contour integral', 0.6142578125, 0.14453125, 0.7890625, 0.1083984375, 0.1083984375)
-GLYPHS[8751] = Glyph('∯', 'surface integral', 0.8916015625, 0.14453125, 0.7890625, 0.1083984375, 0.1083984375)
-GLYPHS[8752] = Glyph('∰', 'volume integral', 1.16845703125, 0.14453125, 0.7890625, 0.1083984375, 0.1083984375)
-GLYPHS[8753] = Glyph('∱', 'clockwise integral', 0.6142578125, 0.14453125, 0.7890625, 0.1083984375, 0.04931640625)
-GLYPHS[8754] = Glyph('∲', 'clockwise contour integral', 0.6142578125, 0.14453125, 0.7890625, 0.1083984375, 0.048828125)
-GLYPHS[8755] = Glyph('∳', 'anticlockwise contour integral', 0.6142578125, 0.14453125, 0.7890625, 0.1083984375, 0.04931640625)
-GLYPHS[8756] = Glyph('∴', 'therefore', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8757] = Glyph('∵', 'because', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8758] = Glyph('∶', 'ratio', 0.42138671875, 0, 0.578125, 0.16259765625, 0.16259765625)
-GLYPHS[8759] = Glyph('∷', 'proportion', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8760] = Glyph('∸', 'dot minus', 0.794921875, -0.26513671875, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8761] = Glyph('∹', 'excess', 0.794921875, -0.0361328125, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8762] = Glyph('∺', 'geometric proportion', 0.794921875, -0.0361328125, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8763] = Glyph('∻', 'homothetic', 0.794921875, -0.0361328125, 0.5419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8764] = Glyph('∼', 'tilde operator', 0.794921875, -0.20556640625, 0.37255859375, 0.1083984375, 0.1083984375)
-GLYPHS[8765] = Glyph('∽', 'reversed tilde', 0.794921875, -0.20556640625, 0.37255859375, 0.1083984375, 0.1083984375)
-GLYPHS[8766] = Glyph('∾', 'inverted lazy s', 0.794921875, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[8767] = Glyph('∿', 'sine wave', 0.79541015625, 0, 0.578125, 0.08447265625, 0.08447265625)
-GLYPHS[8768] = Glyph('≀', 'wreath product', 0.49365234375, 0.072265625, 0.650390625, 0.16259765625, 0.162109375)
-GLYPHS[8769] = Glyph('≁', 'not tilde', 0.794921875, -0.09033203125, 0.48779296875, 0.1083984375, 0.1083984375)
-GLYPHS[8770] = Glyph('≂', 'minus tilde', 0.794921875, -0.115234375, 0.45166015625, 0.1083984375, 0.1083984375)
-GLYPHS[8771] = Glyph('≃', 'asymptotically equal to', 0.794921875, -0.12646484375, 0.462890625, 0.1083984375, 0.1083984375)
-GLYPHS[8772] = Glyph('≄', 'not asymptotically equal to', 0.794921875, -0.005859375, 0.5361328125, 0.1083984375, 0.1083984375)
-GLYPHS[8773] = Glyph('≅', 'approximately equal to', 0.794921875, -0.0361328125, 0.55322265625, 0.1083984375, 0.1083984375)
-GLYPHS[8774] = Glyph('≆', 'approximately but not actually equal to', 0.794921875, 0.0361328125, 0.55322265625, 0.1083984375, 0.1083984375)
-GLYPHS[8775] = Glyph('≇', 'neither approximately nor actually equal to', 0.794921875, 0.072265625, 0.62646484375, 0.1083984375, 0.1083984375)
-GLYPHS[8776] = Glyph('≈', 'almost equal to', 0.794921875, -0.09716796875, 0.48095703125, 0.1083984375, 0.1083984375)
-GLYPHS[8777] = Glyph('≉', 'not almost equal to', 0.794921875, -0.02392578125, 0.55419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8778] = Glyph('≊', 'almost equal or equal to', 0.794921875, -0.01806640625, 0.5712890625, 0.1083984375, 0.1083984375)
-GLYPHS[8779] = Glyph('≋', 'triple tilde', 0.794921875, 0.01123046875, 0.58935546875, 0.1083984375, 0.1083984375)
-GLYPHS[8780] = Glyph('≌', 'all equal to', 0.794921875, 0, 0.638671875, 0.1083984375, 0.1083984375)
-GLYPHS[8781] = Glyph('≍', 'equivalent to', 0.794921875, -0.072265625, 0.505859375, 0.1083984375, 0.1083984375)
-GLYPHS[8782] = Glyph('≎', 'geometrically equivalent to', 0.794921875, -0.0419921875, 0.5361328125, 0.1083984375, 0.1083984375)
-GLYPHS[8783] = Glyph('≏', 'difference between', 0.794921875, -0.1748046875, 0.5361328125, 0.1083984375, 0.1083984375)
-GLYPHS[8784] = Glyph('≐', 'approaches the limit', 0.794921875, -0.17431640625, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8785] = Glyph('≑', 'geometrically equal to', 0.794921875, 0.0185546875, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8786] = Glyph('≒', 'approximately equal to or the image of', 0.794921875, 0.0185546875, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8787] = Glyph('≓', 'image of or approximately equal to', 0.794921875, 0.0185546875, 0.59619140625, 0.1083984375, 0.1083984375)
-GLYPHS[8788] = Glyph('≔', 'colon equals', 0.794921875, -0.15966796875, 0.4248046875, 0.1083984375, 0.1083984375)
-GLYPHS[8789] = Glyph('≕', 'equals colon', 0.794921875, -0.15966796875, 0.4248046875, 0.1083984375, 0.1083984375)
-GLYPHS[8790] = Glyph('≖', 'ring in equal to', 0.794921875, -0.1748046875, 0.40380859375, 0.1083984375, 0.1083984375)
-GLYPHS[8791] = Glyph('≗', 'ring equal to', 0.794921875, 0, 0.6025390625, 0.1083984375, 0.1083984375)
-GLYPHS[8792] = Glyph('≘', 'corresponds to', 0.794921875, 0, 0.5302734375, 0.1083984375, 0.1083984375)
-GLYPHS[8793] = Glyph('≙', 'estimates', 0.794921875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8794] = Glyph('≚', 'equiangular to', 0.794921875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8795] = Glyph('≛', 'star equals', 0.794921875, 0, 0.7197265625, 0.1083984375, 0.1083984375)
-GLYPHS[8796] = Glyph('≜', 'delta equal to', 0.794921875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8797] = Glyph('≝', 'equal to by definition', 0.794921875, 0, 0.658203125, 0.1083984375, 0.1083984375)
-GLYPHS[8798] = Glyph('≞', 'measured by', 0.794921875, 0, 0.59912109375, 0.1083984375, 0.1083984375)
-GLYPHS[8799] = Glyph('≟', 'questioned equal to', 0.794921875, 0, 0.68359375, 0.1083984375, 0.1083984375)
-GLYPHS[8800] = Glyph('≠', 'not equal to', 0.794921875, -0.02392578125, 0.55419921875, 0.1083984375, 0.1083984375)
-GLYPHS[8801] = Glyph('≡', 'identical to', 0.794921875, -0.08447265625, 0.49462890625, 0.1083984375, 0.1083984375)
-GLYPHS[8802] = Glyph('≢', 'not identical to', 0.794921875, 0.0361328125, 0.61474609375, 0.1083984375, 0.1083984375)
-GLYPHS[8803] = Glyph('≣', 'strictly equivalent to', 0.794921875, 0, 0.59033203125, 0.1083984375, 0.1083984375)
-GLYPHS[8804] = Glyph('≤', 'less-than or equal to', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8805] = Glyph('≥', 'greater-than or equal to', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8806] = Glyph('≦', 'less-than over equal to', 0.794921875, 0, 0.759765625, 0.1083984375, 0.1083984375)
-GLYPHS[8807] = Glyph('≧', 'greater-than over equal to', 0.794921875, 0, 0.759765625, 0.1083984375, 0.1083984375)
-GLYPHS[8808] = Glyph('≨', 'less-than but not equal to', 0.794921875, 0.1083984375, 0.759765625, 0.1083984375, 0.1083984375)
-GLYPHS[8809] = Glyph('≩', 'greater-than but not equal to', 0.794921875, 0.1083984375, 0.759765625, 0.1083984375, 0.1083984375)
-GLYPHS[8810] = Glyph('≪', 'much less-than', 1.1181640625, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8811] = Glyph('≫', 'much greater-than', 1.1181640625, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8812] = Glyph('≬', 'between', 0.55419921875, 0.14453125, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8813] = Glyph('≭', 'not equivalent to', 0.794921875, 0.04833984375, 0.62646484375, 0.1083984375, 0.1083984375)
-GLYPHS[8814] = Glyph('≮', 'not less-than', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8815] = Glyph('≯', 'not greater-than', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8816] = Glyph('≰', 'neither less-than nor equal to', 0.794921875, 0.0595703125, 0.7119140625, 0.1083984375, 0.1083984375)
-GLYPHS[8817] = Glyph('≱', 'neither greater-than nor equal to', 0.794921875, 0.08349609375, 0.6875, 0.1083984375, 0.1083984375)
-GLYPHS[8818] = Glyph('≲', 'less-than or equivalent to', 0.794921875, 0.01123046875, 0.65087890625, 0.1083984375, 0.1083984375)
-GLYPHS[8819] = Glyph('≳', 'greater-than or equivalent to', 0.794921875, 0.01123046875, 0.65087890625, 0.1083984375, 0.1083984375)
-GLYPHS[8820] = Glyph('≴', 'neither less-than nor equivalent to', 0.794921875, 0.04833984375, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8821] = Glyph('≵', 'neither greater-than nor equivalent to', 0.794921875, 0.04833984375, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8822] = Glyph('≶', 'less-than or greater-than', 0.794921875, 0.07470703125, 0.72412109375, 0.1083984375, 0.1083984375)
-GLYPHS[8823] = Glyph('≷', 'greater-than or less-than', 0.794921875, 0.07470703125, 0.72412109375, 0.1083984375, 0.1083984375)
-GLYPHS[8824] = Glyph('≸', 'neither less-than nor greater-than', 0.794921875, 0.12060546875, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8825] = Glyph('≹', 'neither greater-than nor less-than', 0.794921875, 0.12060546875, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8826] = Glyph('≺', 'precedes', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8827] = Glyph('≻', 'succeeds', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8828] = Glyph('≼', 'precedes or equal to', 0.794921875, 0.072265625, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8829] = Glyph('≽', 'succeeds or equal to', 0.794921875, 0.072265625, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8830] = Glyph('≾', 'precedes or equivalent to', 0.794921875, 0.01123046875, 0.783203125, 0.1083984375, 0.1083984375)
-GLYPHS[8831] = Glyph('≿', 'succeeds or equivalent to', 0.794921875, 0.01123046875, 0.783203125, 0.1083984375, 0.1083984375)
-GLYPHS[8832] = Glyph('⊀', 'does not precede', 0.794921875, 0.04833984375, 0.62646484375, 0.1083984375, 0.1083984375)
-GLYPHS[8833] = Glyph('⊁', 'does not succeed', 0.794921875, 0.04833984375, 0.62646484375, 0.1083984375, 0.1083984375)
-GLYPHS[8834] = Glyph('⊂', 'subset of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8835] = Glyph('⊃', 'superset of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8836] = Glyph('⊄', 'not a subset of', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8837] = Glyph('⊅', 'not a superset of', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8838] = Glyph('⊆', 'subset of or equal to', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8839] = Glyph('⊇', 'superset of or equal to', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8840] = Glyph('⊈', 'neither a subset of nor equal to', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8841] = Glyph('⊉', 'neither a superset of nor equal to', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8842] = Glyph('⊊', 'subset of with not equal to', 0.794921875, 0.1083984375, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8843] = Glyph('⊋', 'superset of with not equal to', 0.794921875, 0.1083984375, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8844] = Glyph('⊌', 'multiset', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8845] = Glyph('⊍', 'multiset multiplication', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8846] = Glyph('⊎', 'multiset union', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8847] = Glyph('⊏', 'square image of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8848] = Glyph('⊐', 'square original of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8849] = Glyph('⊑', 'square image of or equal to', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8850] = Glyph('⊒', 'square original of or equal to', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8851] = Glyph('⊓', 'square cap', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8852] = Glyph('⊔', 'square cup', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8853] = Glyph('⊕', 'circled plus', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8854] = Glyph('⊖', 'circled minus', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8855] = Glyph('⊗', 'circled times', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8856] = Glyph('⊘', 'circled division slash', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8857] = Glyph('⊙', 'circled dot operator', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8858] = Glyph('⊚', 'circled ring operator', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8859] = Glyph('⊛', 'circled asterisk operator', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8860] = Glyph('⊜', 'circled equals', 0.794921875, 0.01220703125, 0.59033203125, 0.09619140625, 0.09619140625)
-GLYPHS[8861] = Glyph('⊝', 'circled dash', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8862] = Glyph('⊞', 'squared plus', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8863] = Glyph('⊟', 'squared minus', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8864] = Glyph('⊠', 'squared times', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8865] = Glyph('⊡', 'squared dot operator', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8866] = Glyph('⊢', 'right tack', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8867] = Glyph('⊣', 'left tack', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8868] = Glyph('⊤', 'down tack', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8869] = Glyph('⊥', 'up tack', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8870] = Glyph('⊦', 'assertion', 0.578125, 0, 0.578125, 0.14453125, 0.14453125)
-GLYPHS[8871] = Glyph('⊧', 'models', 0.578125, 0, 0.578125, 0.14453125, 0.14453125)
-GLYPHS[8872] = Glyph('⊨', 'true', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8873] = Glyph('⊩', 'forces', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8874] = Glyph('⊪', 'triple vertical bar right turnstile', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8875] = Glyph('⊫', 'double vertical bar double right turnstile', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8876] = Glyph('⊬', 'does not prove', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8877] = Glyph('⊭', 'not true', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8878] = Glyph('⊮', 'does not force', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8879] = Glyph('⊯', 'negated double vertical bar double right turnstile', 0.794921875, 0.0361328125, 0.6142578125, 0.1083984375, 0.1083984375)
-GLYPHS[8880] = Glyph('⊰', 'precedes under relation', 0.794921875, 0, 0.7236328125, 0.1083984375, 0.1083984375)
-GLYPHS[8881] = Glyph('⊱', 'succeeds under relation', 0.794921875, 0, 0.7236328125, 0.1083984375, 0.1083984375)
-GLYPHS[8882] = Glyph('⊲', 'normal subgroup of', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8883] = Glyph('⊳', 'contains as normal subgroup', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8884] = Glyph('⊴', 'normal subgroup of or equal to', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8885] = Glyph('⊵', 'contains as normal subgroup or equal to', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8886] = Glyph('⊶', 'original of', 0.939453125, -0.16259765625, 0.41552734375, 0.1083984375, 0.1083984375)
-GLYPHS[8887] = Glyph('⊷', 'image of', 0.939453125, -0.16259765625, 0.41552734375, 0.1083984375, 0.1083984375)
-GLYPHS[8888] = Glyph('⊸', 'multimap', 0.794921875, -0.16259765625, 0.41552734375, 0.1083984375, 0.1083984375)
-GLYPHS[8889] = Glyph('⊹', 'hermitian conjugate matrix', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8890] = Glyph('⊺', 'intercalate', 0.62646484375, 0.2109375, 0.3251953125, 0.1083984375, 0.1083984375)
-GLYPHS[8891] = Glyph('⊻', 'xor', 0.794921875, 0, 0.578125, 0.0859375, 0.130859375)
-GLYPHS[8892] = Glyph('⊼', 'nand', 0.794921875, 0, 0.578125, 0.1083984375, 0.10791015625)
-GLYPHS[8893] = Glyph('⊽', 'nor', 0.794921875, 0, 0.578125, 0.1083984375, 0.10791015625)
-GLYPHS[8894] = Glyph('⊾', 'right angle with arc', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8895] = Glyph('⊿', 'right triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8896] = Glyph('⋀', 'n-ary logical and', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8897] = Glyph('⋁', 'n-ary logical or', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8898] = Glyph('⋂', 'n-ary intersection', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8899] = Glyph('⋃', 'n-ary union', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8900] = Glyph('⋄', 'diamond operator', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8901] = Glyph('⋅', 'dot operator', 0.44580078125, -0.22900390625, 0.34912109375, 0.16259765625, 0.1630859375)
-GLYPHS[8902] = Glyph('⋆', 'star operator', 0.794921875, -0.0556640625, 0.578125, 0.12255859375, 0.123046875)
-GLYPHS[8903] = Glyph('⋇', 'division times', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8904] = Glyph('⋈', 'bowtie', 0.99755859375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8905] = Glyph('⋉', 'left normal factor semidirect product', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8906] = Glyph('⋊', 'right normal factor semidirect product', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8907] = Glyph('⋋', 'left semidirect product', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8908] = Glyph('⋌', 'right semidirect product', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8909] = Glyph('⋍', 'reversed tilde equals', 0.794921875, -0.12646484375, 0.462890625, 0.1083984375, 0.1083984375)
-GLYPHS[8910] = Glyph('⋎', 'curly logical or', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8911] = Glyph('⋏', 'curly logical and', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8912] = Glyph('⋐', 'double subset', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8913] = Glyph('⋑', 'double superset', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8914] = Glyph('⋒', 'double intersection', 0.794921875, 0, 0.578125, 0.1083984375, 0.10791015625)
-GLYPHS[8915] = Glyph('⋓', 'double union', 0.794921875, 0, 0.578125, 0.1083984375, 0.10791015625)
-GLYPHS[8916] = Glyph('⋔', 'pitchfork', 0.794921875, 0, 0.77099609375, 0.1083984375, 0.1083984375)
-GLYPHS[8917] = Glyph('⋕', 'equal and parallel to', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8918] = Glyph('⋖', 'less-than with dot', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8919] = Glyph('⋗', 'greater-than with dot', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8920] = Glyph('⋘', 'very much less-than', 1.44140625, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8921] = Glyph('⋙', 'very much greater-than', 1.44140625, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8922] = Glyph('⋚', 'less-than equal to or greater-than', 0.794921875, 0.2109375, 0.85986328125, 0.1083984375, 0.1083984375)
-GLYPHS[8923] = Glyph('⋛', 'greater-than equal to or less-than', 0.794921875, 0.2109375, 0.85986328125, 0.1083984375, 0.1083984375)
-GLYPHS[8924] = Glyph('⋜', 'equal to or less-than', 0.794921875, 0, 0.61865234375, 0.1083984375, 0.1083984375)
-GLYPHS[8925] = Glyph('⋝', 'equal to or greater-than', 0.794921875, 0, 0.61865234375, 0.1083984375, 0.1083984375)
-GLYPHS[8926] = Glyph('⋞', 'equal to or precedes', 0.794921875, 0, 0.650390625, 0.1083984375, 0.1083984375)
-GLYPHS[8927] = Glyph('⋟', 'equal to or succeeds', 0.794921875, 0, 0.650390625, 0.1083984375, 0.1083984375)
-GLYPHS[8928] = Glyph('⋠', 'does not precede or equal', 0.794921875, 0.14453125, 0.7470703125, 0.1083984375, 0.1083984375)
-GLYPHS[8929] = Glyph('⋡', 'does not succeed or equal', 0.794921875, 0.14453125, 0.7470703125, 0.1083984375, 0.1083984375)
-GLYPHS[8930] = Glyph('⋢', 'not square image of or equal to', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8931] = Glyph('⋣', 'not square original of or equal to', 0.794921875, 0.1083984375, 0.68701171875, 0.1083984375, 0.1083984375)
-GLYPHS[8932] = Glyph('⋤', 'square image of or not equal to', 0.794921875, 0.1083984375, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8933] = Glyph('⋥', 'square original of or not equal to', 0.794921875, 0.1083984375, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[8934] = Glyph('⋦', 'less-than but not equivalent to', 0.794921875, 0.07763671875, 0.65087890625, 0.1083984375, 0.1083984375)
-GLYPHS[8935] = Glyph('⋧', 'greater-than but not equivalent to', 0.794921875, 0.07763671875, 0.65087890625, 0.1083984375, 0.1083984375)
-GLYPHS[8936] = Glyph('⋨', 'precedes but not equivalent to', 0.794921875, 0.07763671875, 0.7666015625, 0.1083984375, 0.1083984375)
-GLYPHS[8937] = Glyph('⋩', 'succeeds but not equivalent to', 0.794921875, 0.07763671875, 0.7666015625, 0.1083984375, 0.1083984375)
-GLYPHS[8938] = Glyph('⋪', 'not normal subgroup of', 0.794921875, 0.09619140625, 0.6748046875, 0.1083984375, 0.1083984375)
-GLYPHS[8939] = Glyph('⋫', 'does not contain as normal subgroup', 0.794921875, 0.09619140625, 0.6748046875, 0.1083984375, 0.1083984375)
-GLYPHS[8940] = Glyph('⋬', 'not normal subgroup of or equal to', 0.794921875, 0.1083984375, 0.6748046875, 0.1083984375, 0.1083984375)
-GLYPHS[8941] = Glyph('⋭', 'does not contain as normal subgroup or equal', 0.794921875, 0.1083984375, 0.6748046875, 0.1083984375, 0.1083984375)
-GLYPHS[8942] = Glyph('⋮', 'vertical ellipsis', 0.794921875, 0, 0.57861328125, 0.349609375, 0.34912109375)
-GLYPHS[8943] = Glyph('⋯', 'midline horizontal ellipsis', 0.794921875, -0.24072265625, 0.33740234375, 0.1083984375, 0.1083984375)
-GLYPHS[8944] = Glyph('⋰', 'up right diagonal ellipsis', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8945] = Glyph('⋱', 'down right diagonal ellipsis', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[8962] = Glyph('⌂', 'house', 0.84326171875, 0, 0.72265625, 0.06005859375, 0.060546875)
-GLYPHS[8966] = Glyph('⌆', 'perspective', 0.794921875, 0, 0.72265625, 0.1083984375, 0.1083984375)
-GLYPHS[8968] = Glyph('⌈', 'left ceiling', 0.5302734375, 0.14453125, 0.77099609375, 0.19287109375, 0.0966796875)
-GLYPHS[8969] = Glyph('⌉', 'right ceiling', 0.5302734375, 0.14453125, 0.77099609375, 0.09619140625, 0.193359375)
-GLYPHS[8970] = Glyph('⌊', 'left floor', 0.5302734375, 0.14453125, 0.77099609375, 0.19287109375, 0.0966796875)
-GLYPHS[8971] = Glyph('⌋', 'right floor', 0.5302734375, 0.14453125, 0.77099609375, 0.09619140625, 0.193359375)
-GLYPHS[8992] = Glyph('⌠', 'top half integral', 0.421875, 0.2109375, 0.7890625, 0.16259765625, 0.00048828125)
-GLYPHS[8993] = Glyph('⌡', 'bottom half integral', 0.421875, 0.2109375, 0.7890625, 0, 0.1630859375)
-GLYPHS[8994] = Glyph('⌢', 'frown', 0.794921875, -0.2109375, 0.36767578125, 0.1083984375, 0.1083984375)
-GLYPHS[8995] = Glyph('⌣', 'smile', 0.794921875, -0.2109375, 0.36767578125, 0.1083984375, 0.1083984375)
-GLYPHS[9216] = Glyph('␀', 'symbol for null', 1, 0.00927734375, 0.361328125, 0.06640625, 0.025390625)
-GLYPHS[9217] = Glyph('␁', 'symbol for start of heading', 1, 0.00927734375, 0.37060546875, 0.06005859375, 0.04736328125)
-GLYPHS[9218] = Glyph('␂', 'symbol for start of text', 1, 0.00927734375, 0.37060546875, 0.05419921875, 0.03759765625)
-GLYPHS[9219] = Glyph('␃', 'symbol for end of text', 1, 0, 0.361328125, 0.06640625, 0.03759765625)
-GLYPHS[9220] = Glyph('␄', 'symbol for end of transmission', 1, 0.00927734375, 0.37060546875, 0.06640625, 0.0283203125)
-GLYPHS[9221] = Glyph('␅', 'symbol for enquiry', 1, 0.072265625, 0.37060546875, 0.06005859375, 0.03173828125)
-GLYPHS[9222] = Glyph('␆', 'symbol for acknowledge', 1, 0.00927734375, 0.37060546875, 0.01806640625, 0.0205078125)
-GLYPHS[9223] = Glyph('␇', 'symbol for bell', 1, 0, 0.361328125, 0.06640625, 0.017578125)
-GLYPHS[9224] = Glyph('␈', 'symbol for backspace', 1, 0.00927734375, 0.37060546875, 0.21240234375, 0.20947265625)
-GLYPHS[9225] = Glyph('␉', 'symbol for horizontal tabulation', 1, 0, 0.361328125, 0.2001953125, 0.1611328125)
-GLYPHS[9226] = Glyph('␊', 'symbol for line feed', 1, 0, 0.361328125, 0.21337890625, 0.19677734375)
-GLYPHS[9227] = Glyph('␋', 'symbol for vertical tabulation', 0.88916015625, 0, 0.361328125, 0.13330078125, 0.11181640625)
-GLYPHS[9228] = Glyph('␌', 'symbol for form feed', 1, 0, 0.361328125, 0.21875, 0.19970703125)
-GLYPHS[9229] = Glyph('␍', 'symbol for carriage return', 1, 0.00927734375, 0.37060546875, 0.17333984375, 0.18310546875)
-GLYPHS[9230] = Glyph('␎', 'symbol for shift out', 1, 0.00927734375, 0.37060546875, 0.16650390625, 0.1884765625)
-GLYPHS[9231] = Glyph('␏', 'symbol for shift in', 1, 0.00927734375, 0.37060546875, 0.1865234375, 0.2060546875)
-GLYPHS[9232] = Glyph('␐', 'symbol for data link escape', 1, 0, 0.361328125, 0.072265625, 0.0361328125)
-GLYPHS[9233] = Glyph('␑', 'symbol for device control one', 1, 0.00927734375, 0.37060546875, 0.072265625, 0.04150390625)
-GLYPHS[9234] = Glyph('␒', 'symbol for device control two', 1, 0.00927734375, 0.37060546875, 0.072265625, 0.04833984375)
-GLYPHS[9235] = Glyph('␓', 'symbol for device control three', 1, 0.00927734375, 0.37060546875, 0.072265625, 0.05712890625)
-GLYPHS[9236] = Glyph('␔', 'symbol for device control four', 1, 0.00927734375, 0.37060546875, 0.072265625, 0.05126953125)
-GLYPHS[9237] = Glyph('␕', 'symbol for negative acknowledge', 1, 0, 0.361328125, 0.06640625, 0.02001953125)
-GLYPHS[9238] = Glyph('␖', 'symbol for synchronous idle', 1, 0.00927734375, 0.37060546875, 0.05419921875, 0.06005859375)
-GLYPHS[9239] = Glyph('␗', 'symbol for end of transmission block', 1, 0, 0.361328125, 0.06640625, 0.05419921875)
-GLYPHS[9240] = Glyph('␘', 'symbol for cancel', 1, 0.00927734375, 0.37060546875, 0.05419921875, 0.06005859375)
-GLYPHS[9241] = Glyph('␙', 'symbol for end of medium', 1, 0, 0.361328125, 0.1865234375, 0.18701171875)
-GLYPHS[9242] = Glyph('␚', 'symbol for substitute', 1, 0.00927734375, 0.37060546875, 0.06005859375, 0.060546875)
-GLYPHS[9243] = Glyph('␛', 'symbol for escape', 1, 0.00927734375, 0.37060546875, 0.06640625, 0.02978515625)
-GLYPHS[9244] = Glyph('␜', 'symbol for file separator', 1, 0.00927734375, 0.37060546875, 0.21875, 0.203125)
-GLYPHS[9245] = Glyph('␝', 'symbol for group separator', 1, 0.00927734375, 0.37060546875, 0.16650390625, 0.1884765625)
-GLYPHS[9246] = Glyph('␞', 'symbol for record separator', 1, 0.00927734375, 0.37060546875, 0.1865234375, 0.1884765625)
-GLYPHS[9247] = Glyph('␟', 'symbol for unit separator', 1, 0.00927734375, 0.37060546875, 0.193359375, 0.181640625)
-GLYPHS[9248] = Glyph('␠', 'symbol for space', 1, 0.00927734375, 0.37060546875, 0.17333984375, 0.1875)
-GLYPHS[9249] = Glyph('␡', 'symbol for delete', 1, 0, 0.361328125, 0.072265625, 0.0302734375)
-GLYPHS[9250] = Glyph('␢', 'blank symbol', 1, 0.01220703125, 0.783203125, 0.13330078125, 0.1650390625)
-GLYPHS[9251] = Glyph('␣', 'open box', 0.31640625, 0.14453125, 0, 0, 0)
-GLYPHS[9252] = Glyph('␤', 'symbol for newline', 1, 0, 0.361328125, 0.2001953125, 0.16015625)
-GLYPHS[9472] = Glyph('─', 'box drawings light horizontal', 1, -0.2529296875, 0.3251953125, 0, 0)
-GLYPHS[9473] = Glyph('━', 'box drawings heavy horizontal', 1, -0.2412109375, 0.33740234375, 0, 0)
-GLYPHS[9474] = Glyph('│', 'box drawings light vertical', 1, 0.2109375, 0.7890625, 0.4638671875, 0.4638671875)
-GLYPHS[9475] = Glyph('┃', 'box drawings heavy vertical', 1, 0.2109375, 0.7890625, 0.45166015625, 0.4521484375)
-GLYPHS[9476] = Glyph('┄', 'box drawings light triple dash horizontal', 1, -0.2529296875, 0.3251953125, 0.0361328125, 0.0361328125)
-GLYPHS[9477] = Glyph('┅', 'box drawings heavy triple dash horizontal', 1, -0.24072265625, 0.33740234375, 0.0361328125, 0.0361328125)
-GLYPHS[9478] = Glyph('┆', 'box drawings light triple dash vertical', 1, 0.1748046875, 0.7529296875, 0.4638671875, 0.4638671875)
-GLYPHS[9479] = Glyph('┇', 'box drawings heavy triple dash vertical', 1, 0.1748046875, 0.7529296875, 0.45166015625, 0.4521484375)
-GLYPHS[9480] = Glyph('┈', 'box drawings light quadruple dash horizontal', 1, -0.2529296875, 0.3251953125, 0.0361328125, 0.0361328125)
-GLYPHS[9481] = Glyph('┉', 'box drawings heavy quadruple dash horizontal', 1, -0.24072265625, 0.33740234375, 0.0361328125, 0.0361328125)
-GLYPHS[9482] = Glyph('┊', 'box drawings light quadruple dash vertical', 1, 0.1748046875, 0.7529296875, 0.4638671875, 0.4638671875)
-GLYPHS[9483] = Glyph('┋', 'box drawings heavy quadruple dash vertical', 1, 0.1748046875, 0.7529296875, 0.45166015625, 0.4521484375)
-GLYPHS[9484] = Glyph('┌', 'box drawings light down and right', 1, 0.2109375, 0.3251953125, 0.4638671875, 0)
-GLYPHS[9485] = Glyph('┍', 'box drawings down light and right heavy', 1, 0.2109375, 0.33740234375, 0.4638671875, 0)
-GLYPHS[9486] = Glyph('┎', 'box drawings down heavy and right light', 1, 0.2109375, 0.3251953125, 0.45166015625, 0)
-GLYPHS[9487] = Glyph('┏', 'box drawings heavy down and right', 1, 0.2109375, 0.33740234375, 0.45166015625, 0)
-GLYPHS[9488] = Glyph('┐', 'box drawings light down and left', 1, 0.2109375, 0.3251953125, 0, 0.4638671875)
-GLYPHS[9489] = Glyph('┑', 'box drawings down light and left heavy', 1, 0.2109375, 0.33740234375, 0, 0.4638671875)
-GLYPHS[9490] = Glyph('┒', 'box drawings down heavy and left light', 1, 0.2109375, 0.3251953125, 0, 0.45166015625)
-GLYPHS[9491] = Glyph('┓', 'box drawings heavy down and left', 1, 0.2109375, 0.33740234375, 0, 0.45166015625)
-GLYPHS[9492] = Glyph('└', 'box drawings light up and right', 1, -0.2529296875, 0.7890625, 0.4638671875, 0)
-GLYPHS[9493] = Glyph('┕', 'box drawings up light and right heavy', 1, -0.24072265625, 0.7890625, 0.4638671875, 0)
-GLYPHS[9494] = Glyph('┖', 'box drawings up heavy and right light', 1, -0.2529296875, 0.7890625, 0.45166015625, 0)
-GLYPHS[9495] = Glyph('┗', 'box drawings heavy up and right', 1, -0.24072265625, 0.7890625, 0.45166015625, 0)
-GLYPHS[9496] = Glyph('┘', 'box drawings light up and left', 1, -0.2529296875, 0.7890625, 0, 0.4638671875)
-GLYPHS[9497] = Glyph('┙', 'box drawings up light and left heavy', 1, -0.24072265625, 0.7890625, 0, 0.4638671875)
-GLYPHS[9498] = Glyph('┚', 'box drawings up heavy and left light', 1, -0.2529296875, 0.7890625, 0, 0.45166015625)
-GLYPHS[9499] = Glyph('┛', 'box drawings heavy up and left', 1, -0.24072265625, 0.7890625, 0, 0.45166015625)
-GLYPHS[9500] = Glyph('├', 'box drawings light vertical and right', 1, 0.2109375, 0.7890625, 0.4638671875, 0)
-GLYPHS[9501] = Glyph('┝', 'box drawings vertical light and right heavy', 1, 0.2109375, 0.7890625, 0.4638671875, 0)
-GLYPHS[9502] = Glyph('┞', 'box drawings up heavy and right down light', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9503] = Glyph('┟', 'box drawings down heavy and right up light', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9504] = Glyph('┠', 'box drawings vertical heavy and right light', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9505] = Glyph('┡', 'box drawings down light and right up heavy', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9506] = Glyph('┢', 'box drawings up light and right down heavy', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9507] = Glyph('┣', 'box drawings heavy vertical and right', 1, 0.2109375, 0.7890625, 0.45166015625, 0)
-GLYPHS[9508] = Glyph('┤', 'box drawings light vertical and left', 1, 0.2109375, 0.7890625, 0, 0.4638671875)
-GLYPHS[9509] = Glyph('┥', 'box drawings vertical light and left heavy', 1, 0.2109375, 0.7890625, 0, 0.4638671875)
-GLYPHS[9510] = Glyph('┦', 'box drawings up heavy and left down light', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9511] = Glyph('┧', 'box drawings down heavy and left up light', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9512] = Glyph('┨', 'box drawings vertical heavy and left light', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9513] = Glyph('┩', 'box drawings down light and left up heavy', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9514] = Glyph('┪', 'box drawings up light and left down heavy', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9515] = Glyph('┫', 'box drawings heavy vertical and left', 1, 0.2109375, 0.7890625, 0, 0.45166015625)
-GLYPHS[9516] = Glyph('┬', 'box drawings light down and horizontal', 1, 0.2109375, 0.3251953125, 0, 0)
-GLYPHS[9517] = Glyph('┭', 'box drawings left heavy and right down light', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9518] = Glyph('┮', 'box drawings right heavy and left down light', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9519] = Glyph('┯', 'box drawings down light and horizontal heavy', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9520] = Glyph('┰', 'box drawings down heavy and horizontal light', 1, 0.2109375, 0.3251953125, 0, 0)
-GLYPHS[9521] = Glyph('┱', 'box drawings right light and left down heavy', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9522] = Glyph('┲', 'box drawings left light and right down heavy', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9523] = Glyph('┳', 'box drawings heavy down and horizontal', 1, 0.2109375, 0.33740234375, 0, 0)
-GLYPHS[9524] = Glyph('┴', 'box drawings light up and horizontal', 1, -0.2529296875, 0.7890625, 0, 0)
-GLYPHS[9525] = Glyph('┵', 'box drawings left heavy and right up light', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9526] = Glyph('┶', 'box drawings right heavy and left up light', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9527] = Glyph('┷', 'box drawings up light and horizontal heavy', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9528] = Glyph('┸', 'box drawings up heavy and horizontal light', 1, -0.2529296875, 0.7890625, 0, 0)
-GLYPHS[9529] = Glyph('┹', 'box drawings right light and left up heavy', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9530] = Glyph('┺', 'box drawings left light and right up heavy', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9531] = Glyph('┻', 'box drawings heavy up and horizontal', 1, -0.24072265625, 0.7890625, 0, 0)
-GLYPHS[9532] = Glyph('┼', 'box drawings light vertical and horizontal', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9533] = Glyph('┽', 'box drawings left heavy and right vertical light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9534] = Glyph('┾', 'box drawings right heavy and left vertical light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9535] = Glyph('┿', 'box drawings vertical light and horizontal heavy', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9536] = Glyph('╀', 'box drawings up heavy and down horizontal light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9537] = Glyph('╁', 'box drawings down heavy and up horizontal light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9538] = Glyph('╂', 'box drawings vertical heavy and horizontal light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9539] = Glyph('╃', 'box drawings left up heavy and right down light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9540] = Glyph('╄', 'box drawings right up heavy and left down light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9541] = Glyph('╅', 'box drawings left down heavy and right up light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9542] = Glyph('╆', 'box drawings right down heavy and left up light', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9543] = Glyph('╇', 'box drawings down light and up horizontal heavy', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9544] = Glyph('╈', 'box drawings up light and down horizontal heavy', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9545] = Glyph('╉', 'box drawings right light and left vertical heavy', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9546] = Glyph('╊', 'box drawings left light and right vertical heavy', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9547] = Glyph('╋', 'box drawings heavy vertical and horizontal', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9548] = Glyph('╌', 'box drawings light double dash horizontal', 1, -0.2529296875, 0.3251953125, 0.0361328125, 0.0361328125)
-GLYPHS[9549] = Glyph('╍', 'box drawings heavy double dash horizontal', 1, -0.24072265625, 0.33740234375, 0.0361328125, 0.0361328125)
-GLYPHS[9550] = Glyph('╎', 'box drawings light double dash vertical', 1, 0.1748046875, 0.7529296875, 0.4638671875, 0.4638671875)
-GLYPHS[9551] = Glyph('╏', 'box drawings heavy double dash vertical', 1, 0.1748046875, 0.7529296875, 0.45166015625, 0.4521484375)
-GLYPHS[9552] = Glyph('═', 'box drawings double horizontal', 1, -0.1806640625, 0.3974609375, 0, 0)
-GLYPHS[9553] = Glyph('║', 'box drawings double vertical', 1, 0.2109375, 0.7890625, 0.3916015625, 0.3916015625)
-GLYPHS[9554] = Glyph('╒', 'box drawings down single and right double', 1, 0.2109375, 0.3974609375, 0.45166015625, 0)
-GLYPHS[9555] = Glyph('╓', 'box drawings down double and right single', 1, 0.2109375, 0.3251953125, 0.3916015625, 0)
-GLYPHS[9556] = Glyph('╔', 'box drawings double down and right', 1, 0.2109375, 0.3974609375, 0.3916015625, 0)
-GLYPHS[9557] = Glyph('╕', 'box drawings down single and left double', 1, 0.2109375, 0.3974609375, 0, 0.4638671875)
-GLYPHS[9558] = Glyph('╖', 'box drawings down double and left single', 1, 0.2109375, 0.3251953125, 0, 0.3916015625)
-GLYPHS[9559] = Glyph('╗', 'box drawings double down and left', 1, 0.2109375, 0.3974609375, 0, 0.3916015625)
-GLYPHS[9560] = Glyph('╘', 'box drawings up single and right double', 1, -0.1806640625, 0.7890625, 0.3916015625, 0)
-GLYPHS[9561] = Glyph('╙', 'box drawings up double and right single', 1, -0.2529296875, 0.7890625, 0.3916015625, 0)
-GLYPHS[9562] = Glyph('╚', 'box drawings double up and right', 1, -0.1806640625, 0.7890625, 0.3916015625, 0)
-GLYPHS[9563] = Glyph('╛', 'box drawings up single and left double', 1, -0.1806640625, 0.7890625, 0, 0.4638671875)
-GLYPHS[9564] = Glyph('╜', 'box drawings up double and left single', 1, -0.2529296875, 0.7890625, 0, 0.3916015625)
-GLYPHS[9565] = Glyph('╝', 'box drawings double up and left', 1, -0.1806640625, 0.7890625, 0, 0.3916015625)
-GLYPHS[9566] = Glyph('╞', 'box drawings vertical single and right double', 1, 0.2109375, 0.7890625, 0.4638671875, 0)
-GLYPHS[9567] = Glyph('╟', 'box drawings vertical double and right single', 1, 0.2109375, 0.7890625, 0.3916015625, 0)
-GLYPHS[9568] = Glyph('╠', 'box drawings double vertical and right', 1, 0.2109375, 0.7890625, 0.3916015625, 0)
-GLYPHS[9569] = Glyph('╡', 'box drawings vertical single and left double', 1, 0.2109375, 0.7890625, 0, 0.4638671875)
-GLYPHS[9570] = Glyph('╢', 'box drawings vertical double and left single', 1, 0.2109375, 0.7890625, 0, 0.3916015625)
-GLYPHS[9571] = Glyph('╣', 'box drawings double vertical and left', 1, 0.2109375, 0.7890625, 0, 0.3916015625)
-GLYPHS[9572] = Glyph('╤', 'box drawings down single and horizontal double', 1, 0.2109375, 0.3974609375, 0, 0)
-GLYPHS[9573] = Glyph('╥', 'box drawings down double and horizontal single', 1, 0.2109375, 0.3251953125, 0, 0)
-GLYPHS[9574] = Glyph('╦', 'box drawings double down and horizontal', 1, 0.2109375, 0.3974609375, 0, 0)
-GLYPHS[9575] = Glyph('╧', 'box drawings up single and horizontal double', 1, -0.1806640625, 0.7890625, 0, 0)
-GLYPHS[9576] = Glyph('╨', 'box drawings up double and horizontal single', 1, -0.2529296875, 0.7890625, 0, 0)
-GLYPHS[9577] = Glyph('╩', 'box drawings double up and horizontal', 1, -0.1806640625, 0.7890625, 0, 0)
-GLYPHS[9578] = Glyph('╪', 'box drawings vertical single and horizontal double', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9579] = Glyph('╫', 'box drawings vertical double and horizontal single', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9580] = Glyph('╬', 'box drawings double vertical and horizontal', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9581] = Glyph('╭', 'box drawings light arc down and right', 1, 0.2109375, 0.3251953125, 0.4638671875, 0)
-GLYPHS[9582] = Glyph('╮', 'box drawings light arc down and left', 1, 0.2109375, 0.3251953125, 0, 0.4638671875)
-GLYPHS[9583] = Glyph('╯', 'box drawings light arc up and left', 1, -0.2529296875, 0.7890625, 0, 0.4638671875)
-GLYPHS[9584] = Glyph('╰', 'box drawings light arc up and right', 1, -0.2529296875, 0.7890625, 0.4638671875, 0)
-GLYPHS[9585] = Glyph('╱', 'box drawings light diagonal upper right to lower left', 1, 0.236328125, 0.81494140625, -0.02490234375, -0.0263671875)
-GLYPHS[9586] = Glyph('╲', 'box drawings light diagonal upper left to lower right', 1, 0.236328125, 0.81494140625, -0.02490234375, -0.0263671875)
-GLYPHS[9587] = Glyph('╳', 'box drawings light diagonal cross', 1, 0.236083984375, 0.815185546875, -0.02490234375, -0.0263671875)
-GLYPHS[9588] = Glyph('╴', 'box drawings light left', 1, -0.2529296875, 0.3251953125, 0, 0.5)
-GLYPHS[9589] = Glyph('╵', 'box drawings light up', 1, -0.2890625, 0.7890625, 0.4638671875, 0.4638671875)
-GLYPHS[9590] = Glyph('╶', 'box drawings light right', 1, -0.2529296875, 0.3251953125, 0.5, 0)
-GLYPHS[9591] = Glyph('╷', 'box drawings light down', 1, 0.2109375, 0.2890625, 0.4638671875, 0.4638671875)
-GLYPHS[9592] = Glyph('╸', 'box drawings heavy left', 1, -0.24072265625, 0.33740234375, 0, 0.5)
-GLYPHS[9593] = Glyph('╹', 'box drawings heavy up', 1, -0.2890625, 0.7890625, 0.45166015625, 0.45166015625)
-GLYPHS[9594] = Glyph('╺', 'box drawings heavy right', 1, -0.24072265625, 0.33740234375, 0.5, 0)
-GLYPHS[9595] = Glyph('╻', 'box drawings heavy down', 1, 0.2109375, 0.2890625, 0.45166015625, 0.45166015625)
-GLYPHS[9596] = Glyph('╼', 'box drawings light left and heavy right', 1, -0.24072265625, 0.33740234375, 0, 0)
-GLYPHS[9597] = Glyph('╽', 'box drawings light up and heavy down', 1, 0.2109375, 0.7890625, 0.45166015625, 0.45166015625)
-GLYPHS[9598] = Glyph('╾', 'box drawings heavy left and light right', 1, -0.24072265625, 0.33740234375, 0, 0)
-GLYPHS[9599] = Glyph('╿', 'box drawings heavy up and light down', 1, 0.2109375, 0.7890625, 0.45166015625, 0.45166015625)
-GLYPHS[9600] = Glyph('▀', 'upper half block', 1, -0.2890625, 0.7890625, 0, 0)
-GLYPHS[9602] = Glyph('▂', 'lower one quarter block', 1, 0.2109375, 0.0390625, 0, 0)
-GLYPHS[9603] = Glyph('▃', 'lower three eighths block', 1, 0.2109375, 0.1640625, 0, 0)
-GLYPHS[9604] = Glyph('▄', 'lower half block', 1, 0.2109375, 0.2890625, 0, 0)
-GLYPHS[9605] = Glyph('▅', 'lower five eighths block', 1, 0.2109375, 0.4140625, 0, 0)
-GLYPHS[9606] = Glyph('▆', 'lower three quarters block', 1, 0.2109375, 0.5390625, 0, 0)
-GLYPHS[9607] = Glyph('▇', 'lower seven eighths block', 1, 0.2109375, 0.6640625, 0, 0)
-GLYPHS[9608] = Glyph('█', 'full block', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9609] = Glyph('▉', 'left seven eighths block', 1, 0.2109375, 0.7890625, 0, 0.125)
-GLYPHS[9610] = Glyph('▊', 'left three quarters block', 1, 0.2109375, 0.7890625, 0, 0.25)
-GLYPHS[9611] = Glyph('▋', 'left five eighths block', 1, 0.2109375, 0.7890625, 0, 0.375)
-GLYPHS[9612] = Glyph('▌', 'left half block', 1, 0.2109375, 0.7890625, 0, 0.5)
-GLYPHS[9613] = Glyph('▍', 'left three eighths block', 1, 0.2109375, 0.7890625, 0, 0.625)
-GLYPHS[9614] = Glyph('▎', 'left one quarter block', 1, 0.2109375, 0.7890625, 0, 0.75)
-GLYPHS[9615] = Glyph('▏', 'left one eighth block', 1, 0.2109375, 0.7890625, 0, 0.875)
-GLYPHS[9616] = Glyph('▐', 'right half block', 1, 0.2109375, 0.7890625, 0.5, 0)
-GLYPHS[9617] = Glyph('░', 'light shade', 1, 0.16064453125, 0.7890625, 0, 0.0498046875)
-GLYPHS[9618] = Glyph('▒', 'medium shade', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9619] = Glyph('▓', 'dark shade', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9620] = Glyph('▔', 'upper one eighth block', 1, -0.6640625, 0.7890625, 0, 0)
-GLYPHS[9621] = Glyph('▕', 'right one eighth block', 1, 0.2109375, 0.7890625, 0.875, 0)
-GLYPHS[9632] = Glyph('■', 'black square', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9633] = Glyph('□', 'white square', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9634] = Glyph('▢', 'white square with rounded corners', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9635] = Glyph('▣', 'white square containing black small square', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9636] = Glyph('▤', 'square with horizontal fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9637] = Glyph('▥', 'square with vertical fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9638] = Glyph('▦', 'square with orthogonal crosshatch fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9639] = Glyph('▧', 'square with upper left to lower right fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9640] = Glyph('▨', 'square with upper right to lower left fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9641] = Glyph('▩', 'square with diagonal crosshatch fill', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[9642] = Glyph('▪', 'black small square', 0.505859375, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9643] = Glyph('▫', 'white small square', 0.505859375, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9644] = Glyph('▬', 'black rectangle', 0.794921875, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9645] = Glyph('▭', 'white rectangle', 0.794921875, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9646] = Glyph('▮', 'black vertical rectangle', 0.505859375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9647] = Glyph('▯', 'white vertical rectangle', 0.505859375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9648] = Glyph('▰', 'black parallelogram', 0.794921875, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9649] = Glyph('▱', 'white parallelogram', 0.794921875, -0.14404296875, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9650] = Glyph('▲', 'black up-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9651] = Glyph('△', 'white up-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9652] = Glyph('▴', 'black up-pointing small triangle', 0.55078125, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9653] = Glyph('▵', 'white up-pointing small triangle', 0.55078125, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9654] = Glyph('▶', 'black right-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9655] = Glyph('▷', 'white right-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9656] = Glyph('▸', 'black right-pointing small triangle', 0.55078125, -0.1220703125, 0.4560546875, 0.130859375, 0.130859375)
-GLYPHS[9657] = Glyph('▹', 'white right-pointing small triangle', 0.55078125, -0.1220703125, 0.4560546875, 0.130859375, 0.130859375)
-GLYPHS[9658] = Glyph('►', 'black right-pointing pointer', 0.884765625, -0.1220703125, 0.4560546875, 0.1083984375, 0.1083984375)
-GLYPHS[9659] = Glyph('▻', 'white right-pointing pointer', 0.884765625, -0.1220703125, 0.4560546875, 0.1083984375, 0.1083984375)
-GLYPHS[9660] = Glyph('▼', 'black down-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9661] = Glyph('▽', 'white down-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9662] = Glyph('▾', 'black down-pointing small triangle', 0.55078125, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9663] = Glyph('▿', 'white down-pointing small triangle', 0.55078125, -0.14453125, 0.43359375, 0.1083984375, 0.1083984375)
-GLYPHS[9664] = Glyph('◀', 'black left-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9665] = Glyph('◁', 'white left-pointing triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9666] = Glyph('◂', 'black left-pointing small triangle', 0.55078125, -0.1220703125, 0.4560546875, 0.130859375, 0.130859375)
-GLYPHS[9667] = Glyph('◃', 'white left-pointing small triangle', 0.55078125, -0.1220703125, 0.4560546875, 0.130859375, 0.130859375)
-GLYPHS[9668] = Glyph('◄', 'black left-pointing pointer', 0.884765625, -0.1220703125, 0.4560546875, 0.1083984375, 0.1083984375)
-GLYPHS[9669] = Glyph('◅', 'white left-pointing pointer', 0.884765625, -0.1220703125, 0.4560546875, 0.1083984375, 0.1083984375)
-GLYPHS[9670] = Glyph('◆', 'black diamond', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9671] = Glyph('◇', 'white diamond', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[9672] = Glyph('◈', 'white diamond containing black small diamond', 0.794921875, 0, 0.57861328125, 0.1083984375, 0.1083984375)
-GLYPHS[9673] = Glyph('◉', 'fisheye', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9674] = Glyph('◊', 'lozenge', 0.75341796875, 0.01806640625, 0.7412109375, 0.1083984375, 0.1083984375)
-GLYPHS[9675] = Glyph('○', 'white circle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9676] = Glyph('◌', 'dotted circle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9677] = Glyph('◍', 'circle with vertical fill', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9678] = Glyph('◎', 'bullseye', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9679] = Glyph('●', 'black circle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9680] = Glyph('◐', 'circle with left half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9681] = Glyph('◑', 'circle with right half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9682] = Glyph('◒', 'circle with lower half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9683] = Glyph('◓', 'circle with upper half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9684] = Glyph('◔', 'circle with upper right quadrant black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9685] = Glyph('◕', 'circle with all but upper left quadrant black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9686] = Glyph('◖', 'left half black circle', 0.505859375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9687] = Glyph('◗', 'right half black circle', 0.505859375, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9688] = Glyph('◘', 'inverse bullet', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9689] = Glyph('◙', 'inverse white circle', 1, 0.2109375, 0.7890625, 0, 0)
-GLYPHS[9690] = Glyph('◚', 'upper half inverse white circle', 1, -0.2890625, 0.7890625, 0, 0)
-GLYPHS[9691] = Glyph('◛', 'lower half inverse white circle', 1, 0.2109375, 0.2890625, 0, 0)
-GLYPHS[9692] = Glyph('◜', 'upper left quadrant circular arc', 0.591796875, -0.2890625, 0.6640625, 0.1083984375, 0.1083984375)
-GLYPHS[9693] = Glyph('◝', 'upper right quadrant circular arc', 0.591796875, -0.2890625, 0.6640625, 0.1083984375, 0.1083984375)
-GLYPHS[9694] = Glyph('◞', 'lower right quadrant circular arc', 0.591796875, 0.0859375, 0.2890625, 0.1083984375, 0.1083984375)
-GLYPHS[9695] = Glyph('◟', 'lower left quadrant circular arc', 0.591796875, 0.0859375, 0.2890625, 0.1083984375, 0.1083984375)
-GLYPHS[9696] = Glyph('◠', 'upper half circle', 1, -0.2890625, 0.6640625, 0.125, 0.125)
-GLYPHS[9697] = Glyph('◡', 'lower half circle', 1, 0.0859375, 0.2890625, 0.125, 0.125)
-GLYPHS[9698] = Glyph('◢', 'black lower right triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9699] = Glyph('◣', 'black lower left triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9700] = Glyph('◤', 'black upper left triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9701] = Glyph('◥', 'black upper right triangle', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9702] = Glyph('◦', 'white bullet', 0.560546875, -0.1171875, 0.4609375, 0.1083984375, 0.1083984375)
-GLYPHS[9703] = Glyph('◧', 'square with left half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9704] = Glyph('◨', 'square with right half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9705] = Glyph('◩', 'square with upper left diagonal half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9706] = Glyph('◪', 'square with lower right diagonal half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9707] = Glyph('◫', 'white square with vertical bisecting line', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9708] = Glyph('◬', 'white up-pointing triangle with dot', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9709] = Glyph('◭', 'up-pointing triangle with left half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9710] = Glyph('◮', 'up-pointing triangle with right half black', 0.794921875, 0, 0.578125, 0.1083984375, 0.1083984375)
-GLYPHS[9786] = Glyph('☺', 'white smiling face', 0.84326171875, 0.01806640625, 0.74072265625, 0.0419921875, 0.04248046875)
-GLYPHS[9787] = Glyph('☻', 'black smiling face', 0.84326171875, 0.01806640625, 0.74072265625, 0.0419921875, 0.04248046875)
-GLYPHS[9788] = Glyph('☼', 'white sun with rays', 0.7529296875, 0.01220703125, 0.73486328125, 0.0029296875, 0.0029296875)
-GLYPHS[9792] = Glyph('♀', 'female sign', 0.84326171875, 0.19287109375, 0.783203125, 0.09619140625, 0.0966796875)
-GLYPHS[9794] = Glyph('♂', 'male sign', 0.84326171875, 0.01806640625, 0.783203125, 0.01806640625, 0.01171875)
-GLYPHS[9824] = Glyph('♠', 'black spade suit', 0.84326171875, 0, 0.72265625, 0.06201171875, 0.0615234375)
-GLYPHS[9827] = Glyph('♣', 'black club suit', 0.84326171875, 0, 0.72265625, 0.06005859375, 0.06005859375)
-GLYPHS[9829] = Glyph('♥', 'black heart suit', 0.84326171875, 0, 0.72265625, 0.06005859375, 0.060546875)
-GLYPHS[9830] = Glyph('♦', 'black diamond suit', 0.84326171875, 0, 0.72265625, 0.06005859375, 0.060546875)
-GLYPHS[9834] = Glyph('♪', 'eighth note', 0.63232421875, 0.01806640625, 0.72265625, 0.0576171875, 0.08056640625)
-GLYPHS[9835] = Glyph('♫', 'beamed eighth notes', 0.63232421875, 0.14453125, 0.74072265625, 0.0263671875, 0.05859375)
-GLYPHS[9837] = Glyph('♭', 'music flat sign', 0.63818359375, 0, 0.72265625, 0.19287109375, 0.14697265625)
-GLYPHS[9838] = Glyph('♮', 'music natural sign', 0.638671875, 0.14453125, 0.72265625, 0.2080078125, 0.2080078125)
-GLYPHS[9839] = Glyph('♯', 'music sharp sign', 0.63818359375, 0.14453125, 0.72265625, 0.13232421875, 0.13232421875)
-GLYPHS[64257] = Glyph('ﬁ', 'latin small ligature fi', 0.64453125, 0, 0.783203125, 0.0390625, 0.0966796875)
-GLYPHS[64258] = Glyph('ﬂ', 'latin small ligature fl', 0.6474609375, 0, 0.783203125, 0.0390625, 0.09619140625)
-GLYPHS[64286] = Glyph('ﬞ', 'hebrew point judeo-spanish varika', 0, -0.6748046875, 0.8193359375, 0.1923828125, -0.517578125)
+FONT_REGISTRY = FontRegistry()
+FONT_REGISTRY.register(DEFAULT_FONT, METRICS_TABLE_PATH)
+FONT_METRICS = FONT_REGISTRY.get_metrics(DEFAULT_FONT)
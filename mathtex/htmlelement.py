@@ -1,5 +1,10 @@
+from mathtex.displaylist import DisplayList
 from mathtex.fontmetric import FONT_METRICS
+from mathtex.fontmetric import FontMetrics
+from mathtex.shapes import RADICAL_SHAPE
+from mathtex.shapes import SHAPE_UNITS
 from typing import List
+from typing import Optional
 
 
 class HtmlElement:
@@ -13,42 +18,20 @@ class HtmlElement:
         self.font_size = font_size  # font-size relative to 1em
         self.css_class = css_class
         self.text = text
+        self.shape = None  # name of a single-element shape drawn by mathtex.shapes
         self.children = []  # type: List[HtmlElement]
+        self.font_metrics = None  # type: Optional[FontMetrics]  # set on the root by HtmlRender.render
 
-    def to_html(self, offset_x=0, offset_y=0) -> str:
-        if len(self.children) > 0:
-            lines = []
-            for child in self.children:
-                line = child.to_html(self.x + offset_x, self.y + offset_y)
-                if len(line) > 0:
-                    lines.append(line)
-            return '\n'.join(lines)
-        if self.text is None and self.css_class is None:
-            return ""
-        html_text = "" if self.text is None else self.text
-        html_pos = "left:{0}em;top:{1}em;".format(
-            (self.x + offset_x) / self.font_size,
-            (self.y + offset_y) / self.font_size)
-        html_width = "" if self.width is None else "width:{0}em;".format(self.width)
-        html_height = "" if self.height is None else "height:{0}em;".format(self.height)
-        html_font_size = "" if self.font_size == 1 else "font-size:{0}em;".format(self.font_size)
-        html_class = "" if self.css_class is None else ' class="{0}"'.format(self.css_class)
-        return '<{0} style="{1}"{2}>{3}</{0}>'.format(
-            self.name, html_pos + html_width + html_height + html_font_size, html_class, html_text)
+    def to_html(self, font_metrics: Optional[FontMetrics] = None) -> str:
+        return DisplayList.from_element(self, font_metrics=font_metrics).to_html()
 
-    def to_html_div(self) -> str:
-        inner_html = self.to_html()
-        begin_div = '<div class="math" style="width:{0}em;height:{1}em;vertical-align:{2}em;">'.format(
-            self.width,
-            self.height,
-            self.baseline - self.height)
-        lines = [begin_div, inner_html, "</div>"]
-        return '\n'.join(lines)
+    def to_html_div(self, font_metrics: Optional[FontMetrics] = None) -> str:
+        return DisplayList.from_element(self, font_metrics=font_metrics).to_html_div()
 
-    def update_baseline(self, font_size, pseudo_height=None):
+    def update_baseline(self, font_size, pseudo_height=None, font_metrics: FontMetrics = FONT_METRICS):
         if pseudo_height is None:
             pseudo_height = self.height
-        self.baseline = (pseudo_height - FONT_METRICS.height * font_size) / 2 + FONT_METRICS.baseline * font_size
+        self.baseline = (pseudo_height - font_metrics.height * font_size) / 2 + font_metrics.baseline * font_size
 
     @staticmethod
     def create_brace(brace, brace_size, brace_baseline, font_size):
@@ -77,6 +60,30 @@ class HtmlElement:
                 elem.children.append(item)
             return elem
 
+    @staticmethod
+    def create_brace_shape(brace, brace_size, brace_baseline, font_size):
+        # The same box as create_brace, drawn as one shape element.
+        sides = "left" if brace in "([{" else "right"
+        if brace in "()":
+            kind = "bracket-rounded"
+        elif brace in "[]":
+            kind = "bracket"
+        else:
+            kind = "brace"
+        width = 0.5 if kind == "brace" else 0.25
+        elem = HtmlElement(width=width, height=brace_size - font_size / 4, baseline=brace_baseline - font_size / 8)
+        item = HtmlElement(width=width, height=elem.height, css_class="shape")
+        item.shape = "{0}-{1}".format(sides, kind)
+        elem.children.append(item)
+        return elem
+
+    @staticmethod
+    def create_placed(box):
+        # A positionable stand-in for a shared element, e.g. one from the layout cache.
+        elem = HtmlElement(width=box.width, height=box.height, baseline=box.baseline)
+        elem.children.append(box)
+        return elem
+
     @staticmethod
     def create_horizontal_line(x, y, width):
         return HtmlElement(x=x, y=y, width=width, css_class="hline")
@@ -95,3 +102,10 @@ class HtmlElement:
                             height=0.4 * height - 0.3 * font_size,
                             css_class="sqrt2")
         return [line, root1, root2]
+
+    @staticmethod
+    def create_square_root_shape(width, height, font_size):
+        # The radical sign and the overline of create_square_root_group as one shape element.
+        sign = HtmlElement(width=width, height=height, css_class="shape")
+        sign.shape = "{0}{1}".format(RADICAL_SHAPE, int(round(font_size * SHAPE_UNITS)))
+        return [sign]
@@ -1,31 +1,77 @@
+from types import GeneratorType
 from mathtex.astree import MathTexAST
+from mathtex.displaylist import DisplayList
 from mathtex.fontmetric import FONT_METRICS
+from mathtex.fontmetric import FontMetrics
 from mathtex.htmlelement import HtmlElement
-from mathtex.util import Array1D
-from mathtex.util import Array2D
+from mathtex.util import LRUCache
+from mathtex.util import run_nested
+from typing import Callable
+from typing import Dict
+from typing import Generator
 from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
 
+# The render_* methods of nodes with children are generators that yield (child, font_size), are sent
+# the rendered child and return the laid out element, see HtmlRender.render.
+Layout = Generator[Tuple[MathTexAST, float], HtmlElement, HtmlElement]
 
-class RowColumnMeta:
-    def __init__(self):
-        self.x = 0
-        self.y = 0
-        self.width = 0
-        self.height = 0
-        self.baseline = 0
+# Command renderers are called as handler(render, children, font_size) and return an HtmlElement,
+# or are generators that yield (child, font_size) to get a child rendered, see HtmlRender.render.
+# Commands taking arguments must also be listed in parser.TEX_CMD_ARG_NUMBER.
+COMMAND_RENDERERS = {}  # type: Dict[str, Callable]
+
+# The commands drawn by HtmlRender methods, looked up on the instance so that subclasses can override
+# them. Handlers added by register_command take precedence.
+BUILTIN_COMMANDS = {
+    MathTexAST.CMD_LEFT_RIGHT: "render_cmd_left_right",
+    MathTexAST.CMD_SUB_SUP: "render_cmd_sub_sup",
+    "frac": "render_cmd_fraction",
+    "sqrt": "render_cmd_square_root",
+}
+
+# Laid out subtrees keyed by (fingerprint, font_size, render settings). The cached elements are
+# shared and must not be modified; parents position a wrapper created by HtmlElement.create_placed.
+# The settings include the renderer class and command table, layouts built by other code are never reused.
+LAYOUT_CACHE = LRUCache(4096)  # type: LRUCache[HtmlElement]
+
+
+def register_command(cmd, handler: Callable):
+    # Cached layouts may contain the output of the handler that is replaced.
+    COMMAND_RENDERERS[cmd] = handler
+    LAYOUT_CACHE.clear()
 
 
 class HtmlRender:
-    def __init__(self):
+    def __init__(self, font_metrics: Optional[FontMetrics] = None):
+        # font_metrics defaults to the metrics of DEFAULT_FONT, see fontmetric.FONT_REGISTRY
+        self.font_metrics = FONT_METRICS if font_metrics is None else font_metrics
         self.html_elements = []
         self.char_margin = 0
         self.cell_margin = 0.5
         self.line_margin = 0
-        self.line_height = FONT_METRICS.height
+        self.line_height = self.font_metrics.height
+        self.command_renderers = COMMAND_RENDERERS
+        self.command_methods = {cmd: getattr(self, name) for cmd, name in BUILTIN_COMMANDS.items()}
+        self.layout_cache = LAYOUT_CACHE
+        self.layout_settings = None
+        self.measure_only = False  # lay out boxes without glyphs and decorations, see measure()
+        self.svg_shapes = False  # draw braces and radicals as one inline SVG element each, see mathtex.shapes
+        self.merge_glyph_runs = True  # emit consecutive glyphs as text runs, see DisplayList.merge_glyph_runs
+        self.node_renderers = {
+            MathTexAST.TEXT_NODE: lambda node, font_size: self.render_text(node.text, font_size),
+            MathTexAST.BLOCK_NODE: lambda node, font_size: self.render_block(node.children, font_size),
+            MathTexAST.CELL_NODE: lambda node, font_size: self.render_block(node.children, font_size),
+            MathTexAST.ENV_NODE: lambda node, font_size: self.render_env(node.children, font_size),
+            MathTexAST.CMD_NODE: lambda node, font_size: self.render_command(node.command, node.children, font_size),
+        }
 
     @staticmethod
-    def get_baseline(line_height, font_size):
-        return (line_height - FONT_METRICS.height * font_size) / 2 + FONT_METRICS.baseline * font_size
+    def get_baseline(line_height, font_size, font_metrics: FontMetrics = FONT_METRICS):
+        return (line_height - font_metrics.height * font_size) / 2 + font_metrics.baseline * font_size
 
     def align_children(self, elem: HtmlElement, font_size):
         elem.width = 0
@@ -45,138 +91,171 @@ class HtmlRender:
                 elem.height = child.y + child.height
         return elem
 
-    def align_children_grid(self, elem: HtmlElement, children: Array2D[HtmlElement], font_size):
-        rows = Array1D(children.height, lambda: RowColumnMeta())
-        columns = Array1D(children.width, lambda: RowColumnMeta())
-
-        def update_row_column_meta1(y, x, item: HtmlElement):
-            if item.baseline > rows[y].baseline:
-                rows[y].baseline = item.baseline
-            if item.width > columns[x].width:
-                columns[x].width = item.width
-
-        def update_row_column_meta2(y, _, item: HtmlElement):
-            y_offset = rows[y].baseline - item.baseline
-            new_height = y_offset + item.height
-            if new_height > rows[y].height:
-                rows[y].height = new_height
-
-        children.for_each_not_none(update_row_column_meta1)
-        children.for_each_not_none(update_row_column_meta2)
-        for i in range(0, children.height):
+    def align_children_grid(self, elem: HtmlElement, rows: List[List[HtmlElement]], font_size):
+        # Rows may be ragged, a short row leaves its last columns empty.
+        row_count = len(rows)
+        column_count = max(len(row) for row in rows) if row_count > 0 else 0
+        row_baselines = [0] * row_count
+        row_heights = [0] * row_count
+        row_ys = [0] * row_count
+        column_widths = [0] * column_count
+        column_xs = [0] * column_count
+        for i in range(0, row_count):
+            row_baseline = 0
+            for j, item in enumerate(rows[i]):
+                if item.baseline > row_baseline:
+                    row_baseline = item.baseline
+                if item.width > column_widths[j]:
+                    column_widths[j] = item.width
+            row_height = 0
+            for item in rows[i]:
+                new_height = row_baseline - item.baseline + item.height
+                if new_height > row_height:
+                    row_height = new_height
+            row_baselines[i] = row_baseline
+            row_heights[i] = row_height
+        for i in range(0, row_count):
             if i > 0:
-                rows[i].y = rows[i-1].y + rows[i-1].height + self.line_margin * font_size
-            elem.height = rows[i].y + rows[i].height
-        elem.update_baseline(font_size)
-        for j in range(0, children.width):
+                row_ys[i] = row_ys[i-1] + row_heights[i-1] + self.line_margin * font_size
+            elem.height = row_ys[i] + row_heights[i]
+        elem.update_baseline(font_size, font_metrics=self.font_metrics)
+        for j in range(0, column_count):
             if j > 0:
-                columns[j].x = columns[j-1].x + columns[j-1].width + self.cell_margin * font_size
-            elem.width = columns[j].x + columns[j].width
-
-        def update_cell_position(y, x, item: HtmlElement):
-            item.x = columns[x].x
-            item.y = rows[y].y + rows[y].baseline - item.baseline
-            elem.children.append(item)
-        children.for_each_not_none(update_cell_position)
+                column_xs[j] = column_xs[j-1] + column_widths[j-1] + self.cell_margin * font_size
+            elem.width = column_xs[j] + column_widths[j]
+        for i in range(0, row_count):
+            row_top = row_ys[i] + row_baselines[i]
+            for j, item in enumerate(rows[i]):
+                item.x = column_xs[j]
+                item.y = row_top - item.baseline
+            elem.children.extend(rows[i])
 
     def render(self, node: MathTexAST, font_size) -> HtmlElement:
-        node.prepare_render()
-        if node.node_type == MathTexAST.TEXT_NODE:
-            return self.render_text(node.text, font_size)
-        if node.node_type == MathTexAST.BLOCK_NODE:
-            return self.render_block(node.children, font_size)
-        if node.node_type == MathTexAST.CELL_NODE:
-            return self.render_block(node.children, font_size)
-        if node.node_type == MathTexAST.ENV_NODE:
-            return self.render_env(node.children, font_size)
-        if node.node_type == MathTexAST.CMD_NODE:
-            return self.render_command(node.command, node.children, font_size)
-        return HtmlElement(width=0, height=0)
+        # The render_* methods of nodes with children are generators that yield (child, font_size)
+        # and receive the rendered child back, so deep formulas are laid out without recursion.
+        if not node.lowered:
+            node = node.lower()
+        self.layout_settings = (
+            self.char_margin, self.cell_margin, self.line_margin, self.line_height, self.measure_only,
+            self.svg_shapes, self.font_metrics.path, type(self), id(self.command_renderers))
+        elem = run_nested(self.render_node(node, font_size), lambda request: self.render_node(*request))
+        elem.font_metrics = self.font_metrics  # the root is never shared, see render_node
+        return elem
+
+    def render_display_list(self, node: MathTexAST, font_size) -> DisplayList:
+        return DisplayList.from_element(self.render(node, font_size), self.merge_glyph_runs, self.font_metrics)
+
+    def measure(self, node: MathTexAST, font_size):
+        # Returns (width, height, baseline) of the rendered node. It runs the same layout code as
+        # render(), only the glyph and decoration elements that do not affect the metrics are skipped.
+        measure_only = self.measure_only
+        self.measure_only = True
+        try:
+            elem = self.render(node, font_size)
+        finally:
+            self.measure_only = measure_only
+        return elem.width, elem.height, elem.baseline
+
+    def render_node(self, node: MathTexAST, font_size):
+        if self.layout_cache is None or node.node_type == MathTexAST.TEXT_NODE:
+            return self.layout_node(node, font_size)
+        key = (node.get_fingerprint(), font_size, self.layout_settings)
+        box = self.layout_cache.get(key)
+        if box is not None:
+            return HtmlElement.create_placed(box)
+        return self.layout_cached(key, self.layout_node(node, font_size))
+
+    def layout_cached(self, key, layout):
+        if isinstance(layout, GeneratorType):
+            layout = yield from layout
+        self.layout_cache.put(key, layout)
+        return HtmlElement.create_placed(layout)
+
+    def layout_node(self, node: MathTexAST, font_size):
+        renderer = self.node_renderers.get(node.node_type)
+        if renderer is None:
+            return HtmlElement(width=0, height=0)
+        return renderer(node, font_size)
 
     def render_text(self, text, font_size, middle_align_with=None, italic=True, bold=False) -> HtmlElement:
         elem = HtmlElement(width=0, height=self.line_height * font_size)
         if middle_align_with is not None:
-            elem.update_baseline(middle_align_with)
+            elem.update_baseline(middle_align_with, font_metrics=self.font_metrics)
         else:
-            elem.update_baseline(font_size)
+            elem.update_baseline(font_size, font_metrics=self.font_metrics)
+        width, offsets = self.font_metrics.measure_text(text, self.char_margin)
+        elem.width = width * font_size
+        if self.measure_only:
+            return elem
         for i in range(0, len(text)):
             c = text[i]
-            if i > 0:
-                elem.width += self.char_margin * font_size
-                pre_c = text[i - 1]
-                bearing = min(FONT_METRICS.get_glyph(pre_c).right_bearing, FONT_METRICS.get_glyph(c).left_bearing)
-                if bearing > 0:
-                    elem.width -= bearing * font_size
             css_class = "bold" if bold else None
             if c.isalpha() and italic:
                 css_class = "bold italic" if bold else "italic"
-            child = HtmlElement(x=elem.width, y=0, text=c, font_size=font_size, css_class=css_class)
-            elem.width += FONT_METRICS.get_glyph(c).width * font_size
+            child = HtmlElement(x=offsets[i] * font_size, y=0, text=c, font_size=font_size, css_class=css_class)
             elem.children.append(child)
         return elem
 
-    def render_block(self, children: List[MathTexAST], font_size) -> HtmlElement:
+    def render_block(self, children: Sequence[MathTexAST], font_size) -> Layout:
         elem = HtmlElement()
         for i in range(0, len(children)):
-            child = self.render(children[i], font_size)
+            child = yield children[i], font_size
             elem.children.append(child)
         self.align_children(elem, font_size)
         return elem
 
-    def render_env(self, lines: List[MathTexAST], font_size) -> HtmlElement:
+    def render_env(self, lines: Sequence[MathTexAST], font_size) -> Layout:
         elem = HtmlElement()
-        children = Array2D()  # type: Array2D[HtmlElement]
-        for i in range(0, len(lines)):
-            line = lines[i]
-            for j in range(0, len(line.children)):
-                child = self.render(line.children[j], font_size)
-                children.set(i, j, child)
-        self.align_children_grid(elem, children, font_size)
+        rows = []
+        for line in lines:
+            row = []
+            for cell in line.children:
+                child = yield cell, font_size
+                row.append(child)
+            rows.append(row)
+        self.align_children_grid(elem, rows, font_size)
         return elem
 
-    def render_command(self, cmd, children: List[MathTexAST], font_size) -> HtmlElement:
-        if cmd == MathTexAST.CMD_LEFT_RIGHT:
-            return self.render_cmd_left_right(children, font_size)
-        if cmd == MathTexAST.CMD_SUB_SUP:
-            return self.render_cmd_sub_sup(children, font_size)
-        if cmd == "frac":
-            return self.render_cmd_fraction(children, font_size)
-        if cmd == "sqrt":
-            return self.render_cmd_square_root(children, font_size)
+    def render_command(self, cmd, children: Sequence[MathTexAST], font_size) -> Union[HtmlElement, Layout]:
+        handler = self.command_renderers.get(cmd)
+        if handler is not None:
+            return handler(self, children, font_size)
+        method = self.command_methods.get(cmd)
+        if method is not None:
+            return method(children, font_size)
         return self.render_text(cmd, font_size, italic=False)
 
-    def render_cmd_left_right(self, children: List[MathTexAST], font_size) -> HtmlElement:
-        middle_item = self.render(children[2], font_size)
-        brace_size = middle_item.height / FONT_METRICS.height
+    def render_cmd_left_right(self, children: Sequence[MathTexAST], font_size) -> Layout:
+        middle_item = yield children[2], font_size
+        brace_size = middle_item.height / self.font_metrics.height
         left = children[0].get_first_string()
         right = children[1].get_first_string()
+        create_brace = HtmlElement.create_brace_shape if self.svg_shapes else HtmlElement.create_brace
         elem = HtmlElement()
         if len(left) == 1 and left in "([{":
             if brace_size <= 1:
                 elem.children.append(self.render_text(left, brace_size, font_size))
             else:
-                elem.children.append(HtmlElement.create_brace(
-                    left, middle_item.height, middle_item.baseline, font_size))
+                elem.children.append(create_brace(left, middle_item.height, middle_item.baseline, font_size))
         elem.children.append(middle_item)
         if len(right) == 1 and right in ")]}":
             if brace_size <= 1:
                 elem.children.append(self.render_text(right, brace_size, font_size))
             else:
-                elem.children.append(HtmlElement.create_brace(
-                    right, middle_item.height, middle_item.baseline, font_size))
+                elem.children.append(create_brace(right, middle_item.height, middle_item.baseline, font_size))
         self.align_children(elem, font_size)
         return elem
 
-    def render_cmd_sub_sup(self, children: List[MathTexAST], font_size) -> HtmlElement:
+    def render_cmd_sub_sup(self, children: Sequence[MathTexAST], font_size) -> Layout:
         elem = HtmlElement()
-        main_item = self.render(children[0], font_size)
+        main_item = yield children[0], font_size
         elem.children.append(main_item)
         elem.width = main_item.width
         elem.height = main_item.height
         elem.baseline = main_item.baseline
         sub_size = (font_size + 3) / 5
         if children[1] is not None:
-            sub_item = self.render(children[1], sub_size)
+            sub_item = yield children[1], sub_size
             sub_item.x = main_item.width + sub_size * self.char_margin
             elem.children.append(sub_item)
             elem.width = sub_item.x + sub_item.width
@@ -185,7 +264,7 @@ class HtmlRender:
                 elem.baseline += main_item.y
                 elem.height += main_item.y
         if children[2] is not None:
-            sup_item = self.render(children[2], sub_size)
+            sup_item = yield children[2], sub_size
             sup_item.x = main_item.width + sub_size * self.char_margin
             elem.children.append(sup_item)
             elem.width = max(elem.width, sup_item.x + sup_item.width)
@@ -197,30 +276,38 @@ class HtmlRender:
                 elem.height += delta
         return elem
 
-    def render_cmd_fraction(self, children: List[MathTexAST], font_size) -> HtmlElement:
+    def render_cmd_fraction(self, children: Sequence[MathTexAST], font_size) -> Layout:
         elem = HtmlElement()
-        up_item = self.render(children[0], font_size)
-        down_item = self.render(children[1], font_size)
+        up_item = yield children[0], font_size
+        down_item = yield children[1], font_size
         elem.width = max(up_item.width, down_item.width) + font_size / 2
         elem.height = up_item.height + down_item.height + self.line_margin * font_size
-        elem.update_baseline(font_size, pseudo_height=up_item.height * 2 + self.line_margin * font_size)
+        elem.update_baseline(font_size, pseudo_height=up_item.height * 2 + self.line_margin * font_size,
+                             font_metrics=self.font_metrics)
         up_item.x = (elem.width - up_item.width) / 2
         down_item.x = (elem.width - down_item.width) / 2
         down_item.y = elem.height - down_item.height
-        line = HtmlElement.create_horizontal_line(
-            font_size / 8,
-            up_item.height + self.line_margin * font_size / 2,
-            elem.width - font_size / 4)
-        elem.children = [up_item, down_item, line]
+        elem.children = [up_item, down_item]
+        if not self.measure_only:
+            elem.children.append(HtmlElement.create_horizontal_line(
+                font_size / 8,
+                up_item.height + self.line_margin * font_size / 2,
+                elem.width - font_size / 4))
         return elem
 
-    def render_cmd_square_root(self, children: List[MathTexAST], font_size) -> HtmlElement:
+    def render_cmd_square_root(self, children: Sequence[MathTexAST], font_size) -> Layout:
         elem = HtmlElement()
-        inner_item = self.render(children[0], font_size)
+        inner_item = yield children[0], font_size
         inner_item.x = 0.4 * font_size
         inner_item.y = 0.1 * font_size
         elem.width = inner_item.x + inner_item.width + 0.2 * font_size
         elem.height = inner_item.y + inner_item.height
         elem.baseline = inner_item.y + inner_item.baseline
-        elem.children = [inner_item] + HtmlElement.create_square_root_group(elem.width, elem.height, font_size)
+        elem.children = [inner_item]
+        if not self.measure_only:
+            if self.svg_shapes:
+                create_group = HtmlElement.create_square_root_shape
+            else:
+                create_group = HtmlElement.create_square_root_group
+            elem.children += create_group(elem.width, elem.height, font_size)
         return elem
@@ -1,7 +1,6 @@
-import markdown
-from mathtex.mdextension import MathTexExtension
+from mathtex.fontmetric import DEFAULT_FONT
 
-HTML_HEADER = '''<!DOCTYPE html>
+HTML_STYLE = '''<!DOCTYPE html>
 <html>
 <head>
 <meta http-equiv="content-type" content="application/xhtml+xml; charset=UTF-8">
@@ -16,7 +15,7 @@ HTML_HEADER = '''<!DOCTYPE html>
     position: absolute;
     padding: 0;
     margin: 0;
-    font-family: "Lucida Sans Unicode";
+    white-space: nowrap;
 }
 .math .italic {
     font-style: italic;
@@ -81,25 +80,66 @@ HTML_HEADER = '''<!DOCTYPE html>
     border-top: 0.14ex solid;
     border-top-right-radius: 100%;
 }
-</style>
+.math svg.shape {
+    position: absolute;
+    overflow: visible;
+}
+.math svg.shape path {
+    fill: none;
+    stroke: currentColor;
+    stroke-width: 7px;
+}
+'''
+
+# The formulas are laid out with the metrics of this font, see fontmetric.FONT_REGISTRY.
+FONT_STYLE = '''.math div {{
+    font-family: "{0}";
+}}
+'''
+
+HTML_HEAD_END = '''</style>
 </head>
 <body>
 '''
 
+HTML_HEADER = HTML_STYLE + FONT_STYLE.format(DEFAULT_FONT) + HTML_HEAD_END
+
 HTML_FOOTER = "</body></html>"
 
 
-def parse_markdown(text: str) -> str:
-    return HTML_HEADER + markdown.markdown(text, extensions=[MathTexExtension()]) + HTML_FOOTER
+def get_font_style(font_metrics=None) -> str:
+    if font_metrics is None:
+        return FONT_STYLE.format(DEFAULT_FONT)
+    if font_metrics.family is None:
+        raise ValueError("font metrics '{0}' have no font family, register them with FONT_REGISTRY".format(
+            font_metrics.path))
+    return FONT_STYLE.format(font_metrics.family)
+
+
+def parse_markdown(text: str, precision=None, svg_shapes=False, font_metrics=None) -> str:
+    # With a precision, coordinates are rounded to that many decimals and repeated
+    # declarations are moved to CSS classes generated into the page header.
+    # The page is styled with the font family of font_metrics, which defaults to DEFAULT_FONT.
+    # The markdown package and the renderer are only imported here, importing them is slow.
+    import markdown
+    from mathtex.displaylist import StyleSheet
+    from mathtex.mdextension import MathTexExtension
+    header = HTML_STYLE + get_font_style(font_metrics)
+    if precision is None:
+        body = markdown.markdown(text, extensions=[MathTexExtension(svg_shapes=svg_shapes, font_metrics=font_metrics)])
+        return header + HTML_HEAD_END + body + HTML_FOOTER
+    style_sheet = StyleSheet(precision)
+    body = markdown.markdown(text, extensions=[MathTexExtension(style_sheet, svg_shapes, font_metrics)])
+    return header + style_sheet.to_css() + HTML_HEAD_END + body + HTML_FOOTER
 
 
-def parse_markdown_file(filename: str) -> str:
+def parse_markdown_file(filename: str, precision=None, svg_shapes=False, font_metrics=None) -> str:
     with open(filename, "r", encoding="utf8") as file:
         text = file.read()
-    return parse_markdown(text)
+    return parse_markdown(text, precision, svg_shapes, font_metrics)
 
 
-def save_markdown_as_html(file_in: str, file_out: str):
-    html = parse_markdown_file(file_in)
+def save_markdown_as_html(file_in: str, file_out: str, precision=None, svg_shapes=False, font_metrics=None):
+    html = parse_markdown_file(file_in, precision, svg_shapes, font_metrics)
     with open(file_out, "w", encoding="utf8") as file:
         file.write(html)
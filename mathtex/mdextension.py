@@ -1,64 +1,98 @@
+import copy
+from xml.etree import ElementTree as etree
 from markdown.extensions import Extension
-from markdown.inlinepatterns import Pattern
-from markdown.util import etree
+from markdown.inlinepatterns import InlineProcessor
 from markdown.util import AtomicString
-from mathtex.parser import MathTexParser
+from mathtex.parser import parse_formula
 from mathtex.htmlrender import HtmlRender
-from mathtex.htmlelement import HtmlElement
-from typing import List
+from mathtex.displaylist import DisplayItem
+from mathtex.displaylist import DisplayList
+from mathtex.displaylist import StyleSheet
+from mathtex.fontmetric import FontMetrics
+from mathtex.shapes import get_shape_element
+from mathtex.util import LRUCache
+from typing import Optional
 
 MATH_TEX_INLINE_REG_PATTERN = r"\$([^$]+)\$"
+# Above the priority of inline code (190), formulas are found before any other inline pattern.
+MATH_TEX_INLINE_PRIORITY = 200
 
 
-class MathTexInlinePattern(Pattern):
-    def __init__(self):
+class MathTexRenderContext:
+    # Lives as long as its Markdown instance: one renderer for all formulas, and the finished element
+    # of every formula source, so a formula repeated in a document is rendered once and then copied.
+    def __init__(self, style_sheet: Optional[StyleSheet] = None, svg_shapes=False,
+                 font_metrics: Optional[FontMetrics] = None, max_elements=1024):
+        self.style_sheet = style_sheet
+        self.render = HtmlRender(font_metrics)
+        self.render.svg_shapes = svg_shapes
+        self.elements = LRUCache(max_elements)  # type: LRUCache[etree.Element]
+
+    def get_element(self, source: str) -> etree.Element:
+        # Markdown changes the elements it is given, e.g. when indenting the output, so a copy is returned.
+        elem = self.elements.get(source)
+        if elem is None:
+            display_list = self.render.render_display_list(parse_formula(source), 1)
+            elem = MathTexInlinePattern.get_element(display_list, self.style_sheet)
+            self.elements.put(source, elem)
+        return copy.deepcopy(elem)
+
+    def reset(self):
+        self.elements.clear()
+
+
+class MathTexInlinePattern(InlineProcessor):
+    # Matches are searched from a position in the text instead of matching the whole remaining text,
+    # so the text of a paragraph is not copied and rescanned by a wrapping regex for every formula.
+    def __init__(self, context: Optional[MathTexRenderContext] = None):
         super(MathTexInlinePattern, self).__init__(MATH_TEX_INLINE_REG_PATTERN)
+        self.context = MathTexRenderContext() if context is None else context
 
     @staticmethod
-    def get_elements(node: HtmlElement, offset_x=0, offset_y=0) -> List[etree.Element]:
-        if len(node.children) > 0:
-            elements = []
-            for child in node.children:
-                elements += MathTexInlinePattern.get_elements(child, node.x + offset_x, node.y + offset_y)
-            return elements
-        if node.text is None and node.css_class is None:
-            return []
-        elem = etree.Element(node.name)
-        if node.text is not None:
-            elem.text = AtomicString(node.text)
-        if node.css_class is not None:
-            elem.attrib["class"] = node.css_class
-        html_pos = "left:{0}em;top:{1}em;".format(
-            (node.x + offset_x) / node.font_size,
-            (node.y + offset_y) / node.font_size)
-        html_width = "" if node.width is None else "width:{0}em;".format(node.width)
-        html_height = "" if node.height is None else "height:{0}em;".format(node.height)
-        html_font_size = "" if node.font_size == 1 else "font-size:{0}em;".format(node.font_size)
-        elem.attrib["style"] = html_pos + html_width + html_height + html_font_size
-        return [elem]
+    def get_item_element(item: DisplayItem, style_sheet: Optional[StyleSheet] = None) -> etree.Element:
+        if item.shape is not None:
+            elem = copy.deepcopy(get_shape_element(item.shape, item.width, item.height))
+        else:
+            elem = etree.Element("div")
+        if item.text is not None:
+            elem.text = AtomicString(item.text)
+        css_class, style = item.get_class_and_style(style_sheet)
+        if css_class is not None:
+            elem.attrib["class"] = css_class
+        if style != "" or style_sheet is None:
+            elem.attrib["style"] = style
+        return elem
 
     @staticmethod
-    def get_element(node: HtmlElement) -> etree.Element:
+    def get_element(display_list: DisplayList, style_sheet: Optional[StyleSheet] = None) -> etree.Element:
+        precision = None if style_sheet is None else style_sheet.precision
         elem = etree.Element("div")
         elem.attrib["class"] = "math"
-        elem.attrib["style"] = 'width:{0}em;height:{1}em;vertical-align:{2}em;'.format(
-            node.width,
-            node.height,
-            node.baseline - node.height)
-        children = MathTexInlinePattern.get_elements(node)
-        elem.extend(children)
+        elem.attrib["style"] = display_list.get_style(precision)
+        elem.extend([MathTexInlinePattern.get_item_element(item, style_sheet) for item in display_list.items])
         return elem
 
-    def handleMatch(self, m):
-        parser = MathTexParser()
-        parser.begin_parse()
-        parser.parse_line(m.group(2))
-        result = parser.end_parse()
-        render = HtmlRender()
-        html = render.render(result, 1)
-        return MathTexInlinePattern.get_element(html)
+    def handleMatch(self, m, data):
+        return self.context.get_element(m.group(1)), m.start(0), m.end(0)
 
 
 class MathTexExtension(Extension):
-    def extendMarkdown(self, md, md_globals):
-        md.inlinePatterns.add('MathTex', MathTexInlinePattern(), '_begin')
+    def __init__(self, style_sheet: Optional[StyleSheet] = None, svg_shapes=False,
+                 font_metrics: Optional[FontMetrics] = None, **kwargs):
+        # With a style sheet the formulas are emitted in compact form, see StyleSheet.
+        # font_metrics are those of the font the page is styled with, see fontmetric.FONT_REGISTRY.
+        super(MathTexExtension, self).__init__(**kwargs)
+        self.style_sheet = style_sheet
+        self.svg_shapes = svg_shapes
+        self.font_metrics = font_metrics
+        self.context = None  # type: Optional[MathTexRenderContext]
+
+    def extendMarkdown(self, md):
+        self.context = MathTexRenderContext(self.style_sheet, self.svg_shapes, self.font_metrics)
+        md.registerExtension(self)
+        md.inlinePatterns.register(MathTexInlinePattern(self.context), 'mathtex', MATH_TEX_INLINE_PRIORITY)
+
+    def reset(self):
+        # Called by Markdown.reset() between documents.
+        if self.context is not None:
+            self.context.reset()
@@ -1,20 +1,19 @@
-import re
 from mathtex.astree import MathTexAST
-from mathtex.util import last_index
+from typing import List
 from mathtex.texcharset import TEX_CHARSET
-
-
-RE_CMD = re.compile(r"\\([A-Za-z]+|.)", re.DOTALL)
-RE_BEGIN_ENV = re.compile(r"\\begin\{([A-Za-z]+)\}")
-RE_END_ENV = re.compile(r"\\end\{([A-Za-z]+)\}")
-RE_WHITESPACE = re.compile(r"\s+")
-RE_COMMENT = re.compile(r"%.*")
+from mathtex.util import LRUCache
+from mathtex import tokenizer
 
 BEGIN_CELL = 1
 BEGIN_LINE = 2
 BEGIN_BLOCK = 3
 BEGIN_ENV = 4
 
+BLOCK_MARKERS = (BEGIN_BLOCK,)
+CELL_MARKERS = (BEGIN_CELL, BEGIN_LINE, BEGIN_ENV)
+LINE_MARKERS = (BEGIN_LINE, BEGIN_ENV)
+ENV_MARKERS = (BEGIN_ENV,)
+
 TEX_CMD_ARG_NUMBER = {
     "frac": 2,
     "sqrt": 1,
@@ -27,53 +26,112 @@ TEX_CMD_ARG_NUMBER = {
 class MathTexParser:
     def __init__(self):
         self.stack = []
+        self.markers = []  # stack indices of the open BEGIN_* markers, innermost last
+        self.streaming = False
+        self.pending = ""  # unconsumed tail of the fed chunks
+        self.completed = []  # type: List[MathTexAST]
+        self.token_handlers = {
+            tokenizer.TOKEN_BEGIN_ENV: self.begin_env,
+            tokenizer.TOKEN_END_ENV: lambda _: self.end_env(),
+            tokenizer.TOKEN_NEW_LINE: lambda _: self.end_line(True),
+            tokenizer.TOKEN_COMMAND: self.do_command,
+            tokenizer.TOKEN_OPEN_BRACE: lambda _: self.begin_block(),
+            tokenizer.TOKEN_CLOSE_BRACE: lambda _: self.end_block(),
+            tokenizer.TOKEN_SCRIPT: lambda c: self.push_command(c, 1),
+            tokenizer.TOKEN_NEW_CELL: lambda _: self.end_cell(True),
+            tokenizer.TOKEN_TEXT: self.do_text,
+        }
 
     def parse_line(self, line):
-        m = None  # type: re.__Match
-        line_len = len(line)
-        start_pos = 0
-        while start_pos < line_len:
-            if m is not None:
-                start_pos = m.end()
-            if start_pos >= line_len:
-                break
-            m = RE_WHITESPACE.match(line, start_pos)
-            if m is not None:
-                continue
-            m = RE_COMMENT.match(line, start_pos)
-            if m is not None:
-                continue
-            m = RE_BEGIN_ENV.match(line, start_pos)
-            if m is not None:
-                self.begin_env(m.group(1))
-                continue
-            m = RE_END_ENV.match(line, start_pos)
-            if m is not None:
-                self.end_env()
-                continue
-            m = RE_CMD.match(line, start_pos)
-            if m is not None:
-                self.do_command(m.group(1))
-                continue
-            self.do_char(line[start_pos])
-            start_pos += 1
+        handlers = self.token_handlers
+        for kind, value in tokenizer.tokenize(line):
+            handlers[kind](value)
+
+    def feed(self, chunk) -> List[MathTexAST]:
+        # Parses the next chunk of a stream and returns the top-level lines and environments
+        # closed by it. Closed nodes are handed out instead of kept, so the parser only holds
+        # the currently open groups. The first chunk after end_feed() starts a new stream.
+        if not self.streaming:
+            self.begin_feed()
+        tokens, self.pending = tokenizer.tokenize_chunk(self.pending + chunk, False)
+        return self.handle_stream_tokens(tokens)
+
+    def end_feed(self) -> List[MathTexAST]:
+        # Flushes the rest of the stream, environments still open are closed like by their \end.
+        if not self.streaming:
+            self.begin_feed()
+        tokens, self.pending = tokenizer.tokenize_chunk(self.pending, True)
+        self.handle_stream_tokens(tokens)
+        while self.last_marker(ENV_MARKERS) > 1:
+            self.end_env()
+        self.end_line(False)
+        self.streaming = False
+        return self.take_completed()
+
+    def begin_feed(self):
+        self.begin_parse()
+        self.streaming = True
+
+    def handle_stream_tokens(self, tokens) -> List[MathTexAST]:
+        handlers = self.token_handlers
+        for kind, value in tokens:
+            handlers[kind](value)
+        return self.take_completed()
+
+    def take_completed(self) -> List[MathTexAST]:
+        completed = self.completed
+        self.completed = []
+        return completed
+
+    def at_root_line_start(self) -> bool:
+        markers = self.markers
+        if len(markers) == 1:
+            return len(self.stack) == 2
+        return len(markers) == 2 and self.stack[markers[1]] == BEGIN_LINE and len(self.stack) == markers[1] + 1
+
+    def push_marker(self, marker):
+        self.markers.append(len(self.stack))
+        self.stack.append(marker)
+
+    def last_marker(self, markers) -> int:
+        stack = self.stack
+        for i in reversed(self.markers):
+            if stack[i] in markers:
+                return i
+        return -1
+
+    def truncate(self, size):
+        del self.stack[size:]
+        markers = self.markers
+        while len(markers) > 0 and markers[-1] >= size:
+            markers.pop()
 
     def begin_env(self, env_name):
         self.stack.append(env_name)
-        self.stack.append(BEGIN_ENV)
+        self.push_marker(BEGIN_ENV)
 
     def end_env(self):
+        if self.streaming and self.last_marker(ENV_MARKERS) == 1:
+            return  # a stray \end must not close the root of a stream
         self.end_line(False)
-        begin_index = last_index(self.stack, lambda x: x == BEGIN_ENV)
+        begin_index = self.last_marker(ENV_MARKERS)
         if begin_index >= 1:
             env_name = self.stack[begin_index - 1]
             children = self.process_sequence(self.stack[begin_index + 1:])
             env_node = MathTexAST.env_node(env_name, children)
-            self.stack = self.stack[0:begin_index - 1]
-            self.stack.append(env_node)
+            self.truncate(begin_index - 1)
+            if self.streaming and self.at_root_line_start():
+                self.completed.append(env_node)
+            else:
+                self.stack.append(env_node)
 
     def begin_parse(self):
-        self.stack = [MathTexAST.ROOT_ENV, BEGIN_ENV]
+        self.stack = [MathTexAST.ROOT_ENV]
+        self.markers = []
+        self.streaming = False
+        self.pending = ""
+        self.completed = []
+        self.push_marker(BEGIN_ENV)
 
     def end_parse(self):
         self.end_env()
@@ -81,26 +139,30 @@ class MathTexParser:
 
     def end_line(self, new_line):
         self.end_cell(False)
-        begin_index = last_index(self.stack, lambda x: (x == BEGIN_LINE or x == BEGIN_ENV))
+        begin_index = self.last_marker(LINE_MARKERS)
         children = self.process_sequence(self.stack[begin_index + 1:])
         line_node = MathTexAST.line_node(children)
         if begin_index >= 0 and self.stack[begin_index] == BEGIN_LINE:
             begin_index -= 1
-        self.stack = self.stack[0:begin_index + 1]
-        self.stack.append(line_node)
+        self.truncate(begin_index + 1)
+        if self.streaming and self.last_marker(ENV_MARKERS) == 1:
+            if len(children) > 1 or len(children[0].children) > 0:
+                self.completed.append(line_node)
+        else:
+            self.stack.append(line_node)
         if new_line:
-            self.stack.append(BEGIN_LINE)
+            self.push_marker(BEGIN_LINE)
 
     def end_cell(self, new_cell):
-        begin_index = last_index(self.stack, lambda x: (x == BEGIN_CELL or x == BEGIN_ENV or x == BEGIN_LINE))
+        begin_index = self.last_marker(CELL_MARKERS)
         children = self.process_sequence(self.stack[begin_index + 1:])
         cell_node = MathTexAST.cell_node(children)
         if begin_index >= 0 and self.stack[begin_index] == BEGIN_CELL:
             begin_index -= 1
-        self.stack = self.stack[0:begin_index + 1]
+        self.truncate(begin_index + 1)
         self.stack.append(cell_node)
         if new_cell:
-            self.stack.append(BEGIN_CELL)
+            self.push_marker(BEGIN_CELL)
 
     def do_command(self, cmd):
         if cmd == "\\":
@@ -117,41 +179,73 @@ class MathTexParser:
     def push_command(self, cmd, arg_number):
         self.stack.append(MathTexAST.command_node(cmd, arg_number))
 
-    def do_char(self, c):
-        if c == "{":
-            self.stack.append(BEGIN_BLOCK)
-        elif c == "}":
-            begin_index = last_index(self.stack, lambda x: x == BEGIN_BLOCK)
-            if begin_index >= 0:
-                children = self.process_sequence(self.stack[begin_index + 1:])
-                block_node = MathTexAST.block_node(children)
-                self.stack = self.stack[0:begin_index]
-                self.stack.append(block_node)
-        elif c == "_" or c == "^":
-            self.push_command(c, 1)
-        elif c == "&":
-            self.end_cell(True)
-        else:
-            self.stack.append(MathTexAST.text_node(c))
+    def begin_block(self):
+        self.push_marker(BEGIN_BLOCK)
+
+    def end_block(self):
+        begin_index = self.last_marker(BLOCK_MARKERS)
+        if begin_index >= 0:
+            children = self.process_sequence(self.stack[begin_index + 1:])
+            block_node = MathTexAST.block_node(children)
+            self.truncate(begin_index)
+            self.stack.append(block_node)
+
+    def do_text(self, text):
+        self.stack.append(MathTexAST.text_node(text))
+
+    @staticmethod
+    def take_arguments(nodes, start, arg_number):
+        # A text run only feeds its first character to a command, e.g. "\frac12" or "x_12".
+        args = []
+        i = start
+        while len(args) < arg_number and i < len(nodes):
+            node = nodes[i]
+            if isinstance(node, MathTexAST) and node.node_type == MathTexAST.TEXT_NODE and len(node.text) > 1:
+                args.append(MathTexAST.text_node(node.text[0]))
+                nodes[i] = MathTexAST.text_node(node.text[1:])
+            else:
+                args.append(node)
+                i += 1
+        return args, i
 
     @staticmethod
     def process_sequence(nodes):
         result = []
+        text_run = None  # pieces of consecutive text nodes, joined into result[-1]
         i = 0
         while i < len(nodes):
             node = nodes[i]
-            if isinstance(node, MathTexAST):
-                if len(result) > 0:
-                    last_node = result[-1]  # type: MathTexAST
-                    if last_node.node_type == MathTexAST.TEXT_NODE and node.node_type == MathTexAST.TEXT_NODE:
-                        last_node.text += node.text
-                        i += 1
-                        continue
-                if node.node_type == MathTexAST.CMD_NODE:
-                    node.children = nodes[i + 1:i + 1 + node.arg_number]
-                    i += node.arg_number
+            i += 1
+            if not isinstance(node, MathTexAST):
+                continue
+            if node.node_type == MathTexAST.TEXT_NODE:
+                if text_run is None:
+                    text_run = [node.text]
                     result.append(node)
                 else:
-                    result.append(node)
-            i += 1
+                    text_run.append(node.text)
+                continue
+            if text_run is not None and len(text_run) > 1:
+                result[-1].text = "".join(text_run)
+            text_run = None
+            if node.node_type == MathTexAST.CMD_NODE:
+                node.children, i = MathTexParser.take_arguments(nodes, i, node.arg_number)
+            result.append(node)
+        if text_run is not None and len(text_run) > 1:
+            result[-1].text = "".join(text_run)
         return result
+
+
+PARSE_CACHE = LRUCache(1024)  # type: LRUCache[MathTexAST]
+
+
+def parse_formula(source: str) -> MathTexAST:
+    # Returns the shared render IR of the formula, its children are frozen by MathTexAST.lower.
+    node = PARSE_CACHE.get(source)
+    if node is None:
+        parser = MathTexParser()
+        parser.begin_parse()
+        parser.parse_line(source)
+        node = parser.end_parse().lower()
+        PARSE_CACHE.put(source, node)
+    return node
@@ -0,0 +1,80 @@
+from mathtex.util import LRUCache
+from typing import Tuple
+
+SHAPE_UNITS = 100  # path coordinates per em, shape sizes are quantized to whole units
+STROKE_WIDTH = 7  # also set by the ".math svg.shape path" rule of markdown.HTML_STYLE
+
+# (element, markup) of the inline SVG, without position and class, keyed by (shape, width, height)
+# in units. The cached elements are shared, insert a copy into trees that may be modified.
+SHAPE_CACHE = LRUCache(1024)  # type: LRUCache[Tuple["ElementTree.Element", str]]
+
+
+def format_path(path: str, *values) -> str:
+    return path.format(*("{0:g}".format(round(value, 1)) for value in values))
+
+
+def bracket_path(w, h, s):
+    return format_path("M{0} {1}H{1}V{2}H{0}", w - s, s, h - s)
+
+
+def rounded_bracket_path(w, h, s):
+    # The control points are placed so that the middle of the curve touches the left side.
+    c = (5 * s - w) / 3
+    return format_path("M{0} {1}C{2} {3} {2} {4} {0} {5}", w - s, s, c, h / 4, h * 3 / 4, h - s)
+
+
+def brace_path(w, h, s):
+    m = w / 2
+    r = min(m - s, h / 4)
+    return format_path("M{0} {1}Q{2} {1} {2} {3}V{4}Q{2} {5} {1} {5}Q{2} {5} {2} {6}V{7}Q{2} {8} {0} {8}",
+                       w - s, s, m, s + r, h / 2 - r, h / 2, h / 2 + r, h - s - r, h - s)
+
+
+def radical_path(w, h, f):
+    # The sign and the overline of a root box for a font size of f units, the sign fills the
+    # left 0.3em and the overline runs from there to 0.2em before the right side.
+    u = f / 10
+    return format_path("M0 {0}L{1} {2}L{3} {4}L{5} {1}H{6}",
+                       h * 0.6 + u * 1.5, u, h * 0.6 + u, u * 2, h - u * 2, u * 3, w - u * 2)
+
+
+SHAPE_PATHS = {
+    "bracket": bracket_path,
+    "bracket-rounded": rounded_bracket_path,
+    "brace": brace_path,
+}
+RADICAL_SHAPE = "sqrt-"  # followed by the font size in units, e.g. "sqrt-70"
+
+
+def get_shape_size(width, height) -> Tuple[int, int]:
+    return int(round(width * SHAPE_UNITS)), int(round(height * SHAPE_UNITS))
+
+
+def create_shape(shape: str, width, height) -> Tuple["ElementTree.Element", str]:
+    w, h = get_shape_size(width, height)
+    key = (shape, w, h)
+    result = SHAPE_CACHE.get(key)
+    if result is not None:
+        return result
+    from xml.etree import ElementTree
+    # The size is set by the style of the positioned element, and the stroke by the page style.
+    # "right-" shapes are the mirror images of the "left-" ones.
+    if shape.startswith(RADICAL_SHAPE):
+        d = radical_path(w, h, int(shape[len(RADICAL_SHAPE):]))
+    else:
+        d = SHAPE_PATHS[shape.split("-", 1)[1]](w, h, STROKE_WIDTH / 2)
+    svg = ElementTree.Element("svg", {"viewBox": "0 0 {0} {1}".format(w, h)})
+    path = ElementTree.SubElement(svg, "path", {"d": d})
+    if shape.startswith("right-"):
+        path.attrib["transform"] = "matrix(-1 0 0 1 {0} 0)".format(w)
+    result = svg, ElementTree.tostring(svg, encoding="unicode", method="html")
+    SHAPE_CACHE.put(key, result)
+    return result
+
+
+def get_shape_element(shape: str, width, height) -> "ElementTree.Element":
+    return create_shape(shape, width, height)[0]
+
+
+def get_shape_markup(shape: str, width, height) -> str:
+    return create_shape(shape, width, height)[1]
@@ -1,4 +1,6 @@
+from typing import Callable
 from typing import Dict
+from typing import Optional
 
 
 class TexChar:
@@ -9,184 +11,196 @@ class TexChar:
 
 
 class TexCharSet:
-    def __init__(self):
-        self.charset = {}  # type: Dict[str, TexChar]
+    def __init__(self, loader: Optional[Callable[["TexCharSet"], None]] = None):
+        # The loader adds the characters to a new set the first time a character is looked up.
+        self.loader = loader
+        self.charset = {} if loader is None else None  # type: Optional[Dict[str, TexChar]]
 
     def add(self, cmd, char, unicode):
-        self.charset[cmd] = TexChar(cmd, char, unicode)
+        self.get_charset()[cmd] = TexChar(cmd, char, unicode)
+
+    def get_charset(self) -> Dict[str, TexChar]:
+        if self.charset is None:
+            loaded = TexCharSet()
+            self.loader(loaded)
+            self.charset = loaded.charset
+        return self.charset
 
     def get_char(self, cmd):
-        if cmd in self.charset:
-            return self.charset[cmd].char
+        charset = self.get_charset()
+        if cmd in charset:
+            return charset[cmd].char
         return None
 
 
-TEX_CHARSET = TexCharSet()
-
-# Escape character
-TEX_CHARSET.add('{', '{', 123)
-TEX_CHARSET.add('}', '}', 125)
-
-# Greek small letter
-TEX_CHARSET.add('alpha', 'α', 945)
-TEX_CHARSET.add('beta', 'β', 946)
-TEX_CHARSET.add('gamma', 'γ', 947)
-TEX_CHARSET.add('delta', 'δ', 948)
-TEX_CHARSET.add('epsilon', 'ε', 949)
-TEX_CHARSET.add('zeta', 'ζ', 950)
-TEX_CHARSET.add('eta', 'η', 951)
-TEX_CHARSET.add('theta', 'θ', 952)
-TEX_CHARSET.add('iota', 'ι', 953)
-TEX_CHARSET.add('kappa', 'κ', 954)
-TEX_CHARSET.add('lamda', 'λ', 955)
-TEX_CHARSET.add('mu', 'μ', 956)
-TEX_CHARSET.add('nu', 'ν', 957)
-TEX_CHARSET.add('xi', 'ξ', 958)
-TEX_CHARSET.add('omicron', 'ο', 959)
-TEX_CHARSET.add('pi', 'π', 960)
-TEX_CHARSET.add('rho', 'ρ', 961)
-TEX_CHARSET.add('sigma', 'σ', 963)
-TEX_CHARSET.add('tau', 'τ', 964)
-TEX_CHARSET.add('upsilon', 'υ', 965)
-TEX_CHARSET.add('phi', 'φ', 966)
-TEX_CHARSET.add('chi', 'χ', 967)
-TEX_CHARSET.add('psi', 'ψ', 968)
-TEX_CHARSET.add('omega', 'ω', 969)
-
-# Greek capital letter
-TEX_CHARSET.add('Alpha', 'Α', 913)
-TEX_CHARSET.add('Beta', 'Β', 914)
-TEX_CHARSET.add('Gamma', 'Γ', 915)
-TEX_CHARSET.add('Delta', 'Δ', 916)
-TEX_CHARSET.add('Epsilon', 'Ε', 917)
-TEX_CHARSET.add('Zeta', 'Ζ', 918)
-TEX_CHARSET.add('Eta', 'Η', 919)
-TEX_CHARSET.add('Theta', 'Θ', 920)
-TEX_CHARSET.add('Iota', 'Ι', 921)
-TEX_CHARSET.add('Kappa', 'Κ', 922)
-TEX_CHARSET.add('Lamda', 'Λ', 923)
-TEX_CHARSET.add('Mu', 'Μ', 924)
-TEX_CHARSET.add('Nu', 'Ν', 925)
-TEX_CHARSET.add('Xi', 'Ξ', 926)
-TEX_CHARSET.add('Omicron', 'Ο', 927)
-TEX_CHARSET.add('Pi', 'Π', 928)
-TEX_CHARSET.add('Rho', 'Ρ', 929)
-TEX_CHARSET.add('Sigma', 'Σ', 931)
-TEX_CHARSET.add('Tau', 'Τ', 932)
-TEX_CHARSET.add('Upsilon', 'Υ', 933)
-TEX_CHARSET.add('Phi', 'Φ', 934)
-TEX_CHARSET.add('Chi', 'Χ', 935)
-TEX_CHARSET.add('Psi', 'Ψ', 936)
-TEX_CHARSET.add('Omega', 'Ω', 937)
-
-# Greek letter variant
-TEX_CHARSET.add('varsigma', 'ς', 962)
-TEX_CHARSET.add('varbeta', 'ϐ', 976)
-TEX_CHARSET.add('vartheta', 'ϑ', 977)
-TEX_CHARSET.add('varphi', 'ϕ', 981)
-TEX_CHARSET.add('varpi', 'ϖ', 982)
-TEX_CHARSET.add('stigma', 'Ϛ', 986)
-TEX_CHARSET.add('digamma', 'Ϝ', 988)
-TEX_CHARSET.add('koppa', 'Ϟ', 990)
-TEX_CHARSET.add('sampi', 'Ϡ', 992)
-TEX_CHARSET.add('varkappa', 'ϰ', 1008)
-TEX_CHARSET.add('varrho', 'ϱ', 1009)
-TEX_CHARSET.add('lunatesigma', 'ϲ', 1010)
-
-# Symbols
-TEX_CHARSET.add('dagger', '†', 8224)
-TEX_CHARSET.add('ddagger', '‡', 8225)
-TEX_CHARSET.add('bullet', '•', 8226)
-TEX_CHARSET.add('dot', '․', 8228)
-TEX_CHARSET.add('ddot', '‥', 8229)
-TEX_CHARSET.add('dots', '…', 8230)
-TEX_CHARSET.add('cdot', '‧', 8231)
-TEX_CHARSET.add('prime', '′', 8242)
-TEX_CHARSET.add('scruple', '℈', 8456)
-TEX_CHARSET.add('hbar', 'ℏ', 8463)
-TEX_CHARSET.add('Im', 'ℑ', 8465)
-TEX_CHARSET.add('ell', 'ℓ', 8467)
-TEX_CHARSET.add('Re', 'ℜ', 8476)
-TEX_CHARSET.add('ohm', 'Ω', 8486)
-TEX_CHARSET.add('mho', '℧', 8487)
-TEX_CHARSET.add('alef', 'ℵ', 8501)
-
-# Arrows
-TEX_CHARSET.add('gets', '←', 8592)
-TEX_CHARSET.add('leftarrow', '←', 8592)
-TEX_CHARSET.add('uparrow', '↑', 8593)
-TEX_CHARSET.add('to', '→', 8594)
-TEX_CHARSET.add('rightarrow', '→', 8594)
-TEX_CHARSET.add('downarrow', '↓', 8595)
-TEX_CHARSET.add('leftrightarrow', '↔', 8596)
-TEX_CHARSET.add('updownarrow', '↕', 8597)
-TEX_CHARSET.add('nwarrow', '↖', 8598)
-TEX_CHARSET.add('nearrow', '↗', 8599)
-TEX_CHARSET.add('searrow', '↘', 8600)
-TEX_CHARSET.add('swarrow', '↙', 8601)
-TEX_CHARSET.add('leadsto', '↝', 8605)
-TEX_CHARSET.add('hookleftarrow', '↩', 8617)
-TEX_CHARSET.add('hookrightarrow', '↪', 8618)
-TEX_CHARSET.add('leftharpoonup', '↼', 8636)
-TEX_CHARSET.add('leftharpoondown', '↽', 8637)
-TEX_CHARSET.add('upharpoonright', '↾', 8638)
-TEX_CHARSET.add('upharpoonleft', '↿', 8639)
-TEX_CHARSET.add('rightharpoonup', '⇀', 8640)
-TEX_CHARSET.add('rightharpoondown', '⇁', 8641)
-TEX_CHARSET.add('downharpoonright', '⇂', 8642)
-TEX_CHARSET.add('downharpoonleft', '⇃', 8643)
-TEX_CHARSET.add('leftrightharpoons', '⇋', 8651)
-TEX_CHARSET.add('rightleftharpoons', '⇌', 8652)
-TEX_CHARSET.add('Leftarrow', '⇐', 8656)
-TEX_CHARSET.add('Uparrow', '⇑', 8657)
-TEX_CHARSET.add('Rightarrow', '⇒', 8658)
-TEX_CHARSET.add('Downarrow', '⇓', 8659)
-TEX_CHARSET.add('Leftrightarrow', '⇔', 8660)
-TEX_CHARSET.add('Updownarrow', '⇕', 8661)
-
-# Symbols
-TEX_CHARSET.add('forall', '∀', 8704)
-TEX_CHARSET.add('complement', '∁', 8705)
-TEX_CHARSET.add('partial', '∂', 8706)
-TEX_CHARSET.add('exists', '∃', 8707)
-TEX_CHARSET.add('emptyset', '∅', 8709)
-TEX_CHARSET.add('triangle', '∆', 8710)
-TEX_CHARSET.add('nabla', '∇', 8711)
-TEX_CHARSET.add('in', '∈', 8712)
-TEX_CHARSET.add('notin', '∉', 8713)
-TEX_CHARSET.add('ni', '∋', 8715)
-TEX_CHARSET.add('notowns', '∌', 8716)
-TEX_CHARSET.add('blacksquare', '∎', 8718)
-TEX_CHARSET.add('prod', '∏', 8719)
-TEX_CHARSET.add('coprod', '∐', 8720)
-TEX_CHARSET.add('sum', '∑', 8721)
-TEX_CHARSET.add('minus', '−', 8722)
-TEX_CHARSET.add('mp', '∓', 8723)
-TEX_CHARSET.add('dotplus', '∔', 8724)
-TEX_CHARSET.add('setminus', '∖', 8726)
-TEX_CHARSET.add('ast', '∗', 8727)
-TEX_CHARSET.add('circ', '∘', 8728)
-TEX_CHARSET.add('propto', '∝', 8733)
-TEX_CHARSET.add('infty', '∞', 8734)
-TEX_CHARSET.add('angle', '∠', 8736)
-TEX_CHARSET.add('measured angle', '∡', 8737)
-TEX_CHARSET.add('spherical angle', '∢', 8738)
-TEX_CHARSET.add('divides', '∣', 8739)
-TEX_CHARSET.add('does not divide', '∤', 8740)
-TEX_CHARSET.add('parallel to', '∥', 8741)
-TEX_CHARSET.add('not parallel to', '∦', 8742)
-TEX_CHARSET.add('logical and', '∧', 8743)
-TEX_CHARSET.add('logical or', '∨', 8744)
-TEX_CHARSET.add('intersection', '∩', 8745)
-TEX_CHARSET.add('union', '∪', 8746)
-TEX_CHARSET.add('int', '∫', 8747)
-TEX_CHARSET.add('iint', '∬', 8748)
-TEX_CHARSET.add('iiint', '∭', 8749)
-TEX_CHARSET.add('oint', '∮', 8750)
-TEX_CHARSET.add('oiint', '∯', 8751)
-TEX_CHARSET.add('oiiint', '∰', 8752)
-TEX_CHARSET.add('therefore', '∴', 8756)
-TEX_CHARSET.add('because', '∵', 8757)
-TEX_CHARSET.add('dotminus', '∸', 8760)
-TEX_CHARSET.add('sim', '∼', 8764)
-TEX_CHARSET.add('backsim', '∽', 8765)
+def add_tex_chars(charset: TexCharSet):
+    # Escape character
+    charset.add('{', '{', 123)
+    charset.add('}', '}', 125)
+
+    # Greek small letter
+    charset.add('alpha', 'α', 945)
+    charset.add('beta', 'β', 946)
+    charset.add('gamma', 'γ', 947)
+    charset.add('delta', 'δ', 948)
+    charset.add('epsilon', 'ε', 949)
+    charset.add('zeta', 'ζ', 950)
+    charset.add('eta', 'η', 951)
+    charset.add('theta', 'θ', 952)
+    charset.add('iota', 'ι', 953)
+    charset.add('kappa', 'κ', 954)
+    charset.add('lamda', 'λ', 955)
+    charset.add('mu', 'μ', 956)
+    charset.add('nu', 'ν', 957)
+    charset.add('xi', 'ξ', 958)
+    charset.add('omicron', 'ο', 959)
+    charset.add('pi', 'π', 960)
+    charset.add('rho', 'ρ', 961)
+    charset.add('sigma', 'σ', 963)
+    charset.add('tau', 'τ', 964)
+    charset.add('upsilon', 'υ', 965)
+    charset.add('phi', 'φ', 966)
+    charset.add('chi', 'χ', 967)
+    charset.add('psi', 'ψ', 968)
+    charset.add('omega', 'ω', 969)
+
+    # Greek capital letter
+    charset.add('Alpha', 'Α', 913)
+    charset.add('Beta', 'Β', 914)
+    charset.add('Gamma', 'Γ', 915)
+    charset.add('Delta', 'Δ', 916)
+    charset.add('Epsilon', 'Ε', 917)
+    charset.add('Zeta', 'Ζ', 918)
+    charset.add('Eta', 'Η', 919)
+    charset.add('Theta', 'Θ', 920)
+    charset.add('Iota', 'Ι', 921)
+    charset.add('Kappa', 'Κ', 922)
+    charset.add('Lamda', 'Λ', 923)
+    charset.add('Mu', 'Μ', 924)
+    charset.add('Nu', 'Ν', 925)
+    charset.add('Xi', 'Ξ', 926)
+    charset.add('Omicron', 'Ο', 927)
+    charset.add('Pi', 'Π', 928)
+    charset.add('Rho', 'Ρ', 929)
+    charset.add('Sigma', 'Σ', 931)
+    charset.add('Tau', 'Τ', 932)
+    charset.add('Upsilon', 'Υ', 933)
+    charset.add('Phi', 'Φ', 934)
+    charset.add('Chi', 'Χ', 935)
+    charset.add('Psi', 'Ψ', 936)
+    charset.add('Omega', 'Ω', 937)
+
+    # Greek letter variant
+    charset.add('varsigma', 'ς', 962)
+    charset.add('varbeta', 'ϐ', 976)
+    charset.add('vartheta', 'ϑ', 977)
+    charset.add('varphi', 'ϕ', 981)
+    charset.add('varpi', 'ϖ', 982)
+    charset.add('stigma', 'Ϛ', 986)
+    charset.add('digamma', 'Ϝ', 988)
+    charset.add('koppa', 'Ϟ', 990)
+    charset.add('sampi', 'Ϡ', 992)
+    charset.add('varkappa', 'ϰ', 1008)
+    charset.add('varrho', 'ϱ', 1009)
+    charset.add('lunatesigma', 'ϲ', 1010)
+
+    # Symbols
+    charset.add('dagger', '†', 8224)
+    charset.add('ddagger', '‡', 8225)
+    charset.add('bullet', '•', 8226)
+    charset.add('dot', '․', 8228)
+    charset.add('ddot', '‥', 8229)
+    charset.add('dots', '…', 8230)
+    charset.add('cdot', '‧', 8231)
+    charset.add('prime', '′', 8242)
+    charset.add('scruple', '℈', 8456)
+    charset.add('hbar', 'ℏ', 8463)
+    charset.add('Im', 'ℑ', 8465)
+    charset.add('ell', 'ℓ', 8467)
+    charset.add('Re', 'ℜ', 8476)
+    charset.add('ohm', 'Ω', 8486)
+    charset.add('mho', '℧', 8487)
+    charset.add('alef', 'ℵ', 8501)
+
+    # Arrows
+    charset.add('gets', '←', 8592)
+    charset.add('leftarrow', '←', 8592)
+    charset.add('uparrow', '↑', 8593)
+    charset.add('to', '→', 8594)
+    charset.add('rightarrow', '→', 8594)
+    charset.add('downarrow', '↓', 8595)
+    charset.add('leftrightarrow', '↔', 8596)
+    charset.add('updownarrow', '↕', 8597)
+    charset.add('nwarrow', '↖', 8598)
+    charset.add('nearrow', '↗', 8599)
+    charset.add('searrow', '↘', 8600)
+    charset.add('swarrow', '↙', 8601)
+    charset.add('leadsto', '↝', 8605)
+    charset.add('hookleftarrow', '↩', 8617)
+    charset.add('hookrightarrow', '↪', 8618)
+    charset.add('leftharpoonup', '↼', 8636)
+    charset.add('leftharpoondown', '↽', 8637)
+    charset.add('upharpoonright', '↾', 8638)
+    charset.add('upharpoonleft', '↿', 8639)
+    charset.add('rightharpoonup', '⇀', 8640)
+    charset.add('rightharpoondown', '⇁', 8641)
+    charset.add('downharpoonright', '⇂', 8642)
+    charset.add('downharpoonleft', '⇃', 8643)
+    charset.add('leftrightharpoons', '⇋', 8651)
+    charset.add('rightleftharpoons', '⇌', 8652)
+    charset.add('Leftarrow', '⇐', 8656)
+    charset.add('Uparrow', '⇑', 8657)
+    charset.add('Rightarrow', '⇒', 8658)
+    charset.add('Downarrow', '⇓', 8659)
+    charset.add('Leftrightarrow', '⇔', 8660)
+    charset.add('Updownarrow', '⇕', 8661)
+
+    # Symbols
+    charset.add('forall', '∀', 8704)
+    charset.add('complement', '∁', 8705)
+    charset.add('partial', '∂', 8706)
+    charset.add('exists', '∃', 8707)
+    charset.add('emptyset', '∅', 8709)
+    charset.add('triangle', '∆', 8710)
+    charset.add('nabla', '∇', 8711)
+    charset.add('in', '∈', 8712)
+    charset.add('notin', '∉', 8713)
+    charset.add('ni', '∋', 8715)
+    charset.add('notowns', '∌', 8716)
+    charset.add('blacksquare', '∎', 8718)
+    charset.add('prod', '∏', 8719)
+    charset.add('coprod', '∐', 8720)
+    charset.add('sum', '∑', 8721)
+    charset.add('minus', '−', 8722)
+    charset.add('mp', '∓', 8723)
+    charset.add('dotplus', '∔', 8724)
+    charset.add('setminus', '∖', 8726)
+    charset.add('ast', '∗', 8727)
+    charset.add('circ', '∘', 8728)
+    charset.add('propto', '∝', 8733)
+    charset.add('infty', '∞', 8734)
+    charset.add('angle', '∠', 8736)
+    charset.add('measured angle', '∡', 8737)
+    charset.add('spherical angle', '∢', 8738)
+    charset.add('divides', '∣', 8739)
+    charset.add('does not divide', '∤', 8740)
+    charset.add('parallel to', '∥', 8741)
+    charset.add('not parallel to', '∦', 8742)
+    charset.add('logical and', '∧', 8743)
+    charset.add('logical or', '∨', 8744)
+    charset.add('intersection', '∩', 8745)
+    charset.add('union', '∪', 8746)
+    charset.add('int', '∫', 8747)
+    charset.add('iint', '∬', 8748)
+    charset.add('iiint', '∭', 8749)
+    charset.add('oint', '∮', 8750)
+    charset.add('oiint', '∯', 8751)
+    charset.add('oiiint', '∰', 8752)
+    charset.add('therefore', '∴', 8756)
+    charset.add('because', '∵', 8757)
+    charset.add('dotminus', '∸', 8760)
+    charset.add('sim', '∼', 8764)
+    charset.add('backsim', '∽', 8765)
+
+
+TEX_CHARSET = TexCharSet(add_tex_chars)
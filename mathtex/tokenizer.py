@@ -0,0 +1,77 @@
+import re
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+
+TOKEN_BEGIN_ENV = "begin_env"
+TOKEN_END_ENV = "end_env"
+TOKEN_NEW_LINE = "new_line"
+TOKEN_COMMAND = "command"
+TOKEN_OPEN_BRACE = "open_brace"
+TOKEN_CLOSE_BRACE = "close_brace"
+TOKEN_SCRIPT = "script"
+TOKEN_NEW_CELL = "new_cell"
+TOKEN_TEXT = "text"
+
+# The alternatives are tried in the same order as the original per-position regex chain,
+# so that "\begin{...}" wins over the plain "\begin" command and so on.
+RE_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+    | (?P<comment>%[^\n]*)
+    | \\begin\{(?P<begin_env>[A-Za-z]+)\}
+    | \\end\{(?P<end_env>[A-Za-z]+)\}
+    | (?P<new_line>\\\\)
+    | \\(?P<command>[A-Za-z]+|.)
+    | (?P<open_brace>\{)
+    | (?P<close_brace>\})
+    | (?P<script>[_^])
+    | (?P<new_cell>&)
+    | (?P<text>[^\s%\\{}_^&]+|.)
+""", re.DOTALL | re.VERBOSE)
+
+SKIPPED_TOKENS = {"space", "comment"}
+
+
+def tokenize(line: str) -> Iterator[Tuple[str, str]]:
+    for m in RE_TOKEN.finditer(line):
+        kind = m.lastgroup
+        if kind not in SKIPPED_TOKENS:
+            yield kind, m.group(kind)
+
+
+def is_open_ended(m) -> bool:
+    # Tokens that may still grow when more input is appended: "%..." up to the newline,
+    # "\\alp" of "\\alpha" and a lone trailing backslash.
+    kind = m.lastgroup
+    if kind == "comment":
+        return True
+    if kind == TOKEN_COMMAND:
+        return m.group(kind).isalpha()
+    return kind == TOKEN_TEXT and m.group(kind) == "\\"
+
+
+def partial_env_start(matches) -> int:
+    # "\\begin{arr" is tokenized as a command, a brace and a text run until "}" arrives.
+    i = len(matches) - 1
+    if i >= 0 and matches[i].lastgroup == TOKEN_TEXT and matches[i].group(TOKEN_TEXT).isalpha():
+        i -= 1
+    if i >= 1 and matches[i].lastgroup == TOKEN_OPEN_BRACE and \
+            matches[i - 1].lastgroup == TOKEN_COMMAND and matches[i - 1].group(TOKEN_COMMAND) in ("begin", "end"):
+        return i - 1
+    return -1
+
+
+def tokenize_chunk(text: str, final: bool) -> Tuple[List[Tuple[str, str]], str]:
+    # Returns the tokens of the part of a chunk that further input cannot change, and the rest.
+    matches = list(RE_TOKEN.finditer(text))
+    hold = len(matches)
+    if not final and hold > 0:
+        if is_open_ended(matches[-1]):
+            hold -= 1
+        env_start = partial_env_start(matches)
+        if env_start >= 0:
+            hold = env_start
+    tokens = [(m.lastgroup, m.group(m.lastgroup)) for m in matches[:hold] if m.lastgroup not in SKIPPED_TOKENS]
+    rest = text[matches[hold].start():] if hold < len(matches) else ""
+    return tokens, rest
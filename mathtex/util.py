@@ -1,58 +1,95 @@
+import threading
+from collections import OrderedDict
+from types import GeneratorType
 from typing import TypeVar
 from typing import Generic
 from typing import Optional
-from typing import List
 from typing import Callable
+from typing import Iterator
 
 
-def last_index(a_list, func):
-    for i in range(len(a_list) - 1, -1, -1):
-        if func(a_list[i]):
-            return i
-    return -1
+def walk_tree(root, expand: Callable) -> Iterator:
+    # Depth-first walk with an explicit stack: expand(item) returns the items that replace
+    # the item, in order, or None for an item that is yielded as it is.
+    stack = [root]
+    while len(stack) > 0:
+        item = stack.pop()
+        expanded = expand(item)
+        if expanded is None:
+            yield item
+        else:
+            stack.extend(reversed(expanded))
+
+
+def run_nested(task, start_task: Callable):
+    # Runs a generator-based task without Python recursion. A task yields a request for a
+    # subtask; start_task(request) returns either the subtask's result or a generator for
+    # it, and the result is sent back into the waiting task. A task's return value is its result.
+    if not isinstance(task, GeneratorType):
+        return task
+    stack = [task]
+    value = None
+    while True:
+        try:
+            request = stack[-1].send(value)
+        except StopIteration as stop:
+            stack.pop()
+            if len(stack) == 0:
+                return stop.value
+            value = stop.value
+            continue
+        subtask = start_task(request)
+        if isinstance(subtask, GeneratorType):
+            stack.append(subtask)
+            value = None
+        else:
+            value = subtask
 
 
 T = TypeVar('T')
 
 
-class Array1D(Generic[T]):
-    def __init__(self, size, ctor: Callable[[], T]):
-        self.size = size
-        self.items = []
-        for i in range(0, size):
-            self.items.append(ctor())
-
-    def __getitem__(self, item):
-        return self.items[item]
-
-
-class Array2D(Generic[T]):
-    def __init__(self):
-        self.width = 0
-        self.height = 0
-        self.rows = []  # type: List[T]
-
-    def set(self, y, x, elem: T):
-        if y >= self.height:
-            self.height = y + 1
-        if x >= self.width:
-            self.width = x + 1
-        while len(self.rows) < self.height:
-            self.rows.append([])
-        while len(self.rows[y]) < self.width:
-            self.rows[y].append(None)
-        self.rows[y][x] = elem
-
-    def get(self, y, x) -> Optional[T]:
-        if y >= len(self.rows):
-            return None
-        if x >= len(self.rows[y]):
-            return None
-        return self.rows[y][x]
-
-    def for_each_not_none(self, action: Callable[[int, int, T], None]):
-        for i in range(0, self.height):
-            for j in range(0, self.width):
-                item = self.get(i, j)
-                if item is not None:
-                    action(i, j, item)
+class LRUCache(Generic[T]):
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key) -> Optional[T]:
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key, item: T):
+        with self.lock:
+            self.items[key] = item
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def remove(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
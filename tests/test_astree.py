@@ -0,0 +1,79 @@
+import timeit
+from mathtex.astree import MathTexAST
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import MathTexParser
+from mathtex.parser import parse_formula
+
+
+def parse_cell(formula):
+    # The children of the first cell of a formula, as parsed and before lowering.
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(formula)
+    return list(parser.end_parse().children[0].children[0].children)
+
+
+def lower(formula) -> str:
+    return " ".join(str(node) for node in MathTexAST.lower_special_command(parse_cell(formula)))
+
+
+def test_scripts():
+    assert lower("x_a^b") == "<Cmd sub+sup: <Text: x>,<Text: b>,<Text: a>>"
+    # A second script of the same kind stacks on the first.
+    assert lower("x_a_b") == "<Cmd sub+sup: <Cmd sub+sup: <Text: x>,None,<Text: a>>,None,<Text: b>>"
+
+
+def test_scripts_without_base_get_an_empty_base():
+    assert lower("_x y") == "<Cmd sub+sup: <Text: >,None,<Text: x>> <Text: y>"
+    assert lower(r"\left( ^2 x \right)") == \
+        "<Cmd left+right: <Text: (>,<Text: )>,<Block: <Cmd sub+sup: <Text: >,<Text: 2>,None>,<Text: x>>>"
+
+
+def test_nested_delimiters():
+    assert lower(r"\left(\left[x\right]\right)") == \
+        "<Cmd left+right: <Text: (>,<Text: )>,<Block: <Cmd left+right: <Text: [>,<Text: ]>,<Block: <Text: x>>>>>"
+    assert lower(r"\left( a \right) + \left[ b \right]") == \
+        "<Cmd left+right: <Text: (>,<Text: )>,<Block: <Text: a>>> <Text: +> " \
+        "<Cmd left+right: <Text: [>,<Text: ]>,<Block: <Text: b>>>"
+
+
+def test_unmatched_delimiters():
+    # An unmatched \right is dropped and keeps the content before it, an unmatched \left stays.
+    assert lower(r"a \right) b") == "<Text: a> <Text: b>"
+    assert lower(r"\left( a") == "<Cmd left: <Text: (>> <Text: a>"
+
+
+def test_missing_delimiters_are_empty():
+    left = MathTexAST.command_node("left", 1)
+    right = MathTexAST.command_node("right", 1)
+    lowered = MathTexAST.lower_special_command([left, MathTexAST.text_node("x"), right])
+    assert " ".join(map(str, lowered)) == "<Cmd left+right: <Text: >,<Text: >,<Block: <Text: x>>>"
+
+
+def test_malformed_scripts_and_delimiters_render():
+    render = HtmlRender()
+    for formula in ("x_a_b", "_x", r"\left(^2\right)", r"a \right) b", r"\left( a", r"\left \right", "x^"):
+        render.render(parse_formula(formula), 1)
+
+
+def delimited_sum(terms):
+    return r"\left(" + " + ".join(r"a_{0} \alpha^{0}".format(i % 10) for i in range(0, terms)) + r"\right)"
+
+
+def nested_product(terms):
+    return r"\left[" + r" \left( x_i y^i \right) ".join("p" for _ in range(0, terms)) + r"\right]"
+
+
+def get_seconds(children):
+    return min(timeit.repeat(lambda: MathTexAST.lower_special_command(children), number=1, repeat=5))
+
+
+def test_long_delimited_bodies_are_lowered_in_linear_time():
+    # One body of 16000 terms must not take much longer than 160 bodies of 100 terms. Moving the body
+    # of a \right item by item to the front of a list made the long body about four times slower.
+    for build in (delimited_sum, nested_product):
+        long_body = parse_cell(build(16000))
+        short_bodies = parse_cell(" ".join(build(100) for _ in range(0, 160)))
+        lowered = MathTexAST.lower_special_command(long_body)
+        assert len(lowered) == 1 and lowered[0].command == MathTexAST.CMD_LEFT_RIGHT
+        assert get_seconds(long_body) < 2 * get_seconds(short_bodies)
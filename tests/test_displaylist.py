@@ -0,0 +1,93 @@
+from mathtex.displaylist import GLYPH
+from mathtex.displaylist import DisplayItem
+from mathtex.displaylist import DisplayList
+from mathtex.fontmetric import FONT_METRICS
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import parse_formula
+
+
+def expand_runs(display_list):
+    # One (text, x, y, font_size, css_class) per glyph, placed like the browser places the glyphs of a run.
+    glyphs = []
+    for item in display_list.items:
+        if item.kind != GLYPH:
+            glyphs.append((item.text, item.x, item.y, item.font_size, item.css_class))
+            continue
+        x = item.x
+        for c in item.text:
+            glyphs.append((c, x, item.y, item.font_size, item.css_class))
+            x += (display_list.font_metrics.get_glyph(c).width + item.letter_spacing) * item.font_size
+    return glyphs
+
+
+def assert_same_glyphs(expected, actual):
+    assert len(expected) == len(actual)
+    for a, b in zip(expected, actual):
+        assert (a[0], a[3], a[4]) == (b[0], b[3], b[4])
+        assert abs(a[1] - b[1]) < 1e-9 and abs(a[2] - b[2]) < 1e-9, (a, b)
+
+
+def create_display_list(glyphs):
+    display_list = DisplayList(font_metrics=FONT_METRICS)
+    display_list.items = [DisplayItem(GLYPH, x, y, font_size=font_size, text=text, css_class=css_class)
+                          for text, x, y, font_size, css_class in glyphs]
+    return display_list
+
+
+def merge(glyphs):
+    display_list = create_display_list(glyphs)
+    display_list.merge_glyph_runs()
+    return display_list
+
+
+def advance(text, font_size=1):
+    return FONT_METRICS.get_glyph(text).width * font_size
+
+
+def test_merged_runs_keep_the_laid_out_positions():
+    render = HtmlRender()
+    for formula in (r"1234+5678", r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)", r"\frac{abc}{x_{12}} \alpha\beta",
+                    r"\begin{array}{cc} ab & cd \\ 12 & 34 \end{array}"):
+        elem = render.render(parse_formula(formula), 1)
+        plain = DisplayList.from_element(elem, merge_glyph_runs=False)
+        merged = DisplayList.from_element(elem, merge_glyph_runs=True)
+        assert len(merged.items) < len(plain.items)
+        glyphs = [(item.text, item.x, item.y, item.font_size, item.css_class) for item in plain.items]
+        assert_same_glyphs(glyphs, expand_runs(merged))
+
+
+def test_runs_take_the_gap_as_letter_spacing():
+    glyphs = [("a", 0, 0, 1, None), ("b", advance("a") + 0.1, 0, 1, None),
+              ("c", advance("a") + advance("b") + 0.2, 0, 1, None)]
+    merged = merge(glyphs)
+    assert [item.text for item in merged.items] == ["abc"]
+    assert abs(merged.items[0].letter_spacing - 0.1) < 1e-9
+    assert_same_glyphs(glyphs, expand_runs(merged))
+
+
+def test_runs_split():
+    x = advance("a")
+    cases = [
+        # a different gap
+        ([("a", 0, 0, 1, None), ("b", x, 0, 1, None), ("c", x + advance("b") + 0.3, 0, 1, None)], ["ab", "c"]),
+        # a glyph the font does not have
+        ([("a", 0, 0, 1, None), ("递", x, 0, 1, None), ("c", x + advance("递"), 0, 1, None)],
+         ["a", "递", "c"]),
+        # a font-size change
+        ([("a", 0, 0, 1, None), ("b", x, 0, 0.8, None), ("c", x + advance("b", 0.8), 0, 0.8, None)], ["a", "bc"]),
+        # a class change
+        ([("a", 0, 0, 1, None), ("b", x, 0, 1, "italic"), ("c", x + advance("b"), 0, 1, "italic")], ["a", "bc"]),
+        # a baseline change
+        ([("a", 0, 0, 1, None), ("b", x, 0.5, 1, None), ("c", x + advance("b"), 0.5, 1, None)], ["a", "bc"]),
+    ]
+    for glyphs, texts in cases:
+        merged = merge(glyphs)
+        assert [item.text for item in merged.items] == texts
+        assert_same_glyphs(glyphs, expand_runs(merged))
+
+
+def test_nothing_is_merged_without_font_metrics():
+    display_list = create_display_list([("a", 0, 0, 1, None), ("b", advance("a"), 0, 1, None)])
+    display_list.font_metrics = None
+    display_list.merge_glyph_runs()
+    assert [item.text for item in display_list.items] == ["a", "b"]
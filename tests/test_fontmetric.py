@@ -0,0 +1,32 @@
+import pytest
+from mathtex import fontmetric
+from mathtex.fontmetric import FontMetrics
+from mathtex.fontmetric import NUMPY_MIN_LENGTH
+
+
+def test_missing_glyphs_are_counted_per_measured_character():
+    font_metrics = FontMetrics()
+    short = "x递y递"
+    long = short * NUMPY_MIN_LENGTH
+    for i in range(0, 3):
+        font_metrics.measure_text(short)
+        font_metrics.measure_text(long)
+    assert font_metrics.missing_glyphs == {ord("递"): 3 * 2 + 3 * 2 * NUMPY_MIN_LENGTH}
+
+
+def test_missing_glyphs_fall_back_to_m():
+    font_metrics = FontMetrics()
+    assert not font_metrics.has_glyph("递")
+    assert font_metrics.get_glyph("递") is font_metrics.get_glyph("M")
+    assert font_metrics.measure_text("递")[0] == font_metrics.measure_text("M")[0]
+
+
+def test_measure_text_numpy_loads_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(fontmetric, "numpy", None)
+    font_metrics = FontMetrics()
+    text = "x + y_{ij} = \u03b1\u03b2 \U0001d465"
+    width, offsets = font_metrics.measure_text_numpy(text)
+    scalar_width, scalar_offsets = font_metrics.measure_text_scalar(text)
+    assert abs(width - scalar_width) < 1e-9
+    assert all(abs(a - b) < 1e-9 for a, b in zip(offsets, scalar_offsets))
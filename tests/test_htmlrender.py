@@ -0,0 +1,87 @@
+import pytest
+from mathtex.displaylist import DisplayList
+from mathtex.htmlelement import HtmlElement
+from mathtex.htmlrender import COMMAND_RENDERERS
+from mathtex.htmlrender import HtmlRender
+from mathtex.htmlrender import LAYOUT_CACHE
+from mathtex.htmlrender import register_command
+from mathtex.parser import TEX_CMD_ARG_NUMBER
+from mathtex.parser import parse_formula
+from tests.test_parser_scaling import array_formula
+from tests.test_parser_scaling import nested_formula
+
+
+class UpperCaseRender(HtmlRender):
+    def render_text(self, text, font_size, middle_align_with=None, italic=True, bold=False):
+        return super(UpperCaseRender, self).render_text(text.upper(), font_size, middle_align_with, italic, bold)
+
+
+def get_glyphs(render, formula):
+    elem = render.render(parse_formula(formula), 1)
+    return [(item.text, item.x, item.y) for item in DisplayList.from_element(elem, False).items]
+
+
+def test_renderers_of_different_classes_do_not_share_layouts():
+    uncached = UpperCaseRender()
+    uncached.layout_cache = None
+    for formula in (r"{ab}+c", r"\frac{x}{\sqrt{y}}"):
+        plain = get_glyphs(HtmlRender(), formula)
+        upper = get_glyphs(UpperCaseRender(), formula)
+        assert upper == get_glyphs(uncached, formula)
+        assert upper != plain
+        assert get_glyphs(HtmlRender(), formula) == plain
+
+
+class NoRootRender(HtmlRender):
+    def render_cmd_square_root(self, children, font_size):
+        raise NotImplementedError("no roots")
+
+
+def render_twice(render, children, font_size):
+    # Draws its argument two times side by side.
+    elem = HtmlElement()
+    for i in range(0, 2):
+        child = yield children[0], font_size
+        elem.children.append(child)
+    render.align_children(elem, font_size)
+    return elem
+
+
+def test_subclasses_override_builtin_commands():
+    HtmlRender().render(parse_formula(r"\sqrt{x}"), 1)
+    with pytest.raises(NotImplementedError):
+        NoRootRender().render(parse_formula(r"\sqrt{x}"), 1)
+
+
+def test_registered_commands_are_rendered(monkeypatch):
+    monkeypatch.setitem(TEX_CMD_ARG_NUMBER, "twice", 1)
+    try:
+        register_command("twice", render_twice)
+        register_command("checkmark", lambda render, children, font_size: render.render_text("\u2713", font_size))
+        glyphs = get_glyphs(HtmlRender(), r"\twice{ab} + \checkmark")
+        assert [glyph[0] for glyph in glyphs] == ["a", "b", "a", "b", "+", "\u2713"]
+        assert glyphs[2][1] > glyphs[1][1]
+    finally:
+        del COMMAND_RENDERERS["twice"]
+        del COMMAND_RENDERERS["checkmark"]
+        LAYOUT_CACHE.clear()
+
+
+def test_measure_agrees_with_render():
+    formulas = [
+        r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+        r"\frac{\partial E}{\partial w_{ij}} = \sqrt{\frac{1}{2}}",
+        r"\left\{ \begin{array}{cc} a & \boldsymbol{b} \\ c_1^2 & \left[ d \right] \end{array} \right.",
+        nested_formula(50),
+        array_formula(300, 30),
+    ]
+    for svg_shapes in (False, True):
+        for layout_cache in (True, False):
+            render = HtmlRender()
+            render.svg_shapes = svg_shapes
+            if not layout_cache:
+                render.layout_cache = None
+            for formula in formulas:
+                node = parse_formula(formula)
+                elem = render.render(node, 1)
+                assert render.measure(node, 1) == (elem.width, elem.height, elem.baseline), formula
@@ -0,0 +1,53 @@
+from mathtex.htmlrender import HtmlRender
+from mathtex.parser import MathTexParser
+from mathtex.parser import parse_formula
+from mathtex.util import walk_tree
+
+FORMULAS = [
+    r"y^i(t) = f\left(\sum_j w_{ij} y^j(t-1)\right)",
+    r"\frac{\partial E}{\partial w_{ij}} = \sqrt{x_a_b}",
+    r"\left[ \begin{array}{cc} a & b \\ c & \left( d \right) \end{array} \right]",
+]
+
+
+def parse(formula):
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(formula)
+    return parser.end_parse()
+
+
+def expand_children(node):
+    return [child for child in node.children if child is not None]
+
+
+def test_cached_formulas_are_frozen():
+    for formula in FORMULAS:
+        node = parse_formula(formula)
+        assert parse_formula(formula) is node
+        for child in walk_tree(node, expand_children):
+            assert isinstance(child.children, tuple) and child.lowered
+
+
+def test_lowering_is_idempotent():
+    for formula in FORMULAS:
+        node = parse(formula)
+        lowered = node.lower()
+        assert lowered.lower() is lowered
+        assert node.lower().get_fingerprint() == lowered.get_fingerprint()
+        assert parse_formula(formula).get_fingerprint() == lowered.get_fingerprint()
+
+
+def test_rendering_does_not_change_cached_formulas():
+    for layout_cache in (True, False):
+        render = HtmlRender()
+        if not layout_cache:
+            render.layout_cache = None
+        for formula in FORMULAS:
+            node = parse_formula(formula)
+            tree = str(node)
+            html = render.render_display_list(node, 1).to_html_div()
+            render.render_display_list(node, 0.7).to_html_div()
+            assert render.render_display_list(parse_formula(formula), 1).to_html_div() == html
+            assert str(node) == tree
+            assert str(parse(formula).lower()) == tree
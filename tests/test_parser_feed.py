@@ -0,0 +1,78 @@
+from mathtex.astree import MathTexAST
+from mathtex.parser import BEGIN_ENV
+from mathtex.parser import MathTexParser
+
+SOURCES = [
+    r"a + b",
+    r"x_{i}^2 + \alpha \frac12 % comment" + "\n" + r"y",
+    r"a \\ b & c \\ \sqrt{d}",
+    r"\begin{array}{cc} a & b \\ c & \left( d \right) \end{array}",
+    r"\begin{array}{c} a \end{array} x \\ \begin{array}{c} b \end{array}",
+    r"\begin{array}{c} \begin{array}{c} a \\ b \end{array} \\ c \end{array} & d",
+    r"{ \boldsymbol{x} } \\ \\ \sum_{k} w_{ki}",
+]
+
+
+def parse(source):
+    parser = MathTexParser()
+    parser.begin_parse()
+    parser.parse_line(source)
+    return parser.end_parse()
+
+
+def feed(chunks):
+    parser = MathTexParser()
+    nodes = []
+    for chunk in chunks:
+        nodes.extend(parser.feed(chunk))
+    nodes.extend(parser.end_feed())
+    assert parser.stack == [MathTexAST.ROOT_ENV, BEGIN_ENV] and parser.pending == ""
+    return nodes
+
+
+def expected_stream(root):
+    # A stream hands out the environments that start a top-level line on their own,
+    # and leaves out the lines that are empty then.
+    nodes = []
+    for line in root.children:
+        cells = list(line.children)
+        rest = list(cells[0].children)
+        while len(rest) > 0 and rest[0].node_type == MathTexAST.ENV_NODE:
+            nodes.append(rest.pop(0))
+        if len(cells) > 1 or len(rest) > 0:
+            nodes.append(MathTexAST.line_node([MathTexAST.cell_node(rest)] + cells[1:]))
+    return nodes
+
+
+def fingerprints(nodes):
+    return [node.get_fingerprint() for node in nodes]
+
+
+def test_feed_matches_parse_at_every_split_point():
+    for source in SOURCES:
+        expected = fingerprints(expected_stream(parse(source)))
+        assert fingerprints(feed([source])) == expected
+        for i in range(0, len(source) + 1):
+            assert fingerprints(feed([source[:i], source[i:]])) == expected, (source, i)
+
+
+def test_feed_one_character_at_a_time():
+    for source in SOURCES:
+        assert fingerprints(feed(list(source))) == fingerprints(expected_stream(parse(source)))
+
+
+def test_end_feed_closes_open_environments():
+    parser = MathTexParser()
+    assert parser.feed(r"\begin{array}{c} a \\ b") == []
+    nodes = parser.end_feed()
+    assert len(nodes) == 1 and nodes[0].node_type == MathTexAST.ENV_NODE
+    assert nodes[0].get_fingerprint() == parse(r"\begin{array}{c} a \\ b").get_fingerprint()
+    assert parser.stack == [MathTexAST.ROOT_ENV, BEGIN_ENV]
+
+
+def test_feed_starts_a_new_stream_after_end_feed():
+    parser = MathTexParser()
+    assert len(parser.feed(r"a \\ b")) == 1
+    assert len(parser.end_feed()) == 1
+    assert parser.feed("c") == []
+    assert fingerprints(parser.end_feed()) == fingerprints(expected_stream(parse("c")))
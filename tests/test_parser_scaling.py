@@ -0,0 +1,55 @@
+from mathtex.parser import MathTexParser
+
+
+class CountingParser(MathTexParser):
+    # Counts the stack entries the parser looks at: markers searched for the innermost open
+    # group and nodes collected into closed groups.
+    def __init__(self):
+        super(CountingParser, self).__init__()
+        self.operations = 0
+
+    def last_marker(self, markers) -> int:
+        i = super(CountingParser, self).last_marker(markers)
+        self.operations += len(self.markers) - (self.markers.index(i) if i >= 0 else 0)
+        return i
+
+    def process_sequence(self, nodes):
+        self.operations += len(nodes)
+        return MathTexParser.process_sequence(nodes)
+
+
+def count_operations(text) -> int:
+    parser = CountingParser()
+    parser.begin_parse()
+    parser.parse_line(text)
+    parser.end_parse()
+    return parser.operations
+
+
+def array_formula(cells, columns=100):
+    rows = []
+    for start in range(0, cells, columns):
+        rows.append(" & ".join("a_{0}".format(i) for i in range(start, min(cells, start + columns))))
+    return r"\begin{array}{c}" + r" \\ ".join(rows) + r"\end{array}"
+
+
+def nested_formula(depth):
+    return "{x + " * depth + "y" + "}" * depth
+
+
+def assert_linear(build, size):
+    # Twice the input may cost at most a bit more than twice the work, a parser that rescans
+    # the stack for every token would do four times the work.
+    small = count_operations(build(size // 2))
+    large = count_operations(build(size))
+    assert large <= 2.2 * small, (small, large)
+    assert large <= 20 * size, large
+
+
+def test_array_cells_parse_in_linear_time():
+    assert_linear(array_formula, 10000)
+
+
+def test_nested_groups_parse_in_linear_time():
+    assert_linear(nested_formula, 1000)
+
@@ -0,0 +1,38 @@
+# Converts a generated fontmetric.py module (FONT_METRICS.* and GLYPHS[...] = Glyph(...) lines)
+# into the binary table read by mathtex.fontmetric.MetricsTable.
+#
+#   python tools/convert_fontmetric.py <fontmetric.py> [<fontmetric.bin>]
+import ast
+import re
+import sys
+from mathtex.fontmetric import METRICS_TABLE_PATH
+from mathtex.fontmetric import MetricsTable
+
+RE_FONT_VALUE = re.compile(r"^FONT_METRICS\.(glyphCount|baseline|capsHeight|xHeight|height) = (.+)$")
+RE_GLYPH = re.compile(r"^GLYPHS\[(\d+)\] = Glyph\((.*)\)$")
+
+
+def convert(file_in: str, file_out: str):
+    font = {}
+    glyphs = {}
+    with open(file_in, "r", encoding="utf8") as file:
+        for line in file:
+            line = line.rstrip("\n")
+            m = RE_FONT_VALUE.match(line)
+            if m is not None:
+                font[m.group(1)] = ast.literal_eval(m.group(2))
+                continue
+            m = RE_GLYPH.match(line)
+            if m is not None:
+                char, name, *metrics = ast.literal_eval("(" + m.group(2) + ",)")
+                glyphs[int(m.group(1))] = tuple(float(value) for value in metrics)
+    font_values = (font["glyphCount"], font["baseline"], font["capsHeight"], font["xHeight"], font["height"])
+    MetricsTable.write(file_out, font_values, glyphs)
+    print("{0} glyphs written to {1}".format(len(glyphs), file_out))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: convert_fontmetric.py <fontmetric.py> [<fontmetric.bin>]")
+        sys.exit(1)
+    convert(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else METRICS_TABLE_PATH)
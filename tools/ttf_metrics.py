@@ -0,0 +1,158 @@
+# Builds the binary metrics table read by mathtex.fontmetric.MetricsTable from a TrueType font,
+# with the values the former tools/FontMetrics/Program.cs took from WPF's GlyphTypeface.
+#
+#   python tools/ttf_metrics.py <font.ttf> <metrics.bin>
+#
+# Register the table with FONT_REGISTRY.register(<font name>, <metrics.bin>).
+import struct
+import sys
+from mathtex.fontmetric import MetricsTable
+from typing import Dict
+from typing import Tuple
+
+
+class TrueTypeFont:
+    def __init__(self, data: bytes):
+        self.data = data
+        version, table_count = struct.unpack_from(">IH", data, 0)
+        if version not in (0x00010000, 0x74727565):  # 1.0 or "true", "OTTO" fonts have CFF outlines
+            raise ValueError("not a TrueType font with glyf outlines")
+        self.tables = {}  # type: Dict[str, int]
+        for i in range(0, table_count):
+            tag, checksum, offset, length = struct.unpack_from(">4sIII", data, 12 + i * 16)
+            self.tables[tag.decode("latin-1")] = offset
+        for tag in ("head", "hhea", "hmtx", "maxp", "cmap", "loca", "glyf"):
+            if tag not in self.tables:
+                raise ValueError("missing '{0}' table".format(tag))
+        self.units_per_em = self.read(">H", "head", 18)
+        self.glyph_count = self.read(">H", "maxp", 4)
+
+    def read(self, fmt: str, tag: str, offset: int):
+        values = struct.unpack_from(fmt, self.data, self.tables[tag] + offset)
+        return values[0] if len(values) == 1 else values
+
+    def get_font_values(self) -> Tuple[int, float, float, float, float]:
+        # (glyphCount, baseline, capsHeight, xHeight, height) as in GlyphTypeface
+        em = self.units_per_em
+        ascent, descent = self.read(">hh", "hhea", 4)
+        ascent, descent = ascent, -descent
+        caps_height = x_height = None
+        if "OS/2" in self.tables:
+            ascent, descent = self.read(">HH", "OS/2", 74)
+            if self.read(">H", "OS/2", 0) >= 2:
+                x_height, caps_height = self.read(">hh", "OS/2", 86)
+        bounds = self.get_glyph_bounds()
+        cmap = self.get_character_map()
+        if caps_height is None:
+            caps_height = bounds[cmap[ord("H")]][3] if ord("H") in cmap else ascent
+        if x_height is None:
+            x_height = bounds[cmap[ord("x")]][3] if ord("x") in cmap else caps_height
+        return self.glyph_count, ascent / em, caps_height / em, x_height / em, (ascent + descent) / em
+
+    def get_horizontal_metrics(self):
+        # (advance width, left side bearing) in font units by glyph index
+        metric_count = self.read(">H", "hhea", 34)
+        offset = self.tables["hmtx"]
+        metrics = [struct.unpack_from(">Hh", self.data, offset + i * 4) for i in range(0, metric_count)]
+        offset += metric_count * 4
+        advance = metrics[-1][0]
+        for i in range(0, self.glyph_count - metric_count):
+            metrics.append((advance, struct.unpack_from(">h", self.data, offset + i * 2)[0]))
+        return metrics
+
+    def get_glyph_bounds(self):
+        # (xMin, yMin, xMax, yMax) in font units by glyph index, None for glyphs without outline
+        count = self.glyph_count + 1
+        if self.read(">h", "head", 50) == 0:
+            locations = [location * 2 for location in self.read(">{0}H".format(count), "loca", 0)]
+        else:
+            locations = list(self.read(">{0}I".format(count), "loca", 0))
+        bounds = []
+        for i in range(0, self.glyph_count):
+            if locations[i] == locations[i + 1]:
+                bounds.append(None)
+            else:
+                bounds.append(self.read(">4h", "glyf", locations[i] + 2))
+        return bounds
+
+    def get_character_map(self) -> Dict[int, int]:
+        # codepoint -> glyph index from the best Unicode subtable, format 12 before format 4
+        subtables = {}
+        for i in range(0, self.read(">H", "cmap", 2)):
+            platform, encoding, offset = self.read(">HHI", "cmap", 4 + i * 8)
+            if platform == 0 or (platform == 3 and encoding in (1, 10)):
+                offset += self.tables["cmap"]
+                subtables.setdefault(struct.unpack_from(">H", self.data, offset)[0], offset)
+        if 12 in subtables:
+            return self.read_cmap_format_12(subtables[12])
+        if 4 in subtables:
+            return self.read_cmap_format_4(subtables[4])
+        raise ValueError("no Unicode character map of format 4 or 12")
+
+    def read_cmap_format_4(self, offset: int) -> Dict[int, int]:
+        data = self.data
+        segment_count = struct.unpack_from(">H", data, offset + 6)[0] // 2
+        ends_offset = offset + 14
+        starts_offset = ends_offset + segment_count * 2 + 2
+        deltas_offset = starts_offset + segment_count * 2
+        range_offsets_offset = deltas_offset + segment_count * 2
+        cmap = {}
+        for i in range(0, segment_count):
+            end = struct.unpack_from(">H", data, ends_offset + i * 2)[0]
+            start = struct.unpack_from(">H", data, starts_offset + i * 2)[0]
+            delta = struct.unpack_from(">h", data, deltas_offset + i * 2)[0]
+            range_offset_position = range_offsets_offset + i * 2
+            range_offset = struct.unpack_from(">H", data, range_offset_position)[0]
+            for code in range(start, min(end, 0xFFFE) + 1):
+                if range_offset == 0:
+                    glyph = (code + delta) & 0xFFFF
+                else:
+                    position = range_offset_position + range_offset + (code - start) * 2
+                    glyph = struct.unpack_from(">H", data, position)[0]
+                    if glyph != 0:
+                        glyph = (glyph + delta) & 0xFFFF
+                if glyph != 0:
+                    cmap[code] = glyph
+        return cmap
+
+    def read_cmap_format_12(self, offset: int) -> Dict[int, int]:
+        group_count = struct.unpack_from(">I", self.data, offset + 12)[0]
+        cmap = {}
+        for i in range(0, group_count):
+            start, end, glyph = struct.unpack_from(">III", self.data, offset + 16 + i * 12)
+            for code in range(start, end + 1):
+                cmap[code] = glyph + code - start
+        return cmap
+
+    def get_glyph_metrics(self) -> Dict[int, Tuple[float, float, float, float, float]]:
+        # codepoint -> (width, descent, ascent, left_bearing, right_bearing) in em, glyphs
+        # without outline are skipped like Program.cs did
+        em = self.units_per_em
+        horizontal_metrics = self.get_horizontal_metrics()
+        bounds = self.get_glyph_bounds()
+        glyphs = {}
+        for code, glyph in self.get_character_map().items():
+            if glyph >= self.glyph_count or bounds[glyph] is None:
+                continue
+            x_min, y_min, x_max, y_max = bounds[glyph]
+            advance, left_bearing = horizontal_metrics[glyph]
+            right_bearing = advance - left_bearing - (x_max - x_min)
+            glyphs[code] = (advance / em, -y_min / em, y_max / em, left_bearing / em, right_bearing / em)
+        return glyphs
+
+
+def generate(file_in: str, file_out: str):
+    with open(file_in, "rb") as file:
+        font = TrueTypeFont(file.read())
+    glyphs = font.get_glyph_metrics()
+    if ord("M") not in glyphs:
+        raise ValueError("the font has no 'M', it is the fallback for missing glyphs")
+    MetricsTable.write(file_out, font.get_font_values(), glyphs)
+    print("{0} glyphs written to {1}".format(len(glyphs), file_out))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("usage: ttf_metrics.py <font.ttf> <metrics.bin>")
+        sys.exit(1)
+    generate(sys.argv[1], sys.argv[2])